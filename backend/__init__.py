@@ -5,6 +5,16 @@ Main backend module providing data analysis and API access for VATSIM flight tra
 
 # Import main analysis function
 from backend.core.analysis import analyze_flights_data
+from backend.core.analysis_context import (
+    AnalysisContext,
+    get_analysis_context,
+    invalidate_analysis_context,
+)
+from backend.core.airspace import (
+    AirspaceOccupancy,
+    get_airspace_occupancy,
+    get_last_airspace_occupancy,
+)
 
 # Import flight details function
 from backend.core.flights import get_airport_flight_details
@@ -19,11 +29,26 @@ from backend.data.weather import (
     get_taf_batch,
     get_altimeter_setting,
     find_nearest_airport_with_metar,
+    find_nearest_metar_batch,
     find_airports_near_position,
     get_rate_limit_status,
     reset_rate_limit_state,
     fetch_weather_bbox,
     get_weather_batch_bbox,
+    get_weather_age,
+    fetch_weather_bulk,
+    refresh_weather_bulk,
+    get_nearest_metar_cache_stats,
+    get_metar_hedge_stats,
+    get_revalidation_stats,
+)
+from backend.core.spatial import get_spatial_stats
+from backend.core.diagnostics import get_refresh_diagnostics
+
+# Import airport neighborhood functions
+from backend.data.neighborhoods import (
+    find_alternate_candidates,
+    get_neighborhood_table,
 )
 
 # Import groupings functions
@@ -86,6 +111,12 @@ __version__ = "1.0.0"
 # Export public API
 __all__ = [
     "analyze_flights_data",
+    "AnalysisContext",
+    "get_analysis_context",
+    "invalidate_analysis_context",
+    "AirspaceOccupancy",
+    "get_airspace_occupancy",
+    "get_last_airspace_occupancy",
     "get_airport_flight_details",
     "get_wind_info",
     "get_wind_info_batch",
@@ -95,11 +126,22 @@ __all__ = [
     "get_taf_batch",
     "get_altimeter_setting",
     "find_nearest_airport_with_metar",
+    "find_nearest_metar_batch",
     "find_airports_near_position",
     "get_rate_limit_status",
     "reset_rate_limit_state",
     "fetch_weather_bbox",
     "get_weather_batch_bbox",
+    "get_weather_age",
+    "fetch_weather_bulk",
+    "refresh_weather_bulk",
+    "get_nearest_metar_cache_stats",
+    "get_metar_hedge_stats",
+    "get_revalidation_stats",
+    "get_spatial_stats",
+    "get_refresh_diagnostics",
+    "find_alternate_candidates",
+    "get_neighborhood_table",
     "load_all_groupings",
     "load_unified_airport_data",
     "WIND_SOURCE",
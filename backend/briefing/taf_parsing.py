@@ -5,18 +5,14 @@ This module provides shared TAF/forecast parsing functionality used by both
 the UI weather briefing modal and the weather daemon HTML generator.
 """
 
-import re
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
-
-from backend.data.weather_parsing import (
-    CATEGORY_PRIORITY,
-    get_flight_category,
-    parse_visibility_sm,
-    parse_ceiling_feet,
-    parse_ceiling_layer,
-    parse_weather_phenomena,
-    parse_wind_from_metar,
+from typing import Any, Dict, List, Optional, Sequence
+
+from backend.data.weather_parsing import CATEGORY_PRIORITY, parse_metar_tokens
+from backend.data.weather_tokens import (
+    WeatherToken,
+    split_change_groups,
+    tokenize_report,
 )
 
 
@@ -30,20 +26,20 @@ def parse_taf_forecast_details(conditions: str) -> Dict[str, Any]:
     Returns:
         Dict with visibility_sm, ceiling_ft, ceiling_layer, wind, phenomena, category
     """
-    category = get_flight_category(conditions)
-    visibility_sm = parse_visibility_sm(conditions)
-    ceiling_ft = parse_ceiling_feet(conditions)
-    ceiling_layer = parse_ceiling_layer(conditions)
-    wind = parse_wind_from_metar(conditions)
-    phenomena = parse_weather_phenomena(conditions)
+    return _forecast_details(tokenize_report(conditions))
+
+
+def _forecast_details(tokens: Sequence[WeatherToken]) -> Dict[str, Any]:
+    """Get the forecast details of a change group's condition tokens."""
+    parsed = parse_metar_tokens(tokens)
 
     return {
-        "category": category,
-        "visibility_sm": visibility_sm,
-        "ceiling_ft": ceiling_ft,
-        "ceiling_layer": ceiling_layer,
-        "wind": wind,
-        "phenomena": phenomena,
+        "category": parsed.flight_category,
+        "visibility_sm": parsed.visibility_sm,
+        "ceiling_ft": parsed.ceiling_ft,
+        "ceiling_layer": parsed.ceiling_layer,
+        "wind": parsed.wind,
+        "phenomena": list(parsed.phenomena),
     }
 
 
@@ -148,46 +144,14 @@ def parse_taf_changes(
     if not taf:
         return changes
 
-    # Collect all forecast groups with their positions for document-order processing
-    all_groups = []
-
-    # Parse FM groups: FM251800 ...conditions...
-    fm_pattern = r"FM(\d{6})\s+([^\n]+?)(?=\s+FM|\s+TEMPO|\s+BECMG|\s+PROB|$)"
-    for match in re.finditer(fm_pattern, taf, re.DOTALL):
-        all_groups.append(
-            {
-                "pos": match.start(),
-                "type": "FM",
-                "time_str": match.group(1),
-                "conditions": match.group(2),
-                "updates_baseline": True,
-            }
-        )
-
-    # Parse TEMPO/BECMG groups
-    tempo_becmg_pattern = r"(TEMPO|BECMG)\s+(\d{4})/(\d{4})\s+([^\n]+?)(?=\s+TEMPO|\s+BECMG|\s+FM|\s+PROB|$)"
-    for match in re.finditer(tempo_becmg_pattern, taf, re.DOTALL):
-        all_groups.append(
-            {
-                "pos": match.start(),
-                "type": match.group(1),
-                "time_str": f"{match.group(2)}/{match.group(3)}",
-                "conditions": match.group(4),
-                "updates_baseline": False,
-            }
-        )
-
-    # Sort by position in document (chronological order in TAF)
-    all_groups.sort(key=lambda x: x["pos"])
-
     # Track the "baseline" conditions for trend comparison
     baseline_vis = current_vis
     baseline_ceil = current_ceil
     baseline_cat = current_category
 
-    # Process groups in document order
-    for group in all_groups:
-        details = parse_taf_forecast_details(group["conditions"])
+    # Process FM/TEMPO/BECMG groups in document (chronological) order
+    for group in split_change_groups(tokenize_report(taf)):
+        details = _forecast_details(group.tokens)
         predicted_cat = details["category"]
 
         trend = calculate_trend(
@@ -201,8 +165,8 @@ def parse_taf_changes(
 
         changes.append(
             {
-                "type": group["type"],
-                "time_str": group["time_str"],
+                "type": group.kind,
+                "time_str": group.time_str,
                 "category": predicted_cat,
                 "visibility_sm": details["visibility_sm"],
                 "ceiling_ft": details["ceiling_ft"],
@@ -216,7 +180,7 @@ def parse_taf_changes(
         )
 
         # FM groups update the baseline for subsequent comparisons
-        if group["updates_baseline"]:
+        if group.kind == "FM":
             baseline_vis = details["visibility_sm"]
             baseline_ceil = details["ceiling_ft"]
             baseline_cat = predicted_cat
@@ -22,7 +22,8 @@ from backend.config.constants import PERSISTENT_CACHE_TTL
 from common.paths import get_user_cache_dir, get_weather_cache_file
 
 # Cache size limits
-MAX_WEATHER_CACHE_SIZE = 1000  # Max entries in weather data caches
+# Max entries in weather data caches (room for a bulk ingest of every station)
+MAX_WEATHER_CACHE_SIZE = 10000
 MAX_BLACKLIST_SIZE = 5000  # Max entries in blacklists (404 airports)
 
 # Thread locks for cache synchronization
@@ -40,7 +41,8 @@ _WIND_BLACKLIST: LRUCache = LRUCache(
 )  # Keys are ICAOs, values are True
 
 # Cache for METAR data - LRU with size limit
-# {airport_icao: {'metar': str, 'timestamp': datetime}}
+# {airport_icao: {'metar': str, 'parsed': ParsedMetar, 'timestamp': datetime}}
+# ('parsed' is missing for entries restored from the persistent cache)
 _METAR_DATA_CACHE: LRUCache = LRUCache(maxsize=MAX_WEATHER_CACHE_SIZE)
 _METAR_BLACKLIST: LRUCache = LRUCache(
     maxsize=MAX_BLACKLIST_SIZE
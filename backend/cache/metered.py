@@ -0,0 +1,111 @@
+"""
+TTL + LRU cache with hit, miss, eviction and expiry counters.
+
+Entries expire after a fixed time to live, and the least recently used entry
+is evicted when the cache is full, so the cache stays bounded no matter how
+many distinct keys are written. Expired entries are dropped on every write
+(and by expire()), not only when the same key is read again.
+"""
+
+import time
+from typing import Any, Callable, Dict, Hashable
+
+from cachetools import Cache, TTLCache
+
+
+class MeteredTTLCache(TTLCache):
+    """
+    cachetools.TTLCache that counts how it is used.
+
+    Use lookup() for reads so hits and misses are counted. Like the other
+    cachetools caches this class is not thread-safe; guard it with a lock.
+
+    Counters:
+        hits: lookup() calls that found a live entry
+        misses: lookup() calls that didn't
+        evictions: Live entries dropped because the cache was full
+        expirations: Entries dropped because their time to live passed
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Time to live of each entry in seconds
+            timer: Clock used for expiry
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl, timer=timer)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def lookup(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a live entry, counting the hit or miss.
+
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+
+        Returns:
+            The cached value, or default
+        """
+        try:
+            value = self[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def expire(self, time: Any = None) -> Any:
+        """Drop expired entries (see TTLCache.expire), counting them."""
+        # Count by size: before cachetools 5.5 expire() returns None rather
+        # than the expired items. Cache.__len__ is the raw entry count
+        # (TTLCache.__len__ would call expire() again).
+        size = Cache.__len__(self)
+        expired = super().expire(time)
+        self.expirations += size - Cache.__len__(self)
+        return expired
+
+    def popitem(self) -> Any:
+        """Evict the least recently used entry (called when the cache is full)."""
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def clear(self) -> None:
+        """Drop every entry without counting them as evictions."""
+        # MutableMapping.clear() empties the cache through popitem()
+        evictions = self.evictions
+        super().clear()
+        self.evictions = evictions
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache's counters and size.
+
+        Returns:
+            Dictionary with 'size', 'maxsize', 'ttl', 'hits', 'misses',
+            'hit_rate' (0-1, 0 before any lookups), 'evictions' and
+            'expirations'
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -18,9 +18,79 @@ VATSIM_DATA_URL = "https://data.vatsim.net/v3/vatsim-data.json"
 WIND_CACHE_DURATION = 60
 METAR_CACHE_DURATION = 60
 
+# Stale-while-revalidate: wind/METAR/TAF cache entries past their cache
+# duration (or scheduled refresh time) are still returned at once and
+# refreshed in the background, until they are WEATHER_MAX_STALENESS overdue;
+# older entries are fetched before returning, like a miss. At most
+# WEATHER_REVALIDATE_MAX_PENDING airports are queued for background refresh
+# at a time.
+WEATHER_SERVE_STALE = True
+WEATHER_MAX_STALENESS = 900  # seconds
+WEATHER_REVALIDATE_WORKERS = 4
+WEATHER_REVALIDATE_MAX_PENDING = 256
+
+# Observation-time-aware METAR refresh (backend/data/weather_schedule.py):
+# instead of expiring after METAR_CACHE_DURATION, a cached METAR is refetched
+# when the station's next routine report should be published (its last
+# routine observation + reporting interval + publishing delay). A report
+# that is late is rechecked every METAR_OVERDUE_RETRY seconds for up to
+# METAR_OVERDUE_WINDOW, and IFR/LIFR stations are also polled for SPECIs.
+METAR_SCHEDULE_ENABLED = True
+METAR_PUBLISH_DELAY = 60  # seconds from observation to the first check
+METAR_OVERDUE_RETRY = 30  # seconds
+METAR_OVERDUE_WINDOW = 600  # seconds
+METAR_SPECI_POLL_INTERVAL = 60  # seconds, IFR/LIFR stations only
+# ICAO prefixes of regions assumed to report every 30 minutes until a
+# station's own reports show otherwise (Europe and Russia); others hourly
+METAR_HALF_HOURLY_PREFIXES = ("E", "L", "U")
+METAR_SCHEDULE_MAX_STATIONS = 10000
+
+# Bulk weather ingest (backend/data/weather_bulk.py): aviationweather.gov
+# publishes every current METAR and TAF worldwide as two gzipped CSV files,
+# refreshed about once a minute. WEATHER_BULK_SOURCE is the URL or local
+# directory holding them. The TUI uses them instead of bbox requests when
+# tracking all airports; each file is downloaded at most once per interval.
+WEATHER_BULK_SOURCE = "https://aviationweather.gov/data/cache"
+WEATHER_BULK_METAR_FILE = "metars.cache.csv.gz"
+WEATHER_BULK_TAF_FILE = "tafs.cache.csv.gz"
+WEATHER_BULK_WHEN_TRACKING_ALL = True
+WEATHER_BULK_METAR_INTERVAL = 60  # seconds
+WEATHER_BULK_TAF_INTERVAL = 600  # seconds
+WEATHER_BULK_TIMEOUT = 60  # seconds
+
+# Parsed METARs (ParsedMetar) kept by raw text, least recently used evicted
+PARSED_METAR_CACHE_SIZE = 4096
+
+# Tokenized METAR/TAF texts (tokenize_report) kept by raw text
+REPORT_TOKEN_CACHE_SIZE = 8192
+
+# Nearest-METAR result cache (find_nearest_airport_with_metar and
+# find_nearest_metar_batch): results keyed by rounded position and heading
+# bucket, evicted least recently used beyond the size limit
+NEAREST_METAR_CACHE_SIZE = 5000  # Max cached positions
+NEAREST_METAR_CACHE_TTL = 180  # seconds
+
 # Persistent cache TTL (in seconds) - how long cached data is valid across sessions
 # METAR/TAF data is valid for 15 minutes for persistent cache
 PERSISTENT_CACHE_TTL = 900  # 15 minutes
 
 # Global wind source setting (can be "metar" or "minute")
 WIND_SOURCE = "metar"  # Default to METAR
+
+# METAR request hedging: if aviationweather.gov hasn't answered within the
+# budget, also ask metar.vatsim.net and use whichever METAR arrives first.
+# The budget tracks aviationweather.gov's recent p95 latency, clamped to
+# [MIN, MAX], and uses the default until enough requests have been timed.
+METAR_HEDGE_ENABLED = True
+METAR_HEDGE_PERCENTILE = 95
+METAR_HEDGE_MIN_SAMPLES = 20
+METAR_HEDGE_DEFAULT_BUDGET = 1.5  # seconds
+METAR_HEDGE_MIN_BUDGET = 0.3  # seconds
+METAR_HEDGE_MAX_BUDGET = 4.0  # seconds
+
+# Pipelined refresh: weather and airport names for the airports expected on
+# screen are fetched in parallel with the VATSIM feed download. Once the
+# counts are done, the table is built after at most this many seconds from the
+# start of the refresh; weather still in flight lands in the cache for the
+# next refresh.
+REFRESH_PIPELINE_DEADLINE = 4.0  # seconds
@@ -3,29 +3,54 @@ Main analysis module for VATSIM flights and controller staffing.
 """
 
 import os
-from collections import defaultdict
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+import numpy as np
 
 from backend.cache.manager import load_aircraft_approach_speeds
+from backend.config.constants import (
+    REFRESH_PIPELINE_DEADLINE,
+    WEATHER_BULK_WHEN_TRACKING_ALL,
+)
 from backend.data.loaders import load_unified_airport_data
-from backend.data.vatsim_api import download_vatsim_data, filter_flights_by_airports
+from backend.data.vatsim_api import download_vatsim_data
 from backend.data.weather import (
     get_wind_from_metar,
     get_altimeter_setting,
+    get_cached_wind_and_altimeter,
+    get_weather_age,
     get_weather_for_airports_bbox,
+    revalidate_weather_bbox,
+    refresh_weather_bulk,
+    revalidate_weather_bulk,
 )
 from backend.core.controllers import get_staffed_positions
-from backend.core.calculations import format_eta_display, calculate_eta
-from backend.core.groupings import (
-    load_all_groupings,
-    resolve_grouping_recursively,
-    find_grouping_case_insensitive,
+from backend.core.calculations import format_eta_display
+from backend.core.models import AirportStats, GroupingStats
+from backend.core.analysis_context import (
+    AnalysisContext,
+    get_analysis_context,
 )
-from backend.core.flights import (
-    get_nearest_airport_if_on_ground,
-    is_flight_flying_near_arrival,
+from backend.core.airspace import get_airspace_occupancy
+from backend.core.classification import (
+    AirportTable,
+    FlightClassification,
+    classify_flights,
+    get_ground_positions,
+    tally_classifications,
 )
-from backend.core.models import AirportStats, GroupingStats
+from backend.core.snapshot import FlightSnapshot, get_flight_snapshot
+from backend.core.snapshot_delta import SnapshotColumnMemo
+from backend.utils.timing import (
+    RefreshTimeline,
+    finish_refresh_timeline,
+    start_refresh_timeline,
+)
+from common import logger as debug_logger
 from airport_disambiguator import AirportDisambiguator
 
 
@@ -35,27 +60,206 @@ _script_dir = os.path.dirname(
 )
 
 
-def load_airport_data(
-    unified_data: Dict[str, Dict[str, Any]],
-) -> Dict[str, Dict[str, Any]]:
+# Per-row classifications carried across refreshes via snapshot deltas
+_FLIGHT_CLASSIFICATIONS = SnapshotColumnMemo()
+
+
+# Result of the last analysis with the feed and arguments it was computed from:
+# (vatsim_data, analysis_key, analysis_context, result)
+_LAST_ANALYSIS_LOCK = threading.Lock()
+_LAST_ANALYSIS: Optional[Tuple[Any, tuple, AnalysisContext, tuple]] = None
+
+# Pipelined refresh: weather and names for the airports expected on screen
+# are fetched while the feed downloads. AirportDisambiguator isn't thread-safe,
+# so name lookups are serialized on a single worker.
+_REFRESH_WEATHER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="refresh-weather"
+)
+_REFRESH_NAMES_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="refresh-names"
+)
+
+# Airports expected on screen at the next refresh, with the context they were
+# computed for: (analysis_context, airports)
+_SPECULATIVE_AIRPORTS_LOCK = threading.Lock()
+_SPECULATIVE_AIRPORTS: Tuple[Optional[AnalysisContext], List[str]] = (None, [])
+
+
+def _classify_flight_rows(
+    snapshot: FlightSnapshot,
+    flight_rows: np.ndarray,
+    airport_table: AirportTable,
+    aircraft_approach_speeds: Dict[str, int],
+    max_eta_hours: float,
+) -> FlightClassification:
     """
-    Convert unified airport data to the format expected by the rest of the application.
+    Classify flights for the departure/arrival counters, reusing memoized rows.
+
+    Only rows that changed since the previous snapshot (or were never
+    classified under the current context) are run through classify_flights.
 
     Args:
-        unified_data: Unified airport data dictionary
+        snapshot: Flight snapshot
+        flight_rows: Snapshot rows of the relevant flights
+        airport_table: Columnar coordinates of the tracked airports
+        aircraft_approach_speeds: Aircraft approach speeds for ETA calculation
+        max_eta_hours: Maximum ETA in hours to count as arriving
 
     Returns:
-        Dictionary mapping ICAO codes to coordinate/country data
+        FlightClassification aligned with flight_rows
     """
-    airports = {}
-    for code, info in unified_data.items():
-        if info.get("latitude") is not None and info.get("longitude") is not None:
-            airports[code] = {
-                "latitude": info["latitude"],
-                "longitude": info["longitude"],
-                "country_code": info.get("country", ""),
-            }
-    return airports
+    cached, memoized = _FLIGHT_CLASSIFICATIONS.lookup(flight_rows)
+    count = len(flight_rows)
+    classification = FlightClassification(
+        eta_hours=np.full(count, np.nan),
+        category=np.zeros(count, dtype=np.int8),
+        airport=np.full(count, "", dtype=object),
+    )
+    if memoized:
+        classification.eta_hours[cached] = memoized["eta_hours"]
+        classification.category[cached] = memoized["category"]
+        classification.airport[cached] = memoized["airport"]
+
+    missing = ~cached
+    if missing.any():
+        rows = flight_rows[missing]
+        fresh = classify_flights(
+            snapshot,
+            rows,
+            airport_table,
+            aircraft_approach_speeds,
+            max_eta_hours,
+        )
+        classification.eta_hours[missing] = fresh.eta_hours
+        classification.category[missing] = fresh.category
+        classification.airport[missing] = fresh.airport
+        _FLIGHT_CLASSIFICATIONS.store(
+            rows,
+            {
+                "eta_hours": fresh.eta_hours,
+                "category": fresh.category,
+                "airport": fresh.airport,
+            },
+        )
+    debug_logger.debug(
+        f"Classified {int(missing.sum())} of {count} flights ({int(cached.sum())} reused)"
+    )
+    return classification
+
+
+def _fetch_weather_fields(
+    airport_icaos: List[str],
+    airports_data: Dict[str, Dict[str, Any]],
+    hide_wind: bool,
+    timeline: RefreshTimeline,
+    stage: str,
+    bulk: bool = False,
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Fetch weather for airports and extract their wind and altimeter.
+
+    Airports with a fresh METAR cache entry skip the bbox fetch. Stale
+    entries are used as they are and refreshed by a background bbox fetch,
+    so only airports with nothing servable cached wait for the network.
+    With bulk, the bulk cache files replace the bbox fetches and fields are
+    read from the cache only.
+
+    Args:
+        airport_icaos: Airports to get weather for
+        airports_data: Dictionary of airport data with coordinates
+        hide_wind: Whether the wind column is hidden (wind is left empty)
+        timeline: Refresh timeline to record spans on
+        stage: Span name for the fetch (e.g. "weather_prefetch")
+        bulk: Refresh weather from the worldwide bulk cache files (see
+            refresh_weather_bulk) instead of bbox queries
+
+    Returns:
+        Dictionary mapping ICAO codes to (wind, altimeter) strings
+    """
+    missing = []
+    stale = []
+    for icao in airport_icaos:
+        if get_cached_wind_and_altimeter(icao, revalidate=False) is None:
+            missing.append(icao)
+        else:
+            age = get_weather_age(icao)
+            if age is not None and age[1]:
+                stale.append(icao)
+
+    if stale:
+        if bulk:
+            revalidate_weather_bulk(stale)
+        else:
+            revalidate_weather_bbox(stale, airports_data)
+
+    with timeline.span(stage, items=len(missing)):
+        if missing and bulk:
+            # Downloads the bulk files unless they were read within their interval
+            refresh_weather_bulk()
+        elif missing:
+            # Use bbox-based fetching which populates the METAR cache
+            get_weather_for_airports_bbox(missing, airports_data)
+
+    # Get wind and altimeter from cache (populated by the fetch above)
+    fields = {}
+    with timeline.span(f"{stage}_wind_altimeter", items=len(airport_icaos)):
+        for icao in airport_icaos:
+            if bulk:
+                # Airports missing from the bulk files have no METAR station;
+                # don't fetch them one by one
+                cached = get_cached_wind_and_altimeter(icao, revalidate=False)
+                wind, altimeter = cached if cached else ("", None)
+                if hide_wind:
+                    wind = ""
+            else:
+                wind = "" if hide_wind else get_wind_from_metar(icao)
+                altimeter = get_altimeter_setting(icao)
+            fields[icao] = (wind or "", altimeter or "")
+    return fields
+
+
+def _get_full_names(
+    disambiguator: AirportDisambiguator,
+    airport_icaos: List[str],
+    timeline: RefreshTimeline,
+    stage: str,
+) -> Dict[str, str]:
+    """Batch fetch full airport names, recording a span on the timeline."""
+    with timeline.span(stage, items=len(airport_icaos)):
+        return disambiguator.get_full_names_batch(airport_icaos)
+
+
+def _collect_results(
+    futures: List[Future], deadline: Optional[float], stage: str
+) -> Dict[str, Any]:
+    """
+    Merge the dictionaries returned by futures, waiting until a deadline.
+
+    Args:
+        futures: Futures returning dictionaries
+        deadline: time.monotonic() deadline (None = wait for completion)
+        stage: Name used in log messages
+
+    Returns:
+        Merged results of the futures that finished in time
+    """
+    results: Dict[str, Any] = {}
+    for future in futures:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            results.update(future.result(timeout=timeout))
+        except FutureTimeoutError:
+            debug_logger.debug(f"Refresh pipeline: {stage} missed the deadline")
+        except Exception as e:
+            debug_logger.warning(f"Refresh pipeline: {stage} failed: {e}")
+    return results
+
+
+def _get_speculative_airports(context: AnalysisContext) -> List[str]:
+    """Get the airports expected on screen, if computed for this context."""
+    with _SPECULATIVE_AIRPORTS_LOCK:
+        speculative_context, airports = _SPECULATIVE_AIRPORTS
+    return airports if speculative_context is context else []
 
 
 def analyze_flights_data(
@@ -95,6 +299,8 @@ def analyze_flights_data(
         - unified_airport_data: The unified airport data (for reuse by caller)
         - disambiguator: The disambiguator instance (for reuse by caller)
     """
+    global _LAST_ANALYSIS, _SPECULATIVE_AIRPORTS
+
     # Load unified airport data if not provided
     if unified_airport_data is None:
         print("Loading airport database...")
@@ -113,242 +319,261 @@ def analyze_flights_data(
             unified_data=unified_airport_data,
         )
 
-    all_airports_data = load_airport_data(unified_airport_data)
-
-    # Load all custom groupings and ARTCC groupings for display purposes
-    all_custom_groupings = load_all_groupings(
-        os.path.join(_script_dir, "data", "custom_groupings.json"), unified_airport_data
-    )
-
-    # Determine which groupings to display (for the groupings tab)
-    # Note: The airport_allowlist already contains all airports from groupings
-    display_custom_groupings = {}
-
-    if all_custom_groupings:
-        if groupings_allowlist:
-            # Display specified groupings and their sub-groupings
-            included_group_names = set()
-            resolved_grouping_airports = set()
-
-            # Cache for resolved groupings to avoid redundant resolution
-            resolved_cache: dict = {}
+    timeline = start_refresh_timeline()
 
-            def get_resolved(name: str) -> set:
-                if name not in resolved_cache:
-                    resolved_cache[name] = resolve_grouping_recursively(
-                        name, all_custom_groupings
-                    )
-                return resolved_cache[name]
+    # Tracking every airport: two bulk downloads cover all of them
+    bulk_weather = WEATHER_BULK_WHEN_TRACKING_ALL and not airport_allowlist
 
-            for group_name in groupings_allowlist:
-                actual_name = find_grouping_case_insensitive(
-                    group_name, all_custom_groupings
+    # Airport tables and groupings only change with the configuration, so
+    # they are built once and reused until an allowlist or grouping file changes
+    with timeline.span("analysis_context"):
+        context = get_analysis_context(
+            unified_airport_data, airport_allowlist, groupings_allowlist
+        )
+    all_airports_data = context.all_airports_data
+    airports = context.airports
+    display_custom_groupings = context.display_custom_groupings
+
+    # Start weather and name lookups for the airports the last refresh showed
+    # (plus staffed airports) so they overlap with the feed download
+    refresh_start = time.monotonic()
+    speculative_airports = _get_speculative_airports(context)
+    weather_futures: List[Future] = []
+    name_futures: List[Future] = []
+    if speculative_airports:
+        weather_futures.append(
+            _REFRESH_WEATHER_EXECUTOR.submit(
+                _fetch_weather_fields,
+                speculative_airports,
+                all_airports_data,
+                hide_wind,
+                timeline,
+                "weather_prefetch",
+                bulk_weather,
+            )
+        )
+        if disambiguator:
+            name_futures.append(
+                _REFRESH_NAMES_EXECUTOR.submit(
+                    _get_full_names,
+                    disambiguator,
+                    speculative_airports,
+                    timeline,
+                    "name_prefetch",
                 )
-                if actual_name:
-                    included_group_names.add(actual_name)
-                    # Recursively resolve the grouping to all airports (using cache)
-                    group_airports = get_resolved(actual_name)
-                    resolved_grouping_airports.update(group_airports)
-                else:
-                    print(
-                        f"Warning: Grouping '{group_name}' not found in custom_groupings.json."
-                    )
-
-            # Find all sub-groupings that are subsets of the resolved grouping airports
-            for other_group_name in all_custom_groupings:
-                if other_group_name not in included_group_names:
-                    # Resolve this grouping using cache
-                    resolved_other_airports = get_resolved(other_group_name)
-                    if resolved_other_airports and resolved_other_airports.issubset(
-                        resolved_grouping_airports
-                    ):
-                        included_group_names.add(other_group_name)
-
-            # Populate display groupings
-            for name in included_group_names:
-                display_custom_groupings[name] = all_custom_groupings[name]
-        else:
-            # If no groupings_allowlist, display all groupings
-            display_custom_groupings = all_custom_groupings
-    else:
-        display_custom_groupings = {}
-
-    # Filter airports based on allowlist - simple and clean
-    if airport_allowlist:
-        airports = {
-            icao: data
-            for icao, data in all_airports_data.items()
-            if icao in airport_allowlist
-        }
-    else:
-        airports = all_airports_data
+            )
 
     # Download VATSIM data
     print("Downloading live flight data...")
-    data = download_vatsim_data()
+    with timeline.span("feed_download") as span:
+        data = download_vatsim_data()
+        span.items = len(data.get("pilots", [])) if data else 0
     if not data:
+        # Still profile failed refreshes; wait (up to the deadline) for the
+        # prefetches so their spans are recorded - their results stay cached
+        deadline = refresh_start + REFRESH_PIPELINE_DEADLINE
+        _collect_results(weather_futures, deadline, "weather")
+        _collect_results(name_futures, deadline, "names")
+        finish_refresh_timeline(timeline)
         return None, None, 0, unified_airport_data, disambiguator
 
+    # When the feed hasn't advanced (download_vatsim_data hands back the same
+    # object) and nothing else changed, the previous results are still valid
+    analysis_key = (
+        max_eta_hours,
+        tuple(airport_allowlist) if airport_allowlist else None,
+        tuple(groupings_allowlist) if groupings_allowlist else None,
+        include_all_staffed,
+        hide_wind,
+        include_all_arriving,
+        id(unified_airport_data),
+        id(disambiguator),
+    )
+    with _LAST_ANALYSIS_LOCK:
+        if (
+            _LAST_ANALYSIS is not None
+            and _LAST_ANALYSIS[0] is data
+            and _LAST_ANALYSIS[1] == analysis_key
+            and _LAST_ANALYSIS[2] is context
+        ):
+            debug_logger.debug("VATSIM feed unchanged - reusing previous analysis")
+            finish_refresh_timeline(timeline, reused=True)
+            return _LAST_ANALYSIS[3]
+
     # Extract staffed positions
     print("Analyzing controller positions...")
-    staffed_positions = get_staffed_positions(data, all_airports_data)
+    with timeline.span("controller_extraction") as span:
+        staffed_positions = get_staffed_positions(data, all_airports_data)
+        span.items = len(staffed_positions)
 
     # Load aircraft approach speeds
     aircraft_approach_speeds = load_aircraft_approach_speeds(
         os.path.join(_script_dir, "data", "aircraft_data.csv")
     )
 
-    # Filter flights
+    # Filter flights on the columnar snapshot (built once per feed fetch)
     print(f"Processing flights for {len(airports)} airports...")
-    flights = filter_flights_by_airports(data, airports, airport_allowlist)
-
-    # Count flights on ground at departure and near arrival
-    departure_counts = defaultdict(int)
-    arrival_counts = defaultdict(int)
-    arrival_counts_all = defaultdict(
-        int
-    )  # Track all arrivals regardless of max_eta_hours
-    earliest_arrival_eta = defaultdict(
-        lambda: float("inf")
-    )  # Track earliest ETA per airport
-    arrivals_on_ground = defaultdict(int)  # Track arrivals already on ground
-    arrivals_in_flight = defaultdict(int)  # Track arrivals still in flight
-
-    for flight in flights:
-        # Use .get() for defensive access to flight dictionary fields
-        flight_arrival = flight.get("arrival")
-        flight_departure = flight.get("departure")
-
-        # First, calculate the true earliest ETA for all in-flight arrivals
-        if (
-            flight_arrival
-            and flight_arrival in airports
-            and flight.get("groundspeed", 0) > 40
-        ):
-            _, _, eta_hours = calculate_eta(flight, airports, aircraft_approach_speeds)
-            if eta_hours < earliest_arrival_eta[flight_arrival]:
-                earliest_arrival_eta[flight_arrival] = eta_hours
+    with timeline.span("flight_filtering") as span:
+        snapshot = get_flight_snapshot(data)
+        flight_rows = snapshot.filter_rows(airports, airport_allowlist)
+        span.items = len(flight_rows)
+
+    # Assign every airborne pilot to its TRACON and ARTCC (kept per snapshot
+    # for get_last_airspace_occupancy)
+    with timeline.span("airspace_occupancy", items=len(snapshot)):
+        occupancy = get_airspace_occupancy(snapshot)
+        debug_logger.debug(
+            f"Busiest TRACONs: {occupancy.busiest_tracons(5)}, "
+            f"ARTCCs: {occupancy.busiest_artccs(5)}"
+        )
 
-        nearest_airport_if_on_ground = get_nearest_airport_if_on_ground(
-            flight, airports
+    # Classification only depends on the flight and the airport configuration,
+    # so pilots unchanged since the previous snapshot reuse their last result
+    context_key = (
+        frozenset(airport_allowlist) if airport_allowlist else None,
+        max_eta_hours,
+        id(unified_airport_data),
+        id(aircraft_approach_speeds),
+    )
+    with timeline.span("classification", items=len(flight_rows)):
+        # Publish the on-ground airports of every pilot for the flight board
+        # and flight info screens, even when every row below is memoized
+        get_ground_positions(snapshot, context.airport_table)
+        delta = _FLIGHT_CLASSIFICATIONS.advance(snapshot, context_key)
+        debug_logger.debug(f"Snapshot delta: {delta.summary()}")
+        classification = _classify_flight_rows(
+            snapshot,
+            flight_rows,
+            context.airport_table,
+            aircraft_approach_speeds,
+            max_eta_hours,
         )
-        if flight_departure and nearest_airport_if_on_ground == flight_departure:
-            # Count as departure if on ground at departure airport
-            departure_counts[flight_departure] += 1
-        elif flight_arrival and nearest_airport_if_on_ground == flight_arrival:
-            # Count as arrival if on ground at arrival airport
-            arrival_counts[flight_arrival] += 1
-            arrival_counts_all[flight_arrival] += 1
-            arrivals_on_ground[flight_arrival] += 1
-        elif (
-            not flight_departure and not flight_arrival and nearest_airport_if_on_ground
-        ):
-            # For flights on ground without flight plans, count them as a departure at the nearest airport
-            departure_counts[nearest_airport_if_on_ground] += 1
-        elif is_flight_flying_near_arrival(flight, airports, max_eta_hours):
-            # Count as arrival if within the specified ETA hours of arrival airport
-            arrival_counts[flight_arrival] += 1
-            arrival_counts_all[flight_arrival] += 1
-            arrivals_in_flight[flight_arrival] += 1
-        elif flight_arrival and flight_arrival in airports:
-            # Flight has arrival filed but isn't on ground at arrival and isn't flying nearby
-            # This catches flights on ground at departure that haven't departed yet, or in-flight beyond max_eta_hours
-            arrival_counts_all[flight_arrival] += 1
+
+        # Count flights on ground at departure and near arrival, and track the
+        # earliest ETA per airport over all in-flight arrivals
+        counters = tally_classifications(classification, snapshot.arrival[flight_rows])
+    departure_counts = counters["departure_counts"]
+    arrival_counts = counters["arrival_counts"]
+    # All arrivals regardless of max_eta_hours
+    arrival_counts_all = counters["arrival_counts_all"]
+    earliest_arrival_eta = counters["earliest_arrival_eta"]
+    arrivals_on_ground = counters["arrivals_on_ground"]
+    arrivals_in_flight = counters["arrivals_in_flight"]
 
     # First pass: determine which airports will be displayed
     # (those with flights or that are staffed when include_all_staffed is True)
-    airports_to_display = []
-    for airport in airports:
-        departing = departure_counts.get(airport, 0)
-        arriving = arrival_counts.get(airport, 0)
-        arriving_all = arrival_counts_all.get(airport, 0)
-
-        current_staffed_positions = staffed_positions.get(airport, [])
-        staffed_pos_display = ""
-
-        # Check if airport has no tower (NON-ATCT)
-        airport_info = unified_airport_data.get(airport, {})
-        tower_type = airport_info.get("tower_type", "")
-
-        if tower_type == "NON-ATCT":
-            # For non-towered airports, show "N/A" instead of staffed positions
-            staffed_pos_display = "N/A"
-        elif (
-            "ATIS" in current_staffed_positions and len(current_staffed_positions) == 1
-        ):
-            staffed_pos_display = "TOP-DOWN"
-        elif current_staffed_positions:
-            # Remove ATIS from display if other positions are present
-            # Make a copy to avoid mutating the original list
-            display_positions = [
-                pos for pos in current_staffed_positions if pos != "ATIS"
-            ]
-            # Join the already sorted list of positions
-            staffed_pos_display = ", ".join(display_positions)
-
-        total_flights = departing + arriving
-        eta_display = format_eta_display(
-            earliest_arrival_eta.get(airport, float("inf")),
-            arrivals_in_flight.get(airport, 0),
-            arrivals_on_ground.get(airport, 0),
-        )
-
-        # Include airport if it has flights, or if it's staffed and we want to include staffed zero-plane airports,
-        # or if it has any arrivals and include_all_arriving is enabled
-        # Note: "N/A" doesn't count as staffing (it means the airport has no tower)
-        if (
-            total_flights > 0
-            or (
-                staffed_pos_display
-                and staffed_pos_display != "N/A"
-                and include_all_staffed
-            )
-            or (arriving_all > 0 and include_all_arriving)
-        ):
-            airports_to_display.append(
-                {
-                    "icao": airport,
-                    "departing": departing,
-                    "arriving": arriving,
-                    "arriving_all": arriving_all,
-                    "total_flights": total_flights,
-                    "eta_display": eta_display,
-                    "staffed_pos_display": staffed_pos_display,
-                }
+    with timeline.span("airport_display", items=len(airports)):
+        airports_to_display = []
+        for airport in airports:
+            departing = departure_counts.get(airport, 0)
+            arriving = arrival_counts.get(airport, 0)
+            arriving_all = arrival_counts_all.get(airport, 0)
+
+            current_staffed_positions = staffed_positions.get(airport, [])
+            staffed_pos_display = ""
+
+            # Check if airport has no tower (NON-ATCT)
+            airport_info = unified_airport_data.get(airport, {})
+            tower_type = airport_info.get("tower_type", "")
+
+            if tower_type == "NON-ATCT":
+                # For non-towered airports, show "N/A" instead of staffed positions
+                staffed_pos_display = "N/A"
+            elif (
+                "ATIS" in current_staffed_positions
+                and len(current_staffed_positions) == 1
+            ):
+                staffed_pos_display = "TOP-DOWN"
+            elif current_staffed_positions:
+                # Remove ATIS from display if other positions are present
+                # Make a copy to avoid mutating the original list
+                display_positions = [
+                    pos for pos in current_staffed_positions if pos != "ATIS"
+                ]
+                # Join the already sorted list of positions
+                staffed_pos_display = ", ".join(display_positions)
+
+            total_flights = departing + arriving
+            eta_display = format_eta_display(
+                earliest_arrival_eta.get(airport, float("inf")),
+                arrivals_in_flight.get(airport, 0),
+                arrivals_on_ground.get(airport, 0),
             )
 
+            # Include airport if it has flights, or if it's staffed and we want to include staffed zero-plane airports,
+            # or if it has any arrivals and include_all_arriving is enabled
+            # Note: "N/A" doesn't count as staffing (it means the airport has no tower)
+            if (
+                total_flights > 0
+                or (
+                    staffed_pos_display
+                    and staffed_pos_display != "N/A"
+                    and include_all_staffed
+                )
+                or (arriving_all > 0 and include_all_arriving)
+            ):
+                airports_to_display.append(
+                    {
+                        "icao": airport,
+                        "departing": departing,
+                        "arriving": arriving,
+                        "arriving_all": arriving_all,
+                        "total_flights": total_flights,
+                        "eta_display": eta_display,
+                        "staffed_pos_display": staffed_pos_display,
+                    }
+                )
+
     # Fetch weather data using bbox API (more efficient than per-airport fetching)
-    # This populates the METAR cache so wind and altimeter can be retrieved from cache
+    # for displayed airports the speculative prefetch didn't cover
     airports_to_fetch = [apt["icao"] for apt in airports_to_display]
-    if airports_to_fetch:
+    speculated = set(speculative_airports)
+    missing_airports = [icao for icao in airports_to_fetch if icao not in speculated]
+    if missing_airports:
         print(
-            f"Fetching weather data for {len(airports_to_fetch)} active airports using bbox API..."
+            f"Fetching weather data for {len(missing_airports)} active airports using bbox API..."
         )
-        # Use bbox-based fetching which populates the METAR cache
-        get_weather_for_airports_bbox(airports_to_fetch, all_airports_data)
+        weather_futures.append(
+            _REFRESH_WEATHER_EXECUTOR.submit(
+                _fetch_weather_fields,
+                missing_airports,
+                all_airports_data,
+                hide_wind,
+                timeline,
+                "weather_fetch",
+                bulk_weather,
+            )
+        )
+        if disambiguator:
+            print(f"Processing airport names for {len(missing_airports)} airports...")
+            name_futures.append(
+                _REFRESH_NAMES_EXECUTOR.submit(
+                    _get_full_names,
+                    disambiguator,
+                    missing_airports,
+                    timeline,
+                    "name_disambiguation",
+                )
+            )
 
-    # Get wind info from cache (populated by bbox fetch above)
-    # Skip if hide_wind is enabled
-    wind_info_batch = {}
-    if airports_to_fetch and not hide_wind:
-        for icao in airports_to_fetch:
-            wind_info_batch[icao] = get_wind_from_metar(icao)
+    # Wait for weather and names, but not past the deadline once a previous
+    # refresh has populated the caches; late results land in the caches for
+    # the next refresh and missing values fall back to cached weather/ICAO
+    deadline = (
+        refresh_start + REFRESH_PIPELINE_DEADLINE if speculative_airports else None
+    )
+    with timeline.span("pipeline_wait", items=len(airports_to_fetch)):
+        weather_fields = _collect_results(weather_futures, deadline, "weather")
+        pretty_names_batch = _collect_results(name_futures, deadline, "names")
 
-    # Get altimeter settings from cache (populated by bbox fetch above)
+    wind_info_batch = {}
     altimeter_batch = {}
-    if airports_to_fetch:
-        for icao in airports_to_fetch:
-            result = get_altimeter_setting(icao)
-            altimeter_batch[icao] = result if result else ""
-
-    if airports_to_fetch:
-        print(f"Processing airport names for {len(airports_to_fetch)} airports...")
-    # Batch fetch full names (no length limit) for airports that will be displayed (processes locations efficiently)
-    pretty_names_batch = (
-        disambiguator.get_full_names_batch(airports_to_fetch)
-        if disambiguator and airports_to_fetch
-        else {}
-    )
+    for icao in airports_to_fetch:
+        fields = weather_fields.get(icao) or get_cached_wind_and_altimeter(icao)
+        wind, altimeter = fields if fields else ("", "")
+        if not hide_wind:
+            wind_info_batch[icao] = wind
+        altimeter_batch[icao] = altimeter or ""
 
     # Second pass: build airport_data with fetched information
     airport_data = []
@@ -386,66 +611,74 @@ def analyze_flights_data(
     # Sort by total count descending, with arrivals (independent of ETA) as tie-breaker, then alphabetically by ICAO
     airport_data.sort(key=lambda x: (-x.total, -x.arrivals_all, x.icao))
 
-    # Process custom groupings data
+    # Process custom groupings data: every counter is aggregated over all
+    # groupings at once through the grouping-membership matrix
     grouped_data = []
-    if display_custom_groupings:
-        for group_name, _group_airports in display_custom_groupings.items():
-            # Resolve the grouping to actual airports (handles nested groupings)
-            resolved_airports = resolve_grouping_recursively(
-                group_name, all_custom_groupings
-            )
-
-            group_departing = sum(
-                departure_counts.get(ap_icao, 0) for ap_icao in resolved_airports
-            )
-            group_arriving = sum(
-                arrival_counts.get(ap_icao, 0) for ap_icao in resolved_airports
-            )
-            group_arriving_all = sum(
-                arrival_counts_all.get(ap_icao, 0) for ap_icao in resolved_airports
-            )
+    membership = context.grouping_membership
+    with timeline.span("grouping_aggregation", items=len(membership)):
+        if display_custom_groupings and len(membership):
+            group_departing = membership.sum(departure_counts)
+            group_arriving = membership.sum(arrival_counts)
+            group_arriving_all = membership.sum(arrival_counts_all)
+            group_arrivals_in_flight = membership.sum(arrivals_in_flight)
+            group_arrivals_on_ground = membership.sum(arrivals_on_ground)
+            # Earliest ETA among all airports in each grouping
+            group_earliest_eta = membership.min(earliest_arrival_eta)
             group_total = group_departing + group_arriving
 
-            # Find the earliest ETA among all airports in this grouping
-            group_earliest_eta = float("inf")
-            group_arrivals_in_flight = sum(
-                arrivals_in_flight.get(ap_icao, 0) for ap_icao in resolved_airports
-            )
-            group_arrivals_on_ground = sum(
-                arrivals_on_ground.get(ap_icao, 0) for ap_icao in resolved_airports
-            )
-
-            for ap_icao in resolved_airports:
-                if ap_icao in earliest_arrival_eta:
-                    if earliest_arrival_eta[ap_icao] < group_earliest_eta:
-                        group_earliest_eta = earliest_arrival_eta[ap_icao]
-
-            group_eta_display = format_eta_display(
-                group_earliest_eta, group_arrivals_in_flight, group_arrivals_on_ground
-            )
+            # Include groupings with activity, or with any arrivals when include_all_arriving is set
+            active = group_total > 0
+            if include_all_arriving:
+                active |= group_arriving_all > 0
 
-            # Collect staffed airports in this grouping (exclude airports with only ATIS)
-            staffed_airports = [
+            # Staffed airports (excluding airports with only ATIS)
+            staffed_airports_set = {
                 ap_icao
-                for ap_icao in resolved_airports
-                if ap_icao in staffed_positions
-                and any(pos != "ATIS" for pos in staffed_positions[ap_icao])
-            ]
-            staffed_display = ", ".join(staffed_airports) if staffed_airports else ""
+                for ap_icao, positions in staffed_positions.items()
+                if any(pos != "ATIS" for pos in positions)
+            }
+            has_staffed = membership.rows_with_any(staffed_airports_set)
+
+            for row in np.flatnonzero(active):
+                staffed_display = ""
+                if has_staffed[row]:
+                    staffed_display = ", ".join(
+                        membership.members_where(row, staffed_airports_set.__contains__)
+                    )
 
-            # Include groupings with activity, or with any arrivals when include_all_arriving is set
-            if group_total > 0 or (group_arriving_all > 0 and include_all_arriving):
                 stats = GroupingStats(
-                    name=group_name,
-                    total=group_total,
-                    departures=group_departing,
-                    arrivals=group_arriving,
-                    arrivals_all=group_arriving_all,
-                    next_eta=group_eta_display,
+                    name=membership.names[row],
+                    total=int(group_total[row]),
+                    departures=int(group_departing[row]),
+                    arrivals=int(group_arriving[row]),
+                    arrivals_all=int(group_arriving_all[row]),
+                    next_eta=format_eta_display(
+                        float(group_earliest_eta[row]),
+                        int(group_arrivals_in_flight[row]),
+                        int(group_arrivals_on_ground[row]),
+                    ),
                     staffed=staffed_display,
                 )
                 grouped_data.append(stats)
 
-        grouped_data.sort(key=lambda x: x.total, reverse=True)
+            grouped_data.sort(key=lambda x: x.total, reverse=True)
 
-    return airport_data, grouped_data, len(flights), unified_airport_data, disambiguator
+    result = (
+        airport_data,
+        grouped_data,
+        len(flight_rows),
+        unified_airport_data,
+        disambiguator,
+    )
+    with _LAST_ANALYSIS_LOCK:
+        _LAST_ANALYSIS = (data, analysis_key, context, result)
+
+    # Airports to prefetch at the next refresh: the ones shown now plus every
+    # staffed tracked airport
+    expected_airports: Set[str] = set(airports_to_fetch)
+    expected_airports.update(icao for icao in staffed_positions if icao in airports)
+    with _SPECULATIVE_AIRPORTS_LOCK:
+        _SPECULATIVE_AIRPORTS = (context, sorted(expected_airports))
+
+    finish_refresh_timeline(timeline)
+    return result
@@ -0,0 +1,267 @@
+"""
+Static structures derived from the analysis configuration.
+
+Converting the unified airport data, loading and merging the grouping files,
+resolving nested groupings and selecting the display groupings only depend on
+the configuration (airport allowlist, groupings allowlist, grouping files), not
+on the live feed. AnalysisContext holds those structures so the refresh loop
+rebuilds them only when the configuration or a grouping file changes.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from backend.core.classification import AirportTable
+from backend.core.grouping_matrix import GroupingMembership
+from backend.core.groupings import (
+    PRESET_GROUPINGS_DIR,
+    find_grouping_case_insensitive,
+    load_all_groupings,
+    resolve_grouping_recursively,
+)
+from common import logger as debug_logger
+from common.paths import get_custom_groupings_file, get_project_groupings_file
+
+
+def load_airport_data(
+    unified_data: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Convert unified airport data to the format expected by the rest of the application.
+
+    Args:
+        unified_data: Unified airport data dictionary
+
+    Returns:
+        Dictionary mapping ICAO codes to coordinate/country data
+    """
+    airports = {}
+    for code, info in unified_data.items():
+        if info.get("latitude") is not None and info.get("longitude") is not None:
+            airports[code] = {
+                "latitude": info["latitude"],
+                "longitude": info["longitude"],
+                "country_code": info.get("country", ""),
+            }
+    return airports
+
+
+def _grouping_files_fingerprint() -> Tuple[Tuple[str, Optional[int], int], ...]:
+    """
+    Get (path, mtime_ns, size) for every file load_all_groupings reads.
+
+    Missing files are included with a None mtime so creating one is noticed.
+    """
+    paths: List[Path] = [get_project_groupings_file(), get_custom_groupings_file()]
+    if PRESET_GROUPINGS_DIR.exists():
+        paths.extend(sorted(PRESET_GROUPINGS_DIR.glob("*.json")))
+
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((str(path), None, 0))
+    return tuple(fingerprint)
+
+
+@dataclass
+class AnalysisContext:
+    """
+    Configuration-derived structures reused across refreshes.
+
+    Attributes:
+        unified_airport_data: The unified airport data the context was built from
+        all_airports_data: ICAO -> coordinate/country data for all airports
+        airports: The tracked subset of all_airports_data (allowlist applied)
+        airport_table: Columnar coordinates of the tracked airports
+        all_custom_groupings: Merged ARTCC, preset and custom groupings
+        display_custom_groupings: Groupings shown in the groupings tab
+        resolved_groupings: Display grouping name -> resolved airport ICAOs
+        grouping_membership: Sparse display-grouping x airport membership matrix
+        key: Configuration key the context was built for
+    """
+
+    unified_airport_data: Dict[str, Dict[str, Any]]
+    all_airports_data: Dict[str, Dict[str, Any]]
+    airports: Dict[str, Dict[str, Any]]
+    airport_table: AirportTable
+    all_custom_groupings: Dict[str, List[str]]
+    display_custom_groupings: Dict[str, List[str]]
+    resolved_groupings: Dict[str, Set[str]]
+    grouping_membership: GroupingMembership
+    key: tuple = field(repr=False)
+
+
+def _select_display_groupings(
+    all_custom_groupings: Dict[str, List[str]],
+    groupings_allowlist: Optional[List[str]],
+    resolved_cache: Dict[str, Set[str]],
+) -> Dict[str, List[str]]:
+    """
+    Determine which groupings to display in the groupings tab.
+
+    With an allowlist, the named groupings are shown along with every other
+    grouping whose airports are a subset of theirs.
+
+    Args:
+        all_custom_groupings: All available groupings
+        groupings_allowlist: Grouping names to display (None = all)
+        resolved_cache: Cache of resolved groupings, filled in as a side effect
+
+    Returns:
+        Dictionary of groupings to display
+    """
+    if not all_custom_groupings:
+        return {}
+    if not groupings_allowlist:
+        return all_custom_groupings
+
+    def get_resolved(name: str) -> Set[str]:
+        if name not in resolved_cache:
+            resolved_cache[name] = resolve_grouping_recursively(
+                name, all_custom_groupings
+            )
+        return resolved_cache[name]
+
+    included_group_names = set()
+    resolved_grouping_airports: Set[str] = set()
+
+    for group_name in groupings_allowlist:
+        actual_name = find_grouping_case_insensitive(group_name, all_custom_groupings)
+        if actual_name:
+            included_group_names.add(actual_name)
+            resolved_grouping_airports.update(get_resolved(actual_name))
+        else:
+            print(
+                f"Warning: Grouping '{group_name}' not found in custom_groupings.json."
+            )
+
+    # Find all sub-groupings that are subsets of the resolved grouping airports
+    for other_group_name in all_custom_groupings:
+        if other_group_name not in included_group_names:
+            resolved_other_airports = get_resolved(other_group_name)
+            if resolved_other_airports and resolved_other_airports.issubset(
+                resolved_grouping_airports
+            ):
+                included_group_names.add(other_group_name)
+
+    return {name: all_custom_groupings[name] for name in included_group_names}
+
+
+def build_analysis_context(
+    unified_airport_data: Dict[str, Dict[str, Any]],
+    airport_allowlist: Optional[List[str]],
+    groupings_allowlist: Optional[List[str]],
+    key: tuple = (),
+) -> AnalysisContext:
+    """
+    Build the configuration-derived structures for analyze_flights_data.
+
+    Args:
+        unified_airport_data: Unified airport data dictionary
+        airport_allowlist: Airport ICAOs to track (None = all airports)
+        groupings_allowlist: Grouping names to display (None = all groupings)
+        key: Configuration key to record on the context
+
+    Returns:
+        A new AnalysisContext
+    """
+    all_airports_data = load_airport_data(unified_airport_data)
+
+    # Load all custom groupings and ARTCC groupings for display purposes
+    all_custom_groupings = load_all_groupings(None, unified_airport_data)
+
+    resolved_cache: Dict[str, Set[str]] = {}
+    display_custom_groupings = _select_display_groupings(
+        all_custom_groupings, groupings_allowlist, resolved_cache
+    )
+    resolved_groupings = {
+        name: resolved_cache[name]
+        if name in resolved_cache
+        else resolve_grouping_recursively(name, all_custom_groupings)
+        for name in display_custom_groupings
+    }
+
+    if airport_allowlist:
+        allowed = set(airport_allowlist)
+        airports = {
+            icao: data for icao, data in all_airports_data.items() if icao in allowed
+        }
+    else:
+        airports = all_airports_data
+
+    return AnalysisContext(
+        unified_airport_data=unified_airport_data,
+        all_airports_data=all_airports_data,
+        airports=airports,
+        airport_table=AirportTable(airports),
+        all_custom_groupings=all_custom_groupings,
+        display_custom_groupings=display_custom_groupings,
+        resolved_groupings=resolved_groupings,
+        grouping_membership=GroupingMembership(resolved_groupings),
+        key=key,
+    )
+
+
+# Context for the most recent configuration
+_ANALYSIS_CONTEXT: Optional[AnalysisContext] = None
+_ANALYSIS_CONTEXT_LOCK = threading.Lock()
+
+
+def get_analysis_context(
+    unified_airport_data: Dict[str, Dict[str, Any]],
+    airport_allowlist: Optional[List[str]] = None,
+    groupings_allowlist: Optional[List[str]] = None,
+) -> AnalysisContext:
+    """
+    Get the AnalysisContext for a configuration, rebuilding it when stale.
+
+    The context is rebuilt when the unified airport data object, either
+    allowlist, or any grouping file's modification time or size changes.
+    Checking for changes costs a handful of stat() calls.
+
+    This function is thread-safe.
+
+    Args:
+        unified_airport_data: Unified airport data dictionary
+        airport_allowlist: Airport ICAOs to track (None = all airports)
+        groupings_allowlist: Grouping names to display (None = all groupings)
+
+    Returns:
+        The cached or newly built AnalysisContext
+    """
+    global _ANALYSIS_CONTEXT
+
+    key = (
+        tuple(airport_allowlist) if airport_allowlist else None,
+        tuple(groupings_allowlist) if groupings_allowlist else None,
+        _grouping_files_fingerprint(),
+    )
+
+    with _ANALYSIS_CONTEXT_LOCK:
+        context = _ANALYSIS_CONTEXT
+        if (
+            context is not None
+            and context.unified_airport_data is unified_airport_data
+            and context.key == key
+        ):
+            return context
+
+        debug_logger.debug("Building analysis context (configuration changed)")
+        context = build_analysis_context(
+            unified_airport_data, airport_allowlist, groupings_allowlist, key
+        )
+        _ANALYSIS_CONTEXT = context
+        return context
+
+
+def invalidate_analysis_context() -> None:
+    """Drop the cached AnalysisContext so the next analysis rebuilds it."""
+    global _ANALYSIS_CONTEXT
+
+    with _ANALYSIS_CONTEXT_LOCK:
+        _ANALYSIS_CONTEXT = None
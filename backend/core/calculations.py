@@ -6,6 +6,11 @@ import math
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, Tuple
 
+import numpy as np
+
+# Radius of earth in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
 
 def haversine_distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -45,10 +50,40 @@ def haversine_distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) ->
         + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
     )
     c = 2 * math.asin(math.sqrt(a))
-    r = 3440.065  # Radius of earth in nautical miles
+    r = EARTH_RADIUS_NM
     return c * r
 
 
+def haversine_distance_nm_array(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized haversine_distance_nm (same formula and earth radius).
+
+    Inputs are broadcast against each other and are not range-checked.
+
+    Args:
+        lat1, lon1: Coordinates of the first points in decimal degrees
+        lat2, lon2: Coordinates of the second points in decimal degrees
+
+    Returns:
+        Array of distances in nautical miles (NaN where any input is NaN)
+    """
+    lat1_rad = np.radians(lat1)
+    lon1_rad = np.radians(lon1)
+    lat2_rad = np.radians(lat2)
+    lon2_rad = np.radians(lon2)
+
+    dlon = lon2_rad - lon1_rad
+    dlat = lat2_rad - lat1_rad
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    )
+    c = 2 * np.arcsin(np.sqrt(a))
+    return c * EARTH_RADIUS_NM
+
+
 def format_eta_display(
     eta_hours: float, arrivals_in_flight_count: int, arrivals_on_ground_count: int
 ) -> str:
@@ -193,6 +228,31 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     return (math.degrees(bearing) + 360) % 360
 
 
+def calculate_bearing_array(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized calculate_bearing (initial bearing from points 1 to points 2).
+
+    Args:
+        lat1, lon1: Coordinates of the first points in decimal degrees
+        lat2, lon2: Coordinates of the second points in decimal degrees
+
+    Returns:
+        Array of bearings in degrees (0-360, where 0=N, 90=E, 180=S, 270=W)
+    """
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    delta_lon = np.radians(np.asarray(lon2) - np.asarray(lon1))
+
+    x = np.sin(delta_lon) * np.cos(lat2_rad)
+    y = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * np.cos(
+        lat2_rad
+    ) * np.cos(delta_lon)
+
+    return (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+
 def bearing_to_compass(bearing: float) -> str:
     """
     Convert bearing in degrees to compass direction.
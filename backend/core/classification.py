@@ -0,0 +1,477 @@
+"""
+Batch arrival/departure classification of flights for the airport counters.
+
+Vectorized equivalent of running calculate_eta, get_nearest_airport_if_on_ground
+and is_flight_flying_near_arrival per flight: distances, descent-adjusted ETAs
+and on-ground nearest airports are computed for the whole flight table at once
+with NumPy, then tallied into the per-airport counters analyze_flights_data
+reports. The on-ground airports are kept per snapshot (GroundPositions) so
+other screens can read them instead of repeating the spatial query.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.calculations import haversine_distance_nm_array
+from backend.core.snapshot import FlightSnapshot
+from backend.core.spatial import get_airport_spatial_index
+
+# Flight categories (same precedence as the original per-flight if/elif chain)
+CATEGORY_NONE = 0
+CATEGORY_DEPARTING = 1  # On ground at departure (or nearest airport if no plan)
+CATEGORY_ARRIVED = 2  # On ground at arrival
+CATEGORY_ARRIVING = 3  # In flight within max_eta_hours of arrival
+CATEGORY_FILED = 4  # Arrival filed but neither on ground there nor flying nearby
+
+# Thresholds used by the per-flight helpers
+ON_GROUND_MAX_DISTANCE_NM = 6.0
+ON_GROUND_MAX_GROUNDSPEED = 40.0
+IN_FLIGHT_MIN_GROUNDSPEED = 40.0
+
+# ETA model (see calculate_eta)
+APPROACH_AGL = 2500  # Target altitude AGL for approach (feet)
+DESCENT_GRADIENT = 3.0  # nm per 1000 feet of altitude loss
+FINAL_APPROACH_DISTANCE = 5.0  # nm flown at approach speed
+
+
+class AirportTable:
+    """
+    Columnar coordinates of a set of tracked airports.
+
+    Attributes:
+        codes: Object array of ICAO codes, in the dict's order
+        latitude, longitude, elevation: float64 arrays (elevation 0 if unknown)
+        index: ICAO -> row
+    """
+
+    def __init__(self, airports: Dict[str, Dict[str, Any]]):
+        """
+        Build the table from an airports dict (ICAO -> data with lat/lon).
+
+        Airports without coordinates are left out.
+        """
+        codes: List[str] = []
+        lats: List[float] = []
+        lons: List[float] = []
+        elevations: List[float] = []
+        for icao, data in airports.items():
+            lat = data.get("latitude")
+            lon = data.get("longitude")
+            if lat is None or lon is None:
+                continue
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                continue
+            codes.append(icao)
+            lats.append(lat)
+            lons.append(lon)
+            elevations.append(data.get("elevation", 0) or 0)
+
+        self.codes = np.array(codes, dtype=object)
+        self.latitude = np.array(lats, dtype=np.float64)
+        self.longitude = np.array(lons, dtype=np.float64)
+        self.elevation = np.array(elevations, dtype=np.float64)
+        self.index: Dict[str, int] = {icao: row for row, icao in enumerate(codes)}
+        self._airports = airports
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def built_from_all(self, airports_data: Dict[str, Dict[str, Any]]) -> bool:
+        """Check whether the table was built from all of airports_data."""
+        return all(
+            icao in self._airports
+            for icao, data in airports_data.items()
+            if data.get("latitude") is not None and data.get("longitude") is not None
+        )
+
+    def lookup(self, column: np.ndarray) -> np.ndarray:
+        """
+        Map a string column of ICAO codes to table rows.
+
+        Args:
+            column: Object array of ICAO codes ('' for missing)
+
+        Returns:
+            int64 array of table rows, -1 where the code isn't tracked
+        """
+        if len(column) == 0:
+            return np.zeros(0, dtype=np.int64)
+        uniques, inverse = np.unique(column, return_inverse=True)
+        unique_rows = np.fromiter(
+            (self.index.get(code, -1) for code in uniques),
+            dtype=np.int64,
+            count=len(uniques),
+        )
+        return unique_rows[inverse.reshape(-1)]
+
+    def nearest_within(
+        self, lats: np.ndarray, lons: np.ndarray, max_distance_nm: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest airport within a distance of each point.
+
+        Args:
+            lats, lons: Query coordinates in decimal degrees (finite)
+            max_distance_nm: Maximum great circle distance
+
+        Returns:
+            Tuple of (rows, distances): int64 table rows (-1 where no airport
+            is close enough) and distances in nautical miles (inf where -1)
+        """
+        spatial_index = get_airport_spatial_index(self._airports)
+        index_rows, distances = spatial_index.query_nearest(lats, lons, max_distance_nm)
+        # Map the shared index's rows to table rows by ICAO code, so a
+        # difference in filtering or order between the two (or a stale
+        # index) can't attribute a point to the wrong airport
+        rows = np.full(len(index_rows), -1, dtype=np.int64)
+        found = index_rows >= 0
+        rows[found] = self.lookup(spatial_index.codes[index_rows[found]])
+        distances = np.where(rows >= 0, distances, np.inf)
+        return rows, distances
+
+
+@dataclass
+class GroundPositions:
+    """
+    Nearest tracked airport of every slow pilot in a snapshot.
+
+    The on-ground test of get_nearest_airport_if_on_ground (groundspeed at
+    most ON_GROUND_MAX_GROUNDSPEED, within ON_GROUND_MAX_DISTANCE_NM of an
+    airport), run once per snapshot for all pilots so the counters, the flight
+    board and the flight info screen share one spatial query.
+
+    Attributes:
+        snapshot: Snapshot the columns are aligned with
+        airports: Airports that were searched
+        nearest_airport: ICAO code per row ('' if not on ground at any of them)
+        distance_nm: Distance to nearest_airport per row (NaN where '')
+        on_ground: True where nearest_airport is set
+    """
+
+    snapshot: FlightSnapshot
+    airports: AirportTable
+    nearest_airport: np.ndarray
+    distance_nm: np.ndarray
+    on_ground: np.ndarray
+
+    def covers(self, icaos: Iterable[str]) -> bool:
+        """Check whether every airport in icaos was searched."""
+        return all(icao in self.airports.index for icao in icaos)
+
+    def covers_all(self, airports_data: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Check whether every airport with coordinates in airports_data was
+        searched, so nearest_airport is also the nearest of airports_data.
+        """
+        return self.airports.built_from_all(airports_data)
+
+    def airport_for(self, flight: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the airport a flight is on the ground at.
+
+        Args:
+            flight: Pilot or flight dict with callsign, latitude and longitude
+
+        Returns:
+            ICAO code, or None if the flight isn't on the ground at a searched
+            airport or its position differs from the snapshot's
+        """
+        row = self.snapshot.row_of(flight.get("callsign") or "")
+        if row is None or not self.on_ground[row]:
+            return None
+        if (
+            flight.get("latitude") != self.snapshot.latitude[row]
+            or flight.get("longitude") != self.snapshot.longitude[row]
+        ):
+            return None
+        return self.nearest_airport[row]
+
+
+def compute_ground_positions(
+    snapshot: FlightSnapshot, airports: AirportTable
+) -> GroundPositions:
+    """
+    Find the airport every slow pilot of a snapshot is on the ground at.
+
+    Args:
+        snapshot: Flight snapshot
+        airports: Airports to search
+
+    Returns:
+        GroundPositions for the snapshot
+    """
+    count = len(snapshot)
+    lat = snapshot.latitude
+    lon = snapshot.longitude
+    with np.errstate(invalid="ignore"):
+        slow = (
+            np.isfinite(lat)
+            & np.isfinite(lon)
+            & (np.abs(lat) <= 90)
+            & (np.abs(lon) <= 180)
+            & (snapshot.groundspeed <= ON_GROUND_MAX_GROUNDSPEED)
+        )
+    slow_rows = np.flatnonzero(slow)
+    nearest_row = np.full(count, -1, dtype=np.int64)
+    distance_nm = np.full(count, np.nan)
+    if len(slow_rows) and len(airports):
+        rows, distances = airports.nearest_within(
+            lat[slow_rows], lon[slow_rows], ON_GROUND_MAX_DISTANCE_NM
+        )
+        nearest_row[slow_rows] = rows
+        found = rows >= 0
+        distance_nm[slow_rows[found]] = distances[found]
+
+    on_ground = nearest_row >= 0
+    nearest_airport = np.full(count, "", dtype=object)
+    nearest_airport[on_ground] = airports.codes[nearest_row[on_ground]]
+    return GroundPositions(
+        snapshot=snapshot,
+        airports=airports,
+        nearest_airport=nearest_airport,
+        distance_nm=distance_nm,
+        on_ground=on_ground,
+    )
+
+
+# Ground positions of the most recent snapshot against the tracked airports
+_GROUND_POSITIONS: Optional[GroundPositions] = None
+_GROUND_POSITIONS_LOCK = threading.Lock()
+
+
+def get_ground_positions(
+    snapshot: FlightSnapshot, airports: AirportTable
+) -> GroundPositions:
+    """
+    Get the ground positions of a snapshot, computing them once per snapshot.
+
+    The result is kept for get_last_ground_positions, so pass the tracked
+    airports (the analysis context's table), not an ad hoc subset.
+
+    This function is thread-safe.
+
+    Args:
+        snapshot: Flight snapshot
+        airports: Tracked airports
+
+    Returns:
+        GroundPositions for the snapshot
+    """
+    global _GROUND_POSITIONS
+
+    with _GROUND_POSITIONS_LOCK:
+        cached = _GROUND_POSITIONS
+    if (
+        cached is not None
+        and cached.snapshot is snapshot
+        and cached.airports is airports
+    ):
+        return cached
+
+    positions = compute_ground_positions(snapshot, airports)
+    with _GROUND_POSITIONS_LOCK:
+        _GROUND_POSITIONS = positions
+    return positions
+
+
+def get_last_ground_positions() -> Optional[GroundPositions]:
+    """Get the ground positions published by the most recent refresh (None before the first)."""
+    with _GROUND_POSITIONS_LOCK:
+        return _GROUND_POSITIONS
+
+
+@dataclass
+class FlightClassification:
+    """
+    Per-row classification of flights.
+
+    Attributes:
+        eta_hours: ETA to the filed arrival airport, NaN if not computed
+        category: One of the CATEGORY_* constants
+        airport: ICAO code the category applies to ('' for CATEGORY_NONE)
+    """
+
+    eta_hours: np.ndarray
+    category: np.ndarray
+    airport: np.ndarray
+
+
+def classify_flights(
+    snapshot: FlightSnapshot,
+    rows: np.ndarray,
+    airports: AirportTable,
+    aircraft_approach_speeds: Optional[Dict[str, int]],
+    max_eta_hours: float,
+) -> FlightClassification:
+    """
+    Classify snapshot rows for the departure/arrival counters.
+
+    Args:
+        snapshot: Flight snapshot
+        rows: Snapshot rows to classify
+        airports: Tracked airports
+        aircraft_approach_speeds: Aircraft type -> approach speed (knots)
+        max_eta_hours: Maximum ETA in hours to count as arriving (0 = no limit)
+
+    Returns:
+        FlightClassification aligned with rows
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    count = len(rows)
+
+    lat = snapshot.latitude[rows]
+    lon = snapshot.longitude[rows]
+    groundspeed = snapshot.groundspeed[rows]
+    altitude = np.nan_to_num(snapshot.altitude[rows], nan=0.0)
+    departure = snapshot.departure[rows]
+    arrival = snapshot.arrival[rows]
+
+    valid_position = (
+        np.isfinite(lat) & np.isfinite(lon) & (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+    )
+    arrival_row = airports.lookup(arrival)
+    arrival_tracked = arrival_row >= 0
+    has_departure = departure != ""
+    has_arrival = arrival != ""
+
+    # Lateral distance to the filed arrival airport (tracked arrivals only)
+    lateral = np.full(count, np.nan)
+    to_arrival = np.flatnonzero(arrival_tracked & valid_position)
+    target = arrival_row[to_arrival]
+    lateral[to_arrival] = haversine_distance_nm_array(
+        lat[to_arrival],
+        lon[to_arrival],
+        airports.latitude[target],
+        airports.longitude[target],
+    )
+
+    # Descent-adjusted ETA for in-flight arrivals (calculate_eta)
+    eta_hours = np.full(count, np.nan)
+    with np.errstate(invalid="ignore"):
+        eta_mask = arrival_tracked & valid_position & (groundspeed > 40)
+    eta_idx = np.flatnonzero(eta_mask)
+    if len(eta_idx):
+        speed = groundspeed[eta_idx]
+        elevation = airports.elevation[arrival_row[eta_idx]]
+        altitude_to_lose = np.maximum(0, altitude[eta_idx] - (elevation + APPROACH_AGL))
+        descent_distance = (altitude_to_lose / 1000) * DESCENT_GRADIENT
+        distance = np.maximum(lateral[eta_idx], descent_distance)
+        eta = distance / speed
+
+        if aircraft_approach_speeds:
+            approach_speed = np.fromiter(
+                (
+                    aircraft_approach_speeds.get(aircraft, np.nan)
+                    if aircraft
+                    else np.nan
+                    for aircraft in snapshot.aircraft_short[rows[eta_idx]]
+                ),
+                dtype=np.float64,
+                count=len(eta_idx),
+            )
+            has_speed = ~np.isnan(approach_speed)
+            two_phase = has_speed & (distance > FINAL_APPROACH_DISTANCE)
+            on_final = has_speed & ~two_phase
+            eta[two_phase] = (distance[two_phase] - FINAL_APPROACH_DISTANCE) / speed[
+                two_phase
+            ] + FINAL_APPROACH_DISTANCE / approach_speed[two_phase]
+            eta[on_final] = distance[on_final] / np.minimum(
+                speed[on_final], approach_speed[on_final]
+            )
+        eta_hours[eta_idx] = eta
+
+    # Nearest tracked airport for slow aircraft (computed once per snapshot)
+    ground = get_ground_positions(snapshot, airports)
+    nearest = ground.nearest_airport[rows]
+    on_ground = ground.on_ground[rows]
+
+    # Within max_eta_hours of arrival (is_flight_flying_near_arrival)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        flying_near = (
+            arrival_tracked
+            & valid_position
+            & (groundspeed >= IN_FLIGHT_MIN_GROUNDSPEED)
+            & (groundspeed > 0)
+        )
+        if max_eta_hours != 0:
+            flying_near &= (lateral / groundspeed) <= max_eta_hours
+
+    # Apply the if/elif chain in order: earlier categories take precedence
+    category = np.full(count, CATEGORY_NONE, dtype=np.int8)
+    airport = np.full(count, "", dtype=object)
+    unassigned = np.ones(count, dtype=bool)
+
+    def assign(mask: np.ndarray, code: int, codes: np.ndarray) -> None:
+        selected = mask & unassigned
+        category[selected] = code
+        airport[selected] = codes[selected]
+        unassigned[selected] = False
+
+    assign(
+        has_departure & on_ground & (nearest == departure),
+        CATEGORY_DEPARTING,
+        departure,
+    )
+    assign(has_arrival & on_ground & (nearest == arrival), CATEGORY_ARRIVED, arrival)
+    assign(~has_departure & ~has_arrival & on_ground, CATEGORY_DEPARTING, nearest)
+    assign(flying_near, CATEGORY_ARRIVING, arrival)
+    assign(arrival_tracked, CATEGORY_FILED, arrival)
+
+    return FlightClassification(eta_hours, category, airport)
+
+
+def _count_by_airport(codes: np.ndarray) -> Dict[str, int]:
+    """Count occurrences of each ICAO code in an object array."""
+    if len(codes) == 0:
+        return {}
+    uniques, counts = np.unique(codes, return_counts=True)
+    return {code: int(n) for code, n in zip(uniques, counts)}
+
+
+def tally_classifications(
+    classification: FlightClassification, arrival: np.ndarray
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Tally classified flights into per-airport counters.
+
+    Args:
+        classification: Result of classify_flights
+        arrival: Filed arrival ICAO codes aligned with the classification
+
+    Returns:
+        Dictionary of counters, each mapping ICAO -> value:
+        departure_counts, arrival_counts, arrival_counts_all,
+        arrivals_on_ground, arrivals_in_flight (ints) and
+        earliest_arrival_eta (hours)
+    """
+    category = classification.category
+    airport = classification.airport
+
+    arrived = airport[category == CATEGORY_ARRIVED]
+    arriving = airport[category == CATEGORY_ARRIVING]
+    filed = airport[category == CATEGORY_FILED]
+
+    arrival_counts_all = _count_by_airport(np.concatenate((arrived, arriving, filed)))
+    arrival_counts = _count_by_airport(np.concatenate((arrived, arriving)))
+
+    earliest_arrival_eta: Dict[str, float] = {}
+    has_eta = np.flatnonzero(~np.isnan(classification.eta_hours))
+    if len(has_eta):
+        uniques, inverse = np.unique(arrival[has_eta], return_inverse=True)
+        earliest = np.full(len(uniques), np.inf)
+        np.minimum.at(earliest, inverse.reshape(-1), classification.eta_hours[has_eta])
+        earliest_arrival_eta = {
+            code: float(eta) for code, eta in zip(uniques, earliest)
+        }
+
+    return {
+        "departure_counts": _count_by_airport(airport[category == CATEGORY_DEPARTING]),
+        "arrival_counts": arrival_counts,
+        "arrival_counts_all": arrival_counts_all,
+        "arrivals_on_ground": _count_by_airport(arrived),
+        "arrivals_in_flight": _count_by_airport(arriving),
+        "earliest_arrival_eta": earliest_arrival_eta,
+    }
@@ -0,0 +1,35 @@
+"""
+Snapshot of the application's cache, hedging and spatial index counters.
+
+Collected into each refresh's timeline when profiling (main.py --profile), so
+hit rates and hedge wins can be read alongside the stage timings.
+"""
+
+from typing import Any, Dict
+
+from backend.core.spatial import get_spatial_stats
+from backend.data.weather import (
+    get_metar_hedge_stats,
+    get_nearest_metar_cache_stats,
+    get_revalidation_stats,
+)
+from backend.net import get_host_latency_stats
+from backend.utils.single_flight import get_single_flight_stats
+
+
+def get_refresh_diagnostics() -> Dict[str, Any]:
+    """
+    Get the current diagnostics counters.
+
+    Returns:
+        Dictionary with 'nearest_metar_cache', 'metar_hedge', 'revalidation',
+        'spatial', 'host_latency' and 'single_flight' statistics
+    """
+    return {
+        "nearest_metar_cache": get_nearest_metar_cache_stats(),
+        "metar_hedge": get_metar_hedge_stats(),
+        "revalidation": get_revalidation_stats(),
+        "spatial": get_spatial_stats(),
+        "host_latency": get_host_latency_stats(),
+        "single_flight": get_single_flight_stats(),
+    }
@@ -9,10 +9,15 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 from backend.core.calculations import calculate_bearing, bearing_to_compass
-from backend.core.spatial import get_airport_spatial_index
+from backend.core.spatial import (
+    SpatialIndex,
+    get_airport_spatial_index,
+    get_runway_spatial_index,
+)
 from backend.core.aircraft_performance import get_required_runway_length
 from backend.data.runways import get_longest_runway, get_runway_summary
 from backend.data.cifp import get_approach_list_for_airport
+from backend.data.neighborhoods import get_neighborhood_table
 
 
 @dataclass
@@ -60,6 +65,7 @@ def find_nearby_airports(
     airports_data: Dict[str, Dict[str, Any]],
     radius_nm: float = 100.0,
     max_results: int = 500,
+    spatial_index: Optional[SpatialIndex] = None,
 ) -> List[Tuple[str, float, float]]:
     """Find airports within a given radius.
 
@@ -69,11 +75,13 @@ def find_nearby_airports(
         airports_data: Dictionary of all airport data
         radius_nm: Search radius in nautical miles
         max_results: Maximum results to return
+        spatial_index: Index to search (default: every airport in airports_data)
 
     Returns:
         List of (icao, distance_nm, bearing_deg) tuples, sorted by distance
     """
-    spatial_index = get_airport_spatial_index(airports_data)
+    if spatial_index is None:
+        spatial_index = get_airport_spatial_index(airports_data)
     nearby = spatial_index.find_within_distance(lat, lon, radius_nm)
 
     results = []
@@ -124,8 +132,21 @@ def find_suitable_diversions(
         get_required_runway_length(aircraft_type) if aircraft_type else None
     )
 
+    # Search only airports with a long enough runway when that filter is on,
+    # so the result limit isn't used up by airports that would be dropped
+    if filters.require_runway_capability and required_runway:
+        spatial_index = get_runway_spatial_index(airports_data, required_runway)
+    else:
+        spatial_index = get_airport_spatial_index(airports_data)
+
     # Find nearby airports
-    nearby = find_nearby_airports(lat, lon, airports_data, radius_nm, max_results=500)
+    nearby = find_nearby_airports(
+        lat, lon, airports_data, radius_nm, max_results=500, spatial_index=spatial_index
+    )
+
+    # Airports the neighborhood table knows to have no approaches skip the
+    # CIFP scan below
+    neighborhood_table = get_neighborhood_table()
 
     diversions: List[DiversionOption] = []
 
@@ -143,7 +164,11 @@ def find_suitable_diversions(
                 continue
 
         # Get approach information
-        approaches = get_approach_list_for_airport(icao)
+        table_row = neighborhood_table.index.get(icao) if neighborhood_table else None
+        if table_row is not None and not neighborhood_table.has_iap[table_row]:
+            approaches = []
+        else:
+            approaches = get_approach_list_for_airport(icao)
         has_approaches_flag = len(approaches) > 0
 
         # Check approaches filter
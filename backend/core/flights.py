@@ -6,6 +6,12 @@ from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Tuple, cast
 
 from backend.core.calculations import haversine_distance_nm, calculate_eta
+from backend.core.classification import (
+    AirportTable,
+    compute_ground_positions,
+    get_last_ground_positions,
+)
+from backend.core.snapshot import get_flight_snapshot
 from backend.core.spatial import get_airport_spatial_index
 
 
@@ -72,18 +78,10 @@ def get_nearest_airport_if_on_ground(
     if flight_lat is None or flight_lon is None:
         return None
 
-    # Use spatial index for efficient nearest airport lookup
+    # The index only contains the airports passed in (e.g. the tracked set)
     spatial_index = get_airport_spatial_index(airports)
-
-    # Filter to only airports in our tracked set
-    def filter_tracked(airport: Dict[str, Any]) -> bool:
-        return airport["icao"] in airports
-
     return spatial_index.find_nearest(
-        flight_lat,
-        flight_lon,
-        max_distance_nm=max_distance_nm,
-        filter_fn=filter_tracked,
+        flight_lat, flight_lon, max_distance_nm=max_distance_nm
     )
 
 
@@ -168,14 +166,9 @@ def find_nearest_airport(
     if flight_lat is None or flight_lon is None:
         return None
 
-    # Use spatial index for efficient lookup
+    # The index only contains the airports passed in (e.g. the tracked set)
     spatial_index = get_airport_spatial_index(airports)
-
-    # Filter to only airports in our tracked set
-    def filter_tracked(airport: Dict[str, Any]) -> bool:
-        return airport["icao"] in airports
-
-    return spatial_index.find_nearest(flight_lat, flight_lon, filter_fn=filter_tracked)
+    return spatial_index.find_nearest(flight_lat, flight_lon)
 
 
 def get_airport_flight_details(
@@ -203,7 +196,6 @@ def get_airport_flight_details(
         - departures_list: List[DepartureInfo]
         - arrivals_list: List[ArrivalInfo]
     """
-    from backend.data.vatsim_api import filter_flights_by_airports
     from ui import debug_logger
 
     debug_logger.debug(
@@ -237,19 +229,30 @@ def get_airport_flight_details(
     debug_logger.debug(f"[BACKEND] Created airports dict with {len(airports)} airports")
 
     # Filter flights - we need all flights that involve our airports
-    flights = filter_flights_by_airports(
-        vatsim_data, all_airports_data, airport_icao_list
-    )
+    snapshot = get_flight_snapshot(vatsim_data)
+    flight_rows = snapshot.filter_rows(all_airports_data, airport_icao_list)
+    flights = snapshot.flight_dicts(flight_rows)
     debug_logger.debug(
-        f"[BACKEND] filter_flights_by_airports returned {len(flights)} flights"
+        f"[BACKEND] snapshot filter selected {len(flights)} of {len(snapshot)} flights"
     )
 
+    # On-ground airports: the refresh already resolved them against the
+    # tracked airports for this snapshot; search just these airports when the
+    # board shows an untracked airport or the feed has moved on
+    ground = get_last_ground_positions()
+    if (
+        ground is None
+        or ground.snapshot is not snapshot
+        or not ground.covers(airport_icao_list)
+    ):
+        ground = compute_ground_positions(snapshot, AirportTable(airports))
+
     departures_list = []
     arrivals_list = []
 
     debug_logger.debug(f"[BACKEND] Processing {len(flights)} flights...")
 
-    for flight in flights:
+    for row, flight in zip(flight_rows, flights):
         # Safely extract required fields with defensive access
         callsign = flight.get("callsign")
         departure = flight.get("departure")
@@ -262,9 +265,7 @@ def get_airport_flight_details(
             )
             continue
 
-        nearest_airport_if_on_ground = get_nearest_airport_if_on_ground(
-            flight, airports
-        )
+        nearest_airport_if_on_ground = ground.nearest_airport[row] or None
 
         # Check if this is a local flight (departure == arrival)
         is_local_flight = departure and arrival and departure == arrival
@@ -0,0 +1,144 @@
+"""
+Sparse grouping-membership matrix for per-grouping aggregation.
+
+Summing per-airport counters over every grouping's resolved airports is a
+nested Python loop per metric. GroupingMembership stores the memberships once
+as a CSR matrix (groupings x airports), so each counter is aggregated for all
+groupings with a single sparse mat-vec, and the earliest ETA with a segmented
+minimum over the matrix rows.
+"""
+
+from typing import Callable, Dict, Iterable, List, Mapping, Set
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class GroupingMembership:
+    """
+    CSR membership matrix of groupings over airports.
+
+    Each row lists a grouping's airports in the iteration order of its resolved
+    set, so per-grouping airport lists come out in the same order as iterating
+    the set directly.
+
+    Attributes:
+        names: Grouping names, one per row
+        airports: Airport ICAO codes, one per column
+        column_index: ICAO -> column
+        matrix: int64 CSR matrix with a 1 for every (grouping, airport) member
+    """
+
+    def __init__(self, resolved_groupings: Mapping[str, Set[str]]):
+        """
+        Build the matrix from resolved groupings.
+
+        Args:
+            resolved_groupings: Grouping name -> resolved airport ICAOs
+        """
+        self.names: List[str] = list(resolved_groupings)
+        self.column_index: Dict[str, int] = {}
+        indices: List[int] = []
+        indptr = [0]
+        for name in self.names:
+            for icao in resolved_groupings[name]:
+                column = self.column_index.get(icao)
+                if column is None:
+                    column = len(self.column_index)
+                    self.column_index[icao] = column
+                indices.append(column)
+            indptr.append(len(indices))
+
+        self.airports: List[str] = list(self.column_index)
+        self._indices = np.array(indices, dtype=np.int64)
+        self._indptr = np.array(indptr, dtype=np.int64)
+        self.matrix = csr_matrix(
+            (np.ones(len(indices), dtype=np.int64), self._indices, self._indptr),
+            shape=(len(self.names), len(self.airports)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def vector(
+        self, values: Mapping[str, float], fill: float = 0, dtype=np.int64
+    ) -> np.ndarray:
+        """
+        Scatter a per-airport mapping into a column-aligned vector.
+
+        Only the mapping's entries are visited, so sparse counters over a large
+        airport set stay cheap.
+
+        Args:
+            values: ICAO -> value (airports outside the matrix are ignored)
+            fill: Value for airports missing from the mapping
+            dtype: NumPy dtype of the vector
+
+        Returns:
+            Array with one value per column
+        """
+        vector = np.full(len(self.airports), fill, dtype=dtype)
+        column_index = self.column_index
+        for icao, value in values.items():
+            column = column_index.get(icao)
+            if column is not None:
+                vector[column] = value
+        return vector
+
+    def sum(self, values: Mapping[str, int]) -> np.ndarray:
+        """
+        Sum a per-airport counter over every grouping.
+
+        Args:
+            values: ICAO -> count
+
+        Returns:
+            int64 array with one total per grouping
+        """
+        if not len(self):
+            return np.zeros(0, dtype=np.int64)
+        return self.matrix @ self.vector(values)
+
+    def min(self, values: Mapping[str, float]) -> np.ndarray:
+        """
+        Minimum of a per-airport value over every grouping.
+
+        Args:
+            values: ICAO -> value (airports without a value are skipped)
+
+        Returns:
+            float64 array with one minimum per grouping (inf if no member has a value)
+        """
+        result = np.full(len(self), np.inf)
+        if not len(self._indices):
+            return result
+        member_values = self.vector(values, fill=np.inf, dtype=np.float64)[
+            self._indices
+        ]
+        non_empty = np.flatnonzero(np.diff(self._indptr) > 0)
+        result[non_empty] = np.minimum.reduceat(member_values, self._indptr[non_empty])
+        return result
+
+    def members(self, row: int) -> List[str]:
+        """Get a grouping's airports in resolved-set order."""
+        columns = self._indices[self._indptr[row] : self._indptr[row + 1]]
+        return [self.airports[column] for column in columns]
+
+    def members_where(self, row: int, predicate: Callable[[str], bool]) -> List[str]:
+        """Get a grouping's airports that satisfy a predicate, in order."""
+        return [icao for icao in self.members(row) if predicate(icao)]
+
+    def rows_with_any(self, airports: Iterable[str]) -> np.ndarray:
+        """
+        Get the groupings that contain at least one of the given airports.
+
+        Args:
+            airports: ICAO codes
+
+        Returns:
+            Boolean array with one flag per grouping
+        """
+        if not len(self):
+            return np.zeros(0, dtype=bool)
+        flags = self.vector({icao: 1 for icao in airports})
+        return (self.matrix @ flags) > 0
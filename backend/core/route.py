@@ -179,15 +179,21 @@ def find_enroute_airports(
 
     index = get_airport_spatial_index(airports_data)
 
-    for lat, lon, route_distance in sample_points:
-        # Find airports near this point
-        nearby = index.find_within_distance(lat, lon, max_distance_nm=search_radius_nm)
+    # Find airports near every sample point in one batched query
+    nearby_by_point = index.query_radius(
+        [lat for lat, _, _ in sample_points],
+        [lon for _, lon, _ in sample_points],
+        search_radius_nm,
+    )
 
+    for (lat, lon, route_distance), (rows, distances) in zip(
+        sample_points, nearby_by_point
+    ):
         # Pick the best airport (prefer larger airports with likely METAR)
         best = None
         best_score = -1
 
-        for icao, distance in nearby:
+        for icao, distance in zip(index.codes[rows].tolist(), distances.tolist()):
             if icao in used_icaos:
                 continue
 
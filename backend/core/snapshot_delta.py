@@ -0,0 +1,335 @@
+"""
+Delta engine between consecutive VATSIM feed snapshots.
+
+Between two 15-second feed fetches most pilots are either parked (nothing
+changes) or have only moved. Diffing consecutive FlightSnapshots by callsign
+and flight plan revision lets per-flight work (ETA, on-ground classification,
+ATIS/route parsing) be redone only for the pilots that actually changed.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from backend.core.snapshot import FlightSnapshot
+
+T = TypeVar("T")
+
+
+@dataclass
+class SnapshotDelta:
+    """
+    Per-callsign changes from one snapshot to the next.
+
+    Row arrays index into the current snapshot. Every uniquely-keyed current
+    row lands in exactly one of added/refiled/moved/unchanged.
+
+    Attributes:
+        added: Rows whose callsign was not in the previous snapshot
+        removed: Callsigns that were in the previous snapshot but are gone
+        refiled: Rows whose flight plan changed (revision_id or endpoints)
+        moved: Rows with the same flight plan but a new position/speed/altitude
+        unchanged: Rows identical to the previous snapshot in every tracked field
+        previous_rows: Previous-snapshot row for each current row (-1 if none)
+    """
+
+    added: np.ndarray
+    removed: List[str]
+    refiled: np.ndarray
+    moved: np.ndarray
+    unchanged: np.ndarray
+    previous_rows: np.ndarray = field(repr=False)
+
+    @property
+    def changed_rows(self) -> np.ndarray:
+        """Rows whose derived per-flight values must be recomputed."""
+        return np.sort(np.concatenate((self.added, self.refiled, self.moved)))
+
+    @property
+    def is_empty(self) -> bool:
+        """True when nothing was added, removed, refiled or moved."""
+        return not (
+            len(self.added) or self.removed or len(self.refiled) or len(self.moved)
+        )
+
+    def summary(self) -> str:
+        """Short human-readable summary for debug logging."""
+        return (
+            f"+{len(self.added)} -{len(self.removed)} "
+            f"refiled={len(self.refiled)} moved={len(self.moved)} "
+            f"unchanged={len(self.unchanged)}"
+        )
+
+
+def _same(previous: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Elementwise equality for float columns, treating NaN == NaN."""
+    return (previous == current) | (np.isnan(previous) & np.isnan(current))
+
+
+def _keyed_rows(snapshot: FlightSnapshot) -> np.ndarray:
+    """Boolean mask of rows that own their callsign (first occurrence wins)."""
+    keyed = np.zeros(len(snapshot), dtype=bool)
+    if snapshot.callsign_index:
+        keyed[np.fromiter(snapshot.callsign_index.values(), dtype=np.int64)] = True
+    return keyed
+
+
+def compute_snapshot_delta(
+    previous: Optional[FlightSnapshot], current: FlightSnapshot
+) -> SnapshotDelta:
+    """
+    Diff two snapshots keyed on callsign and flight plan revision.
+
+    A pilot is 'refiled' when its flight plan revision_id, departure, arrival or
+    aircraft type changed, and 'moved' when the plan is the same but latitude,
+    longitude, groundspeed or altitude changed. Rows with an empty or duplicate
+    callsign are always reported as added so they are never served stale values.
+
+    Args:
+        previous: The previous snapshot (None on the first refresh)
+        current: The current snapshot
+
+    Returns:
+        SnapshotDelta describing the current snapshot relative to previous
+    """
+    count = len(current)
+    keyed = _keyed_rows(current)
+
+    if previous is None or len(previous) == 0:
+        previous_rows = np.full(count, -1, dtype=np.int64)
+        removed = list(previous.callsign_index) if previous is not None else []
+    else:
+        previous_index = previous.callsign_index
+        previous_rows = np.fromiter(
+            (previous_index.get(callsign, -1) for callsign in current.callsign),
+            dtype=np.int64,
+            count=count,
+        )
+        previous_rows[~keyed] = -1
+        removed = [
+            callsign
+            for callsign in previous_index
+            if callsign not in current.callsign_index
+        ]
+
+    matched = np.flatnonzero(previous_rows >= 0)
+    added = np.flatnonzero(previous_rows < 0)
+
+    if previous is None or len(matched) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return SnapshotDelta(added, removed, empty, empty, empty, previous_rows)
+
+    prev = previous_rows[matched]
+    same_plan = (
+        (previous.revision_id[prev] == current.revision_id[matched])
+        & (previous.departure[prev] == current.departure[matched])
+        & (previous.arrival[prev] == current.arrival[matched])
+        & (previous.aircraft_short[prev] == current.aircraft_short[matched])
+    )
+    same_state = (
+        _same(previous.latitude[prev], current.latitude[matched])
+        & _same(previous.longitude[prev], current.longitude[matched])
+        & _same(previous.groundspeed[prev], current.groundspeed[matched])
+        & _same(previous.altitude[prev], current.altitude[matched])
+    )
+
+    return SnapshotDelta(
+        added=added,
+        removed=removed,
+        refiled=matched[~same_plan],
+        moved=matched[same_plan & ~same_state],
+        unchanged=matched[same_plan & same_state],
+        previous_rows=previous_rows,
+    )
+
+
+class SnapshotMemo(Generic[T]):
+    """
+    Per-callsign memo of values derived from a flight, invalidated by deltas.
+
+    Callers advance the memo once per snapshot; entries for added, removed,
+    refiled and moved pilots are dropped, so get() only returns values for
+    pilots whose inputs are unchanged. A change of context key (e.g. a new
+    airport allowlist) clears the memo.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: Optional[FlightSnapshot] = None
+        self._context: Optional[Hashable] = None
+        self._values: Dict[str, T] = {}
+        self._delta: Optional[SnapshotDelta] = None
+
+    def advance(
+        self, snapshot: FlightSnapshot, context: Optional[Hashable] = None
+    ) -> SnapshotDelta:
+        """
+        Move the memo to a new snapshot, dropping stale entries.
+
+        Advancing to the snapshot the memo is already on is a no-op and returns
+        the delta from the previous advance.
+
+        Args:
+            snapshot: The current snapshot
+            context: Hashable key for everything else the derived values depend on
+
+        Returns:
+            SnapshotDelta from the memo's previous snapshot to this one
+        """
+        with self._lock:
+            if snapshot is self._snapshot and context == self._context:
+                if self._delta is not None:
+                    return self._delta
+
+            previous = self._snapshot if context == self._context else None
+            delta = compute_snapshot_delta(previous, snapshot)
+
+            if previous is None:
+                self._values = {}
+            else:
+                values = self._values
+                for callsign in delta.removed:
+                    values.pop(callsign, None)
+                callsigns = snapshot.callsign
+                for row in delta.changed_rows:
+                    values.pop(callsigns[row], None)
+
+            self._snapshot = snapshot
+            self._context = context
+            self._delta = delta
+            return delta
+
+    def get(self, callsign: str) -> Optional[T]:
+        """Get the memoized value for a callsign, or None."""
+        with self._lock:
+            return self._values.get(callsign)
+
+    def put(self, callsign: str, value: T) -> None:
+        """Memoize a value for a callsign in the current snapshot."""
+        if not callsign:
+            return
+        with self._lock:
+            self._values[callsign] = value
+
+    def clear(self) -> None:
+        """Forget the snapshot and all memoized values."""
+        with self._lock:
+            self._snapshot = None
+            self._context = None
+            self._values = {}
+            self._delta = None
+
+
+class SnapshotColumnMemo:
+    """
+    Row-aligned memo of per-flight array columns, invalidated by deltas.
+
+    Array counterpart of SnapshotMemo for batch (NumPy) consumers: values are
+    stored per snapshot row, and advancing to a new snapshot carries the
+    values of unchanged pilots over to their new rows in one gather.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: Optional[FlightSnapshot] = None
+        self._context: Optional[Hashable] = None
+        self._columns: Dict[str, np.ndarray] = {}
+        self._valid = np.zeros(0, dtype=bool)
+        self._delta: Optional[SnapshotDelta] = None
+
+    def advance(
+        self, snapshot: FlightSnapshot, context: Optional[Hashable] = None
+    ) -> SnapshotDelta:
+        """
+        Move the memo to a new snapshot, keeping values for unchanged pilots.
+
+        Advancing to the snapshot the memo is already on is a no-op and returns
+        the delta from the previous advance.
+
+        Args:
+            snapshot: The current snapshot
+            context: Hashable key for everything else the derived values depend on
+
+        Returns:
+            SnapshotDelta from the memo's previous snapshot to this one
+        """
+        with self._lock:
+            if snapshot is self._snapshot and context == self._context:
+                if self._delta is not None:
+                    return self._delta
+
+            previous = self._snapshot if context == self._context else None
+            delta = compute_snapshot_delta(previous, snapshot)
+
+            count = len(snapshot)
+            valid = np.zeros(count, dtype=bool)
+            columns: Dict[str, np.ndarray] = {}
+            if previous is not None and self._columns:
+                rows = delta.unchanged
+                previous_rows = delta.previous_rows[rows]
+                keep = self._valid[previous_rows]
+                rows = rows[keep]
+                previous_rows = previous_rows[keep]
+                valid[rows] = True
+                for name, values in self._columns.items():
+                    column = np.empty(count, dtype=values.dtype)
+                    column[rows] = values[previous_rows]
+                    columns[name] = column
+
+            self._snapshot = snapshot
+            self._context = context
+            self._columns = columns
+            self._valid = valid
+            self._delta = delta
+            return delta
+
+    def lookup(self, rows: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Get memoized values for snapshot rows.
+
+        Args:
+            rows: Rows of the current snapshot
+
+        Returns:
+            Tuple of (cached, columns): a boolean mask of rows with memoized
+            values, and each column's values for the cached rows
+        """
+        with self._lock:
+            cached = self._valid[rows]
+            hits = rows[cached]
+            return cached, {
+                name: values[hits] for name, values in self._columns.items()
+            }
+
+    def store(self, rows: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Memoize column values for rows of the current snapshot.
+
+        Args:
+            rows: Rows of the current snapshot
+            columns: Column name -> values aligned with rows
+        """
+        with self._lock:
+            count = len(self._valid)
+            for name, values in columns.items():
+                column = self._columns.get(name)
+                if column is None:
+                    column = np.empty(count, dtype=values.dtype)
+                    self._columns[name] = column
+                column[rows] = values
+            self._valid[rows] = True
+
+    def clear(self) -> None:
+        """Forget the snapshot and all memoized values."""
+        with self._lock:
+            self._snapshot = None
+            self._context = None
+            self._columns = {}
+            self._valid = np.zeros(0, dtype=bool)
+            self._delta = None
@@ -1,47 +1,151 @@
 """
 Spatial indexing utilities for efficient geographic lookups.
 
-This module provides a grid-based spatial index for O(1) average-case
-nearest neighbor lookups instead of O(n) linear scans.
+This module provides a KD-tree spatial index over airport positions. Points
+are stored as 3-D unit vectors so straight-line (chord) distance in the tree
+is monotonic in great circle distance, which makes nearest neighbour and
+radius queries exact anywhere on the globe (including the poles and the
+antimeridian). Batch queries take coordinate arrays so callers can resolve
+every point of a refresh with one call.
+
+All airport indexes are owned by one SpatialService: indexes are cached per
+airport subset (tracked airports, full database, towered airports, METAR
+stations, ...), keyed by name and a fingerprint of the airport data, so each
+lookup searches a pre-filtered tree instead of filtering candidates. Runtime
+exclusions (e.g. airports found not to report METAR) are applied to cached
+indexes as a bitmask instead of rebuilding them, and invalidate() is the one
+hook that drops every index.
 """
 
 import threading
-from typing import Dict, Any, List, Optional, Tuple, Callable
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Callable
 
-from backend.core.calculations import haversine_distance_nm
+import numpy as np
+from cachetools import LRUCache
+from scipy.spatial import cKDTree
 
+from backend.core.calculations import EARTH_RADIUS_NM, haversine_distance_nm_array
+from backend.utils.single_flight import SingleFlight
 
-# Default grid cell size in degrees (approximately 60nm at equator)
-DEFAULT_CELL_SIZE = 1.0
 
-# Cache for spatial index - keyed by dataset size to handle different airport sets
-_AIRPORT_SPATIAL_INDEX: Optional["SpatialIndex"] = None
-_AIRPORT_SPATIAL_INDEX_LOCK = threading.Lock()
-_AIRPORT_SPATIAL_INDEX_TIMESTAMP: Optional[datetime] = None
-_AIRPORT_SPATIAL_INDEX_SIZE: int = 0  # Track size of dataset used to build index
-_SPATIAL_INDEX_TTL_SECONDS = 300  # Rebuild every 5 minutes
+# Relative/absolute padding applied to chord bounds so floating point error in
+# the unit vectors can't drop a point that is exactly on the search radius.
+# Candidates are re-checked with the exact haversine distance afterwards.
+_CHORD_PADDING = 1e-9
+_CHORD_EPSILON = 1e-12
+
+# Cache size limits
+MAX_SPATIAL_INDEXES = 8  # Max cached indexes (one per named airport subset)
+MAX_FINGERPRINTED_DATASETS = 16  # Max airport dicts with a remembered fingerprint
+
+# Fingerprints of airport dicts are remembered per dict object and recomputed
+# after this long, so in-place edits to a dict are picked up eventually
+_FINGERPRINT_TTL_SECONDS = 300
+
+# Index names for the standard airport subsets
+INDEX_AIRPORTS = "airports"
+INDEX_TOWERED = "towered"
+INDEX_RUNWAY = "runway"
+INDEX_METAR = "metar"
+
+# Exclusion layers (sets of airports masked out of the indexes that use them)
+EXCLUDE_METAR_BLACKLIST = "metar_blacklist"
+
+# Rows examined per point by the first nearest-neighbour pass when an index
+# has exclusions; points whose candidates are all excluded are retried with
+# this many times more
+_EXCLUDED_NEAREST_K = 4
+
+
+def unit_vectors(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Convert coordinates to 3-D unit vectors.
+
+    Args:
+        lats: Latitudes in decimal degrees
+        lons: Longitudes in decimal degrees
+
+    Returns:
+        Array of shape (n, 3), one row per point
+    """
+    lat_rad = np.radians(lats)
+    lon_rad = np.radians(lons)
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack(
+        (cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad))
+    )
+
+
+def chord_length(distance_nm: Any) -> Any:
+    """
+    Convert a great circle distance to the unit-sphere chord that spans it.
+
+    The result is padded slightly so it is safe to use as a search bound.
+
+    Args:
+        distance_nm: Great circle distance(s) in nautical miles
+
+    Returns:
+        Chord length(s) on the unit sphere (at most 2)
+    """
+    angle = np.minimum(
+        np.asarray(distance_nm, dtype=np.float64) / EARTH_RADIUS_NM, np.pi
+    )
+    return 2 * np.sin(angle / 2) * (1 + _CHORD_PADDING) + _CHORD_EPSILON
 
 
 class SpatialIndex:
     """
-    A grid-based spatial index for efficient nearest neighbor queries.
+    A KD-tree spatial index for efficient nearest neighbor and radius queries.
 
-    The index divides the world into cells of configurable size (default 1 degree).
-    Lookups check the target cell and neighboring cells, providing O(1) average
-    case performance for nearest neighbor queries.
+    Airports are indexed by row. The batch methods (query_nearest and
+    query_radius) take arrays of coordinates and return rows into 'codes',
+    'latitude' and 'longitude'; find_nearest and find_within_distance are
+    single-point wrappers that return ICAO codes.
+
+    Airports can be excluded after the index is built (see exclude); excluded
+    rows stay in the tree but are never returned.
+
+    Attributes:
+        codes: Object array of ICAO codes
+        latitude, longitude: float64 arrays of airport coordinates
     """
 
-    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+    def __init__(self):
+        """Initialize an empty spatial index."""
+        self.codes = np.zeros(0, dtype=object)
+        self.latitude = np.zeros(0, dtype=np.float64)
+        self.longitude = np.zeros(0, dtype=np.float64)
+        self._tree: Optional[cKDTree] = None
+        self._excluded: Optional[np.ndarray] = None
+        self._excluded_count = 0
+        self._row_of: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_points(
+        cls,
+        codes: List[str],
+        lats: List[float],
+        lons: List[float],
+    ) -> "SpatialIndex":
         """
-        Initialize the spatial index.
+        Build an index from parallel lists of codes and coordinates.
+
+        Points with coordinates outside the valid range are left out.
 
         Args:
-            cell_size: Size of grid cells in degrees (default: 1.0)
+            codes: ICAO codes
+            lats: Latitudes in decimal degrees
+            lons: Longitudes in decimal degrees
+
+        Returns:
+            A new SpatialIndex
         """
-        self.cell_size = cell_size
-        self.grid: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
-        self.airports: List[Dict[str, Any]] = []
+        index = cls()
+        index._set_points(codes, lats, lons)
+        return index
 
     def build(self, airports_data: Dict[str, Dict[str, Any]]) -> None:
         """
@@ -51,43 +155,240 @@ class SpatialIndex:
             airports_data: Dictionary mapping ICAO codes to airport data
                           (must include 'latitude' and 'longitude' keys)
         """
-        self.grid.clear()
-        self.airports.clear()
-
+        codes = []
+        lats = []
+        lons = []
         for icao, data in airports_data.items():
             lat = data.get("latitude")
             lon = data.get("longitude")
             if lat is None or lon is None:
                 continue
+            codes.append(icao)
+            lats.append(lat)
+            lons.append(lon)
 
-            airport = {"icao": icao, "latitude": lat, "longitude": lon, "data": data}
-            self.airports.append(airport)
+        self._set_points(codes, lats, lons)
 
-            # Add to grid cell
-            cell_key = self._get_cell_key(lat, lon)
-            if cell_key not in self.grid:
-                self.grid[cell_key] = []
-            self.grid[cell_key].append(airport)
+    def _set_points(
+        self,
+        codes: List[str],
+        lats: List[float],
+        lons: List[float],
+    ) -> None:
+        """Store the valid points and build the tree."""
+        lat_array = np.asarray(lats, dtype=np.float64).reshape(-1)
+        lon_array = np.asarray(lons, dtype=np.float64).reshape(-1)
+        valid = (
+            (lat_array >= -90)
+            & (lat_array <= 90)
+            & (lon_array >= -180)
+            & (lon_array <= 180)
+        )
+        rows = np.flatnonzero(valid)
 
-    def _get_cell_key(self, lat: float, lon: float) -> Tuple[int, int]:
-        """Get the grid cell key for a given coordinate."""
-        return (int(lat / self.cell_size), int(lon / self.cell_size))
+        self.codes = np.array(codes, dtype=object)[rows]
+        self.latitude = lat_array[rows]
+        self.longitude = lon_array[rows]
+        self._tree = (
+            cKDTree(unit_vectors(self.latitude, self.longitude)) if len(rows) else None
+        )
+        self._excluded = None
+        self._excluded_count = 0
+        self._row_of = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def excluded_count(self) -> int:
+        """Number of excluded airports."""
+        return self._excluded_count
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the index arrays and tree, in bytes."""
+        total = self.codes.nbytes + self.latitude.nbytes + self.longitude.nbytes
+        if self._tree is not None:
+            # Unit vectors plus the tree's index permutation and node arrays
+            total += self._tree.data.nbytes + 2 * self._tree.indices.nbytes
+        if self._excluded is not None:
+            total += self._excluded.nbytes
+        return total
+
+    def exclude(self, codes: Iterable[str]) -> int:
+        """
+        Exclude airports from query results without rebuilding the tree.
 
-    def _get_neighboring_cells(self, lat: float, lon: float) -> List[Tuple[int, int]]:
-        """Get all cell keys in the 3x3 neighborhood around the target cell."""
-        center = self._get_cell_key(lat, lon)
-        cells = []
-        for dlat in [-1, 0, 1]:
-            for dlon in [-1, 0, 1]:
-                cells.append((center[0] + dlat, center[1] + dlon))
-        return cells
+        Args:
+            codes: ICAO codes to exclude (codes not in the index are ignored)
+
+        Returns:
+            Number of airports newly excluded
+        """
+        if self._row_of is None:
+            self._row_of = {icao: row for row, icao in enumerate(self.codes.tolist())}
+        rows = [row for row in map(self._row_of.get, codes) if row is not None]
+        if not rows:
+            return 0
+
+        if self._excluded is None:
+            self._excluded = np.zeros(len(self), dtype=bool)
+        newly_excluded = int(np.count_nonzero(~self._excluded[rows]))
+        self._excluded[rows] = True
+        self._excluded_count += newly_excluded
+        return newly_excluded
+
+    def query_nearest(
+        self,
+        lats: Any,
+        lons: Any,
+        max_nm: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest indexed airport to each query point.
+
+        Args:
+            lats: Query latitudes in decimal degrees
+            lons: Query longitudes in decimal degrees
+            max_nm: Maximum great circle distance (optional)
+
+        Returns:
+            Tuple of (rows, distances): int64 rows (-1 where nothing is within
+            max_nm) and float64 distances in nautical miles (inf where not found)
+        """
+        lat_array = np.asarray(lats, dtype=np.float64).reshape(-1)
+        lon_array = np.asarray(lons, dtype=np.float64).reshape(-1)
+        rows = np.full(len(lat_array), -1, dtype=np.int64)
+        distances = np.full(len(lat_array), np.inf)
+        if self._tree is None or len(lat_array) == 0:
+            return rows, distances
+
+        bound = np.inf if max_nm is None else float(chord_length(max_nm))
+        tree_rows = self._nearest_tree_rows(unit_vectors(lat_array, lon_array), bound)
+        candidates = np.flatnonzero(tree_rows < len(self))
+        if len(candidates) == 0:
+            return rows, distances
+
+        airport_rows = tree_rows[candidates]
+        candidate_distances = haversine_distance_nm_array(
+            lat_array[candidates],
+            lon_array[candidates],
+            self.latitude[airport_rows],
+            self.longitude[airport_rows],
+        )
+        if max_nm is None:
+            within = np.ones(len(candidates), dtype=bool)
+        else:
+            within = candidate_distances <= max_nm
+        rows[candidates[within]] = airport_rows[within]
+        distances[candidates[within]] = candidate_distances[within]
+        return rows, distances
+
+    def _nearest_tree_rows(self, vectors: np.ndarray, bound: float) -> np.ndarray:
+        """
+        Get the nearest non-excluded tree row of each query vector.
+
+        Returns:
+            int64 rows, len(self) where nothing is within the chord bound
+        """
+        assert self._tree is not None
+        if self._excluded is None:
+            _, tree_rows = self._tree.query(vectors, k=1, distance_upper_bound=bound)
+            return np.asarray(tree_rows, dtype=np.int64)
+
+        # Neighbours come back nearest first, so the first non-excluded one is
+        # the answer; widen k only for the points whose candidates were all
+        # excluded and that may still have more within the bound. The nearest
+        # excluded_count + 1 rows always include a usable one, so k never has
+        # to grow past that (a query never degrades into a full scan).
+        size = len(self)
+        max_k = min(self.excluded_count + 1, size)
+        result = np.full(len(vectors), size, dtype=np.int64)
+        pending = np.arange(len(vectors))
+        k = _EXCLUDED_NEAREST_K
+        while len(pending):
+            k = min(k, max_k)
+            _, tree_rows = self._tree.query(
+                vectors[pending], k=k, distance_upper_bound=bound
+            )
+            tree_rows = np.asarray(tree_rows, dtype=np.int64).reshape(len(pending), k)
+            usable = tree_rows < size
+            usable[usable] = ~self._excluded[tree_rows[usable]]
+            found = usable.any(axis=1)
+            first = usable.argmax(axis=1)
+            result[pending[found]] = tree_rows[found, first[found]]
+
+            exhausted = (tree_rows[:, -1] >= size) | (k == max_k)
+            pending = pending[~found & ~exhausted]
+            k *= _EXCLUDED_NEAREST_K
+        return result
+
+    def query_radius(
+        self,
+        lats: Any,
+        lons: Any,
+        nm: Any,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Find every indexed airport within a radius of each query point.
+
+        Args:
+            lats: Query latitudes in decimal degrees
+            lons: Query longitudes in decimal degrees
+            nm: Search radius in nautical miles (scalar, or one per point)
+
+        Returns:
+            One (rows, distances) tuple per query point, sorted by distance
+        """
+        lat_array = np.asarray(lats, dtype=np.float64).reshape(-1)
+        lon_array = np.asarray(lons, dtype=np.float64).reshape(-1)
+        count = len(lat_array)
+        radius = np.broadcast_to(np.asarray(nm, dtype=np.float64), (count,))
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64))
+        if self._tree is None or count == 0:
+            return [empty] * count
+
+        matches = self._tree.query_ball_point(
+            unit_vectors(lat_array, lon_array), r=chord_length(radius)
+        )
+        lengths = np.fromiter((len(m) for m in matches), dtype=np.int64, count=count)
+        if not lengths.sum():
+            return [empty] * count
+
+        # Flatten all matches so the exact distances are computed in one pass
+        points = np.repeat(np.arange(count), lengths)
+        airport_rows = np.fromiter(
+            (row for m in matches for row in m), dtype=np.int64, count=len(points)
+        )
+        distances = haversine_distance_nm_array(
+            lat_array[points],
+            lon_array[points],
+            self.latitude[airport_rows],
+            self.longitude[airport_rows],
+        )
+        within = distances <= radius[points]
+        if self._excluded is not None:
+            within &= ~self._excluded[airport_rows]
+        points = points[within]
+        airport_rows = airport_rows[within]
+        distances = distances[within]
+
+        order = np.lexsort((distances, points))
+        points = points[order]
+        airport_rows = airport_rows[order]
+        distances = distances[order]
+
+        bounds = np.searchsorted(points, np.arange(count + 1))
+        return [
+            (airport_rows[start:end], distances[start:end])
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
 
     def find_nearest(
         self,
         lat: float,
         lon: float,
         max_distance_nm: Optional[float] = None,
-        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> Optional[str]:
         """
         Find the nearest airport to the given coordinates.
@@ -96,54 +397,18 @@ class SpatialIndex:
             lat: Latitude of the query point
             lon: Longitude of the query point
             max_distance_nm: Maximum distance in nautical miles (optional)
-            filter_fn: Optional function to filter airports (takes airport dict, returns bool)
 
         Returns:
             ICAO code of the nearest airport, or None if no airport found
         """
-        if not self.airports:
-            return None
-
-        # Get candidate airports from neighboring cells
-        candidates = []
-        for cell_key in self._get_neighboring_cells(lat, lon):
-            if cell_key in self.grid:
-                candidates.extend(self.grid[cell_key])
-
-        # If no candidates in neighborhood, fall back to all airports
-        # (this happens near cell boundaries or with very sparse data)
-        if not candidates:
-            candidates = self.airports
-
-        # Find nearest
-        nearest_icao = None
-        min_distance = float("inf")
-
-        for airport in candidates:
-            if filter_fn and not filter_fn(airport):
-                continue
-
-            try:
-                distance = haversine_distance_nm(
-                    lat, lon, airport["latitude"], airport["longitude"]
-                )
-            except ValueError:
-                # Skip airports with invalid coordinates
-                continue
-
-            if distance < min_distance:
-                if max_distance_nm is None or distance <= max_distance_nm:
-                    min_distance = distance
-                    nearest_icao = airport["icao"]
-
-        return nearest_icao
+        rows, _ = self.query_nearest([lat], [lon], max_distance_nm)
+        return self.codes[rows[0]] if rows[0] >= 0 else None
 
     def find_within_distance(
         self,
         lat: float,
         lon: float,
         max_distance_nm: float,
-        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> List[Tuple[str, float]]:
         """
         Find all airports within a given distance.
@@ -152,62 +417,372 @@ class SpatialIndex:
             lat: Latitude of the query point
             lon: Longitude of the query point
             max_distance_nm: Maximum distance in nautical miles
-            filter_fn: Optional function to filter airports
 
         Returns:
             List of (ICAO code, distance) tuples, sorted by distance
         """
-        import math
+        rows, distances = self.query_radius([lat], [lon], max_distance_nm)[0]
+        return list(zip(self.codes[rows].tolist(), distances.tolist()))
 
-        results = []
 
-        # Get candidate airports from neighboring cells
-        # For latitude: ~60nm per degree
-        # For longitude: ~60nm * cos(lat) per degree (shrinks at higher latitudes)
-        cells_lat = max(1, int(max_distance_nm / 60) + 1)
+def dataset_fingerprint(airports_data: Dict[str, Dict[str, Any]]) -> int:
+    """
+    Fingerprint the contents of an airport dict (codes and coordinates).
 
-        # Longitude degrees are shorter at higher latitudes
-        # Add extra buffer (+1) for edge effects
-        cos_lat = math.cos(math.radians(abs(lat))) if abs(lat) < 89 else 0.02
-        nm_per_lon_degree = 60 * cos_lat
-        cells_lon = max(1, int(max_distance_nm / nm_per_lon_degree) + 1)
+    Two dicts with the same airports at the same positions, in the same order,
+    get the same fingerprint, so equal subsets built separately share an index.
 
-        center = self._get_cell_key(lat, lon)
+    Args:
+        airports_data: Dictionary mapping ICAO codes to airport data
 
-        candidates = []
-        for dlat in range(-cells_lat, cells_lat + 1):
-            for dlon in range(-cells_lon, cells_lon + 1):
-                cell_key = (center[0] + dlat, center[1] + dlon)
-                if cell_key in self.grid:
-                    candidates.extend(self.grid[cell_key])
+    Returns:
+        Hash of the dict's (ICAO, latitude, longitude) entries
+    """
+    return hash(
+        tuple(
+            (icao, data.get("latitude"), data.get("longitude"))
+            for icao, data in airports_data.items()
+        )
+    )
 
-        for airport in candidates:
-            if filter_fn and not filter_fn(airport):
-                continue
 
-            try:
-                distance = haversine_distance_nm(
-                    lat, lon, airport["latitude"], airport["longitude"]
-                )
-            except ValueError:
-                # Skip airports with invalid coordinates
-                continue
+@dataclass
+class _IndexEntry:
+    """A cached index and the bookkeeping SpatialService keeps for it."""
+
+    index: SpatialIndex
+    exclusion_layer: Optional[str]
+    exclusions_applied: int
+    build_seconds: float
+    built_at: float
+
+
+class SpatialService:
+    """
+    Owner of every cached airport spatial index.
+
+    Indexes are cached by name and by a fingerprint of the airport dict they
+    were built from, so the tracked airports, the full database and filtered
+    subsets each keep their own pre-filtered index; the least recently used
+    index is evicted once max_indexes are cached.
+
+    Filters are layered: a predicate (or a dedicated builder, like the METAR
+    station whitelist) selects the airports an index holds, and an optional
+    exclusion layer masks airports out at query time. Airports added to an
+    exclusion layer are applied to the indexes using it on their next lookup,
+    without a rebuild.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_indexes: int = MAX_SPATIAL_INDEXES,
+        max_datasets: int = MAX_FINGERPRINTED_DATASETS,
+    ):
+        """
+        Initialize an empty service.
 
-            if distance <= max_distance_nm:
-                results.append((airport["icao"], distance))
+        Args:
+            max_indexes: Max cached indexes
+            max_datasets: Max airport dicts with a remembered fingerprint
+        """
+        self._lock = threading.Lock()
+        # (name, dataset fingerprint) -> _IndexEntry
+        self._indexes: LRUCache = LRUCache(maxsize=max_indexes)
+        # id(airports_data) -> (airports_data, len, fingerprint, computed_at). The
+        # dict itself is kept so its id can't be reused by another object while cached.
+        self._fingerprints: LRUCache = LRUCache(maxsize=max_datasets)
+        # Exclusion layer -> excluded codes, in the order they were added
+        self._exclusions: Dict[str, List[str]] = {}
+        self._exclusion_sets: Dict[str, Set[str]] = {}
+        self._invalidation_listeners: List[Callable[[], None]] = []
+        # Index builds run outside the lock; concurrent misses share one build
+        self._builds_in_flight = SingleFlight("spatial_index")
+
+        # Diagnostics counters
+        self._builds: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def _get_dataset_fingerprint(self, airports_data: Dict[str, Dict[str, Any]]) -> int:
+        """Get a dict's fingerprint, reusing the last one computed for the same object.
+
+        Must be called with the lock held.
+        """
+        now = time.monotonic()
+        entry = self._fingerprints.get(id(airports_data))
+        if (
+            entry is not None
+            and entry[0] is airports_data
+            and entry[1] == len(airports_data)
+            and now - entry[3] < _FINGERPRINT_TTL_SECONDS
+        ):
+            return entry[2]
+
+        fingerprint = dataset_fingerprint(airports_data)
+        self._fingerprints[id(airports_data)] = (
+            airports_data,
+            len(airports_data),
+            fingerprint,
+            now,
+        )
+        return fingerprint
+
+    def _get_or_build(
+        self,
+        name: str,
+        airports_data: Dict[str, Dict[str, Any]],
+        builder: Callable[[], SpatialIndex],
+        exclusion_layer: Optional[str],
+    ) -> SpatialIndex:
+        """Get a cached index, building it with builder() on a miss."""
+        with self._lock:
+            key = (name, self._get_dataset_fingerprint(airports_data))
+            entry = self._indexes.get(key)
+            if entry is not None:
+                self._hits += 1
+                return self._apply_exclusions(entry)
+            self._misses += 1
+            generation = self._invalidations
+
+        # Build without the lock so other lookups aren't blocked; callers
+        # missing the same index at the same time wait for one build
+        entry = self._builds_in_flight.do(
+            (key, generation),
+            self._build_entry,
+            key,
+            builder,
+            exclusion_layer,
+            generation,
+        )
+        with self._lock:
+            return self._apply_exclusions(entry)
+
+    def _build_entry(
+        self,
+        key: Tuple[str, int],
+        builder: Callable[[], SpatialIndex],
+        exclusion_layer: Optional[str],
+        generation: int,
+    ) -> _IndexEntry:
+        """Build an index and publish it, unless invalidate() ran meanwhile."""
+        start = time.perf_counter()
+        index = builder()
+        entry = _IndexEntry(
+            index=index,
+            exclusion_layer=exclusion_layer,
+            exclusions_applied=0,
+            build_seconds=time.perf_counter() - start,
+            built_at=time.monotonic(),
+        )
+        with self._lock:
+            if generation == self._invalidations:
+                self._indexes[key] = entry
+                self._builds[key[0]] = self._builds.get(key[0], 0) + 1
+        return entry
+
+    def _apply_exclusions(self, entry: _IndexEntry) -> SpatialIndex:
+        """Apply exclusions added since the index last saw its layer.
+
+        Must be called with the lock held.
+        """
+        if entry.exclusion_layer is not None:
+            excluded = self._exclusions.get(entry.exclusion_layer, [])
+            if entry.exclusions_applied < len(excluded):
+                entry.index.exclude(excluded[entry.exclusions_applied :])
+                entry.exclusions_applied = len(excluded)
+        return entry.index
+
+    def get_index(
+        self,
+        name: str,
+        airports_data: Dict[str, Dict[str, Any]],
+        predicate: Optional[Callable[[str, Dict[str, Any]], bool]] = None,
+        exclusion_layer: Optional[str] = None,
+    ) -> SpatialIndex:
+        """
+        Get or build a cached spatial index over a subset of airports.
+
+        Args:
+            name: Index name; must identify the predicate (e.g. "runway>=5000")
+            airports_data: Dictionary of airport data
+            predicate: Optional (icao, data) -> bool selecting the airports to index
+            exclusion_layer: Optional exclusion layer masked out of results
+
+        Returns:
+            SpatialIndex instance
+        """
+
+        def build() -> SpatialIndex:
+            if predicate is not None:
+                subset = {
+                    icao: data
+                    for icao, data in airports_data.items()
+                    if predicate(icao, data)
+                }
+            else:
+                subset = airports_data
+            index = SpatialIndex()
+            index.build(subset)
+            return index
 
-        # Sort by distance
-        results.sort(key=lambda x: x[1])
-        return results
+        return self._get_or_build(name, airports_data, build, exclusion_layer)
+
+    def get_metar_index(self, airports_data: Dict[str, Dict[str, Any]]) -> SpatialIndex:
+        """
+        Get or build the cached spatial index of airports that report METAR.
+
+        The index holds the METAR stations of the memory-mapped airport spatial
+        cache (rebuilt from airports_data when stale), minus the
+        EXCLUDE_METAR_BLACKLIST layer. Without a spatial cache every airport
+        with coordinates is indexed.
+
+        Args:
+            airports_data: Dictionary of all airport data
+
+        Returns:
+            SpatialIndex instance
+        """
+        from backend.data.spatial_cache import get_airport_spatial_cache
+
+        def build() -> SpatialIndex:
+            spatial_cache = get_airport_spatial_cache(airports_data)
+            if spatial_cache is None:
+                index = SpatialIndex()
+                index.build(airports_data)
+                return index
+
+            stations = np.asarray(spatial_cache.metar_station, dtype=bool)
+            return SpatialIndex.from_points(
+                spatial_cache.icao_codes()[stations],
+                spatial_cache.latitude[stations],
+                spatial_cache.longitude[stations],
+            )
+
+        return self._get_or_build(
+            INDEX_METAR, airports_data, build, EXCLUDE_METAR_BLACKLIST
+        )
+
+    def exclude(self, layer: str, codes: Iterable[str]) -> None:
+        """
+        Add airports to an exclusion layer.
+
+        Indexes using the layer mask them out on their next lookup.
+
+        Args:
+            layer: Exclusion layer name (e.g. EXCLUDE_METAR_BLACKLIST)
+            codes: ICAO codes to exclude
+        """
+        with self._lock:
+            excluded = self._exclusions.setdefault(layer, [])
+            excluded_set = self._exclusion_sets.setdefault(layer, set())
+            for icao in codes:
+                if icao not in excluded_set:
+                    excluded_set.add(icao)
+                    excluded.append(icao)
+
+    def add_invalidation_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback to run whenever invalidate() is called.
+
+        Use it for caches of results derived from the indexes.
+
+        Args:
+            callback: Function taking no arguments
+        """
+        with self._lock:
+            self._invalidation_listeners.append(callback)
+
+    def invalidate(self) -> None:
+        """
+        Drop every cached index so the next lookups rebuild them.
+
+        Exclusion layers are kept. Registered invalidation listeners are
+        called after the indexes are dropped.
+        """
+        with self._lock:
+            self._indexes.clear()
+            self._fingerprints.clear()
+            self._invalidations += 1
+            listeners = list(self._invalidation_listeners)
+
+        for callback in listeners:
+            callback()
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """
+        Get the service's cache statistics and memory footprint.
+
+        Returns:
+            Dictionary with per-index details ('indexes'), build counts per
+            index name ('builds'), 'hits', 'misses', 'invalidations', the
+            size of each exclusion layer ('exclusions') and the total
+            approximate index memory in bytes ('nbytes')
+        """
+        with self._lock:
+            now = time.monotonic()
+            indexes = [
+                {
+                    "name": name,
+                    "airports": len(entry.index),
+                    "excluded": entry.index.excluded_count,
+                    "nbytes": entry.index.nbytes,
+                    "build_ms": round(entry.build_seconds * 1000, 2),
+                    "age_seconds": round(now - entry.built_at, 1),
+                }
+                for (name, _fingerprint), entry in self._indexes.items()
+            ]
+            return {
+                "indexes": indexes,
+                "builds": dict(self._builds),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "exclusions": {
+                    layer: len(codes) for layer, codes in self._exclusions.items()
+                },
+                "nbytes": sum(index["nbytes"] for index in indexes),
+            }
+
+
+# Service shared by the whole application
+_SPATIAL_SERVICE = SpatialService()
+
+
+def get_spatial_service() -> SpatialService:
+    """Get the application's spatial service."""
+    return _SPATIAL_SERVICE
+
+
+def get_spatial_index(
+    name: str,
+    airports_data: Dict[str, Dict[str, Any]],
+    predicate: Optional[Callable[[str, Dict[str, Any]], bool]] = None,
+) -> SpatialIndex:
+    """
+    Get or build a cached spatial index over a subset of airports.
+
+    See SpatialService.get_index. This function is thread-safe.
+
+    Args:
+        name: Index name; must identify the predicate (e.g. "runway>=5000")
+        airports_data: Dictionary of airport data
+        predicate: Optional (icao, data) -> bool selecting the airports to index
+
+    Returns:
+        SpatialIndex instance
+    """
+    return _SPATIAL_SERVICE.get_index(name, airports_data, predicate)
 
 
 def get_airport_spatial_index(airports_data: Dict[str, Dict[str, Any]]) -> SpatialIndex:
     """
-    Get or build the cached airport spatial index.
+    Get or build the cached spatial index of every airport in airports_data.
 
-    The index is cached globally and rebuilt every 5 minutes to pick up
-    any changes to airport data. It also rebuilds if a larger dataset is
-    passed (e.g., switching from tracked airports to full database).
+    Pass the tracked airports to search only those, or the full database to
+    search everything; each set gets its own index.
 
     This function is thread-safe.
 
@@ -217,44 +792,61 @@ def get_airport_spatial_index(airports_data: Dict[str, Dict[str, Any]]) -> Spati
     Returns:
         SpatialIndex instance
     """
-    global \
-        _AIRPORT_SPATIAL_INDEX, \
-        _AIRPORT_SPATIAL_INDEX_TIMESTAMP, \
-        _AIRPORT_SPATIAL_INDEX_SIZE
-
-    current_time = datetime.now(timezone.utc)
-    current_size = len(airports_data) if airports_data else 0
-
-    with _AIRPORT_SPATIAL_INDEX_LOCK:
-        # Check if we need to build or rebuild the index
-        # Rebuild if: no index, TTL expired, OR larger dataset requested
-        needs_rebuild = (
-            _AIRPORT_SPATIAL_INDEX is None
-            or _AIRPORT_SPATIAL_INDEX_TIMESTAMP is None
-            or (current_time - _AIRPORT_SPATIAL_INDEX_TIMESTAMP).total_seconds()
-            > _SPATIAL_INDEX_TTL_SECONDS
-            or current_size > _AIRPORT_SPATIAL_INDEX_SIZE  # Rebuild for larger datasets
+    return get_spatial_index(INDEX_AIRPORTS, airports_data)
+
+
+def get_towered_spatial_index(
+    airports_data: Dict[str, Dict[str, Any]],
+) -> SpatialIndex:
+    """
+    Get or build the cached spatial index of towered (ATCT) airports.
+
+    Args:
+        airports_data: Dictionary of airport data
+
+    Returns:
+        SpatialIndex instance
+    """
+    return get_spatial_index(
+        INDEX_TOWERED,
+        airports_data,
+        lambda _icao, data: data.get("tower_type") == "ATCT",
+    )
+
+
+def get_runway_spatial_index(
+    airports_data: Dict[str, Dict[str, Any]], min_runway_ft: int
+) -> SpatialIndex:
+    """
+    Get or build the cached spatial index of airports with a long enough runway.
+
+    Args:
+        airports_data: Dictionary of airport data
+        min_runway_ft: Minimum length of the longest open runway in feet
+
+    Returns:
+        SpatialIndex instance
+    """
+    from backend.data.runways import load_runway_data
+
+    runways = load_runway_data()
+
+    def has_runway(icao: str, _data: Dict[str, Any]) -> bool:
+        return any(
+            not runway.closed and runway.length_ft >= min_runway_ft
+            for runway in runways.get(icao, ())
         )
 
-        if needs_rebuild:
-            index = SpatialIndex()
-            index.build(airports_data)
-            _AIRPORT_SPATIAL_INDEX = index
-            _AIRPORT_SPATIAL_INDEX_TIMESTAMP = current_time
-            _AIRPORT_SPATIAL_INDEX_SIZE = current_size
+    return get_spatial_index(
+        f"{INDEX_RUNWAY}>={min_runway_ft}", airports_data, has_runway
+    )
+
 
-        assert _AIRPORT_SPATIAL_INDEX is not None
-        return _AIRPORT_SPATIAL_INDEX
+def get_spatial_stats() -> Dict[str, Any]:
+    """Get the spatial service diagnostics (see SpatialService.diagnostics)."""
+    return _SPATIAL_SERVICE.diagnostics()
 
 
 def clear_spatial_index_cache() -> None:
-    """Clear the spatial index cache (thread-safe)."""
-    global \
-        _AIRPORT_SPATIAL_INDEX, \
-        _AIRPORT_SPATIAL_INDEX_TIMESTAMP, \
-        _AIRPORT_SPATIAL_INDEX_SIZE
-
-    with _AIRPORT_SPATIAL_INDEX_LOCK:
-        _AIRPORT_SPATIAL_INDEX = None
-        _AIRPORT_SPATIAL_INDEX_TIMESTAMP = None
-        _AIRPORT_SPATIAL_INDEX_SIZE = 0
+    """Drop every cached spatial index (thread-safe)."""
+    _SPATIAL_SERVICE.invalidate()
@@ -0,0 +1,125 @@
+"""
+Loaders for TRACON and ARTCC boundary polygons.
+
+TRACON boundaries come from the SimAware files in data/simaware_boundaries
+(one file per facility, one polygon per sector; see
+scripts/generate_simaware_boundaries.py). ARTCC boundaries come from the
+vNAS boundary cache written by the weather daemon
+(scripts/weather_daemon/artcc_boundaries.py), falling back to the embedded
+approximations in embedded_artcc_boundaries.py when it hasn't run yet.
+
+Every loader returns facility ID -> list of rings, each ring a float64 array
+of shape (n, 2) holding (latitude, longitude) pairs.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from backend.data.embedded_artcc_boundaries import get_embedded_boundaries
+from common import logger as debug_logger
+from common.paths import get_data_dir, get_project_root
+
+SIMAWARE_BOUNDARIES_DIRNAME = "simaware_boundaries"
+
+# Where the weather daemon caches the vNAS ARTCC boundaries
+ARTCC_BOUNDARIES_CACHE_FILE = (
+    get_project_root() / "cache" / "artcc_boundaries" / "artcc_boundaries.json"
+)
+
+
+def _to_ring(coordinates: Any) -> Optional[np.ndarray]:
+    """Convert a list of [lat, lon] points to a ring array (None if invalid)."""
+    try:
+        ring = np.asarray(coordinates, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if ring.ndim != 2 or ring.shape[1] != 2 or len(ring) < 3:
+        return None
+    if not np.isfinite(ring).all():
+        return None
+    return ring
+
+
+def load_tracon_boundaries(
+    boundaries_dir: Optional[Path] = None,
+) -> Dict[str, List[np.ndarray]]:
+    """
+    Load the SimAware TRACON boundaries.
+
+    Each facility's rings are all of its sector polygons (e.g. NCT has
+    SFO, OAK, SJC, ...), so together they cover the whole facility.
+
+    Args:
+        boundaries_dir: Directory of SimAware JSON files (default: data dir)
+
+    Returns:
+        Dictionary mapping facility IDs to lists of rings
+    """
+    if boundaries_dir is None:
+        boundaries_dir = get_data_dir() / SIMAWARE_BOUNDARIES_DIRNAME
+
+    boundaries: Dict[str, List[np.ndarray]] = {}
+    if not boundaries_dir.exists():
+        return boundaries
+
+    for json_file in sorted(boundaries_dir.glob("*.json")):
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            debug_logger.warning(f"Could not load TRACON boundary {json_file}: {e}")
+            continue
+        if not isinstance(data, dict):
+            continue
+
+        rings = []
+        for sector in data.values():
+            if not isinstance(sector, dict):
+                continue
+            ring = _to_ring(sector.get("coordinates"))
+            if ring is not None:
+                rings.append(ring)
+        if rings:
+            boundaries[json_file.stem] = rings
+
+    return boundaries
+
+
+def load_artcc_boundaries(
+    cache_file: Optional[Path] = None,
+) -> Dict[str, List[np.ndarray]]:
+    """
+    Load the ARTCC boundaries.
+
+    Uses the weather daemon's vNAS boundary cache when present (of any AIRAC
+    cycle; boundaries rarely change), otherwise the embedded approximations.
+
+    Args:
+        cache_file: vNAS boundary cache file (default: the daemon's cache)
+
+    Returns:
+        Dictionary mapping ARTCC IDs to lists of rings
+    """
+    if cache_file is None:
+        cache_file = ARTCC_BOUNDARIES_CACHE_FILE
+
+    raw: Dict[str, Any] = {}
+    if cache_file.exists():
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                raw = json.load(f).get("boundaries", {})
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            debug_logger.warning(f"Could not load ARTCC boundaries {cache_file}: {e}")
+
+    if not raw:
+        raw = get_embedded_boundaries()
+
+    boundaries: Dict[str, List[np.ndarray]] = {}
+    for artcc, polygons in raw.items():
+        rings = [ring for ring in map(_to_ring, polygons) if ring is not None]
+        if rings:
+            boundaries[artcc.upper()] = rings
+    return boundaries
@@ -81,6 +81,18 @@ METAR_REMOVAL_PATTERNS = [
     # Orphaned "UTC." leftover
     r"\bUTC\.\s*",
 ]
+_METAR_REMOVAL_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in METAR_REMOVAL_PATTERNS
+]
+
+# Cleanup of the text left after the METAR removal
+_WHITESPACE_RE = re.compile(r"\s+")
+_EMPTY_PARENS_RE = re.compile(r"\(\s*\)")
+_SPACE_BEFORE_DOT_RE = re.compile(r"\s+\.")
+_SPACE_BEFORE_COMMA_RE = re.compile(r"\s+,")
+_LONG_DOTS_RE = re.compile(r"\.{4,}")
+_FOUR_DOTS_RE = re.compile(r"\.\.\.\.")
+_DOUBLE_DOT_RE = re.compile(r"(?<!\.)\.\.(?!\.)")
 
 
 def filter_atis_text(atis_text: str) -> str:
@@ -99,26 +111,36 @@ def filter_atis_text(atis_text: str) -> str:
 
     # Remove METAR patterns
     filtered = atis_text
-    for pattern in METAR_REMOVAL_PATTERNS:
-        filtered = re.sub(pattern, " ", filtered, flags=re.IGNORECASE)
+    for pattern in _METAR_REMOVAL_RES:
+        filtered = pattern.sub(" ", filtered)
 
     # Clean up multiple spaces and trim
-    filtered = re.sub(r"\s+", " ", filtered).strip()
+    filtered = _WHITESPACE_RE.sub(" ", filtered).strip()
 
     # Remove orphaned parentheses and punctuation
-    filtered = re.sub(r"\(\s*\)", "", filtered)
-    filtered = re.sub(r"\s+\.", ".", filtered)
-    filtered = re.sub(r"\s+,", ",", filtered)
+    filtered = _EMPTY_PARENS_RE.sub("", filtered)
+    filtered = _SPACE_BEFORE_DOT_RE.sub(".", filtered)
+    filtered = _SPACE_BEFORE_COMMA_RE.sub(",", filtered)
     # Clean up multiple dots - normalize to single dot or ellipsis
-    filtered = re.sub(r"\.{4,}", "...", filtered)  # 4+ dots -> ellipsis
-    filtered = re.sub(r"\.\.\.\.", "...", filtered)  # 4 dots -> ellipsis
-    filtered = re.sub(r"(?<!\.)\.\.(?!\.)", ".", filtered)  # exactly 2 dots -> 1 dot
+    filtered = _LONG_DOTS_RE.sub("...", filtered)  # 4+ dots -> ellipsis
+    filtered = _FOUR_DOTS_RE.sub("...", filtered)  # 4 dots -> ellipsis
+    filtered = _DOUBLE_DOT_RE.sub(".", filtered)  # exactly 2 dots -> 1 dot
     # Clean up space before punctuation one more time
-    filtered = re.sub(r"\s+\.", ".", filtered)
+    filtered = _SPACE_BEFORE_DOT_RE.sub(".", filtered)
 
     return filtered
 
 
+# Runway number with optional direction: "17R", "17 RIGHT", "17RIGHT"
+_RUNWAY_NUMBER_RE = re.compile(
+    r"\b(\d{1,2})\s*([LRC]|LEFT|RIGHT|CENTER)?\b", re.IGNORECASE
+)
+# Standalone direction referring to the previous runway number: "17R AND LEFT"
+_STANDALONE_DIRECTION_RE = re.compile(
+    r"\b(AND|&|,)\s+(LEFT|RIGHT|CENTER)\b", re.IGNORECASE
+)
+
+
 def _extract_runway_numbers(text: str) -> Set[str]:
     """
     Extract runway numbers from a text fragment.
@@ -135,8 +157,7 @@ def _extract_runway_numbers(text: str) -> Set[str]:
 
     # Pattern 1: Match runway numbers with optional space before direction
     # e.g., "17R", "17L", "17 RIGHT", "17 LEFT", "17RIGHT"
-    pattern = r"\b(\d{1,2})\s*([LRC]|LEFT|RIGHT|CENTER)?\b"
-    for match in re.finditer(pattern, text, re.IGNORECASE):
+    for match in _RUNWAY_NUMBER_RE.finditer(text):
         num = match.group(1)
         suffix = match.group(2) or ""
         # Convert spoken forms to single letter
@@ -147,8 +168,7 @@ def _extract_runway_numbers(text: str) -> Set[str]:
     # Pattern 2: Handle standalone LEFT/RIGHT/CENTER that refer to the previous runway number
     # e.g., "17R AND LEFT" means 17R and 17L
     if last_runway_num:
-        standalone_pattern = r"\b(AND|&|,)\s+(LEFT|RIGHT|CENTER)\b"
-        for match in re.finditer(standalone_pattern, text, re.IGNORECASE):
+        for match in _STANDALONE_DIRECTION_RE.finditer(text):
             direction = match.group(2).upper()
             suffix = suffix_map.get(direction, "")
             if suffix:
@@ -157,6 +177,59 @@ def _extract_runway_numbers(text: str) -> Set[str]:
     return runways
 
 
+# Runway assignment patterns for parse_approach_info (matched against upper-cased text)
+_COMPOUND_RE = re.compile(
+    rf"\b(?:{LANDING_KW})\s*(?:/|AND)\s*"
+    rf"(?:{DEPARTING_KW})\s*"
+    rf"(?:{RWY_PREFIX})?\s*"
+    rf"({RWY_CHARS})"
+)
+
+_LANDING_RE = re.compile(
+    rf"\b(?:{LANDING_KW})\s+"
+    rf"(?:{RWY_PREFIX})?\s*"
+    rf"({RWY_CHARS})"
+)
+
+_DEPARTING_RE = re.compile(
+    rf"\b(?:{DEPARTING_KW})\s+"
+    rf"(?:{RWY_PREFIX})?\s*(?:{RWY_PREFIX})?\s*"
+    rf"({RWY_CHARS})"
+)
+
+_APPROACH_RE = re.compile(
+    rf"\b({APPROACH_TYPES})[-\s]?[XYZWUK]?\s*"
+    rf"(?:{APPROACH_SUFFIX})?\s*"
+    r"(?:TO\s+)?"
+    rf"(?:{RWY_PREFIX})?\s*"
+    rf"({RWY_NUM_PATTERN})"
+)
+
+_EXPECT_RE = re.compile(
+    r"\b(?:ARRIVALS?\s+)?(?:EXPECT|EXPT?|EXPECTED)\s+"
+    r"(?:PROC\s+)?"
+    rf"({APPROACH_TYPES})[-\s]?[XYZWUK]?\s*"
+    rf"(?:{APPROACH_SUFFIX})?\s*"
+    rf"(?:{RWY_PREFIX})?\s*(?:{RWY_PREFIX})?\s*"
+    rf"({RWY_NUM_PATTERN})"
+)
+
+_FOR_RE = re.compile(
+    rf"\b(?:{RWY_PREFIX})\s*"
+    r"(\d{1,2}[LRC]?)\s+"
+    r"FOR\s+(?:ALL\s+(?:OTHER\s+)?)?"
+    r"(ARR(?:IVALS?)?|DEP(?:ARTURES?)?)"
+)
+
+_SIMUL_RE = re.compile(
+    r"\b(?:SIMUL?(?:TANEOUS)?|INSTR?)\s+"
+    r"(DEPARTURES?|ARRIVALS?|DEPS?|ARRS?)\s+"
+    r"(?:IN\s+(?:PROG(?:RESS)?|USE|EFFECT)\s+)?"
+    rf"(?:{RWY_PREFIX})?\s*"
+    rf"({RWY_NUM_PATTERN})"
+)
+
+
 def parse_approach_info(atis_text: str) -> Dict[str, Any]:
     """
     Parse ATIS text to extract active runway assignments AND approach types.
@@ -188,25 +261,14 @@ def parse_approach_info(atis_text: str) -> Dict[str, Any]:
 
     # Pattern 1: Compound LDG/DEPTG or LDG AND DEPTG format (both ops on same runways)
     # e.g., "LDG/DEPTG 4/8", "LDG AND DEPTG RWY 27", "ARR/DEP RWY 36"
-    compound_pattern = (
-        rf"\b(?:{LANDING_KW})\s*(?:/|AND)\s*"
-        rf"(?:{DEPARTING_KW})\s*"
-        rf"(?:{RWY_PREFIX})?\s*"
-        rf"({RWY_CHARS})"
-    )
-    for match in re.finditer(compound_pattern, text):
+    for match in _COMPOUND_RE.finditer(text):
         rwys = _extract_runway_numbers(match.group(1))
         landing.update(rwys)
         departing.update(rwys)
 
     # Pattern 2: Landing/Arriving runways
     # e.g., "LDG RWY 16L", "LANDING RUNWAY 27", "ARR RWY 35", "LNDG RWYS 17R AND LEFT"
-    landing_pattern = (
-        rf"\b(?:{LANDING_KW})\s+"
-        rf"(?:{RWY_PREFIX})?\s*"
-        rf"({RWY_CHARS})"
-    )
-    for match in re.finditer(landing_pattern, text):
+    for match in _LANDING_RE.finditer(text):
         # Skip if this is part of a compound pattern (already handled)
         start = match.start()
         prefix_check = text[max(0, start - 5) : start]
@@ -218,12 +280,7 @@ def parse_approach_info(atis_text: str) -> Dict[str, Any]:
     # Pattern 3: Departing runways
     # e.g., "DEP RWY 16R", "DEPARTING RWYS 26L, 27R", "DEPTG RWY 18"
     # Handles malformed double prefix: "DEPG RWYS RWY 10L"
-    departing_pattern = (
-        rf"\b(?:{DEPARTING_KW})\s+"
-        rf"(?:{RWY_PREFIX})?\s*(?:{RWY_PREFIX})?\s*"
-        rf"({RWY_CHARS})"
-    )
-    for match in re.finditer(departing_pattern, text):
+    for match in _DEPARTING_RE.finditer(text):
         # Skip if this is part of a compound pattern
         start = match.start()
         prefix_check = text[max(0, start - 5) : start]
@@ -235,14 +292,7 @@ def parse_approach_info(atis_text: str) -> Dict[str, Any]:
     # Pattern 4: Approach types imply landing runway (CAPTURE APPROACH TYPE)
     # e.g., "ILS RWY 22R", "RNAV-Y RWY 35", "VISUAL APPROACH RWY 26"
     # Also handles spoken forms: "ILS RWYS 17R AND LEFT" means 17R and 17L
-    approach_pattern = (
-        rf"\b({APPROACH_TYPES})[-\s]?[XYZWUK]?\s*"
-        rf"(?:{APPROACH_SUFFIX})?\s*"
-        r"(?:TO\s+)?"
-        rf"(?:{RWY_PREFIX})?\s*"
-        rf"({RWY_NUM_PATTERN})"
-    )
-    for match in re.finditer(approach_pattern, text):
+    for match in _APPROACH_RE.finditer(text):
         approach_type = match.group(1)
         rwys = _extract_runway_numbers(match.group(2))
         landing.update(rwys)
@@ -252,15 +302,7 @@ def parse_approach_info(atis_text: str) -> Dict[str, Any]:
     # e.g., "EXPECT ILS RWY 35L", "EXP VIS APCH RWY 27", "ARRIVALS EXPECT ILS APCH RWY 10L"
     # Also handles spoken forms: "EXPECT ILS RWYS 17R AND LEFT"
     # Handles malformed double prefix: "ARRIVALS EXPECT ILS RWYS RWY 10L"
-    expect_pattern = (
-        r"\b(?:ARRIVALS?\s+)?(?:EXPECT|EXPT?|EXPECTED)\s+"
-        r"(?:PROC\s+)?"
-        rf"({APPROACH_TYPES})[-\s]?[XYZWUK]?\s*"
-        rf"(?:{APPROACH_SUFFIX})?\s*"
-        rf"(?:{RWY_PREFIX})?\s*(?:{RWY_PREFIX})?\s*"
-        rf"({RWY_NUM_PATTERN})"
-    )
-    for match in re.finditer(expect_pattern, text):
+    for match in _EXPECT_RE.finditer(text):
         approach_type = match.group(1)
         rwys = _extract_runway_numbers(match.group(2))
         landing.update(rwys)
@@ -268,13 +310,7 @@ def parse_approach_info(atis_text: str) -> Dict[str, Any]:
 
     # Pattern 6: RWY XX FOR ARR/DEP (Australian/international style)
     # e.g., "RWY 03 FOR ARR", "RWY 06 FOR DEP"
-    for_pattern = (
-        rf"\b(?:{RWY_PREFIX})\s*"
-        r"(\d{1,2}[LRC]?)\s+"
-        r"FOR\s+(?:ALL\s+(?:OTHER\s+)?)?"
-        r"(ARR(?:IVALS?)?|DEP(?:ARTURES?)?)"
-    )
-    for match in re.finditer(for_pattern, text):
+    for match in _FOR_RE.finditer(text):
         rwy = match.group(1)
         op_type = match.group(2).upper()
         if op_type.startswith("ARR"):
@@ -284,14 +320,7 @@ def parse_approach_info(atis_text: str) -> Dict[str, Any]:
 
     # Pattern 7: SIMUL/INSTR operations
     # e.g., "SIMUL DEPARTURES RWYS 24 AND 25"
-    simul_pattern = (
-        r"\b(?:SIMUL?(?:TANEOUS)?|INSTR?)\s+"
-        r"(DEPARTURES?|ARRIVALS?|DEPS?|ARRS?)\s+"
-        r"(?:IN\s+(?:PROG(?:RESS)?|USE|EFFECT)\s+)?"
-        rf"(?:{RWY_PREFIX})?\s*"
-        rf"({RWY_NUM_PATTERN})"
-    )
-    for match in re.finditer(simul_pattern, text):
+    for match in _SIMUL_RE.finditer(text):
         op_type = match.group(1).upper()
         rwys = _extract_runway_numbers(match.group(2))
         if op_type.startswith("ARR"):
@@ -318,6 +347,9 @@ def parse_runway_assignments(atis_text: str) -> Dict[str, Set[str]]:
     return {"landing": result["landing"], "departing": result["departing"]}
 
 
+_LEADING_DIGITS_RE = re.compile(r"\d+")
+
+
 def format_runway_summary(assignments: Dict[str, Set[str]]) -> str:
     """
     Format runway assignments as a compact summary string.
@@ -336,7 +368,7 @@ def format_runway_summary(assignments: Dict[str, Set[str]]) -> str:
 
     # Sort runways for consistent display (handle malformed runway strings gracefully)
     def runway_sort_key(x: str) -> Tuple[int, str]:
-        match = re.match(r"\d+", x)
+        match = _LEADING_DIGITS_RE.match(x)
         return (int(match.group()) if match else 99, x)
 
     landing_sorted = sorted(landing, key=runway_sort_key)
@@ -355,6 +387,145 @@ def format_runway_summary(assignments: Dict[str, Set[str]]) -> str:
     return " ".join(parts)
 
 
+# Approach/runway highlighting for colorize_atis_text, applied in order:
+# (pattern, replacement)
+_APPROACH_HIGHLIGHTS = [
+    # Pattern 1: Approach type + optional variant + optional comma + RWY + runway numbers
+    # e.g., "ILS Z RWY 22R", "RNAV-Y RWY 35", "ILS RWYS 16R AND 16L", "ILS, RWY 12"
+    # Also handles spoken forms: "ILS RWYS 17R AND LEFT" means 17R and 17L
+    (
+        re.compile(
+            rf"\b({APPROACH_TYPES})[-\s]?([XYZWUK])?,?\s*"
+            rf"({RWY_PREFIX})?\s*"
+            rf"({RWY_NUM_PATTERN})\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 2: Approach type + APCH/APPROACH + RWY + runway numbers
+    # e.g., "ILS APCH RWY 35L", "VISUAL APPROACH RWY 26R", "VIS APCH RWYS 17L, 17R"
+    # Also handles spoken forms: "ILS APCH RWYS 17R AND LEFT"
+    (
+        re.compile(
+            rf"\b({APPROACH_TYPES}|INSTR?)[-\s]?([XYZWUK])?\s*"
+            rf"({APPROACH_SUFFIX})\s*"
+            rf"((?:TO\s+)?(?:{RWY_PREFIX})?\s*{RWY_NUM_PATTERN})?",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 3: APCH + approach type (Canadian/other style)
+    # e.g., "APCH ILS OR RNAV RWY 27"
+    # Also handles spoken forms: "APCH ILS RWYS 17R AND LEFT"
+    (
+        re.compile(
+            rf"\b(APCH)\s+((?:{APPROACH_TYPES})(?:\s+OR\s+(?:{APPROACH_TYPES}))*)"
+            rf"(\s+(?:{RWY_PREFIX})\s*{RWY_NUM_PATTERN})?",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 4: Standalone approach mentions
+    # e.g., "ILS APPROACHES", "VISUAL APCHS IN USE", "INST APCHS"
+    (
+        re.compile(
+            rf"\b({APPROACH_TYPES}|INSTR?)\s+"
+            rf"({APPROACH_SUFFIX})\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\1 \2[/yellow]",
+    ),
+    # Pattern 5: EXPECT/EXP + approach type (also handles "ARRIVALS EXPECT...")
+    # e.g., "EXPECT ILS APPROACH", "EXP VIS APCH", "EXPT PROC ILS", "ARRIVALS EXPECT ILS APCH RWY 10L"
+    (
+        re.compile(
+            r"\b((?:ARRIVALS?\s+)?(?:EXPECT|EXPT?|EXPECTED))\s+(?:PROC\s+)?"
+            rf"({APPROACH_TYPES}|INSTR?)[-\s]?([XYZWUK])?\s*"
+            rf"(?:{APPROACH_SUFFIX})?\s*"
+            rf"(?:(?:{RWY_PREFIX})\s*(?:{RWY_PREFIX})?\s*{RWY_NUM_PATTERN})?",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 6: Compound LDG/DEPTG or LDG AND DEPTG format - must come before Pattern 7
+    # e.g., "LDG/DEPTG 4/8", "LNDG AND DEPG RWY 17R, 17L", "LDG AND DEPTG RWY 27"
+    # Also handles spoken forms: "LDG/DEPTG 17R AND LEFT"
+    (
+        re.compile(
+            rf"\b((?:{LANDING_KW})\s*(?:/|AND)\s*(?:{DEPARTING_KW}))\s*"
+            rf"((?:{RWY_PREFIX})?\s*)?"
+            rf"({RWY_NUM_PATTERN})\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 6b: ARR/DEP compound format
+    # e.g., "ARR/DEP RWY 36", "ARR AND DEP RWY 30"
+    # Also handles spoken forms: "ARR/DEP 17R AND LEFT"
+    (
+        re.compile(
+            r"\b(ARR(?:IVING)?\s*(?:/|AND)\s*DEP(?:ARTING)?)\s*"
+            rf"((?:{RWY_PREFIX})?\s*)?"
+            rf"({RWY_NUM_PATTERN})\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 7: Runway assignments (LDG/ARR/DEP + RWY + numbers)
+    # e.g., "LDG RWY 16L", "DEPTG RWYS 26L, 27R", "LANDING RUNWAY 27", "DEPARTING RWY 18"
+    # Also handles DEPG (common variant), DEPARTURE
+    # Handles spoken forms: "17R AND LEFT", "28L AND RIGHT"
+    # Handles malformed double prefix: "DEPG RWYS RWY 10L" (some controllers do this)
+    # Uses negative lookbehind to avoid matching after "/" or "AND " (already handled by Pattern 6)
+    (
+        re.compile(
+            rf"(?<!/)(?<!AND )\b({LANDING_KW}|{DEPARTING_KW})\s+"
+            rf"((?:{RWY_PREFIX})\s*(?:{RWY_PREFIX})?\s*)?"
+            rf"({RWY_NUM_PATTERN})\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 8: INSTR DEPARTURES IN PROG + RWYS (LAX style)
+    # e.g., "INSTR DEPARTURES IN PROG RWYS 24 AND 25"
+    # Also handles spoken forms: "SIMUL ARRIVALS RWYS 17R AND LEFT"
+    (
+        re.compile(
+            r"\b(INSTR?|SIMUL?(?:TANEOUS)?)\s+"
+            r"(DEPARTURES?|ARRIVALS?|DEPS?|ARRS?)\s+"
+            r"(?:IN\s+(?:PROG(?:RESS)?|USE|EFFECT)\s+)?"
+            rf"((?:{RWY_PREFIX})?\s*)?"
+            rf"({RWY_NUM_PATTERN})\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 9: RWY XX FOR ARR/DEP (Australian/international style)
+    # e.g., "RWY 03 FOR ARR", "RWY 06 FOR DEP", "RWY 03 FOR ALL DEP"
+    (
+        re.compile(
+            rf"\b({RWY_PREFIX})\s*"
+            r"(\d{1,2}[LRC]?)\s+"
+            r"FOR\s+(?:ALL\s+(?:OTHER\s+)?)?"
+            r"(ARR(?:IVALS?)?|DEP(?:ARTURES?)?)\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+    # Pattern 10: Parallel operations
+    # e.g., "PARL OPS ARE BEING CNTD", "PARALLEL OPS IN USE", "PARL OPERATIONS"
+    (
+        re.compile(
+            r"\b(PAR(?:A)?L(?:LEL)?)\s+"
+            r"(OPS?|OPERATIONS?)"
+            r"(?:\s+(?:ARE\s+)?(?:BEING\s+)?(?:CNTD|CONDUCTED|IN\s+(?:USE|EFFECT|PROG(?:RESS)?)))?\b",
+            re.IGNORECASE,
+        ),
+        r"[yellow]\g<0>[/yellow]",
+    ),
+]
+
+
 def colorize_atis_text(text: str, atis_code: str = "") -> str:
     """
     Colorize ATIS text with highlighted approach types, runways, and ATIS letter.
@@ -418,137 +589,8 @@ def colorize_atis_text(text: str, atis_code: str = "") -> str:
             flags=re.IGNORECASE,
         )
 
-    # Pattern 1: Approach type + optional variant + optional comma + RWY + runway numbers
-    # e.g., "ILS Z RWY 22R", "RNAV-Y RWY 35", "ILS RWYS 16R AND 16L", "ILS, RWY 12"
-    # Also handles spoken forms: "ILS RWYS 17R AND LEFT" means 17R and 17L
-    result = re.sub(
-        rf"\b({APPROACH_TYPES})[-\s]?([XYZWUK])?,?\s*"
-        rf"({RWY_PREFIX})?\s*"
-        rf"({RWY_NUM_PATTERN})\b",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 2: Approach type + APCH/APPROACH + RWY + runway numbers
-    # e.g., "ILS APCH RWY 35L", "VISUAL APPROACH RWY 26R", "VIS APCH RWYS 17L, 17R"
-    # Also handles spoken forms: "ILS APCH RWYS 17R AND LEFT"
-    result = re.sub(
-        rf"\b({APPROACH_TYPES}|INSTR?)[-\s]?([XYZWUK])?\s*"
-        rf"({APPROACH_SUFFIX})\s*"
-        rf"((?:TO\s+)?(?:{RWY_PREFIX})?\s*{RWY_NUM_PATTERN})?",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 3: APCH + approach type (Canadian/other style)
-    # e.g., "APCH ILS OR RNAV RWY 27"
-    # Also handles spoken forms: "APCH ILS RWYS 17R AND LEFT"
-    result = re.sub(
-        rf"\b(APCH)\s+((?:{APPROACH_TYPES})(?:\s+OR\s+(?:{APPROACH_TYPES}))*)"
-        rf"(\s+(?:{RWY_PREFIX})\s*{RWY_NUM_PATTERN})?",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 4: Standalone approach mentions
-    # e.g., "ILS APPROACHES", "VISUAL APCHS IN USE", "INST APCHS"
-    result = re.sub(
-        rf"\b({APPROACH_TYPES}|INSTR?)\s+"
-        rf"({APPROACH_SUFFIX})\b",
-        r"[yellow]\1 \2[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 5: EXPECT/EXP + approach type (also handles "ARRIVALS EXPECT...")
-    # e.g., "EXPECT ILS APPROACH", "EXP VIS APCH", "EXPT PROC ILS", "ARRIVALS EXPECT ILS APCH RWY 10L"
-    result = re.sub(
-        r"\b((?:ARRIVALS?\s+)?(?:EXPECT|EXPT?|EXPECTED))\s+(?:PROC\s+)?"
-        rf"({APPROACH_TYPES}|INSTR?)[-\s]?([XYZWUK])?\s*"
-        rf"(?:{APPROACH_SUFFIX})?\s*"
-        rf"(?:(?:{RWY_PREFIX})\s*(?:{RWY_PREFIX})?\s*{RWY_NUM_PATTERN})?",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 6: Compound LDG/DEPTG or LDG AND DEPTG format - must come before Pattern 7
-    # e.g., "LDG/DEPTG 4/8", "LNDG AND DEPG RWY 17R, 17L", "LDG AND DEPTG RWY 27"
-    # Also handles spoken forms: "LDG/DEPTG 17R AND LEFT"
-    result = re.sub(
-        rf"\b((?:{LANDING_KW})\s*(?:/|AND)\s*(?:{DEPARTING_KW}))\s*"
-        rf"((?:{RWY_PREFIX})?\s*)?"
-        rf"({RWY_NUM_PATTERN})\b",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 6b: ARR/DEP compound format
-    # e.g., "ARR/DEP RWY 36", "ARR AND DEP RWY 30"
-    # Also handles spoken forms: "ARR/DEP 17R AND LEFT"
-    result = re.sub(
-        r"\b(ARR(?:IVING)?\s*(?:/|AND)\s*DEP(?:ARTING)?)\s*"
-        rf"((?:{RWY_PREFIX})?\s*)?"
-        rf"({RWY_NUM_PATTERN})\b",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 7: Runway assignments (LDG/ARR/DEP + RWY + numbers)
-    # e.g., "LDG RWY 16L", "DEPTG RWYS 26L, 27R", "LANDING RUNWAY 27", "DEPARTING RWY 18"
-    # Also handles DEPG (common variant), DEPARTURE
-    # Handles spoken forms: "17R AND LEFT", "28L AND RIGHT"
-    # Handles malformed double prefix: "DEPG RWYS RWY 10L" (some controllers do this)
-    # Uses negative lookbehind to avoid matching after "/" or "AND " (already handled by Pattern 6)
-    result = re.sub(
-        rf"(?<!/)(?<!AND )\b({LANDING_KW}|{DEPARTING_KW})\s+"
-        rf"((?:{RWY_PREFIX})\s*(?:{RWY_PREFIX})?\s*)?"
-        rf"({RWY_NUM_PATTERN})\b",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 8: INSTR DEPARTURES IN PROG + RWYS (LAX style)
-    # e.g., "INSTR DEPARTURES IN PROG RWYS 24 AND 25"
-    # Also handles spoken forms: "SIMUL ARRIVALS RWYS 17R AND LEFT"
-    result = re.sub(
-        r"\b(INSTR?|SIMUL?(?:TANEOUS)?)\s+"
-        r"(DEPARTURES?|ARRIVALS?|DEPS?|ARRS?)\s+"
-        r"(?:IN\s+(?:PROG(?:RESS)?|USE|EFFECT)\s+)?"
-        rf"((?:{RWY_PREFIX})?\s*)?"
-        rf"({RWY_NUM_PATTERN})\b",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 9: RWY XX FOR ARR/DEP (Australian/international style)
-    # e.g., "RWY 03 FOR ARR", "RWY 06 FOR DEP", "RWY 03 FOR ALL DEP"
-    result = re.sub(
-        rf"\b({RWY_PREFIX})\s*"
-        r"(\d{1,2}[LRC]?)\s+"
-        r"FOR\s+(?:ALL\s+(?:OTHER\s+)?)?"
-        r"(ARR(?:IVALS?)?|DEP(?:ARTURES?)?)\b",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
-
-    # Pattern 10: Parallel operations
-    # e.g., "PARL OPS ARE BEING CNTD", "PARALLEL OPS IN USE", "PARL OPERATIONS"
-    result = re.sub(
-        r"\b(PAR(?:A)?L(?:LEL)?)\s+"
-        r"(OPS?|OPERATIONS?)"
-        r"(?:\s+(?:ARE\s+)?(?:BEING\s+)?(?:CNTD|CONDUCTED|IN\s+(?:USE|EFFECT|PROG(?:RESS)?)))?\b",
-        r"[yellow]\g<0>[/yellow]",
-        result,
-        flags=re.IGNORECASE,
-    )
+    # Highlight approaches, runway assignments and parallel operations
+    for pattern, replacement in _APPROACH_HIGHLIGHTS:
+        result = pattern.sub(replacement, result)
 
     return result
@@ -434,6 +434,53 @@ def parse_approach_record(line: str) -> Optional[CifpApproachFix]:
 # --- High-Level API ---
 
 
+def _normalize_airport_code(airport: str) -> str:
+    """Normalize an airport code for CIFP lookups - handle both "KSFO" and "SFO"."""
+    airport = airport.upper()
+    if airport.startswith("K") and len(airport) == 4:
+        return airport[1:]  # Strip K for CONUS airports
+    return airport
+
+
+def get_airports_with_approaches() -> set[str]:
+    """Get every airport with at least one approach procedure, in one CIFP scan.
+
+    Codes are returned in the form get_approaches_for_airport matches them
+    (e.g. "KSFO", "KRNO"); use has_approaches_in() to test an ICAO code.
+
+    Returns:
+        Set of CIFP airport identifiers, empty if CIFP data is unavailable
+    """
+    cifp_path = ensure_cifp_data(quiet=True)
+    if not cifp_path:
+        return set()
+
+    airports: set[str] = set()
+    try:
+        with open(cifp_path, "r", encoding="latin-1") as f:
+            for line in f:
+                # Position 7-10: Airport ICAO, position 13: Subsection (F = Approach)
+                if len(line) >= 50 and line.startswith("SUSAP") and line[12] == "F":
+                    airports.add(line[6:10])
+    except (OSError, IOError):
+        return set()
+
+    return airports
+
+
+def has_approaches_in(airport: str, airports_with_approaches: set[str]) -> bool:
+    """Check an airport against the result of get_airports_with_approaches().
+
+    Args:
+        airport: Airport code (e.g., "RNO", "KRNO", "KSFO")
+        airports_with_approaches: Set from get_airports_with_approaches()
+
+    Returns:
+        True if get_approaches_for_airport would find approaches for the airport
+    """
+    return f"K{_normalize_airport_code(airport)}" in airports_with_approaches
+
+
 @lru_cache(maxsize=100)
 def get_approaches_for_airport(airport: str) -> dict[str, CifpApproach]:
     """Get all approach procedures for an airport.
@@ -448,13 +495,7 @@ def get_approaches_for_airport(airport: str) -> dict[str, CifpApproach]:
     if not cifp_path:
         return {}
 
-    # Normalize airport code - handle both "KSFO" and "SFO"
-    airport = airport.upper()
-    if airport.startswith("K") and len(airport) == 4:
-        airport_code = airport[1:]  # Strip K for CONUS airports
-    else:
-        airport_code = airport
-
+    airport_code = _normalize_airport_code(airport)
     search_prefix = f"SUSAP K{airport_code}"
 
     approaches: dict[str, CifpApproach] = {}
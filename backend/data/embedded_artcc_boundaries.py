@@ -0,0 +1,148 @@
+"""
+Embedded ARTCC boundary approximations.
+
+Simplified polygons for each US ARTCC, used when the vNAS boundary data
+hasn't been downloaded. Kept free of third-party imports so both the
+airspace loader and the weather daemon can use it.
+"""
+
+from typing import Dict, List, Tuple
+
+
+def get_embedded_boundaries() -> Dict[str, List[List[Tuple[float, float]]]]:
+    """
+    Return embedded ARTCC boundary approximations.
+
+    These are simplified polygon approximations for each ARTCC.
+    Used as a fallback when vNAS API is unavailable.
+    """
+    return {
+        "ZAB": [
+            [
+                (36.5, -109.0),
+                (36.5, -103.5),
+                (32.0, -103.5),
+                (31.0, -106.0),
+                (31.0, -111.5),
+                (33.0, -114.5),
+                (36.5, -114.5),
+                (36.5, -109.0),
+            ]
+        ],
+        "ZAN": [
+            [
+                (71.0, -180.0),
+                (71.0, -130.0),
+                (60.0, -130.0),
+                (54.0, -135.0),
+                (51.0, -170.0),
+                (52.0, -180.0),
+                (71.0, -180.0),
+            ]
+        ],
+        "ZAU": [
+            [(44.0, -90.5), (44.0, -85.0), (39.5, -85.0), (39.5, -90.5), (44.0, -90.5)]
+        ],
+        "ZBW": [
+            [(47.5, -74.0), (47.5, -67.0), (41.0, -67.0), (41.0, -74.0), (47.5, -74.0)]
+        ],
+        "ZDC": [
+            [(41.0, -79.5), (41.0, -74.0), (36.5, -74.0), (36.5, -79.5), (41.0, -79.5)]
+        ],
+        "ZDV": [
+            [
+                (44.0, -111.0),
+                (44.0, -102.0),
+                (37.0, -102.0),
+                (37.0, -111.0),
+                (44.0, -111.0),
+            ]
+        ],
+        "ZFW": [
+            [
+                (36.5, -102.0),
+                (36.5, -94.0),
+                (29.5, -94.0),
+                (29.5, -102.0),
+                (36.5, -102.0),
+            ]
+        ],
+        "ZHU": [
+            [(32.0, -97.0), (32.0, -89.0), (27.0, -89.0), (27.0, -97.0), (32.0, -97.0)]
+        ],
+        "ZID": [
+            [(42.0, -87.0), (42.0, -81.0), (37.0, -81.0), (37.0, -87.0), (42.0, -87.0)]
+        ],
+        "ZJX": [
+            [(32.0, -84.0), (32.0, -79.0), (27.0, -79.0), (27.0, -84.0), (32.0, -84.0)]
+        ],
+        "ZKC": [
+            [(42.0, -97.0), (42.0, -90.5), (36.5, -90.5), (36.5, -97.0), (42.0, -97.0)]
+        ],
+        "ZLA": [
+            [
+                (36.5, -121.0),
+                (36.5, -114.5),
+                (32.0, -114.5),
+                (32.0, -121.0),
+                (36.5, -121.0),
+            ]
+        ],
+        "ZLC": [
+            [
+                (49.0, -117.0),
+                (49.0, -111.0),
+                (40.0, -111.0),
+                (40.0, -117.0),
+                (49.0, -117.0),
+            ]
+        ],
+        "ZMA": [
+            [(27.0, -84.0), (27.0, -77.0), (23.0, -77.0), (23.0, -84.0), (27.0, -84.0)]
+        ],
+        "ZME": [
+            [(37.0, -92.0), (37.0, -86.0), (32.5, -86.0), (32.5, -92.0), (37.0, -92.0)]
+        ],
+        "ZMP": [
+            [(49.0, -97.0), (49.0, -89.0), (43.0, -89.0), (43.0, -97.0), (49.0, -97.0)]
+        ],
+        "ZNY": [
+            [(43.5, -76.5), (43.5, -71.0), (40.0, -71.0), (40.0, -76.5), (43.5, -76.5)]
+        ],
+        "ZOA": [
+            [
+                (41.0, -125.0),
+                (41.0, -118.0),
+                (35.5, -118.0),
+                (35.5, -125.0),
+                (41.0, -125.0),
+            ]
+        ],
+        "ZOB": [
+            [(43.5, -84.0), (43.5, -78.0), (39.5, -78.0), (39.5, -84.0), (43.5, -84.0)]
+        ],
+        "ZSE": [
+            [
+                (49.0, -125.0),
+                (49.0, -117.0),
+                (42.0, -117.0),
+                (42.0, -125.0),
+                (49.0, -125.0),
+            ]
+        ],
+        "ZSU": [
+            [(19.5, -65.0), (19.5, -64.0), (17.5, -64.0), (17.5, -65.0), (19.5, -65.0)]
+        ],
+        "ZTL": [
+            [(36.5, -87.0), (36.5, -81.0), (32.0, -81.0), (32.0, -87.0), (36.5, -87.0)]
+        ],
+        "ZHN": [
+            [
+                (26.0, -164.0),
+                (26.0, -150.0),
+                (17.0, -150.0),
+                (17.0, -164.0),
+                (26.0, -164.0),
+            ]
+        ],
+    }
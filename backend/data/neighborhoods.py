@@ -0,0 +1,371 @@
+"""
+Precomputed airport neighborhood table for alternate and diversion searches.
+
+scripts/precalculate_airport_neighborhoods.py stores, for every airport, its
+alternate-capable neighbors (METAR-capable or with instrument approaches)
+within NEIGHBORHOOD_RADIUS_NM, nearest first, with their distance and bearing.
+Per-airport longest runway, instrument approach and METAR flags are stored
+alongside, so an airport-centric alternate search is a slice of the neighbor
+arrays plus a mask, with no geometry or per-airport lookups at query time.
+
+The table is saved as an uncompressed .npz and memory-mapped on load; only
+the pages of the airports actually queried are read from disk.
+"""
+
+import threading
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from backend.cache.manager import get_metar_cache
+from backend.core.calculations import (
+    calculate_bearing,
+    calculate_bearing_array,
+    haversine_distance_nm,
+)
+from backend.core.spatial import SpatialIndex
+from backend.data.spatial_cache import is_metar_candidate
+from backend.data.weather import find_airports_near_position
+from backend.utils.npz import load_npz_memmap, save_npz
+from common import logger as debug_logger
+from common.paths import get_data_dir
+
+NEIGHBORHOOD_VERSION = 1
+NEIGHBORHOOD_RADIUS_NM = 150.0
+NEIGHBORHOOD_LIMIT = 500  # Max neighbors stored per airport (nearest first)
+NEIGHBORHOOD_FILENAME = "airport_neighborhoods.npz"
+
+# Origins are processed in chunks so the radius query stays small in memory
+_BUILD_CHUNK_SIZE = 2048
+
+
+@dataclass
+class NeighborhoodTable:
+    """
+    Airport neighborhoods in CSR layout.
+
+    Neighbors of the airport at row i are neighbors[offsets[i]:offsets[i + 1]],
+    sorted by distance, with matching distance_nm and bearing_deg entries.
+    The airport itself is not included.
+
+    Attributes:
+        codes: ICAO code per row
+        index: ICAO -> row
+        radius_nm: Radius the neighborhoods were computed for
+        longest_runway_ft: Longest open runway per row (0 if unknown)
+        has_iap: True for rows with instrument approaches
+        metar_capable: True for rows likely to report METAR
+        offsets: int64 start of each row's neighbors (length rows + 1)
+        neighbors: int32 neighbor rows
+        distance_nm: float32 great circle distance to each neighbor
+        bearing_deg: float32 initial bearing to each neighbor
+    """
+
+    codes: np.ndarray
+    index: Dict[str, int]
+    radius_nm: float
+    longest_runway_ft: np.ndarray
+    has_iap: np.ndarray
+    metar_capable: np.ndarray
+    offsets: np.ndarray
+    neighbors: np.ndarray
+    distance_nm: np.ndarray
+    bearing_deg: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, icao: object) -> bool:
+        return icao in self.index
+
+    def neighbors_of(
+        self,
+        icao: str,
+        radius_nm: Optional[float] = None,
+        metar_capable: bool = False,
+        has_iap: bool = False,
+        min_runway_ft: Optional[int] = None,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Get an airport's neighbors, optionally filtered.
+
+        Args:
+            icao: Airport ICAO code
+            radius_nm: Maximum distance (default: the table radius)
+            metar_capable: Only include METAR-capable neighbors
+            has_iap: Only include neighbors with instrument approaches
+            min_runway_ft: Only include neighbors with a runway at least this long
+
+        Returns:
+            Tuple of (rows, distances, bearings) sorted by distance, or None if
+            the airport isn't in the table or radius_nm exceeds the table radius
+        """
+        row = self.index.get(icao)
+        if row is None or (radius_nm is not None and radius_nm > self.radius_nm):
+            return None
+
+        start = int(self.offsets[row])
+        end = int(self.offsets[row + 1])
+        distances = np.asarray(self.distance_nm[start:end])
+        if radius_nm is not None:
+            end = start + int(np.searchsorted(distances, radius_nm, side="right"))
+            distances = distances[: end - start]
+
+        rows = np.asarray(self.neighbors[start:end])
+        bearings = np.asarray(self.bearing_deg[start:end])
+
+        mask = np.ones(len(rows), dtype=bool)
+        if metar_capable:
+            mask &= self.metar_capable[rows]
+        if has_iap:
+            mask &= self.has_iap[rows]
+        if min_runway_ft is not None:
+            mask &= self.longest_runway_ft[rows] >= min_runway_ft
+        return rows[mask], distances[mask], bearings[mask]
+
+
+def build_neighborhood_arrays(
+    airports_data: Dict[str, Dict[str, Any]],
+    longest_runways: Dict[str, int],
+    iap_airports: Set[str],
+    metar_airports: Optional[Set[str]] = None,
+    radius_nm: float = NEIGHBORHOOD_RADIUS_NM,
+    limit: int = NEIGHBORHOOD_LIMIT,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the neighborhood table arrays.
+
+    Args:
+        airports_data: Dictionary of all airport data
+        longest_runways: ICAO -> longest open runway in feet
+        iap_airports: ICAOs with instrument approaches
+        metar_airports: ICAOs known to report METAR (default: is_metar_candidate)
+        radius_nm: Neighborhood radius in nautical miles
+        limit: Max neighbors stored per airport
+
+    Returns:
+        Dictionary of arrays for save_neighborhood_table
+    """
+    codes: List[str] = []
+    lats: List[float] = []
+    lons: List[float] = []
+    for icao, data in airports_data.items():
+        lat = data.get("latitude")
+        lon = data.get("longitude")
+        if lat is None or lon is None:
+            continue
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            continue
+        codes.append(icao)
+        lats.append(lat)
+        lons.append(lon)
+
+    latitude = np.array(lats, dtype=np.float64)
+    longitude = np.array(lons, dtype=np.float64)
+    longest_runway_ft = np.array(
+        [longest_runways.get(icao, 0) for icao in codes], dtype=np.int32
+    )
+    has_iap = np.array([icao in iap_airports for icao in codes], dtype=bool)
+    if metar_airports is None:
+        metar_capable = np.array([is_metar_candidate(icao) for icao in codes])
+    else:
+        metar_capable = np.array([icao in metar_airports for icao in codes])
+    metar_capable = metar_capable.astype(bool).reshape(-1)
+
+    # Only airports that can serve as an alternate are stored as neighbors
+    candidates = np.flatnonzero(metar_capable | has_iap)
+    candidate_index = SpatialIndex.from_points(
+        [codes[row] for row in candidates], latitude[candidates], longitude[candidates]
+    )
+
+    counts = np.zeros(len(codes), dtype=np.int64)
+    neighbor_chunks: List[np.ndarray] = []
+    distance_chunks: List[np.ndarray] = []
+    bearing_chunks: List[np.ndarray] = []
+    for chunk_start in range(0, len(codes), _BUILD_CHUNK_SIZE):
+        origins = np.arange(
+            chunk_start, min(chunk_start + _BUILD_CHUNK_SIZE, len(codes))
+        )
+        matches = candidate_index.query_radius(
+            latitude[origins], longitude[origins], radius_nm
+        )
+        for origin, (rows, distances) in zip(origins.tolist(), matches):
+            rows = candidates[rows]
+            keep = rows != origin
+            rows = rows[keep][:limit]
+            distances = distances[keep][:limit]
+            counts[origin] = len(rows)
+            neighbor_chunks.append(rows.astype(np.int32))
+            distance_chunks.append(distances.astype(np.float32))
+            bearing_chunks.append(
+                calculate_bearing_array(
+                    latitude[origin], longitude[origin], latitude[rows], longitude[rows]
+                ).astype(np.float32)
+            )
+
+    offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    def concat(chunks: List[np.ndarray], dtype) -> np.ndarray:
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=dtype)
+
+    return {
+        "version": np.array(NEIGHBORHOOD_VERSION),
+        "radius_nm": np.array(radius_nm),
+        "codes": np.array(codes, dtype=str),
+        "longest_runway_ft": longest_runway_ft,
+        "has_iap": has_iap,
+        "metar_capable": metar_capable,
+        "offsets": offsets,
+        "neighbors": concat(neighbor_chunks, np.int32),
+        "distance_nm": concat(distance_chunks, np.float32),
+        "bearing_deg": concat(bearing_chunks, np.float32),
+    }
+
+
+def save_neighborhood_table(path: Path, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write neighborhood arrays to an uncompressed .npz (so it can be memory-mapped).
+
+    Args:
+        path: Output file path
+        arrays: Arrays from build_neighborhood_arrays
+    """
+    save_npz(path, arrays)
+
+
+def load_neighborhood_table(path: Path) -> Optional[NeighborhoodTable]:
+    """
+    Load a neighborhood table file.
+
+    Args:
+        path: Path to the .npz file
+
+    Returns:
+        NeighborhoodTable, or None if the file is missing, invalid or outdated
+    """
+    if not path.exists():
+        return None
+
+    try:
+        arrays = load_npz_memmap(path)
+        if int(arrays["version"]) != NEIGHBORHOOD_VERSION:
+            debug_logger.info(f"Ignoring outdated neighborhood table {path}")
+            return None
+
+        codes = np.asarray(arrays["codes"]).astype(object)
+        return NeighborhoodTable(
+            codes=codes,
+            index={icao: row for row, icao in enumerate(codes.tolist())},
+            radius_nm=float(arrays["radius_nm"]),
+            longest_runway_ft=np.asarray(arrays["longest_runway_ft"]),
+            has_iap=np.asarray(arrays["has_iap"]),
+            metar_capable=np.asarray(arrays["metar_capable"]),
+            offsets=arrays["offsets"],
+            neighbors=arrays["neighbors"],
+            distance_nm=arrays["distance_nm"],
+            bearing_deg=arrays["bearing_deg"],
+        )
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        debug_logger.warning(f"Could not load neighborhood table {path}: {e}")
+        return None
+
+
+# Table loaded from the data directory (loaded once on first use)
+_NEIGHBORHOOD_TABLE: Optional[NeighborhoodTable] = None
+_NEIGHBORHOOD_TABLE_LOADED = False
+_NEIGHBORHOOD_TABLE_LOCK = threading.Lock()
+
+
+def get_neighborhood_table() -> Optional[NeighborhoodTable]:
+    """
+    Get the neighborhood table from the data directory (thread-safe).
+
+    Returns:
+        NeighborhoodTable, or None if it hasn't been generated
+    """
+    global _NEIGHBORHOOD_TABLE, _NEIGHBORHOOD_TABLE_LOADED
+
+    with _NEIGHBORHOOD_TABLE_LOCK:
+        if not _NEIGHBORHOOD_TABLE_LOADED:
+            _NEIGHBORHOOD_TABLE = load_neighborhood_table(
+                get_data_dir() / NEIGHBORHOOD_FILENAME
+            )
+            _NEIGHBORHOOD_TABLE_LOADED = True
+        return _NEIGHBORHOOD_TABLE
+
+
+def find_alternate_candidates(
+    origin_icao: str,
+    airports_data: Dict[str, Dict[str, Any]],
+    radius_nm: float = 100.0,
+    max_results: int = 500,
+) -> List[Tuple[str, float, float]]:
+    """
+    Find METAR-capable airports near an airport, for VFR alternate searches.
+
+    Uses the neighborhood table when available, and falls back to a spatial
+    search around the airport's coordinates otherwise. Airports blacklisted
+    for METAR are left out.
+
+    Args:
+        origin_icao: ICAO code of the origin airport
+        airports_data: Dictionary of all airport data
+        radius_nm: Search radius in nautical miles
+        max_results: Maximum number of airports to return
+
+    Returns:
+        List of (icao, distance_nm, bearing_deg) tuples, sorted by distance
+    """
+    _metar_data_cache, metar_blacklist = get_metar_cache()
+
+    table = get_neighborhood_table()
+    neighbors = (
+        table.neighbors_of(origin_icao, radius_nm, metar_capable=True)
+        if table is not None
+        else None
+    )
+    if table is not None and neighbors is not None:
+        rows, distances, bearings = neighbors
+        results = []
+        for icao, distance, bearing in zip(
+            table.codes[rows].tolist(), distances.tolist(), bearings.tolist()
+        ):
+            if icao in metar_blacklist:
+                continue
+            results.append((icao, distance, bearing))
+            if len(results) >= max_results:
+                break
+        return results
+
+    origin_data = airports_data.get(origin_icao, {})
+    origin_lat = origin_data.get("latitude")
+    origin_lon = origin_data.get("longitude")
+    if origin_lat is None or origin_lon is None:
+        return []
+
+    nearby = find_airports_near_position(
+        origin_lat, origin_lon, airports_data, radius_nm=radius_nm, max_results=500
+    )
+    results = []
+    for icao in nearby:
+        if not is_metar_candidate(icao) or icao == origin_icao:
+            continue
+        data = airports_data.get(icao, {})
+        lat = data.get("latitude")
+        lon = data.get("longitude")
+        if lat is None or lon is None:
+            continue
+        results.append(
+            (
+                icao,
+                haversine_distance_nm(origin_lat, origin_lon, lat, lon),
+                calculate_bearing(origin_lat, origin_lon, lat, lon),
+            )
+        )
+        if len(results) >= max_results:
+            break
+    return results
@@ -0,0 +1,374 @@
+"""
+Binary persisted airport spatial cache.
+
+scripts/precalculate_airport_spatial_data.py writes data/airport_spatial_cache.npz:
+airport positions grouped by 1-degree grid cell (sorted cell keys plus
+offsets), float32 latitude/longitude, fixed-width ICAO codes with a sorted
+lookup order, and a flag for airports known to report METAR. The file carries
+a format version, a fingerprint of the airport data it was built from and a
+checksum of its contents.
+
+The arrays are memory-mapped on load, so opening the cache costs microseconds
+instead of parsing JSON, and the METAR airport index is built straight from
+them. A missing, outdated or corrupt cache, or one built from different
+airport data, is rebuilt from the airport data and written to the user cache
+directory.
+"""
+
+import hashlib
+import threading
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from backend.utils.npz import arrays_checksum, load_npz_memmap, save_npz
+from common import logger as debug_logger
+from common.paths import get_data_dir, get_user_cache_dir
+
+SPATIAL_CACHE_VERSION = 3
+SPATIAL_CACHE_FILENAME = "airport_spatial_cache.npz"
+
+# Grid cells are 1 degree; keys encode (int(lat), int(lon)) as one integer
+_CELL_LON_SPAN = 361
+_CHECKSUM_FIELD = "checksum"
+
+
+def is_metar_candidate(icao: str) -> bool:
+    """
+    Check whether an airport code is likely to report METAR.
+
+    4-letter codes with all letters are standard ICAO; this filters out
+    private strips (27CL, CA22, L36, etc.).
+    """
+    return len(icao) == 4 and icao.isalpha()
+
+
+def source_fingerprint(airports_data: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Fingerprint the airport data a cache is built from.
+
+    Covers the ICAO codes and coordinates in order, like
+    backend.core.spatial.dataset_fingerprint, but doesn't depend on Python's
+    per-process string hashing, so it can be stored in the file.
+
+    Args:
+        airports_data: Dictionary mapping ICAO codes to airport data
+
+    Returns:
+        Hex digest of the dict's (ICAO, latitude, longitude) entries
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for icao, data in airports_data.items():
+        digest.update(
+            f"{icao},{data.get('latitude')!r},{data.get('longitude')!r};".encode()
+        )
+    return digest.hexdigest()
+
+
+def encode_cell_keys(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Get the grid cell key of each coordinate.
+
+    Cells are 1 degree, truncated toward zero like int(lat), int(lon).
+
+    Args:
+        lats: Latitudes in decimal degrees
+        lons: Longitudes in decimal degrees
+
+    Returns:
+        int32 array of cell keys
+    """
+    lat_cells = np.trunc(np.asarray(lats, dtype=np.float64)).astype(np.int32)
+    lon_cells = np.trunc(np.asarray(lons, dtype=np.float64)).astype(np.int32)
+    return (lat_cells + 90) * _CELL_LON_SPAN + (lon_cells + 180)
+
+
+def build_spatial_cache_arrays(
+    airports_data: Dict[str, Dict[str, Any]],
+    metar_stations: Optional[Set[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the spatial cache arrays (including version and checksum).
+
+    Args:
+        airports_data: Dictionary of airport data with coordinates
+        metar_stations: ICAOs known to report METAR (None = all airports)
+
+    Returns:
+        Dictionary of arrays for save_spatial_cache
+    """
+    codes = []
+    lats = []
+    lons = []
+    for icao, data in airports_data.items():
+        lat = data.get("latitude")
+        lon = data.get("longitude")
+        if lat is None or lon is None:
+            continue
+        codes.append(icao)
+        lats.append(lat)
+        lons.append(lon)
+
+    latitude = np.array(lats, dtype=np.float64)
+    longitude = np.array(lons, dtype=np.float64)
+    cell_of_point = encode_cell_keys(latitude, longitude)
+
+    # Group points by cell (stable, so airports keep their order within a cell)
+    order = np.argsort(cell_of_point, kind="stable")
+    cell_of_point = cell_of_point[order]
+    cell_keys, cell_starts = np.unique(cell_of_point, return_index=True)
+    cell_offsets = np.append(cell_starts, len(order)).astype(np.int64)
+
+    point_codes = np.array(codes, dtype=bytes)[order] if codes else np.zeros(0, "S4")
+    if metar_stations is None:
+        metar_station = np.ones(len(order), dtype=bool)
+    else:
+        metar_station = np.array(
+            [codes[row] in metar_stations for row in order.tolist()], dtype=bool
+        )
+    icao_rows = np.argsort(point_codes, kind="stable").astype(np.int32)
+
+    arrays = {
+        "version": np.array(SPATIAL_CACHE_VERSION, dtype=np.int32),
+        "generated": np.array(datetime.now(timezone.utc).isoformat()),
+        "source_fingerprint": np.array(source_fingerprint(airports_data)),
+        "cell_keys": cell_keys.astype(np.int32),
+        "cell_offsets": cell_offsets,
+        "latitude": latitude[order].astype(np.float32),
+        "longitude": longitude[order].astype(np.float32),
+        "codes": point_codes,
+        "icao_sorted": point_codes[icao_rows],
+        "icao_rows": icao_rows,
+        "metar_station": metar_station,
+    }
+    arrays[_CHECKSUM_FIELD] = np.array(
+        arrays_checksum(arrays, exclude=[_CHECKSUM_FIELD])
+    )
+    return arrays
+
+
+def save_spatial_cache(path: Path, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write spatial cache arrays to disk.
+
+    Args:
+        path: Output file path
+        arrays: Arrays from build_spatial_cache_arrays
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save_npz(path, arrays)
+
+
+@dataclass
+class AirportSpatialCache:
+    """
+    Memory-mapped airport positions grouped by 1-degree grid cell.
+
+    Points are stored in cell order; the points of cell_keys[i] are rows
+    cell_offsets[i]:cell_offsets[i + 1].
+
+    Attributes:
+        cell_keys: Sorted int32 cell keys (see encode_cell_keys)
+        cell_offsets: int64 start row of each cell (length cells + 1)
+        latitude, longitude: float32 coordinates per row
+        codes: Fixed-width ICAO code bytes per row
+        icao_sorted: The codes in sorted order (for binary search)
+        icao_rows: Row of each entry of icao_sorted
+        metar_station: True for rows known to report METAR
+        source_fingerprint: source_fingerprint() of the airport data the
+            cache was built from
+    """
+
+    cell_keys: np.ndarray
+    cell_offsets: np.ndarray
+    latitude: np.ndarray
+    longitude: np.ndarray
+    codes: np.ndarray
+    icao_sorted: np.ndarray
+    icao_rows: np.ndarray
+    metar_station: np.ndarray
+    source_fingerprint: str
+    _icao_codes: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def icao_codes(self) -> np.ndarray:
+        """Get the ICAO codes as an object array of str (decoded once)."""
+        if self._icao_codes is None:
+            self._icao_codes = np.char.decode(np.asarray(self.codes)).astype(object)
+        return self._icao_codes
+
+    def find(self, icao: str) -> int:
+        """
+        Find an airport's row.
+
+        Args:
+            icao: ICAO code
+
+        Returns:
+            Row, or -1 if the airport isn't in the cache
+        """
+        key = icao.encode()
+        position = int(np.searchsorted(self.icao_sorted, key))
+        if position < len(self.icao_sorted) and self.icao_sorted[position] == key:
+            return int(self.icao_rows[position])
+        return -1
+
+    def cell_rows(self, lat_cell: int, lon_cell: int) -> slice:
+        """
+        Get the rows of a grid cell.
+
+        Args:
+            lat_cell: int(latitude) of the cell
+            lon_cell: int(longitude) of the cell
+
+        Returns:
+            Slice of rows (empty if the cell has no airports)
+        """
+        key = (lat_cell + 90) * _CELL_LON_SPAN + (lon_cell + 180)
+        position = int(np.searchsorted(self.cell_keys, key))
+        if position == len(self.cell_keys) or self.cell_keys[position] != key:
+            return slice(0, 0)
+        return slice(
+            int(self.cell_offsets[position]), int(self.cell_offsets[position + 1])
+        )
+
+
+def _cache_from_arrays(arrays: Dict[str, np.ndarray]) -> AirportSpatialCache:
+    """Wrap spatial cache arrays (loaded or freshly built) in an AirportSpatialCache."""
+    return AirportSpatialCache(
+        cell_keys=arrays["cell_keys"],
+        cell_offsets=arrays["cell_offsets"],
+        latitude=arrays["latitude"],
+        longitude=arrays["longitude"],
+        codes=arrays["codes"],
+        icao_sorted=arrays["icao_sorted"],
+        icao_rows=arrays["icao_rows"],
+        metar_station=arrays["metar_station"],
+        source_fingerprint=str(arrays["source_fingerprint"]),
+    )
+
+
+def load_spatial_cache(path: Path) -> Optional[AirportSpatialCache]:
+    """
+    Load and validate a spatial cache file.
+
+    Args:
+        path: Path to the cache file
+
+    Returns:
+        AirportSpatialCache, or None if the file is missing, has another
+        format version or fails its checksum
+    """
+    if not path.exists():
+        return None
+
+    try:
+        arrays = load_npz_memmap(path)
+        if int(arrays["version"]) != SPATIAL_CACHE_VERSION:
+            debug_logger.info(f"Spatial cache {path} has an old format version")
+            return None
+        if str(arrays[_CHECKSUM_FIELD]) != arrays_checksum(
+            arrays, exclude=[_CHECKSUM_FIELD]
+        ):
+            debug_logger.warning(f"Spatial cache {path} failed its checksum")
+            return None
+
+        return _cache_from_arrays(arrays)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        debug_logger.warning(f"Could not load spatial cache {path}: {e}")
+        return None
+
+
+# Loaded cache (the shipped file, or a rebuilt one in the user cache directory)
+_SPATIAL_CACHE: Optional[AirportSpatialCache] = None
+_SPATIAL_CACHE_LOADED = False
+_SPATIAL_CACHE_LOCK = threading.Lock()
+# Last airport dict fingerprinted and its fingerprint (guarded by the lock)
+_LAST_SOURCE: Tuple[Optional[Dict[str, Dict[str, Any]]], str] = (None, "")
+
+
+def _is_current(
+    cache: Optional[AirportSpatialCache],
+    airports_data: Optional[Dict[str, Dict[str, Any]]],
+) -> bool:
+    """
+    Check that a cache exists and was built from the same airport data.
+
+    Must be called with _SPATIAL_CACHE_LOCK held.
+    """
+    global _LAST_SOURCE
+
+    if cache is None:
+        return False
+    if not airports_data:
+        return True
+    if _LAST_SOURCE[0] is not airports_data:
+        _LAST_SOURCE = (airports_data, source_fingerprint(airports_data))
+    return cache.source_fingerprint == _LAST_SOURCE[1]
+
+
+def get_airport_spatial_cache(
+    airports_data: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Optional[AirportSpatialCache]:
+    """
+    Get the airport spatial cache, rebuilding it when stale (thread-safe).
+
+    The shipped cache in the data directory is used when it is valid and was
+    built from the same airports (codes and coordinates) as airports_data;
+    otherwise the cache in the user cache directory is tried. If neither is current and airports_data
+    is given, a new cache is built from it (METAR stations by
+    is_metar_candidate) and written to the user cache directory.
+
+    Args:
+        airports_data: Current airport data, for staleness checks and rebuilds
+
+    Returns:
+        AirportSpatialCache, or None if none is available and airports_data
+        wasn't given
+    """
+    global _SPATIAL_CACHE, _SPATIAL_CACHE_LOADED
+
+    with _SPATIAL_CACHE_LOCK:
+        if _SPATIAL_CACHE_LOADED and (
+            not airports_data or _is_current(_SPATIAL_CACHE, airports_data)
+        ):
+            return _SPATIAL_CACHE
+
+        cache = load_spatial_cache(get_data_dir() / SPATIAL_CACHE_FILENAME)
+        if not _is_current(cache, airports_data):
+            user_path = get_user_cache_dir() / SPATIAL_CACHE_FILENAME
+            cache = load_spatial_cache(user_path)
+
+            if not _is_current(cache, airports_data) and airports_data:
+                debug_logger.info("Rebuilding airport spatial cache")
+                arrays = build_spatial_cache_arrays(
+                    airports_data,
+                    {icao for icao in airports_data if is_metar_candidate(icao)},
+                )
+                try:
+                    save_spatial_cache(user_path, arrays)
+                    cache = load_spatial_cache(user_path)
+                except OSError as e:
+                    debug_logger.warning(f"Could not write spatial cache: {e}")
+                    cache = None
+                if cache is None:
+                    cache = _cache_from_arrays(arrays)
+
+        _SPATIAL_CACHE = cache
+        _SPATIAL_CACHE_LOADED = True
+        return cache
+
+
+def clear_spatial_cache() -> None:
+    """Forget the loaded spatial cache so the next use reloads it (thread-safe)."""
+    global _SPATIAL_CACHE, _SPATIAL_CACHE_LOADED
+
+    with _SPATIAL_CACHE_LOCK:
+        _SPATIAL_CACHE = None
+        _SPATIAL_CACHE_LOADED = False
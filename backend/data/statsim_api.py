@@ -11,6 +11,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 
+from backend.net import get_http_client
 from common import logger as debug_logger
 
 
@@ -70,7 +71,7 @@ def fetch_flights_from_origin(
     }
 
     try:
-        response = requests.get(url, params=params, timeout=timeout)
+        response = get_http_client().get(url, params=params, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.Timeout:
@@ -122,7 +123,7 @@ def fetch_flights_to_destination(
     }
 
     try:
-        response = requests.get(url, params=params, timeout=timeout)
+        response = get_http_client().get(url, params=params, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.Timeout:
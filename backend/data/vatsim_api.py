@@ -10,6 +10,9 @@ from typing import Dict, Any, List, Optional
 import requests
 
 from backend.config.constants import VATSIM_DATA_URL
+from backend.core.snapshot import get_flight_snapshot
+from backend.net import get_http_client
+from backend.utils.single_flight import SingleFlight
 from common import logger as debug_logger
 
 # Cache for VATSIM data to avoid redundant API calls within refresh window
@@ -17,6 +20,9 @@ _VATSIM_DATA_CACHE: Optional[Dict[str, Any]] = None
 _VATSIM_DATA_CACHE_TIME: float = 0
 _VATSIM_DATA_CACHE_LOCK = threading.Lock()
 VATSIM_CACHE_DURATION = 15  # seconds - matches typical refresh interval
+# HTTP validators from the last full download, for conditional requests
+_VATSIM_DATA_ETAG: Optional[str] = None
+_VATSIM_DATA_LAST_MODIFIED: Optional[str] = None
 
 # Cache for member stats (longer duration since stats don't change frequently)
 _MEMBER_STATS_CACHE: Dict[int, Dict[str, Any]] = {}
@@ -25,6 +31,18 @@ _MEMBER_STATS_CACHE_LOCK = threading.Lock()
 MEMBER_STATS_CACHE_DURATION = 300  # 5 minutes - stats don't change frequently
 VATSIM_API_BASE_URL = "https://api.vatsim.net/v2"
 
+# In-flight request registries so concurrent cache misses share one fetch
+_VATSIM_DATA_FETCHES = SingleFlight("vatsim_data")
+_MEMBER_STATS_FETCHES = SingleFlight("member_stats")
+
+
+def _feed_update_timestamp(data: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Get general.update_timestamp from a decoded VATSIM feed, if present."""
+    if not data:
+        return None
+    general = data.get("general") or {}
+    return general.get("update_timestamp")
+
 
 def download_vatsim_data(
     timeout: int = 10, max_retries: int = 3
@@ -35,6 +53,16 @@ def download_vatsim_data(
     Data is cached for 15 seconds to avoid redundant API calls when multiple
     components request data within the same refresh window.
 
+    Once the cache expires, the feed is re-requested conditionally (ETag /
+    If-Modified-Since). If the server answers 304 Not Modified, or the new
+    download has the same general.update_timestamp, the previously returned
+    dictionary is returned again. Callers can therefore detect an unchanged
+    feed with an identity check and skip recomputation.
+
+    Concurrent callers that miss the cache together share a single download.
+
+    This function is thread-safe.
+
     Args:
         timeout: Request timeout in seconds (default: 10)
         max_retries: Maximum number of retry attempts (default: 3)
@@ -43,30 +71,82 @@ def download_vatsim_data(
         Dictionary containing VATSIM data (pilots, controllers, atis, etc.)
         or None if all retries failed
     """
-    global _VATSIM_DATA_CACHE, _VATSIM_DATA_CACHE_TIME
-
-    current_time = time.time()
-
     # Check cache first (with lock for thread safety)
     with _VATSIM_DATA_CACHE_LOCK:
         if _VATSIM_DATA_CACHE is not None:
-            cache_age = current_time - _VATSIM_DATA_CACHE_TIME
+            cache_age = time.time() - _VATSIM_DATA_CACHE_TIME
             if cache_age < VATSIM_CACHE_DURATION:
                 return _VATSIM_DATA_CACHE
 
-    # Cache miss or expired - fetch fresh data
+    # Cache miss or expired - callers that miss together share one download
+    return _VATSIM_DATA_FETCHES.do(
+        "vatsim-data", _fetch_vatsim_data, timeout, max_retries
+    )
+
+
+def _fetch_vatsim_data(timeout: int, max_retries: int) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the VATSIM feed and update the cache (see download_vatsim_data).
+
+    Args:
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retry attempts
+
+    Returns:
+        Dictionary containing VATSIM data, or None if all retries failed
+    """
+    global _VATSIM_DATA_CACHE, _VATSIM_DATA_CACHE_TIME
+    global _VATSIM_DATA_ETAG, _VATSIM_DATA_LAST_MODIFIED
+
+    with _VATSIM_DATA_CACHE_LOCK:
+        cached_data = _VATSIM_DATA_CACHE
+        # Another caller may have refreshed the cache while we were waiting
+        if cached_data is not None:
+            cache_age = time.time() - _VATSIM_DATA_CACHE_TIME
+            if cache_age < VATSIM_CACHE_DURATION:
+                return cached_data
+
+        # Revalidate the cached feed rather than unconditionally re-downloading
+        headers = {}
+        if cached_data is not None:
+            if _VATSIM_DATA_ETAG:
+                headers["If-None-Match"] = _VATSIM_DATA_ETAG
+            if _VATSIM_DATA_LAST_MODIFIED:
+                headers["If-Modified-Since"] = _VATSIM_DATA_LAST_MODIFIED
+
     last_exception: Optional[Exception] = None
 
     for attempt in range(max_retries):
         try:
-            response = requests.get(VATSIM_DATA_URL, timeout=timeout)
+            response = get_http_client().get(
+                VATSIM_DATA_URL, timeout=timeout, headers=headers
+            )
+            if response.status_code == 304 and cached_data is not None:
+                debug_logger.debug("VATSIM feed not modified (304)")
+                with _VATSIM_DATA_CACHE_LOCK:
+                    _VATSIM_DATA_CACHE_TIME = time.time()
+                return cached_data
+
             response.raise_for_status()
             data = response.json()
 
+            # A full download of a feed that hasn't advanced is still the same
+            # feed - keep the previous object so downstream caches stay valid
+            new_timestamp = _feed_update_timestamp(data)
+            if (
+                cached_data is not None
+                and new_timestamp
+                and new_timestamp == _feed_update_timestamp(cached_data)
+            ):
+                debug_logger.debug(f"VATSIM feed unchanged since {new_timestamp}")
+                data = cached_data
+
             # Update cache
             with _VATSIM_DATA_CACHE_LOCK:
                 _VATSIM_DATA_CACHE = data
                 _VATSIM_DATA_CACHE_TIME = time.time()
+                _VATSIM_DATA_ETAG = response.headers.get("ETag")
+                _VATSIM_DATA_LAST_MODIFIED = response.headers.get("Last-Modified")
 
             return data
         except requests.Timeout as e:
@@ -107,6 +187,8 @@ def get_member_stats(cid: int, timeout: int = 5) -> Optional[Dict[str, Any]]:
     """
     Fetch member statistics from the VATSIM API.
 
+    Concurrent requests for the same CID share a single fetch.
+
     Args:
         cid: VATSIM Client ID (numeric)
         timeout: Request timeout in seconds (default: 5)
@@ -116,8 +198,6 @@ def get_member_stats(cid: int, timeout: int = 5) -> Optional[Dict[str, Any]]:
         or None if the request failed or member not found.
         Example: {'id': 934876, 'pilot': 123.5, 'atc': 45.2, ...}
     """
-    global _MEMBER_STATS_CACHE, _MEMBER_STATS_CACHE_TIME
-
     current_time = time.time()
 
     # Check cache first
@@ -127,10 +207,26 @@ def get_member_stats(cid: int, timeout: int = 5) -> Optional[Dict[str, Any]]:
             if cache_age < MEMBER_STATS_CACHE_DURATION:
                 return _MEMBER_STATS_CACHE[cid]
 
+    return _MEMBER_STATS_FETCHES.do(cid, _fetch_member_stats, cid, timeout)
+
+
+def _fetch_member_stats(cid: int, timeout: int) -> Optional[Dict[str, Any]]:
+    """
+    Fetch member statistics from the API and update the cache.
+
+    Args:
+        cid: VATSIM Client ID (numeric)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Member stats dictionary, or None if the request failed
+    """
+    global _MEMBER_STATS_CACHE, _MEMBER_STATS_CACHE_TIME
+
     # Fetch from API
     url = f"{VATSIM_API_BASE_URL}/members/{cid}/stats"
     try:
-        response = requests.get(url, timeout=timeout)
+        response = get_http_client().get(url, timeout=timeout)
         if response.status_code == 404:
             return None
         response.raise_for_status()
@@ -158,6 +254,9 @@ def filter_flights_by_airports(
     """
     Filter flights by departure and arrival airports.
 
+    Selection runs over the columnar FlightSnapshot for the feed; only the
+    selected rows are materialized as dictionaries.
+
     Args:
         data: VATSIM data dictionary containing 'pilots' list
         airports: Dictionary of airport data
@@ -166,80 +265,9 @@ def filter_flights_by_airports(
     Returns:
         List of filtered flight dictionaries
     """
-    flights = data.get("pilots", [])
-    filtered_flights = []
-
-    for flight in flights:
-        # For flights with flight plans
-        # Check if flight has a valid flight plan with non-empty departure or arrival
-        departure = None
-        arrival = None
-        has_valid_flight_plan = False
-
-        if flight.get("flight_plan"):
-            departure = flight["flight_plan"].get("departure")
-            arrival = flight["flight_plan"].get("arrival")
-
-            # Treat empty strings as None/null for departure and arrival
-            if not departure:
-                departure = None
-            if not arrival:
-                arrival = None
-
-            # Only consider it a valid flight plan if at least one field is non-empty
-            has_valid_flight_plan = departure is not None or arrival is not None
-
-        if has_valid_flight_plan:
-            # If allowlist is provided, check if either departure or arrival is in the allowlist
-            # Otherwise, check if both departure and arrival airports are in our airport data
-            if airport_allowlist:
-                if (departure and departure in airports) or (
-                    arrival and arrival in airports
-                ):
-                    filtered_flights.append(
-                        {
-                            "callsign": flight.get("callsign"),
-                            "departure": departure,
-                            "arrival": arrival,
-                            "latitude": flight.get("latitude"),
-                            "longitude": flight.get("longitude"),
-                            "groundspeed": flight.get("groundspeed"),
-                            "altitude": flight.get("altitude"),
-                            "flight_plan": flight.get("flight_plan"),
-                        }
-                    )
-            elif (
-                departure and arrival and departure in airports and arrival in airports
-            ):
-                filtered_flights.append(
-                    {
-                        "callsign": flight.get("callsign"),
-                        "departure": departure,
-                        "arrival": arrival,
-                        "latitude": flight.get("latitude"),
-                        "longitude": flight.get("longitude"),
-                        "groundspeed": flight.get("groundspeed"),
-                        "altitude": flight.get("altitude"),
-                        "flight_plan": flight.get("flight_plan"),
-                    }
-                )
-        # For flights without valid flight plans, we'll still include them for ground analysis
-        # but with None for departure/arrival
-        elif flight.get("latitude") is not None and flight.get("longitude") is not None:
-            filtered_flights.append(
-                {
-                    "callsign": flight.get("callsign"),
-                    "departure": None,
-                    "arrival": None,
-                    "latitude": flight.get("latitude"),
-                    "longitude": flight.get("longitude"),
-                    "groundspeed": flight.get("groundspeed"),
-                    "altitude": flight.get("altitude"),
-                    "flight_plan": flight.get("flight_plan"),
-                }
-            )
-
-    return filtered_flights
+    snapshot = get_flight_snapshot(data)
+    rows = snapshot.filter_rows(airports, airport_allowlist)
+    return snapshot.flight_dicts(rows)
 
 
 def get_atis_for_airports(
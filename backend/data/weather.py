@@ -3,14 +3,15 @@ Weather data fetching for airports (METAR and wind information).
 """
 
 import json
-import re
 import threading
 import time
-import urllib.request
-import urllib.error
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Set, Tuple, Optional, Any, Callable
+
+import numpy as np
+import requests
 
 from backend.cache.manager import (
     get_wind_cache,
@@ -20,8 +21,41 @@ from backend.cache.manager import (
     get_metar_cache_lock,
     get_taf_cache_lock,
 )
-from backend.config.constants import WIND_CACHE_DURATION, METAR_CACHE_DURATION
-from backend.core.calculations import haversine_distance_nm, calculate_bearing
+from backend.cache.metered import MeteredTTLCache
+from backend.config.constants import (
+    WIND_CACHE_DURATION,
+    METAR_CACHE_DURATION,
+    METAR_HEDGE_ENABLED,
+    METAR_HEDGE_PERCENTILE,
+    METAR_HEDGE_MIN_SAMPLES,
+    METAR_HEDGE_DEFAULT_BUDGET,
+    METAR_HEDGE_MIN_BUDGET,
+    METAR_HEDGE_MAX_BUDGET,
+    NEAREST_METAR_CACHE_SIZE,
+    NEAREST_METAR_CACHE_TTL,
+    WEATHER_SERVE_STALE,
+    WEATHER_MAX_STALENESS,
+    WEATHER_REVALIDATE_WORKERS,
+    WEATHER_REVALIDATE_MAX_PENDING,
+    METAR_SCHEDULE_ENABLED,
+    WEATHER_BULK_METAR_INTERVAL,
+    WEATHER_BULK_TAF_INTERVAL,
+    WEATHER_BULK_TIMEOUT,
+)
+from backend.core.calculations import calculate_bearing_array
+from backend.core.spatial import (
+    EXCLUDE_METAR_BLACKLIST,
+    SpatialIndex,
+    get_spatial_service,
+)
+from backend.net import LatencyHistogram, get_http_client
+from backend.data.weather_parsing import (
+    ParsedMetar,
+    get_parsed_metar,
+)
+from backend.data.weather_bulk import read_bulk_metars, read_bulk_tafs
+from backend.data.weather_schedule import get_observation_scheduler
+from backend.utils.single_flight import SingleFlight
 
 # Rate limiting state
 _rate_limit_lock = threading.Lock()
@@ -35,6 +69,41 @@ RATE_LIMIT_MAX_BACKOFF = 30.0  # Maximum backoff delay in seconds
 RATE_LIMIT_BACKOFF_MULTIPLIER = 2.0  # Exponential backoff multiplier
 RATE_LIMIT_RECOVERY_TIME = 60.0  # Seconds without errors before resetting backoff
 
+# In-flight request registries so concurrent cache misses share one fetch
+_METAR_FETCHES = SingleFlight("metar")
+_TAF_FETCHES = SingleFlight("taf")
+_WIND_FETCHES = SingleFlight("wind")
+_BULK_FETCHES = SingleFlight("bulk")
+
+# Bulk ingest (see refresh_weather_bulk): time.monotonic() of the last
+# successful download of each cache file, keyed by "metar"/"taf"
+_bulk_lock = threading.Lock()
+_bulk_last_ingest: Dict[str, float] = {}
+
+# Stale-while-revalidate (see _cache_freshness and _revalidate_in_background)
+_WEATHER_REVALIDATE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=WEATHER_REVALIDATE_WORKERS, thread_name_prefix="weather-revalidate"
+)
+_revalidate_lock = threading.Lock()
+_revalidating: Set[Tuple[str, str]] = set()  # (cache, ICAO) queued or running
+_revalidations_queued = 0
+_revalidations_dropped = 0
+
+# METAR hedging (see _fetch_metar_from_sources). Fallbacks get their own
+# pool so they never queue behind the primaries they are hedging.
+_METAR_PRIMARY_EXECUTOR = ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix="metar-primary"
+)
+_METAR_FALLBACK_EXECUTOR = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="metar-fallback"
+)
+# Latency of single-station aviationweather.gov METAR requests, measured
+# from when each request is sent (the hedge budget; bbox requests excluded)
+_METAR_LATENCY = LatencyHistogram()
+_metar_hedge_lock = threading.Lock()
+_metar_hedges_fired = 0
+_metar_hedges_won = 0
+
 
 def _check_rate_limit_error(status_code: int) -> bool:
     """Check if an HTTP status code indicates rate limiting."""
@@ -153,16 +222,212 @@ def _parse_wind_from_observation(properties: dict) -> Tuple[bool, str]:
     return (True, wind_str)
 
 
+def _cache_freshness(
+    cache_entry: Dict[str, Any], ttl: float, now: datetime
+) -> Optional[bool]:
+    """
+    Classify a weather cache entry by age.
+
+    Entries with a 'refresh_at' (METARs scheduled by the observation
+    scheduler) are fresh until then; others for ttl seconds after their
+    'timestamp'.
+
+    Args:
+        cache_entry: Cache entry with a 'timestamp'
+        ttl: Cache duration in seconds
+        now: Current UTC time
+
+    Returns:
+        True if the entry is fresh, False if it is stale but may still be
+        served (while it is revalidated), None if it must be refetched
+    """
+    refresh_at = cache_entry.get("refresh_at")
+    if refresh_at is None:
+        refresh_at = cache_entry["timestamp"] + timedelta(seconds=ttl)
+    overdue = (now - refresh_at).total_seconds()
+    if overdue < 0:
+        return True
+    if WEATHER_SERVE_STALE and overdue < WEATHER_MAX_STALENESS:
+        return False
+    return None
+
+
+def _new_metar_entry(
+    airport_icao: str, metar_text: str, fetched_at: datetime
+) -> Dict[str, Any]:
+    """
+    Build a METAR cache entry with its parsed fields.
+
+    With METAR_SCHEDULE_ENABLED the entry stays fresh until the station's
+    next report is expected (see ObservationScheduler) rather than for
+    METAR_CACHE_DURATION.
+
+    Args:
+        airport_icao: The ICAO code of the airport
+        metar_text: Raw METAR
+        fetched_at: UTC time the METAR was fetched
+
+    Returns:
+        Cache entry for the METAR cache
+    """
+    parsed = get_parsed_metar(metar_text)
+    entry = {"metar": metar_text, "parsed": parsed, "timestamp": fetched_at}
+    if METAR_SCHEDULE_ENABLED:
+        entry["refresh_at"] = get_observation_scheduler().schedule(
+            airport_icao, parsed, fetched_at
+        )
+    return entry
+
+
+def _refetch_each(
+    airport_icaos: List[str], flights: SingleFlight, fetch: Callable[[str], str]
+) -> None:
+    """Refetch airports one at a time, sharing fetches already in flight."""
+    for icao in airport_icaos:
+        flights.do(icao, fetch, icao)
+
+
+def _revalidate_in_background(
+    cache_name: str,
+    airport_icaos: List[str],
+    refresh: Callable[..., Any],
+    *args: Any,
+) -> None:
+    """
+    Queue a background refresh of stale cache entries.
+
+    Airports already queued or being refreshed for the same cache are skipped,
+    and airports beyond WEATHER_REVALIDATE_MAX_PENDING are dropped (their stale
+    entries are queued again on a later read).
+
+    Args:
+        cache_name: Cache the entries belong to ("metar", "taf" or "wind")
+        airport_icaos: Airports with stale entries
+        refresh: Called on a worker as refresh(claimed_airports, *args)
+        *args: Extra arguments for refresh
+    """
+    global _revalidations_queued, _revalidations_dropped
+
+    with _revalidate_lock:
+        keys = [
+            (cache_name, icao)
+            for icao in dict.fromkeys(airport_icaos)
+            if (cache_name, icao) not in _revalidating
+        ]
+        room = max(0, WEATHER_REVALIDATE_MAX_PENDING - len(_revalidating))
+        if len(keys) > room:
+            _revalidations_dropped += len(keys) - room
+            keys = keys[:room]
+        if not keys:
+            return
+        _revalidating.update(keys)
+        _revalidations_queued += len(keys)
+
+    claimed = [icao for _cache_name, icao in keys]
+
+    def run() -> None:
+        try:
+            refresh(claimed, *args)
+        except Exception as e:
+            from common import logger as debug_logger
+
+            debug_logger.debug(
+                f"Background {cache_name} refresh failed: {type(e).__name__}: {e}"
+            )
+        finally:
+            with _revalidate_lock:
+                _revalidating.difference_update(keys)
+
+    _WEATHER_REVALIDATE_EXECUTOR.submit(run)
+
+
+def revalidate_weather_bbox(
+    airport_icaos: List[str], airports_data: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Refresh stale METARs for many airports in the background with bbox queries.
+
+    Returns immediately. Airports queued here are not also refetched one by
+    one when their stale entries are read in the meantime.
+
+    Args:
+        airport_icaos: Airports whose cached METARs are stale
+        airports_data: Dictionary mapping ICAO codes to airport data with lat/lon
+    """
+    _revalidate_in_background(
+        "metar", airport_icaos, get_weather_for_airports_bbox, airports_data
+    )
+
+
+def get_weather_age(
+    airport_icao: str, cache_name: str = "metar"
+) -> Optional[Tuple[float, bool]]:
+    """
+    Get how old a cached weather value is, for display next to the value.
+
+    This function is thread-safe.
+
+    Args:
+        airport_icao: The ICAO code of the airport
+        cache_name: "metar", "taf" or "wind" (weather.gov observations)
+
+    Returns:
+        Tuple of (age in seconds, is_stale), where stale values are past their
+        cache duration (or scheduled refresh) and being refreshed, or None if
+        nothing is cached
+    """
+    if cache_name == "wind":
+        cache, _blacklist = get_wind_cache()
+        lock = get_wind_cache_lock()
+        ttl = WIND_CACHE_DURATION
+    elif cache_name == "taf":
+        cache, _blacklist = get_taf_cache()
+        lock = get_taf_cache_lock()
+        ttl = METAR_CACHE_DURATION
+    else:
+        cache, _blacklist = get_metar_cache()
+        lock = get_metar_cache_lock()
+        ttl = METAR_CACHE_DURATION
+
+    with lock:
+        cache_entry = cache.get(airport_icao)
+        if cache_entry is None:
+            return None
+
+    now = datetime.now(timezone.utc)
+    age = (now - cache_entry["timestamp"]).total_seconds()
+    return age, _cache_freshness(cache_entry, ttl, now) is not True
+
+
+def get_revalidation_stats() -> Dict[str, int]:
+    """
+    Get stale-while-revalidate counters.
+
+    Returns:
+        Dictionary with 'pending' (airports queued or being refreshed now),
+        'queued' (airports queued in total) and 'dropped' (stale reads not
+        queued because too many refreshes were pending)
+    """
+    with _revalidate_lock:
+        return {
+            "pending": len(_revalidating),
+            "queued": _revalidations_queued,
+            "dropped": _revalidations_dropped,
+        }
+
+
 def get_wind_info_minute(airport_icao: str) -> str:
     """
     Fetch current wind information from weather.gov API with caching.
 
-    Wind data is cached for 60 seconds to avoid excessive API calls.
+    Wind data is cached for 60 seconds to avoid excessive API calls; stale
+    entries are returned while they are refreshed in the background.
     If the latest observation doesn't have wind data, fetches the last 10 observations
     and returns the most recent one with valid wind data.
     Airports returning 404 are blacklisted and never queried again.
 
-    This function is thread-safe.
+    This function is thread-safe. Concurrent calls for the same airport
+    share a single fetch.
 
     Args:
         airport_icao: The ICAO code of the airport
@@ -178,23 +443,48 @@ def get_wind_info_minute(airport_icao: str) -> str:
         if airport_icao in wind_blacklist:
             return ""
 
-        # Check if we have valid cached data
-        current_time = datetime.now(timezone.utc)
-        if airport_icao in wind_data_cache:
-            cache_entry = wind_data_cache[airport_icao]
-            time_since_cache = (current_time - cache_entry["timestamp"]).total_seconds()
-            if time_since_cache < WIND_CACHE_DURATION:
-                return cache_entry["wind_info"]
+        # Check if we have valid (or servable stale) cached data
+        cache_entry = wind_data_cache.get(airport_icao)
+        fresh = (
+            None
+            if cache_entry is None
+            else _cache_freshness(
+                cache_entry, WIND_CACHE_DURATION, datetime.now(timezone.utc)
+            )
+        )
+
+    if fresh is not None:
+        if not fresh:
+            _revalidate_in_background(
+                "wind", [airport_icao], _refetch_each, _WIND_FETCHES, _fetch_wind_minute
+            )
+        return cache_entry["wind_info"]
+
+    # Cache miss or too old - fetch new data (outside lock to avoid blocking)
+    return _WIND_FETCHES.do(airport_icao, _fetch_wind_minute, airport_icao)
+
+
+def _fetch_wind_minute(airport_icao: str) -> str:
+    """
+    Fetch wind from weather.gov observations and update the cache.
+
+    See get_wind_info_minute.
+
+    Args:
+        airport_icao: The ICAO code of the airport
+
+    Returns:
+        Formatted wind string, or the cached/empty string on errors
+    """
+    wind_data_cache, wind_blacklist = get_wind_cache()
+    wind_lock = get_wind_cache_lock()
 
-    # Cache miss or expired - fetch new data (outside lock to avoid blocking)
     try:
         # First, try the latest observation
         url = f"https://api.weather.gov/stations/{airport_icao}/observations/latest"
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "VATSIM-Control-Recs/1.0")
-
-        with urllib.request.urlopen(req, timeout=3) as response:
-            data = json.loads(response.read().decode())
+        response = get_http_client().get(url)
+        response.raise_for_status()
+        data = json.loads(response.content.decode())
 
         properties = data.get("properties", {})
         has_data, wind_str = _parse_wind_from_observation(properties)
@@ -204,11 +494,9 @@ def get_wind_info_minute(airport_icao: str) -> str:
             url = (
                 f"https://api.weather.gov/stations/{airport_icao}/observations?limit=30"
             )
-            req = urllib.request.Request(url)
-            req.add_header("User-Agent", "VATSIM-Control-Recs/1.0")
-
-            with urllib.request.urlopen(req, timeout=3) as response:
-                data = json.loads(response.read().decode())
+            response = get_http_client().get(url)
+            response.raise_for_status()
+            data = json.loads(response.content.decode())
 
             # Iterate through observations to find the first one with wind data
             features = data.get("features", [])
@@ -228,8 +516,8 @@ def get_wind_info_minute(airport_icao: str) -> str:
 
         return wind_str
 
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
+    except requests.HTTPError as e:
+        if e.response.status_code == 404:
             # Station doesn't exist - blacklist it permanently
             with wind_lock:
                 wind_blacklist[airport_icao] = True
@@ -240,11 +528,10 @@ def get_wind_info_minute(airport_icao: str) -> str:
                 return wind_data_cache[airport_icao]["wind_info"]
         return ""
     except (
-        urllib.error.URLError,
+        requests.RequestException,
         json.JSONDecodeError,
         KeyError,
         ValueError,
-        TimeoutError,
     ):
         # On other errors, return cached data if available (even if expired), otherwise empty string
         with wind_lock:
@@ -253,13 +540,27 @@ def get_wind_info_minute(airport_icao: str) -> str:
         return ""
 
 
-def _fetch_metar_from_aviationweather(airport_icao: str) -> Optional[str]:
+def _fetch_metar_from_aviationweather(
+    airport_icao: str, sent: Optional[threading.Event] = None
+) -> Optional[str]:
     """
     Fetch METAR from aviationweather.gov API.
 
+    Args:
+        airport_icao: Station ICAO code
+        sent: Set once the request is actually sent (after any backoff and
+            the host's concurrency gate)
+
     Returns:
         METAR string, empty string if no data, or None on error
     """
+    sent_at: List[float] = []
+
+    def on_send() -> None:
+        sent_at.append(time.perf_counter())
+        if sent is not None:
+            sent.set()
+
     try:
         # Wait for backoff if rate limiting is active
         _wait_for_backoff()
@@ -267,11 +568,17 @@ def _fetch_metar_from_aviationweather(airport_icao: str) -> Optional[str]:
         url = (
             f"https://aviationweather.gov/api/data/metar?ids={airport_icao}&format=raw"
         )
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "VATSIM-Control-Recs/1.0")
-
-        with urllib.request.urlopen(req, timeout=5) as response:
-            metar_text = response.read().decode("utf-8").strip()
+        failed = True
+        try:
+            response = get_http_client().get(url, on_send=on_send)
+            failed = response.status_code >= 400
+        finally:
+            if sent_at:
+                _METAR_LATENCY.record(
+                    (time.perf_counter() - sent_at[0]) * 1000, error=failed
+                )
+        response.raise_for_status()
+        metar_text = response.content.decode("utf-8").strip()
 
         # Record successful request (may reset backoff after recovery period)
         _record_successful_request()
@@ -286,18 +593,19 @@ def _fetch_metar_from_aviationweather(airport_icao: str) -> Optional[str]:
 
         return metar_text
 
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
+    except requests.HTTPError as e:
+        status_code = e.response.status_code
+        if status_code == 404:
             return None  # Station doesn't exist - blacklist
-        if _check_rate_limit_error(e.code):
+        if _check_rate_limit_error(status_code):
             backoff = _record_rate_limit_error()
             from common import logger as debug_logger
 
             debug_logger.debug(
-                f"Rate limit detected (HTTP {e.code}) for METAR {airport_icao}, backoff: {backoff:.1f}s"
+                f"Rate limit detected (HTTP {status_code}) for METAR {airport_icao}, backoff: {backoff:.1f}s"
             )
         return ""  # Other HTTP errors - try fallback
-    except (urllib.error.URLError, TimeoutError):
+    except requests.RequestException:
         return ""  # Network error - try fallback
     except Exception:
         return ""  # Other errors - try fallback
@@ -312,11 +620,9 @@ def _fetch_metar_from_vatsim(airport_icao: str) -> Optional[str]:
     """
     try:
         url = f"https://metar.vatsim.net/{airport_icao}"
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "VATSIM-Control-Recs/1.0")
-
-        with urllib.request.urlopen(req, timeout=5) as response:
-            metar_text = response.read().decode("utf-8").strip()
+        response = get_http_client().get(url)
+        response.raise_for_status()
+        metar_text = response.content.decode("utf-8").strip()
 
         if not metar_text or metar_text.startswith("No METAR"):
             return ""
@@ -327,16 +633,108 @@ def _fetch_metar_from_vatsim(airport_icao: str) -> Optional[str]:
         return ""
 
 
+def _metar_hedge_budget() -> Optional[float]:
+    """
+    Get how long to wait for aviationweather.gov before hedging, in seconds.
+
+    Returns:
+        Budget in seconds, or None if hedging is disabled
+    """
+    if not METAR_HEDGE_ENABLED:
+        return None
+    p95_ms = _METAR_LATENCY.percentile(METAR_HEDGE_PERCENTILE, METAR_HEDGE_MIN_SAMPLES)
+    budget = p95_ms / 1000 if p95_ms is not None else METAR_HEDGE_DEFAULT_BUDGET
+    return min(METAR_HEDGE_MAX_BUDGET, max(METAR_HEDGE_MIN_BUDGET, budget))
+
+
+def _fetch_metar_from_sources(airport_icao: str) -> Optional[str]:
+    """
+    Fetch METAR from aviationweather.gov, falling back to metar.vatsim.net.
+
+    With hedging enabled, the fallback is also started when aviationweather.gov
+    hasn't answered within the hedge budget, and the first METAR to arrive wins.
+
+    Returns:
+        METAR string, empty string if no source had one, or None if the
+        primary source reports the station doesn't exist
+    """
+    global _metar_hedges_fired, _metar_hedges_won
+
+    budget = _metar_hedge_budget()
+    if budget is None:
+        metar_text = _fetch_metar_from_aviationweather(airport_icao)
+        if metar_text == "":
+            metar_text = _fetch_metar_from_vatsim(airport_icao)
+        return metar_text
+
+    # The budget runs from when the primary request is sent, not while it
+    # waits for a worker or the host's concurrency gate
+    sent = threading.Event()
+    primary = _METAR_PRIMARY_EXECUTOR.submit(
+        _fetch_metar_from_aviationweather, airport_icao, sent
+    )
+    primary.add_done_callback(lambda _: sent.set())
+    sent.wait()
+    try:
+        metar_text = primary.result(timeout=budget)
+    except FuturesTimeoutError:
+        # Primary is slow - race the VATSIM fallback against it
+        fallback = _METAR_FALLBACK_EXECUTOR.submit(
+            _fetch_metar_from_vatsim, airport_icao
+        )
+        with _metar_hedge_lock:
+            _metar_hedges_fired += 1
+        for future in as_completed((primary, fallback)):
+            result = future.result()
+            if result:
+                if future is fallback:
+                    with _metar_hedge_lock:
+                        _metar_hedges_won += 1
+                return result
+        return primary.result()
+
+    # If primary returned empty, try VATSIM fallback
+    if metar_text == "":
+        metar_text = _fetch_metar_from_vatsim(airport_icao)
+    return metar_text
+
+
+def get_metar_hedge_stats() -> Dict[str, int]:
+    """
+    Get METAR hedging counters.
+
+    Returns:
+        Dictionary with 'fired' (fallback requests started because the primary
+        was slow) and 'won' (hedged requests answered first by the fallback)
+    """
+    with _metar_hedge_lock:
+        return {"fired": _metar_hedges_fired, "won": _metar_hedges_won}
+
+
+def _entry_parsed(cache_entry: Dict[str, Any]) -> ParsedMetar:
+    """
+    Get the parsed fields of a METAR cache entry.
+
+    Entries restored from the persistent cache only hold the raw text, so
+    their fields come from the parse cache.
+    """
+    parsed = cache_entry.get("parsed")
+    return parsed if parsed is not None else get_parsed_metar(cache_entry["metar"])
+
+
 def get_metar(airport_icao: str) -> str:
     """
     Fetch current METAR with caching.
 
     Uses aviationweather.gov as primary source, with VATSIM METAR API as fallback.
-    METAR data is cached for 60 seconds to avoid excessive API calls.
-    When fetching METAR, wind and altimeter are also parsed and cached
-    to avoid redundant parsing when both values are needed.
+    METAR data is cached until the station's next report is expected (see
+    weather_schedule), or for 60 seconds with METAR_SCHEDULE_ENABLED off;
+    stale entries are returned while they are refreshed in the background.
+    Fetched METARs are parsed once (ParsedMetar) and cached with the raw
+    text, so wind, altimeter and the other fields are never re-parsed.
 
-    This function is thread-safe.
+    This function is thread-safe. Concurrent calls for the same airport
+    share a single fetch.
 
     Args:
         airport_icao: The ICAO code of the airport
@@ -344,36 +742,95 @@ def get_metar(airport_icao: str) -> str:
     Returns:
         Full METAR string or empty string if unavailable
     """
-    metar_data_cache, metar_blacklist = get_metar_cache()
+    cached = _get_cached_metar(airport_icao, allow_stale=True)
+    if cached is not None:
+        return cached
+
+    # Cache miss or too old - concurrent callers for the same airport share
+    # one fetch (outside the cache lock to avoid blocking)
+    return _METAR_FETCHES.do(airport_icao, _fetch_metar, airport_icao)
+
+
+def _get_cached_metar_entry(
+    airport_icao: str, allow_stale: bool, revalidate: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the METAR cache entry of an airport if it can be served.
+
+    Args:
+        airport_icao: The ICAO code of the airport
+        allow_stale: Also return entries past the cache duration (but within
+            WEATHER_MAX_STALENESS)
+        revalidate: Queue a background refresh when a stale entry is returned
+
+    Returns:
+        The cache entry, or None if there is none that can be served
+    """
+    metar_data_cache, _metar_blacklist = get_metar_cache()
     metar_lock = get_metar_cache_lock()
 
-    # Check if airport is blacklisted (doesn't have METAR data available)
     with metar_lock:
+        cache_entry = metar_data_cache.get(airport_icao)
+        if cache_entry is None:
+            return None
+        fresh = _cache_freshness(
+            cache_entry, METAR_CACHE_DURATION, datetime.now(timezone.utc)
+        )
+
+    if fresh is None or (not fresh and not allow_stale):
+        return None
+    if not fresh and revalidate:
+        _revalidate_in_background(
+            "metar", [airport_icao], _refetch_each, _METAR_FETCHES, _fetch_metar
+        )
+    return cache_entry
+
+
+def _get_cached_metar(airport_icao: str, allow_stale: bool = False) -> Optional[str]:
+    """
+    Get a cached METAR, '' for blacklisted airports, or None on a miss.
+
+    Stale entries are only returned with allow_stale (see _get_cached_metar_entry).
+    """
+    _metar_data_cache, metar_blacklist = get_metar_cache()
+
+    # Check if airport is blacklisted (doesn't have METAR data available)
+    with get_metar_cache_lock():
         if airport_icao in metar_blacklist:
             return ""
 
-        # Check if we have valid cached data
-        current_time = datetime.now(timezone.utc)
-        if airport_icao in metar_data_cache:
-            cache_entry = metar_data_cache[airport_icao]
-            time_since_cache = (current_time - cache_entry["timestamp"]).total_seconds()
-            if time_since_cache < METAR_CACHE_DURATION:
-                return cache_entry["metar"]
+    cache_entry = _get_cached_metar_entry(airport_icao, allow_stale)
+    return None if cache_entry is None else cache_entry["metar"]
+
+
+def _fetch_metar(airport_icao: str) -> str:
+    """
+    Fetch a METAR from the network and update the cache (see get_metar).
 
-    # Cache miss or expired - fetch new data (outside lock to avoid blocking)
-    # Try primary source first
-    metar_text = _fetch_metar_from_aviationweather(airport_icao)
+    Args:
+        airport_icao: The ICAO code of the airport
+
+    Returns:
+        Full METAR string or empty string if unavailable
+    """
+    metar_data_cache, metar_blacklist = get_metar_cache()
+    metar_lock = get_metar_cache_lock()
+
+    # Another caller may have refreshed the cache while we were waiting
+    cached = _get_cached_metar(airport_icao)
+    if cached is not None:
+        return cached
+
+    # aviationweather.gov first, metar.vatsim.net as (possibly hedged) fallback
+    metar_text = _fetch_metar_from_sources(airport_icao)
 
     if metar_text is None:
         # Station doesn't exist - blacklist it permanently
         with metar_lock:
             metar_blacklist[airport_icao] = True
+        get_spatial_service().exclude(EXCLUDE_METAR_BLACKLIST, [airport_icao])
         return ""
 
-    # If primary returned empty, try VATSIM fallback
-    if metar_text == "":
-        metar_text = _fetch_metar_from_vatsim(airport_icao)
-
     # If still empty, return cached data if available or empty string
     if not metar_text:
         with metar_lock:
@@ -381,19 +838,10 @@ def get_metar(airport_icao: str) -> str:
                 return metar_data_cache[airport_icao]["metar"]
         return ""
 
-    # Parse wind and altimeter from METAR for caching
-    parsed_wind = _parse_wind_from_metar(metar_text)
-    parsed_altimeter = parse_altimeter_from_metar(metar_text)
-
-    # Cache the result with parsed values
-    current_time = datetime.now(timezone.utc)
+    # Cache the result with its parsed fields
+    cache_entry = _new_metar_entry(airport_icao, metar_text, datetime.now(timezone.utc))
     with metar_lock:
-        metar_data_cache[airport_icao] = {
-            "metar": metar_text,
-            "wind": parsed_wind,
-            "altimeter": parsed_altimeter,
-            "timestamp": current_time,
-        }
+        metar_data_cache[airport_icao] = cache_entry
 
     return metar_text
 
@@ -402,10 +850,12 @@ def get_taf(airport_icao: str) -> str:
     """
     Fetch current TAF (Terminal Aerodrome Forecast) from aviationweather.gov API with caching.
 
-    TAF data is cached for 60 seconds to avoid excessive API calls.
+    TAF data is cached for 60 seconds to avoid excessive API calls; stale
+    entries are returned while they are refreshed in the background.
     Airports returning 404 or no data are blacklisted and never queried again in this session.
 
-    This function is thread-safe.
+    This function is thread-safe. Concurrent calls for the same airport
+    share a single fetch.
 
     Args:
         airport_icao: The ICAO code of the airport
@@ -413,6 +863,23 @@ def get_taf(airport_icao: str) -> str:
     Returns:
         Full TAF string or empty string if unavailable
     """
+    cached = _get_cached_taf(airport_icao, allow_stale=True)
+    if cached is not None:
+        return cached
+
+    # Cache miss or too old - concurrent callers for the same airport share
+    # one fetch (outside the cache lock to avoid blocking)
+    return _TAF_FETCHES.do(airport_icao, _fetch_taf, airport_icao)
+
+
+def _get_cached_taf(airport_icao: str, allow_stale: bool = False) -> Optional[str]:
+    """
+    Get a cached TAF, '' for blacklisted airports, or None on a miss.
+
+    With allow_stale, entries past the cache duration (but within
+    WEATHER_MAX_STALENESS) are also returned and queued for a background
+    refresh.
+    """
     taf_data_cache, taf_blacklist = get_taf_cache()
     taf_lock = get_taf_cache_lock()
 
@@ -421,27 +888,49 @@ def get_taf(airport_icao: str) -> str:
         if airport_icao in taf_blacklist:
             return ""
 
-        # Check if we have valid cached data
-        current_time = datetime.now(timezone.utc)
-        if airport_icao in taf_data_cache:
-            cache_entry = taf_data_cache[airport_icao]
-            time_since_cache = (current_time - cache_entry["timestamp"]).total_seconds()
-            if (
-                time_since_cache < METAR_CACHE_DURATION
-            ):  # Use same cache duration as METAR
-                return cache_entry["taf"]
-
-    # Cache miss or expired - fetch new data (outside lock to avoid blocking)
+        cache_entry = taf_data_cache.get(airport_icao)
+        if cache_entry is None:
+            return None
+        # Use same cache duration as METAR
+        fresh = _cache_freshness(
+            cache_entry, METAR_CACHE_DURATION, datetime.now(timezone.utc)
+        )
+
+    if fresh is None or (not fresh and not allow_stale):
+        return None
+    if not fresh:
+        _revalidate_in_background(
+            "taf", [airport_icao], _refetch_each, _TAF_FETCHES, _fetch_taf
+        )
+    return cache_entry["taf"]
+
+
+def _fetch_taf(airport_icao: str) -> str:
+    """
+    Fetch a TAF from aviationweather.gov and update the cache (see get_taf).
+
+    Args:
+        airport_icao: The ICAO code of the airport
+
+    Returns:
+        Full TAF string or empty string if unavailable
+    """
+    taf_data_cache, taf_blacklist = get_taf_cache()
+    taf_lock = get_taf_cache_lock()
+
+    # Another caller may have refreshed the cache while we were waiting
+    cached = _get_cached_taf(airport_icao)
+    if cached is not None:
+        return cached
+
     try:
         # Wait for backoff if rate limiting is active
         _wait_for_backoff()
 
         url = f"https://aviationweather.gov/api/data/taf?ids={airport_icao}&format=raw"
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "VATSIM-Control-Recs/1.0")
-
-        with urllib.request.urlopen(req, timeout=5) as response:
-            taf_text = response.read().decode("utf-8").strip()
+        response = get_http_client().get(url)
+        response.raise_for_status()
+        taf_text = response.content.decode("utf-8").strip()
 
         # Record successful request (may reset backoff after recovery period)
         _record_successful_request()
@@ -464,18 +953,19 @@ def get_taf(airport_icao: str) -> str:
 
         return taf_text
 
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
+    except requests.HTTPError as e:
+        status_code = e.response.status_code
+        if status_code == 404:
             # Station doesn't exist - blacklist it permanently
             with taf_lock:
                 taf_blacklist[airport_icao] = True
             return ""
-        if _check_rate_limit_error(e.code):
+        if _check_rate_limit_error(status_code):
             backoff = _record_rate_limit_error()
             from common import logger as debug_logger
 
             debug_logger.debug(
-                f"Rate limit detected (HTTP {e.code}) for TAF {airport_icao}, backoff: {backoff:.1f}s"
+                f"Rate limit detected (HTTP {status_code}) for TAF {airport_icao}, backoff: {backoff:.1f}s"
             )
         # For other HTTP errors - temporary, don't blacklist
         # Return cached data if available
@@ -484,11 +974,10 @@ def get_taf(airport_icao: str) -> str:
                 return taf_data_cache[airport_icao]["taf"]
         return ""
     except (
-        urllib.error.URLError,
+        requests.RequestException,
         json.JSONDecodeError,
         KeyError,
         ValueError,
-        TimeoutError,
     ) as e:
         # Expected network/parsing errors - temporary, don't blacklist
         from common import logger as debug_logger
@@ -514,69 +1003,6 @@ def get_taf(airport_icao: str) -> str:
         return ""
 
 
-def _parse_wind_from_metar(metar: str) -> str:
-    """
-    Parse wind information from a METAR string.
-
-    Args:
-        metar: The METAR string
-
-    Returns:
-        Wind string in format like "27005KT" or "27005G12KT" or "00000KT" or empty string if unavailable
-    """
-    if not metar:
-        return ""
-
-    # Parse wind from METAR
-    # Wind format in METAR: DDDSSGggKT or DDDSSKMHor DDDSSKPH (Direction Speed Gust)
-    # Also handle VRB for variable, and 00000KT for calm
-
-    # Look for wind pattern: direction (3 digits or VRB), speed (2-3 digits), optional gust (G + 2-3 digits), units (KT/KMH/KPH/MPS)
-    wind_pattern = r"\b(\d{3}|VRB)(\d{2,3})(G\d{2,3})?(KT|KMH|KPH|MPS)\b"
-    match = re.search(wind_pattern, metar)
-
-    if match:
-        direction = match.group(1)
-        speed = match.group(2)
-        gust = match.group(3)  # Includes 'G' prefix if present
-        units = match.group(4)
-
-        # Check for calm winds
-        if direction != "VRB" and int(speed) == 0:
-            return "00000KT"
-
-        # Build wind string (always convert to KT for consistency)
-        wind_str = f"{direction}{speed}"
-        if gust:
-            wind_str += gust
-
-        # Add KT suffix (convert if needed, but METAR is usually in KT)
-        if units == "KT":
-            wind_str += "KT"
-        elif units in ["KMH", "KPH"]:
-            # Convert km/h to knots (1 knot = 1.852 km/h)
-            speed_kt = round(int(speed) / 1.852)
-            wind_str = f"{direction}{speed_kt:02d}"
-            if gust:
-                gust_kt = round(int(gust[1:]) / 1.852)
-                wind_str += f"G{gust_kt:02d}"
-            wind_str += "KT"
-        elif units == "MPS":
-            # Convert m/s to knots (1 knot = 0.514444 m/s)
-            speed_kt = round(int(speed) / 0.514444)
-            wind_str = f"{direction}{speed_kt:02d}"
-            if gust:
-                gust_kt = round(int(gust[1:]) / 0.514444)
-                wind_str += f"G{gust_kt:02d}"
-            wind_str += "KT"
-        else:
-            wind_str += "KT"
-
-        return wind_str
-
-    return ""
-
-
 def get_wind_from_metar(airport_icao: str) -> str:
     """
     Extract wind information from METAR.
@@ -590,31 +1016,18 @@ def get_wind_from_metar(airport_icao: str) -> str:
     Returns:
         Wind string in format like "27005KT" or "27005G12KT" or "00000KT" or empty string if unavailable
     """
-    metar_data_cache, _metar_blacklist = get_metar_cache()
-    metar_lock = get_metar_cache_lock()
+    # Check if we have cached parsed wind data (stale entries are refreshed
+    # in the background)
+    cache_entry = _get_cached_metar_entry(airport_icao, allow_stale=True)
+    if cache_entry is not None:
+        return _entry_parsed(cache_entry).wind_kt
 
-    # Check if we have cached parsed wind data
-    with metar_lock:
-        current_time = datetime.now(timezone.utc)
-        if airport_icao in metar_data_cache:
-            cache_entry = metar_data_cache[airport_icao]
-            time_since_cache = (current_time - cache_entry["timestamp"]).total_seconds()
-            if time_since_cache < METAR_CACHE_DURATION:
-                # Return cached parsed wind if available
-                return cache_entry.get("wind", "")
-
-    # Cache miss or expired - fetch METAR (which will parse and cache wind)
+    # Cache miss or too old - fetch METAR (which parses and caches it)
     metar = get_metar(airport_icao)
     if not metar:
         return ""
 
-    # After get_metar, check cache again for parsed wind
-    with metar_lock:
-        if airport_icao in metar_data_cache:
-            return metar_data_cache[airport_icao].get("wind", "")
-
-    # Fallback: parse directly if cache doesn't have it for some reason
-    return _parse_wind_from_metar(metar)
+    return get_parsed_metar(metar).wind_kt
 
 
 def get_wind_info(airport_icao: str, source: str = "metar") -> str:
@@ -799,7 +1212,23 @@ def fetch_weather_bbox(
         timeout: Request timeout in seconds
 
     Returns:
-        Tuple of (metars_dict, tafs_dict) where keys are ICAO codes
+        Tuple of (metars_dict, tafs_dict) where keys are ICAO codes (both
+        empty if the request failed)
+    """
+    try:
+        return _fetch_weather_bbox(bbox, include_taf, timeout)
+    except Exception:
+        return ({}, {})
+
+
+def _fetch_weather_bbox(
+    bbox: Tuple[float, float, float, float], include_taf: bool, timeout: int
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Fetch the weather in a bounding box (see fetch_weather_bbox).
+
+    Raises:
+        requests.RequestException, ValueError: If the request failed
     """
     min_lat, min_lon, max_lat, max_lon = bbox
     bbox_str = f"{min_lat},{min_lon},{max_lat},{max_lon}"
@@ -807,43 +1236,38 @@ def fetch_weather_bbox(
     metars: Dict[str, str] = {}
     tafs: Dict[str, str] = {}
 
-    try:
-        # Wait for backoff if rate limiting is active
-        _wait_for_backoff()
+    # Wait for backoff if rate limiting is active
+    _wait_for_backoff()
 
-        # Use taf=true to get both METAR and TAF in one call
-        taf_param = "&taf=true" if include_taf else ""
-        url = f"https://aviationweather.gov/api/data/metar?bbox={bbox_str}&format=json{taf_param}"
+    # Use taf=true to get both METAR and TAF in one call
+    taf_param = "&taf=true" if include_taf else ""
+    url = f"https://aviationweather.gov/api/data/metar?bbox={bbox_str}&format=json{taf_param}"
 
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "VATSIM-Control-Recs/1.0")
+    response = get_http_client().get(url, timeout=timeout)
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        if _check_rate_limit_error(e.response.status_code):
+            _record_rate_limit_error()
+        raise
+    data = json.loads(response.content.decode("utf-8"))
 
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            data = json.loads(response.read().decode("utf-8"))
+    # Record successful request
+    _record_successful_request()
 
-        # Record successful request
-        _record_successful_request()
+    # Parse response - it's an array of METAR objects
+    if isinstance(data, list):
+        for entry in data:
+            icao = entry.get("icaoId", "")
+            raw_metar = entry.get("rawOb", "")
+            raw_taf = entry.get("rawTaf", "")
 
-        # Parse response - it's an array of METAR objects
-        if isinstance(data, list):
-            for entry in data:
-                icao = entry.get("icaoId", "")
-                raw_metar = entry.get("rawOb", "")
-                raw_taf = entry.get("rawTaf", "")
+            if icao and raw_metar:
+                metars[icao] = raw_metar
+            if icao and raw_taf:
+                tafs[icao] = raw_taf
 
-                if icao and raw_metar:
-                    metars[icao] = raw_metar
-                if icao and raw_taf:
-                    tafs[icao] = raw_taf
-
-        return (metars, tafs)
-
-    except urllib.error.HTTPError as e:
-        if _check_rate_limit_error(e.code):
-            _record_rate_limit_error()
-        return ({}, {})
-    except Exception:
-        return ({}, {})
+    return (metars, tafs)
 
 
 def get_weather_batch_bbox(
@@ -905,242 +1329,238 @@ def get_weather_batch_bbox(
     return (all_metars, all_tafs)
 
 
-def parse_altimeter_from_metar(metar: str) -> Optional[str]:
+def _ingest_bulk_file(
+    kind: str, source: Optional[str], timeout: float
+) -> Dict[str, str]:
     """
-    Extract altimeter setting from METAR.
+    Download one bulk cache file and load its reports into the cache.
+
+    Stations missing from the file are not blacklisted: the files only hold
+    current reports, so a missing station may just be late.
 
     Args:
-        metar: The METAR string
+        kind: "metar" or "taf"
+        source: Base URL or local directory (None = WEATHER_BULK_SOURCE)
+        timeout: Request timeout in seconds
 
     Returns:
-        Altimeter string in format "A2992" or "Q1013" or None if not found
+        Dictionary mapping ICAO codes to reports (empty if the download failed)
     """
-    if not metar:
-        return None
+    from common import logger as debug_logger
 
-    # Altimeter format in METAR:
-    # A#### for inches of mercury (e.g., A2992 = 29.92 inHg)
-    # Q#### for hectopascals/millibars (e.g., Q1013 = 1013 hPa)
-    altimeter_pattern = r"\b([AQ]\d{4})\b"
-    match = re.search(altimeter_pattern, metar)
+    read_reports = read_bulk_metars if kind == "metar" else read_bulk_tafs
+    try:
+        # Wait for backoff if rate limiting is active
+        _wait_for_backoff()
 
-    if match:
-        return match.group(1)
+        start = time.perf_counter()
+        reports = read_reports(source, timeout)
 
-    return None
+        # Record successful request
+        _record_successful_request()
+    except requests.HTTPError as e:
+        if _check_rate_limit_error(e.response.status_code):
+            _record_rate_limit_error()
+        debug_logger.warning(f"Bulk {kind} download failed: {e}")
+        return {}
+    except Exception as e:
+        debug_logger.warning(f"Bulk {kind} download failed: {type(e).__name__}: {e}")
+        return {}
 
+    current_time = datetime.now(timezone.utc)
+    if kind == "metar":
+        new_entries = {
+            icao: _new_metar_entry(icao, metar, current_time)
+            for icao, metar in reports.items()
+        }
+        metar_data_cache, _metar_blacklist = get_metar_cache()
+        with get_metar_cache_lock():
+            metar_data_cache.update(new_entries)
+    else:
+        # Fresh until the next TAF download rather than for METAR_CACHE_DURATION
+        refresh_at = current_time + timedelta(seconds=WEATHER_BULK_TAF_INTERVAL)
+        new_entries = {
+            icao: {"taf": taf, "timestamp": current_time, "refresh_at": refresh_at}
+            for icao, taf in reports.items()
+        }
+        taf_data_cache, _taf_blacklist = get_taf_cache()
+        with get_taf_cache_lock():
+            taf_data_cache.update(new_entries)
 
-def get_altimeter_setting(airport_icao: str) -> Optional[str]:
-    """
-    Get altimeter setting for an airport from its METAR.
-    Uses cached parsed altimeter if available to avoid redundant parsing.
+    with _bulk_lock:
+        _bulk_last_ingest[kind] = time.monotonic()
 
-    This function is thread-safe.
+    debug_logger.info(
+        f"Bulk {kind} ingest: {len(reports)} stations in "
+        f"{time.perf_counter() - start:.1f}s"
+    )
+    return reports
 
-    Args:
-        airport_icao: The ICAO code of the airport
 
-    Returns:
-        Altimeter string (e.g., "A2992" or "Q1013") or None if unavailable
+def fetch_weather_bulk(
+    include_taf: bool = True,
+    source: Optional[str] = None,
+    timeout: float = WEATHER_BULK_TIMEOUT,
+) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
-    metar_data_cache, _metar_blacklist = get_metar_cache()
-    metar_lock = get_metar_cache_lock()
+    Fetch METAR and TAF data for every station worldwide.
 
-    # Check if we have cached parsed altimeter data
-    with metar_lock:
-        current_time = datetime.now(timezone.utc)
-        if airport_icao in metar_data_cache:
-            cache_entry = metar_data_cache[airport_icao]
-            time_since_cache = (current_time - cache_entry["timestamp"]).total_seconds()
-            if time_since_cache < METAR_CACHE_DURATION:
-                # Return cached parsed altimeter if available
-                return cache_entry.get("altimeter")
-
-    # Cache miss or expired - fetch METAR (which will parse and cache altimeter)
-    metar = get_metar(airport_icao)
-    if not metar:
-        return None
+    Downloads the aviationweather.gov bulk cache files (one request each, see
+    weather_bulk) and populates the METAR and TAF caches, replacing one bbox
+    query per region plus the per-airport fallback.
 
-    # After get_metar, check cache again for parsed altimeter
-    with metar_lock:
-        if airport_icao in metar_data_cache:
-            return metar_data_cache[airport_icao].get("altimeter")
-
-    # Fallback: parse directly if cache doesn't have it for some reason
-    return parse_altimeter_from_metar(metar)
+    Args:
+        include_taf: Whether to also download the TAF file
+        source: Base URL or local directory (None = WEATHER_BULK_SOURCE)
+        timeout: Request timeout in seconds
 
+    Returns:
+        Tuple of (metars_dict, tafs_dict) where keys are ICAO codes
+    """
+    metars = _ingest_bulk_file("metar", source, timeout)
+    tafs = _ingest_bulk_file("taf", source, timeout) if include_taf else {}
+    return (metars, tafs)
 
-# Global cache for spatial index of airports with METAR
-_METAR_AIRPORT_SPATIAL_INDEX: Optional[Dict[str, Any]] = None
-_METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP: Optional[datetime] = None
-_METAR_SPATIAL_INDEX_DURATION = 300  # 5 minutes cache
-_METAR_SPATIAL_INDEX_LOCK = (
-    threading.Lock()
-)  # Lock for synchronizing spatial index rebuild
 
-# Position-based result cache for find_nearest_airport_with_metar
-# Key: (rounded_lat, rounded_lon) tuple, Value: {'result': tuple or None, 'timestamp': datetime}
-_NEAREST_METAR_RESULT_CACHE: Dict[Tuple[float, float], Dict[str, Any]] = {}
-_NEAREST_METAR_RESULT_CACHE_DURATION = (
-    60  # 1 minute cache (matches METAR cache duration)
-)
-_NEAREST_METAR_RESULT_CACHE_LOCK = threading.Lock()
-_NEAREST_METAR_POSITION_GRID_SIZE = 0.1  # ~6nm grid for position rounding
+def refresh_weather_bulk(
+    include_taf: bool = True, source: Optional[str] = None
+) -> None:
+    """
+    Bring the METAR and TAF caches up to date from the bulk cache files.
 
-# Persisted spatial cache (loaded from disk once at startup)
-_PERSISTED_SPATIAL_CACHE: Optional[Dict[str, Any]] = None
-_PERSISTED_SPATIAL_CACHE_LOADED = False
-_KNOWN_METAR_STATIONS: Optional[set] = None  # Whitelist of airports known to have METAR
+    Each file is downloaded at most once per WEATHER_BULK_METAR_INTERVAL /
+    WEATHER_BULK_TAF_INTERVAL, and concurrent callers share one download, so
+    this can be called on every refresh.
 
+    This function is thread-safe.
 
-def _load_persisted_spatial_cache() -> Optional[Dict[str, Any]]:
+    Args:
+        include_taf: Whether to also refresh TAFs
+        source: Base URL or local directory (None = WEATHER_BULK_SOURCE)
     """
-    Load persisted spatial cache from disk if available.
+    kinds = [("metar", WEATHER_BULK_METAR_INTERVAL)]
+    if include_taf:
+        kinds.append(("taf", WEATHER_BULK_TAF_INTERVAL))
+
+    for kind, interval in kinds:
+        with _bulk_lock:
+            last_ingest = _bulk_last_ingest.get(kind)
+        if last_ingest is not None and time.monotonic() - last_ingest < interval:
+            continue
+        _BULK_FETCHES.do(kind, _ingest_bulk_file, kind, source, WEATHER_BULK_TIMEOUT)
 
-    The cache file is generated by scripts/precalculate_airport_spatial_data.py
-    and contains the spatial grid and known METAR stations.
 
-    Returns:
-        Cache data dictionary or None if not available
+def revalidate_weather_bulk(airport_icaos: List[str]) -> None:
     """
-    global \
-        _PERSISTED_SPATIAL_CACHE, \
-        _PERSISTED_SPATIAL_CACHE_LOADED, \
-        _KNOWN_METAR_STATIONS
-
-    if _PERSISTED_SPATIAL_CACHE_LOADED:
-        return _PERSISTED_SPATIAL_CACHE
-
-    _PERSISTED_SPATIAL_CACHE_LOADED = True
+    Refresh stale METARs in the background from the bulk cache files.
 
-    try:
-        # Find the cache file relative to this module
-        import os
-
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        cache_file = os.path.join(
-            module_dir, "..", "..", "data", "airport_spatial_cache.json"
-        )
-        cache_file = os.path.normpath(cache_file)
+    Returns immediately. Like revalidate_weather_bbox, the airports are not
+    also refetched one by one while the download is pending.
 
-        if not os.path.exists(cache_file):
-            return None
+    Args:
+        airport_icaos: Airports whose cached METARs are stale
+    """
+    _revalidate_in_background(
+        "metar", airport_icaos, lambda _claimed: refresh_weather_bulk()
+    )
 
-        with open(cache_file, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
 
-        # Validate version
-        if cache_data.get("version") != 1:
-            return None
+def get_altimeter_setting(airport_icao: str) -> Optional[str]:
+    """
+    Get altimeter setting for an airport from its METAR.
+    Uses cached parsed altimeter if available to avoid redundant parsing.
 
-        _PERSISTED_SPATIAL_CACHE = cache_data
+    This function is thread-safe.
 
-        # Load known METAR stations as a set for fast lookup
-        metar_stations = cache_data.get("metar_stations")
-        if metar_stations:
-            _KNOWN_METAR_STATIONS = set(metar_stations)
+    Args:
+        airport_icao: The ICAO code of the airport
 
-        return cache_data
+    Returns:
+        Altimeter string (e.g., "A2992" or "Q1013") or None if unavailable
+    """
+    # Check if we have cached parsed altimeter data (stale entries are
+    # refreshed in the background)
+    cache_entry = _get_cached_metar_entry(airport_icao, allow_stale=True)
+    if cache_entry is not None:
+        return _entry_parsed(cache_entry).altimeter
 
-    except Exception:
+    # Cache miss or too old - fetch METAR (which parses and caches it)
+    metar = get_metar(airport_icao)
+    if not metar:
         return None
 
+    return get_parsed_metar(metar).altimeter
 
-def _build_metar_airport_spatial_index(
-    airports_data: Dict[str, Dict[str, Any]],
-) -> Dict[str, Any]:
+
+def get_cached_wind_and_altimeter(
+    airport_icao: str, revalidate: bool = True
+) -> Optional[Tuple[str, Optional[str]]]:
     """
-    Build a spatial index of airports that have METAR data for efficient nearest-airport lookups.
+    Get parsed wind and altimeter from the METAR cache without fetching.
 
-    First tries to load from persisted cache (generated by precalculate script).
-    Falls back to building from scratch if cache is unavailable.
+    Stale entries (past the cache duration but within WEATHER_MAX_STALENESS)
+    are returned too; see get_weather_age for telling them apart.
 
-    For optimization, we use a simple grid-based spatial hash:
-    - Divide the world into 1-degree grid cells
-    - Store airports in each cell for quick regional lookup
-    - This avoids expensive distance calculations for all airports
+    This function is thread-safe.
 
     Args:
-        airports_data: Dictionary of all airport data
+        airport_icao: The ICAO code of the airport
+        revalidate: Queue a background refresh of a stale entry (pass False
+            when the caller refreshes stale entries itself)
 
     Returns:
-        Dictionary with spatial index structure
+        Tuple of (wind, altimeter) from the cache entry, ('', None) for
+        airports without METAR data, or None if nothing servable is cached
     """
     _metar_data_cache, metar_blacklist = get_metar_cache()
 
-    # Try to load from persisted cache first
-    persisted_cache = _load_persisted_spatial_cache()
-
-    if persisted_cache and "spatial_grid" in persisted_cache:
-        # Use persisted spatial grid, but filter by runtime blacklist and METAR whitelist
-        persisted_grid = persisted_cache["spatial_grid"]
-
-        valid_airports = []
-        spatial_grid = {}
+    with get_metar_cache_lock():
+        if airport_icao in metar_blacklist:
+            return "", None
 
-        for cell_key_str, airports in persisted_grid.items():
-            # Convert string key back to tuple
-            parts = cell_key_str.split(",")
-            cell_key = (int(parts[0]), int(parts[1]))
+    cache_entry = _get_cached_metar_entry(airport_icao, True, revalidate)
+    if cache_entry is None:
+        return None
+    parsed = _entry_parsed(cache_entry)
+    return parsed.wind_kt, parsed.altimeter
 
-            for airport in airports:
-                icao = airport["icao"]
 
-                # Skip if blacklisted at runtime (404 errors)
-                if icao in metar_blacklist:
-                    continue
+# Position-based result cache for find_nearest_airport_with_metar
+# Key: (rounded_lat, rounded_lon, heading_bucket), Value: result tuple or None
+_NEAREST_METAR_RESULT_CACHE = MeteredTTLCache(
+    maxsize=NEAREST_METAR_CACHE_SIZE, ttl=NEAREST_METAR_CACHE_TTL
+)
+_NEAREST_METAR_RESULT_CACHE_LOCK = threading.Lock()
+_NEAREST_METAR_POSITION_GRID_SIZE = 0.1  # ~6nm grid for position rounding
+_NEAREST_METAR_HEADING_BUCKET_DEGREES = 45  # Heading-biased results per 45 degrees
+_NEAREST_METAR_MAX_ATTEMPTS = 20  # Max candidate stations tried per position
+_NEAREST_METAR_MISSING = object()  # lookup() default (None is a cached result)
 
-                # If we have a whitelist, only include known METAR stations
-                if _KNOWN_METAR_STATIONS and icao not in _KNOWN_METAR_STATIONS:
-                    continue
 
-                valid_airports.append(airport)
+def _clear_nearest_metar_results() -> None:
+    """Clear the position-based nearest METAR result cache."""
+    with _NEAREST_METAR_RESULT_CACHE_LOCK:
+        _NEAREST_METAR_RESULT_CACHE.clear()
 
-                if cell_key not in spatial_grid:
-                    spatial_grid[cell_key] = []
-                spatial_grid[cell_key].append(airport)
 
-        return {
-            "grid": spatial_grid,
-            "airports": valid_airports,
-            "cell_size": 1.0,  # degrees
-        }
+def get_nearest_metar_cache_stats() -> Dict[str, Any]:
+    """
+    Get the nearest-METAR result cache counters.
 
-    # No persisted cache - build from scratch
-    valid_airports = []
-    for icao, data in airports_data.items():
-        # Skip if blacklisted or missing coordinates
-        if (
-            icao in metar_blacklist
-            or data.get("latitude") is None
-            or data.get("longitude") is None
-        ):
-            continue
+    Expired entries are dropped first, so 'size' only counts live results.
 
-        # If we have a whitelist, only include known METAR stations
-        if _KNOWN_METAR_STATIONS and icao not in _KNOWN_METAR_STATIONS:
-            continue
+    Returns:
+        Dictionary from MeteredTTLCache.stats() (size, hits, misses,
+        hit_rate, evictions, expirations, ...)
+    """
+    with _NEAREST_METAR_RESULT_CACHE_LOCK:
+        _NEAREST_METAR_RESULT_CACHE.expire()
+        return _NEAREST_METAR_RESULT_CACHE.stats()
 
-        valid_airports.append(
-            {"icao": icao, "lat": data["latitude"], "lon": data["longitude"]}
-        )
 
-    # Build spatial grid (1-degree cells)
-    spatial_grid = {}
-    for airport in valid_airports:
-        lat_cell = int(airport["lat"])
-        lon_cell = int(airport["lon"])
-        cell_key = (lat_cell, lon_cell)
-
-        if cell_key not in spatial_grid:
-            spatial_grid[cell_key] = []
-        spatial_grid[cell_key].append(airport)
-
-    return {
-        "grid": spatial_grid,
-        "airports": valid_airports,
-        "cell_size": 1.0,  # degrees
-    }
+# Results depend on the METAR index, so drop them whenever the indexes are
+# rebuilt or invalidated
+get_spatial_service().add_invalidation_listener(_clear_nearest_metar_results)
 
 
 def find_airports_near_position(
@@ -1166,66 +1586,238 @@ def find_airports_near_position(
     Returns:
         List of airport ICAO codes sorted by distance (closest first)
     """
-    global _METAR_AIRPORT_SPATIAL_INDEX, _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP
+    spatial_index = get_spatial_service().get_metar_index(airports_data)
+
+    # Rows come back sorted by distance
+    rows, _distances = spatial_index.query_radius([latitude], [longitude], radius_nm)[0]
+    return spatial_index.codes[rows[:max_results]].tolist()
 
-    # Ensure spatial index is built
-    current_time = datetime.now(timezone.utc)
 
-    needs_rebuild = (
-        _METAR_AIRPORT_SPATIAL_INDEX is None
-        or _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP is None
-        or (current_time - _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP).total_seconds()
-        > _METAR_SPATIAL_INDEX_DURATION
+def _nearest_metar_cache_key(
+    latitude: float,
+    longitude: float,
+    heading: Optional[float],
+    groundspeed: Optional[float],
+) -> Tuple[float, float, Optional[int]]:
+    """
+    Get the result cache key of a position (~6nm grid) and heading.
+
+    Heading-biased searches (see _score_metar_candidates) also key on a
+    45-degree heading bucket, so an aircraft going the opposite way never
+    gets a result that favours airports behind it. Unbiased searches use
+    bucket None.
+    """
+    bucket = None
+    if (
+        heading is not None
+        and not np.isnan(heading)
+        and not (groundspeed is not None and groundspeed <= 40)
+    ):
+        bucket = int(heading % 360 // _NEAREST_METAR_HEADING_BUCKET_DEGREES)
+    return (
+        round(latitude / _NEAREST_METAR_POSITION_GRID_SIZE)
+        * _NEAREST_METAR_POSITION_GRID_SIZE,
+        round(longitude / _NEAREST_METAR_POSITION_GRID_SIZE)
+        * _NEAREST_METAR_POSITION_GRID_SIZE,
+        bucket,
     )
 
-    if needs_rebuild:
-        with _METAR_SPATIAL_INDEX_LOCK:
-            current_time = datetime.now(timezone.utc)
-            if (
-                _METAR_AIRPORT_SPATIAL_INDEX is None
-                or _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP is None
-                or (
-                    current_time - _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP
-                ).total_seconds()
-                > _METAR_SPATIAL_INDEX_DURATION
-            ):
-                _METAR_AIRPORT_SPATIAL_INDEX = _build_metar_airport_spatial_index(
-                    airports_data
-                )
-                _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP = current_time
 
-    spatial_index = _METAR_AIRPORT_SPATIAL_INDEX
-    assert spatial_index is not None, "Spatial index should have been built"
-    grid = spatial_index["grid"]
+def _score_metar_candidates(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    headings: np.ndarray,
+    groundspeeds: np.ndarray,
+    spatial_index: SpatialIndex,
+    max_distance_nm: float,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Rank the METAR stations around each position, best first.
 
-    # Determine which cells to search
-    lat_cell = int(latitude)
-    lon_cell = int(longitude)
+    When a heading is known and the aircraft is in flight (groundspeed > 40kt
+    or unknown), airports ahead are preferred: distances are scaled by a
+    penalty from 0.7 (straight ahead) to 1.5 (directly behind).
 
-    # Search current cell and adjacent cells (3x3 grid)
-    search_cells = []
-    for dlat in [-1, 0, 1]:
-        for dlon in [-1, 0, 1]:
-            search_cells.append((lat_cell + dlat, lon_cell + dlon))
+    Returns:
+        One (rows, distances) tuple per position, at most
+        _NEAREST_METAR_MAX_ATTEMPTS long, rows into spatial_index
+    """
+    matches = spatial_index.query_radius(latitudes, longitudes, max_distance_nm)
+    counts = np.fromiter((len(rows) for rows, _ in matches), np.int64, len(matches))
+    if not counts.sum():
+        return matches
+
+    points = np.repeat(np.arange(len(matches)), counts)
+    rows = np.concatenate([rows for rows, _ in matches])
+    distances = np.concatenate([distances for _, distances in matches])
+
+    use_heading_bias = ~np.isnan(headings) & ~(groundspeeds <= 40)
+    biased = use_heading_bias[points] & (distances > 0)
+    scores = distances.copy()
+    if biased.any():
+        bearings = calculate_bearing_array(
+            latitudes[points[biased]],
+            longitudes[points[biased]],
+            spatial_index.latitude[rows[biased]],
+            spatial_index.longitude[rows[biased]],
+        )
+        heading_diff = np.abs(bearings - headings[points[biased]])
+        heading_diff = np.where(heading_diff > 180, 360 - heading_diff, heading_diff)
+        scores[biased] *= 0.7 + 0.8 * (heading_diff / 180.0)
+
+    # Sort by score within each position, keeping the best few
+    order = np.lexsort((scores, points))
+    points = points[order]
+    rows = rows[order]
+    distances = distances[order]
+    bounds = np.searchsorted(points, np.arange(len(matches) + 1))
+    return [
+        (
+            rows[start : min(end, start + _NEAREST_METAR_MAX_ATTEMPTS)],
+            distances[start : min(end, start + _NEAREST_METAR_MAX_ATTEMPTS)],
+        )
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
 
-    # Find airports within radius
-    candidates = []
 
-    for cell_key in search_cells:
-        if cell_key not in grid:
-            continue
+def find_nearest_metar_batch(
+    positions: List[Tuple[float, float]],
+    airports_data: Dict[str, Dict[str, Any]],
+    headings: Optional[List[Optional[float]]] = None,
+    groundspeeds: Optional[List[Optional[float]]] = None,
+    max_distance_nm: float = 100.0,
+) -> List[Optional[Tuple[str, str, float]]]:
+    """
+    Find the nearest airport with METAR data for many aircraft at once.
 
-        for airport in grid[cell_key]:
-            distance = haversine_distance_nm(
-                latitude, longitude, airport["lat"], airport["lon"]
+    Candidate stations around every position are found with one spatial
+    query and ranked with the same heading bias as
+    find_nearest_airport_with_metar. The METARs of all candidates not already
+    cached are then prefetched together with bbox requests (one per ~10-degree
+    area, in parallel), so a whole flight board resolves in one round trip.
+    Candidates in areas whose bbox request failed are fetched per station,
+    one batch of next-best candidates at a time.
+
+    Results are cached per rounded position (~6nm grid) and heading bucket
+    for NEAREST_METAR_CACHE_TTL seconds, shared with
+    find_nearest_airport_with_metar.
+
+    Args:
+        positions: (latitude, longitude) of each aircraft
+        airports_data: Dictionary of all airport data
+        headings: Optional heading per aircraft in degrees (None/NaN if unknown)
+        groundspeeds: Optional groundspeed per aircraft in knots (None/NaN if unknown)
+        max_distance_nm: Maximum search radius in nautical miles (default: 100)
+
+    Returns:
+        One (icao_code, altimeter_setting, distance_nm) tuple per position, or
+        None where no airport with METAR was found
+    """
+    results: List[Optional[Tuple[str, str, float]]] = [None] * len(positions)
+    if not positions:
+        return results
+
+    # Serve positions from the result cache where possible
+    cache_keys = [
+        _nearest_metar_cache_key(
+            lat,
+            lon,
+            headings[position] if headings is not None else None,
+            groundspeeds[position] if groundspeeds is not None else None,
+        )
+        for position, (lat, lon) in enumerate(positions)
+    ]
+    pending: List[int] = []
+    with _NEAREST_METAR_RESULT_CACHE_LOCK:
+        for position, cache_key in enumerate(cache_keys):
+            cached = _NEAREST_METAR_RESULT_CACHE.lookup(
+                cache_key, _NEAREST_METAR_MISSING
             )
+            if cached is _NEAREST_METAR_MISSING:
+                pending.append(position)
+            else:
+                results[position] = cached
+    if not pending:
+        return results
+
+    def column(values: Optional[List[Optional[float]]]) -> np.ndarray:
+        if values is None:
+            return np.full(len(pending), np.nan)
+        return np.array(
+            [np.nan if values[p] is None else values[p] for p in pending],
+            dtype=np.float64,
+        )
+
+    spatial_index = get_spatial_service().get_metar_index(airports_data)
+    candidates = _score_metar_candidates(
+        np.array([positions[p][0] for p in pending], dtype=np.float64),
+        np.array([positions[p][1] for p in pending], dtype=np.float64),
+        column(headings),
+        column(groundspeeds),
+        spatial_index,
+        max_distance_nm,
+    )
 
-            if distance <= radius_nm:
-                candidates.append((distance, airport["icao"]))
+    # Altimeter of every candidate station (deduplicated across aircraft)
+    altimeters: Dict[str, Optional[str]] = {}
+    uncached: Dict[str, Dict[str, float]] = {}
+    for rows, _distances in candidates:
+        for row in rows.tolist():
+            icao = spatial_index.codes[row]
+            if icao in altimeters or icao in uncached:
+                continue
+            cached = get_cached_wind_and_altimeter(icao)
+            if cached is not None:
+                altimeters[icao] = cached[1]
+            else:
+                uncached[icao] = {
+                    "latitude": float(spatial_index.latitude[row]),
+                    "longitude": float(spatial_index.longitude[row]),
+                }
 
-    # Sort by distance and return top results
-    candidates.sort(key=lambda x: x[0])
-    return [icao for _, icao in candidates[:max_results]]
+    if uncached:
+        fetched, unqueried = _fetch_airport_metars_bbox(list(uncached), uncached)
+        # Stations a successful bbox request didn't return have no current METAR
+        for icao, metar in fetched.items():
+            if icao not in unqueried:
+                altimeters[icao] = get_parsed_metar(metar).altimeter
+        if unqueried:
+            # Some bbox requests failed: fetch each aircraft's next-best
+            # unqueried candidate in parallel until every aircraft is
+            # resolved or out of candidates
+            for _attempt in range(_NEAREST_METAR_MAX_ATTEMPTS):
+                wanted = set()
+                for rows, _distances in candidates:
+                    codes = spatial_index.codes[rows].tolist()
+                    if any(altimeters.get(icao) for icao in codes):
+                        continue
+                    untried = [icao for icao in codes if icao not in altimeters]
+                    if untried:
+                        wanted.add(untried[0])
+                if not wanted:
+                    break
+                for icao, metar in get_metar_batch(list(wanted)).items():
+                    altimeters[icao] = get_parsed_metar(metar).altimeter
+
+    # Pick each aircraft's best candidate that has an altimeter setting
+    with _NEAREST_METAR_RESULT_CACHE_LOCK:
+        for position, (rows, distances) in zip(pending, candidates):
+            result = None
+            for row, distance in zip(rows.tolist(), distances.tolist()):
+                icao = spatial_index.codes[row]
+                altimeter = altimeters.get(icao)
+                if altimeter:
+                    result = (icao, altimeter, distance)
+                    break
+            results[position] = result
+            # Don't remember "no METAR" while some candidates went unqueried
+            if result is None and any(
+                icao not in altimeters for icao in spatial_index.codes[rows].tolist()
+            ):
+                continue
+            _NEAREST_METAR_RESULT_CACHE[cache_keys[position]] = result
+
+    return results
 
 
 def find_nearest_airport_with_metar(
@@ -1239,9 +1831,10 @@ def find_nearest_airport_with_metar(
     """
     Find the nearest airport with METAR data to given coordinates.
 
-    Uses a spatial index for efficient lookup. The index is cached and rebuilt
-    every 5 minutes to account for new METAR blacklists. Results are also cached
-    based on rounded position (~6nm grid) for 1 minute.
+    Uses the spatial service's METAR index, which masks out airports as they
+    are blacklisted. Results are also cached based on rounded position (~6nm
+    grid) and heading bucket. See find_nearest_metar_batch to resolve many
+    aircraft at once.
 
     When aircraft_heading is provided and groundspeed > 40kt, airports ahead
     of the aircraft are preferred over those behind. The scoring uses a heading
@@ -1259,137 +1852,13 @@ def find_nearest_airport_with_metar(
         Tuple of (icao_code, altimeter_setting, distance_nm) or None if no airport found
         Distance is in nautical miles
     """
-    global _METAR_AIRPORT_SPATIAL_INDEX, _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP
-
-    current_time = datetime.now(timezone.utc)
-
-    # Round position to grid for cache lookup (~6nm grid)
-    rounded_lat = (
-        round(latitude / _NEAREST_METAR_POSITION_GRID_SIZE)
-        * _NEAREST_METAR_POSITION_GRID_SIZE
-    )
-    rounded_lon = (
-        round(longitude / _NEAREST_METAR_POSITION_GRID_SIZE)
-        * _NEAREST_METAR_POSITION_GRID_SIZE
-    )
-    cache_key = (rounded_lat, rounded_lon)
-
-    # Check result cache first (fast path)
-    with _NEAREST_METAR_RESULT_CACHE_LOCK:
-        if cache_key in _NEAREST_METAR_RESULT_CACHE:
-            cache_entry = _NEAREST_METAR_RESULT_CACHE[cache_key]
-            time_since_cache = (current_time - cache_entry["timestamp"]).total_seconds()
-            if time_since_cache < _NEAREST_METAR_RESULT_CACHE_DURATION:
-                return cache_entry["result"]
-
-    # Check if we need to build or rebuild the spatial index (double-checked locking)
-    needs_rebuild = (
-        _METAR_AIRPORT_SPATIAL_INDEX is None
-        or _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP is None
-        or (current_time - _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP).total_seconds()
-        > _METAR_SPATIAL_INDEX_DURATION
-    )
-
-    if needs_rebuild:
-        with _METAR_SPATIAL_INDEX_LOCK:
-            # Re-check inside lock (another thread may have rebuilt)
-            current_time = datetime.now(timezone.utc)
-            if (
-                _METAR_AIRPORT_SPATIAL_INDEX is None
-                or _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP is None
-                or (
-                    current_time - _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP
-                ).total_seconds()
-                > _METAR_SPATIAL_INDEX_DURATION
-            ):
-                _METAR_AIRPORT_SPATIAL_INDEX = _build_metar_airport_spatial_index(
-                    airports_data
-                )
-                _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP = current_time
-
-    spatial_index = _METAR_AIRPORT_SPATIAL_INDEX
-    assert spatial_index is not None, "Spatial index should have been built"
-    grid = spatial_index["grid"]
-
-    # Determine which cells to search
-    # 1 degree of latitude ≈ 60nm, so we need to search enough cells to cover max_distance_nm
-    # At mid-latitudes, 1 degree of longitude ≈ 45nm, so use conservative estimate
-    # Add 1 to ensure we cover the edges
-    cell_radius = int(max_distance_nm / 45) + 1
-
-    lat_cell = int(latitude)
-    lon_cell = int(longitude)
-
-    # Build list of cells to search based on max_distance_nm
-    search_cells = set()
-    for dlat in range(-cell_radius, cell_radius + 1):
-        for dlon in range(-cell_radius, cell_radius + 1):
-            search_cells.add((lat_cell + dlat, lon_cell + dlon))
-
-    # Determine if we should apply heading bias
-    # Only apply if in flight (groundspeed > 40kt) and heading is provided
-    use_heading_bias = aircraft_heading is not None and (
-        aircraft_groundspeed is None or aircraft_groundspeed > 40
-    )
-
-    # Find all airports within search radius, scored by distance and heading
-    candidates = []
-    tried_icaos = set()
-
-    for cell_key in search_cells:
-        if cell_key not in grid:
-            continue
-
-        for airport in grid[cell_key]:
-            if airport["icao"] in tried_icaos:
-                continue
-            tried_icaos.add(airport["icao"])
-
-            distance = haversine_distance_nm(
-                latitude, longitude, airport["lat"], airport["lon"]
-            )
-
-            if distance <= max_distance_nm:
-                # Calculate score with optional heading bias
-                if use_heading_bias and distance > 0 and aircraft_heading is not None:
-                    # Calculate bearing from aircraft to airport
-                    bearing_to_airport = calculate_bearing(
-                        latitude, longitude, airport["lat"], airport["lon"]
-                    )
-                    # Calculate angular difference (0-180 degrees)
-                    heading_diff = abs(bearing_to_airport - aircraft_heading)
-                    if heading_diff > 180:
-                        heading_diff = 360 - heading_diff
-                    # Calculate penalty: 0.7 (ahead) to 1.5 (behind)
-                    # Formula: 0.7 + 0.8 * (heading_diff / 180)
-                    heading_penalty = 0.7 + 0.8 * (heading_diff / 180.0)
-                    score = distance * heading_penalty
-                else:
-                    score = distance
-
-                candidates.append((score, distance, airport["icao"]))
-
-    # Sort by score (lowest first - closest/most ahead)
-    candidates.sort(key=lambda x: x[0])
-
-    # Try airports in order of score until we find one with METAR
-    MAX_ATTEMPTS = 20  # Limit attempts to prevent excessive API calls
-    result = None
-
-    for _score, distance, icao in candidates[:MAX_ATTEMPTS]:
-        altimeter = get_altimeter_setting(icao)
-        if altimeter:
-            result = (icao, altimeter, distance)
-            break
-
-    # Cache the result (even if None) for this position
-    with _NEAREST_METAR_RESULT_CACHE_LOCK:
-        _NEAREST_METAR_RESULT_CACHE[cache_key] = {
-            "result": result,
-            "timestamp": datetime.now(timezone.utc),
-        }
-
-    return result
+    return find_nearest_metar_batch(
+        [(latitude, longitude)],
+        airports_data,
+        headings=[aircraft_heading],
+        groundspeeds=[aircraft_groundspeed],
+        max_distance_nm=max_distance_nm,
+    )[0]
 
 
 def clear_weather_caches() -> None:
@@ -1397,16 +1866,8 @@ def clear_weather_caches() -> None:
 
     Call this when tracked airports change to ensure fresh data is fetched.
     """
-    global _METAR_AIRPORT_SPATIAL_INDEX, _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP
-
-    # Clear module-level spatial index cache
-    with _METAR_SPATIAL_INDEX_LOCK:
-        _METAR_AIRPORT_SPATIAL_INDEX = None
-        _METAR_AIRPORT_SPATIAL_INDEX_TIMESTAMP = None
-
-    # Clear position-based result cache
-    with _NEAREST_METAR_RESULT_CACHE_LOCK:
-        _NEAREST_METAR_RESULT_CACHE.clear()
+    # Drop the spatial indexes (this also clears the position-based result cache)
+    get_spatial_service().invalidate()
 
     # Clear the shared caches from cache manager
     wind_data_cache, _wind_blacklist = get_wind_cache()
@@ -1427,6 +1888,10 @@ def clear_weather_caches() -> None:
         taf_data_cache.clear()
         # Don't clear blacklist - those are permanent 404s
 
+    # The next bulk refresh downloads the files again
+    with _bulk_lock:
+        _bulk_last_ingest.clear()
+
 
 def get_rate_limit_status() -> Dict[str, Any]:
     """
@@ -1604,32 +2069,57 @@ def get_weather_for_airports_bbox(
     Returns:
         Dictionary mapping ICAO codes to METAR strings (empty string if unavailable)
     """
+    metars, _unqueried = _fetch_airport_metars_bbox(
+        airport_icaos, airports_data, max_workers, progress_callback
+    )
+    return metars
+
+
+def _fetch_airport_metars_bbox(
+    airport_icaos: List[str],
+    airports_data: Dict[str, Dict[str, Any]],
+    max_workers: int = 5,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Fetch METAR data for airports using bbox queries, reporting which
+    airports no successful request covered.
+
+    See get_weather_for_airports_bbox.
+
+    Returns:
+        Tuple of (ICAO -> METAR, empty string if unavailable; ICAOs of
+        airports outside every bbox whose request succeeded, whose empty
+        METAR means "unknown" rather than "no report")
+    """
     if not airport_icaos:
-        return {}
+        return {}, set()
 
     # Calculate bboxes for the airports
     bboxes = calculate_airport_bboxes(airport_icaos, airports_data)
 
     if not bboxes:
-        return {}
+        return {icao: "" for icao in airport_icaos}, set(airport_icaos)
 
     # Convert to set for filtering
     target_set = set(a.upper() for a in airport_icaos)
 
     all_metars: Dict[str, str] = {}
+    succeeded: List[Tuple[float, float, float, float]] = []
     total = len(bboxes)
     completed = 0
 
     # Fetch weather for each bbox in parallel
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_bbox = {
-            executor.submit(fetch_weather_bbox, bbox, False): bbox_id
-            for bbox_id, bbox in bboxes.items()
+            executor.submit(_fetch_weather_bbox, bbox, False, 30): bbox
+            for bbox in bboxes.values()
         }
 
         for future in as_completed(future_to_bbox):
             try:
                 metars, _tafs = future.result()
+                succeeded.append(future_to_bbox[future])
                 # Filter to target airports
                 for icao, metar in metars.items():
                     if icao.upper() in target_set:
@@ -1646,21 +2136,29 @@ def get_weather_for_airports_bbox(
     metar_data_cache, _metar_blacklist = get_metar_cache()
     metar_lock = get_metar_cache_lock()
     current_time = datetime.now(timezone.utc)
+    new_entries = {
+        icao: _new_metar_entry(icao, metar, current_time)
+        for icao, metar in all_metars.items()
+        if metar
+    }
 
     with metar_lock:
-        for icao, metar in all_metars.items():
-            if metar:
-                # Parse wind and altimeter from METAR for caching
-                parsed_wind = _parse_wind_from_metar(metar)
-                parsed_altimeter = parse_altimeter_from_metar(metar)
-
-                metar_data_cache[icao] = {
-                    "metar": metar,
-                    "wind": parsed_wind,
-                    "altimeter": parsed_altimeter,
-                    "timestamp": current_time,
-                }
+        metar_data_cache.update(new_entries)
+
+    def queried(icao: str) -> bool:
+        airport = airports_data.get(icao) or {}
+        lat = airport.get("latitude")
+        lon = airport.get("longitude")
+        if lat is None or lon is None:
+            return False
+        return any(
+            min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+            for min_lat, min_lon, max_lat, max_lon in succeeded
+        )
 
     # Ensure all requested airports have an entry (empty string if not found)
     result = {icao: all_metars.get(icao, "") for icao in airport_icaos}
-    return result
+    unqueried = {
+        icao for icao in airport_icaos if not result[icao] and not queried(icao)
+    }
+    return result, unqueried
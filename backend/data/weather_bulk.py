@@ -0,0 +1,199 @@
+"""
+Bulk METAR/TAF ingest from the aviationweather.gov cache files.
+
+aviationweather.gov publishes every current METAR and TAF worldwide as two
+gzipped CSV files (metars.cache.csv.gz and tafs.cache.csv.gz). Reading those
+two files replaces one bbox request per ARTCC plus the per-airport fallback
+requests. The files are streamed and decompressed as they download, so only
+one report per station is held in memory.
+
+A source is either a base URL (http/https) or a local directory holding
+files with the same names, e.g. a copy written by
+scripts/weather_daemon/bulk_weather_standin.py for offline runs.
+"""
+
+import csv
+import gzip
+import io
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+from backend.config import constants as backend_constants
+from backend.config.constants import (
+    WEATHER_BULK_METAR_FILE,
+    WEATHER_BULK_TAF_FILE,
+    WEATHER_BULK_TIMEOUT,
+)
+from backend.net import get_http_client
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Columns identifying a report in the cache files; the time column is used
+# to keep the latest report when a station appears more than once
+_STATION_COLUMN = "station_id"
+_RAW_TEXT_COLUMN = "raw_text"
+_METAR_TIME_COLUMN = "observation_time"
+_TAF_TIME_COLUMN = "issue_time"
+
+
+def cache_file_location(source: Optional[str], file_name: str) -> str:
+    """
+    Get the URL or path of a cache file.
+
+    Args:
+        source: Base URL or local directory (None = WEATHER_BULK_SOURCE)
+        file_name: Cache file name (e.g. "metars.cache.csv.gz")
+
+    Returns:
+        URL or local path of the file
+    """
+    source = source or backend_constants.WEATHER_BULK_SOURCE
+    if source.startswith(("http://", "https://")):
+        return f"{source.rstrip('/')}/{file_name}"
+    if source.startswith("file://"):
+        source = source[len("file://") :]
+    return os.path.join(source, file_name)
+
+
+@contextmanager
+def open_cache_file(location: str, timeout: float = WEATHER_BULK_TIMEOUT):
+    """
+    Open a cache file as a decompressed text stream.
+
+    Gzipped content is detected from its first bytes, so uncompressed files
+    (or servers that already decoded the gzip) work too.
+
+    Args:
+        location: URL or local path (see cache_file_location)
+        timeout: Network timeout in seconds
+
+    Yields:
+        Text stream of the CSV content
+
+    Raises:
+        requests.RequestException: On network or HTTP errors
+        OSError: If a local file can't be read
+    """
+    if location.startswith(("http://", "https://")):
+        response = get_http_client().get(location, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Keep the stream readable at EOF for the buffered/gzip readers
+            response.raw.auto_close = False
+            with _decompressed_text(response.raw) as text:
+                yield text
+        finally:
+            response.close()
+    else:
+        with open(location, "rb") as raw, _decompressed_text(raw) as text:
+            yield text
+
+
+@contextmanager
+def _decompressed_text(raw: BinaryIO):
+    """Wrap a binary stream, gunzipping it if it is gzip data."""
+    buffered = io.BufferedReader(raw) if not hasattr(raw, "peek") else raw
+    stream: BinaryIO = buffered
+    if buffered.peek(2)[:2] == _GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=buffered)
+    text = io.TextIOWrapper(stream, encoding="utf-8", errors="replace", newline="")
+    try:
+        yield text
+    finally:
+        text.detach()
+
+
+def iter_cache_file_reports(
+    text: io.TextIOBase, time_column: str
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Read the reports of a cache file.
+
+    The CSV data is preceded by a few status lines ("No errors", "123 ms",
+    "4823 results", ...) that are skipped up to the header row.
+
+    Args:
+        text: Text stream of the CSV content
+        time_column: Column with the report time
+
+    Yields:
+        Tuples of (station ICAO, raw report, report time) in file order
+    """
+    reader = csv.reader(text)
+    for header in reader:
+        if _RAW_TEXT_COLUMN in header and _STATION_COLUMN in header:
+            break
+    else:
+        return
+
+    raw_index = header.index(_RAW_TEXT_COLUMN)
+    station_index = header.index(_STATION_COLUMN)
+    time_index = header.index(time_column) if time_column in header else None
+    width = max(raw_index, station_index, time_index or 0)
+
+    for row in reader:
+        if len(row) <= width:
+            continue
+        station = row[station_index].strip().upper()
+        raw = row[raw_index].strip()
+        if station and raw:
+            yield station, raw, row[time_index] if time_index is not None else ""
+
+
+def read_latest_reports(
+    location: str, time_column: str, timeout: float = WEATHER_BULK_TIMEOUT
+) -> Dict[str, str]:
+    """
+    Stream a cache file and keep the latest report of each station.
+
+    Args:
+        location: URL or local path (see cache_file_location)
+        time_column: Column with the report time (ISO 8601, so it sorts as text)
+        timeout: Network timeout in seconds
+
+    Returns:
+        Dictionary mapping station ICAO to its latest raw report
+    """
+    latest: Dict[str, Tuple[str, str]] = {}
+    with open_cache_file(location, timeout) as text:
+        for station, raw, report_time in iter_cache_file_reports(text, time_column):
+            current = latest.get(station)
+            if current is None or report_time >= current[0]:
+                latest[station] = (report_time, raw)
+    return {station: raw for station, (_time, raw) in latest.items()}
+
+
+def read_bulk_metars(
+    source: Optional[str] = None, timeout: float = WEATHER_BULK_TIMEOUT
+) -> Dict[str, str]:
+    """
+    Read the latest METAR of every station from the METAR cache file.
+
+    Args:
+        source: Base URL or local directory (None = WEATHER_BULK_SOURCE)
+        timeout: Network timeout in seconds
+
+    Returns:
+        Dictionary mapping station ICAO to raw METAR
+    """
+    location = cache_file_location(source, WEATHER_BULK_METAR_FILE)
+    return read_latest_reports(location, _METAR_TIME_COLUMN, timeout)
+
+
+def read_bulk_tafs(
+    source: Optional[str] = None, timeout: float = WEATHER_BULK_TIMEOUT
+) -> Dict[str, str]:
+    """
+    Read the latest TAF of every station from the TAF cache file.
+
+    Args:
+        source: Base URL or local directory (None = WEATHER_BULK_SOURCE)
+        timeout: Network timeout in seconds
+
+    Returns:
+        Dictionary mapping station ICAO to raw TAF
+    """
+    location = cache_file_location(source, WEATHER_BULK_TAF_FILE)
+    return read_latest_reports(location, _TAF_TIME_COLUMN, timeout)
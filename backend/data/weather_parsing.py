@@ -2,10 +2,32 @@
 Shared weather parsing constants and utilities.
 
 Used by both the UI weather briefing modal and the weather daemon generator.
+
+The field extractors read groups from the single-pass tokenizer in
+weather_tokens rather than searching the raw text themselves.
+get_parsed_metar() parses a raw METAR into a ParsedMetar once and caches it
+by the raw text, so the main table, flight board, briefings and daemon cards
+read the same fields instead of each re-running the extractors below.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cachetools import LRUCache
+
+from backend.config.constants import PARSED_METAR_CACHE_SIZE
+from backend.data.weather_tokens import (
+    TOKEN_ALTIMETER,
+    TOKEN_SKY,
+    TOKEN_TIME,
+    TOKEN_VISIBILITY,
+    TOKEN_WEATHER,
+    TOKEN_WIND,
+    WeatherToken,
+    tokenize_report,
+)
 
 # Category priority for trend comparison (lower = worse conditions)
 CATEGORY_PRIORITY = {"LIFR": 0, "IFR": 1, "MVFR": 2, "VFR": 3}
@@ -104,6 +126,142 @@ def get_airport_size_priority(airport_info: Dict[str, Any]) -> int:
     return TOWER_TYPE_PRIORITY.get(tower_type, 9)
 
 
+# =============================================================================
+# Field extraction from tokenize_report() groups. The public parse_* helpers
+# below and parse_metar_tokens() all read the same tokens.
+# =============================================================================
+
+_WIND_GROUP_RE = re.compile(r"(\d{3}|VRB)(\d{2,3})(G\d{2,3})?(KT|MPS|KMH|KPH)")
+
+# Units parse_wind_from_metar reports verbatim (KPH is only converted)
+_WIND_REPORTED_UNITS = ("KT", "MPS", "KMH")
+
+# Ceiling-forming sky covers (BKN, OVC, VV = vertical visibility/obscured)
+_CEILING_COVERS = ("BKN", "OVC", "VV")
+
+
+def _first_group(tokens: Sequence[WeatherToken], kind: str) -> Optional[str]:
+    """Get the text of the first token of a kind."""
+    for token in tokens:
+        if token.kind == kind:
+            return token.text
+    return None
+
+
+def _obs_time(tokens: Sequence[WeatherToken]) -> Optional[str]:
+    """Get the observation time (DDHHMM) from the time group."""
+    time_group = _first_group(tokens, TOKEN_TIME)
+    return time_group[:6] if time_group else None
+
+
+def _wind_group(
+    tokens: Sequence[WeatherToken], units: Optional[Tuple[str, ...]] = None
+) -> Optional[str]:
+    """Get the first wind group, optionally only one reported in the given units."""
+    for token in tokens:
+        if token.kind == TOKEN_WIND and (units is None or token.text.endswith(units)):
+            return token.text
+    return None
+
+
+def _visibility_rank(group: str) -> int:
+    """Rank a visibility group: mixed fraction, M-fraction, fraction, miles, meters."""
+    if " " in group:
+        return 0
+    if "/" in group:
+        return 1 if group.startswith("M") else 2
+    if group.endswith("SM"):
+        return 3
+    return 4
+
+
+def _visibility_group(
+    tokens: Sequence[WeatherToken], statute_only: bool = False
+) -> Optional[str]:
+    """
+    Pick the prevailing visibility group.
+
+    The most specific statute-mile form wins, then meters, so a report with
+    both (e.g. a TAF fragment) reads the way it always has.
+    """
+    best = None
+    best_rank = 4 if statute_only else 5
+    for token in tokens:
+        if token.kind == TOKEN_VISIBILITY:
+            rank = _visibility_rank(token.text)
+            if rank < best_rank:
+                best, best_rank = token.text, rank
+    return best
+
+
+def _visibility_sm(tokens: Sequence[WeatherToken]) -> Optional[float]:
+    """Get the prevailing visibility in statute miles."""
+    group = _visibility_group(tokens)
+    if group is None:
+        return None
+
+    # Mixed fraction: "1 1/2SM", "2 1/4SM"
+    if " " in group:
+        whole, fraction = group[:-2].split()
+        num, den = fraction.split("/")
+        return int(whole) + (int(num) / int(den))
+
+    # Fraction: "1/2SM", or "M1/4SM" (less than 1/4 mile)
+    if "/" in group:
+        num, den = group[:-2].lstrip("M").split("/")
+        if group.startswith("M"):
+            # Return slightly less than the fraction for "less than" indicator
+            return (int(num) / int(den)) - 0.01
+        return int(num) / int(den)
+
+    # Whole miles: "10SM", "3SM", "P6SM" (P = plus/more than 6)
+    if group.endswith("SM"):
+        vis = int(group[:-2].lstrip("PM"))
+        if group.startswith("P"):
+            return vis + 1  # Slightly more than indicated
+        return float(vis)
+
+    # Meters: "9999" = 10km+, "0800" = 800m
+    meters = int(group)
+    if meters == 9999:
+        return 7.0  # Greater than 6 SM
+    # Convert meters to statute miles (1 SM = 1609.34 meters)
+    return meters / 1609.34
+
+
+def _ceiling(tokens: Sequence[WeatherToken]) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Get the ceiling: the lowest BKN, OVC or VV layer.
+
+    Returns:
+        (height in feet AGL, layer as "BKN004"), or (None, None) if no ceiling
+    """
+    lowest_height = None
+    lowest_layer = None
+    for token in tokens:
+        if token.kind != TOKEN_SKY:
+            continue
+        cover = token.text[:2] if token.text.startswith("VV") else token.text[:3]
+        height_str = token.text[len(cover) : len(cover) + 3]
+        if cover not in _CEILING_COVERS or not height_str.isdigit():
+            continue
+        # Heights are in hundreds of feet AGL
+        height_feet = int(height_str) * 100
+        if lowest_height is None or height_feet < lowest_height:
+            lowest_height = height_feet
+            lowest_layer = f"{cover}{height_str}"
+    return lowest_height, lowest_layer
+
+
+def _phenomena(tokens: Sequence[WeatherToken]) -> List[str]:
+    """Decode the present-weather groups."""
+    phenomena: List[str] = []
+    for token in tokens:
+        if token.kind == TOKEN_WEATHER:
+            phenomena.extend(_parse_single_weather(token.text))
+    return phenomena
+
+
 def parse_visibility_sm(metar: str) -> Optional[float]:
     """
     Parse visibility in statute miles from METAR.
@@ -117,58 +275,7 @@ def parse_visibility_sm(metar: str) -> Optional[float]:
     if not metar:
         return None
 
-    # Handle visibility patterns in order of specificity:
-    # 1. Fractional visibility: "1/2SM", "1 1/2SM", "M1/4SM" (M = less than)
-    # 2. Whole number visibility: "10SM", "3SM"
-    # 3. Meters visibility (convert to SM): "9999" means 10+ km, "0800" = 800m
-
-    # Pattern for mixed fraction like "1 1/2SM" or "2 1/4SM"
-    mixed_frac_match = re.search(r"\b(\d+)\s+(\d+)/(\d+)SM\b", metar)
-    if mixed_frac_match:
-        whole = int(mixed_frac_match.group(1))
-        num = int(mixed_frac_match.group(2))
-        den = int(mixed_frac_match.group(3))
-        return whole + (num / den)
-
-    # Pattern for "M1/4SM" (less than 1/4 mile)
-    less_than_frac_match = re.search(r"\bM(\d+)/(\d+)SM\b", metar)
-    if less_than_frac_match:
-        num = int(less_than_frac_match.group(1))
-        den = int(less_than_frac_match.group(2))
-        # Return slightly less than the fraction for "less than" indicator
-        return (num / den) - 0.01
-
-    # Pattern for simple fraction like "1/2SM", "3/4SM"
-    frac_match = re.search(r"\b(\d+)/(\d+)SM\b", metar)
-    if frac_match:
-        num = int(frac_match.group(1))
-        den = int(frac_match.group(2))
-        return num / den
-
-    # Pattern for whole number like "10SM", "3SM", "P6SM" (P = plus/more than 6)
-    whole_match = re.search(r"\b[PM]?(\d+)SM\b", metar)
-    if whole_match:
-        vis = int(whole_match.group(1))
-        # P6SM means greater than 6 miles - treat as good visibility
-        if "P" in metar and f"P{vis}SM" in metar:
-            return vis + 1  # Slightly more than indicated
-        return float(vis)
-
-    # Pattern for meters (4-digit): "9999" = 10km+, "0800" = 800m
-    # This appears after the wind in METAR, before clouds
-    meters_match = re.search(r"\b(\d{4})\b(?!\d)", metar)
-    if meters_match:
-        # Make sure it's not a time or other number
-        meters_str = meters_match.group(1)
-        meters = int(meters_str)
-        # Visibility in meters is typically 0000-9999
-        # 9999 means visibility >= 10km
-        if meters == 9999:
-            return 7.0  # Greater than 6 SM
-        # Convert meters to statute miles (1 SM = 1609.34 meters)
-        return meters / 1609.34
-
-    return None
+    return _visibility_sm(tokenize_report(metar))
 
 
 def parse_ceiling_feet(metar: str) -> Optional[int]:
@@ -184,24 +291,7 @@ def parse_ceiling_feet(metar: str) -> Optional[int]:
     if not metar:
         return None
 
-    # Cloud layer patterns: FEW015, SCT025, BKN035, OVC050, VV003 (vertical visibility)
-    # Heights are in hundreds of feet AGL
-    # Ceiling is the lowest BKN (broken), OVC (overcast), or VV (vertical visibility/obscured)
-
-    cloud_pattern = r"\b(BKN|OVC|VV)(\d{3})\b"
-    matches = re.findall(cloud_pattern, metar)
-
-    if not matches:
-        return None  # No ceiling (clear, few, or scattered only)
-
-    # Find the lowest ceiling layer
-    lowest_ceiling = None
-    for _layer_type, height_str in matches:
-        height_feet = int(height_str) * 100
-        if lowest_ceiling is None or height_feet < lowest_ceiling:
-            lowest_ceiling = height_feet
-
-    return lowest_ceiling
+    return _ceiling(tokenize_report(metar))[0]
 
 
 def parse_ceiling_layer(metar: str) -> Optional[str]:
@@ -217,23 +307,7 @@ def parse_ceiling_layer(metar: str) -> Optional[str]:
     if not metar:
         return None
 
-    # Cloud layer patterns: BKN035, OVC050, VV003 (vertical visibility)
-    cloud_pattern = r"\b(BKN|OVC|VV)(\d{3})\b"
-    matches = re.findall(cloud_pattern, metar)
-
-    if not matches:
-        return None
-
-    # Find the lowest ceiling layer
-    lowest_layer = None
-    lowest_height = None
-    for layer_type, height_str in matches:
-        height_feet = int(height_str) * 100
-        if lowest_height is None or height_feet < lowest_height:
-            lowest_height = height_feet
-            lowest_layer = f"{layer_type}{height_str}"
-
-    return lowest_layer
+    return _ceiling(tokenize_report(metar))[1]
 
 
 def extract_visibility_str(metar: str) -> Optional[str]:
@@ -250,28 +324,7 @@ def extract_visibility_str(metar: str) -> Optional[str]:
     if not metar:
         return None
 
-    # Match visibility patterns in order of specificity:
-    # Mixed fraction: "1 1/2SM", "2 1/4SM"
-    mixed_match = re.search(r"\b(\d+\s+\d+/\d+SM)\b", metar)
-    if mixed_match:
-        return mixed_match.group(1)
-
-    # Less than fraction: "M1/4SM"
-    less_than_match = re.search(r"\b(M\d+/\d+SM)\b", metar)
-    if less_than_match:
-        return less_than_match.group(1)
-
-    # Simple fraction: "1/2SM", "3/4SM"
-    frac_match = re.search(r"\b(\d+/\d+SM)\b", metar)
-    if frac_match:
-        return frac_match.group(1)
-
-    # Whole number with optional P prefix: "10SM", "P6SM"
-    whole_match = re.search(r"\b(P?\d+SM)\b", metar)
-    if whole_match:
-        return whole_match.group(1)
-
-    return None
+    return _visibility_group(tokenize_report(metar), statute_only=True)
 
 
 def extract_flight_rules_weather(metar: str) -> Tuple[Optional[str], Optional[str]]:
@@ -301,11 +354,86 @@ def parse_wind_from_metar(metar: str) -> Optional[str]:
     if not metar:
         return None
 
-    wind_pattern = r"\b(\d{3}|VRB)(\d{2,3})(G\d{2,3})?(KT|MPS|KMH)\b"
-    match = re.search(wind_pattern, metar)
-    if match:
-        return match.group(0)
-    return None
+    return _wind_group(tokenize_report(metar), _WIND_REPORTED_UNITS)
+
+
+def parse_wind_kt_from_metar(metar: str) -> str:
+    """
+    Parse wind from METAR, converted to knots.
+
+    Args:
+        metar: Raw METAR string
+
+    Returns:
+        Wind string in format like "27005KT" or "27005G12KT" or "00000KT" or empty string if unavailable
+    """
+    if not metar:
+        return ""
+
+    wind = _wind_group(tokenize_report(metar))
+    return _wind_in_knots(wind) if wind else ""
+
+
+def _wind_in_knots(wind: str) -> str:
+    """Convert a wind group to knots ("00000KT" when calm)."""
+    # Wind format in METAR: DDDSSGggKT or DDDSSKMH or DDDSSKPH (Direction Speed Gust)
+    # Also handle VRB for variable, and 00000KT for calm
+    match = _WIND_GROUP_RE.fullmatch(wind)
+    direction = match.group(1)
+    speed = match.group(2)
+    gust = match.group(3)  # Includes 'G' prefix if present
+    units = match.group(4)
+
+    # Check for calm winds
+    if direction != "VRB" and int(speed) == 0:
+        return "00000KT"
+
+    # Build wind string (always convert to KT for consistency)
+    wind_str = f"{direction}{speed}"
+    if gust:
+        wind_str += gust
+
+    # Add KT suffix (convert if needed, but METAR is usually in KT)
+    if units == "KT":
+        wind_str += "KT"
+    elif units in ["KMH", "KPH"]:
+        # Convert km/h to knots (1 knot = 1.852 km/h)
+        speed_kt = round(int(speed) / 1.852)
+        wind_str = f"{direction}{speed_kt:02d}"
+        if gust:
+            gust_kt = round(int(gust[1:]) / 1.852)
+            wind_str += f"G{gust_kt:02d}"
+        wind_str += "KT"
+    elif units == "MPS":
+        # Convert m/s to knots (1 knot = 0.514444 m/s)
+        speed_kt = round(int(speed) / 0.514444)
+        wind_str = f"{direction}{speed_kt:02d}"
+        if gust:
+            gust_kt = round(int(gust[1:]) / 0.514444)
+            wind_str += f"G{gust_kt:02d}"
+        wind_str += "KT"
+    else:
+        wind_str += "KT"
+
+    return wind_str
+
+
+def parse_altimeter_from_metar(metar: str) -> Optional[str]:
+    """
+    Extract altimeter setting from METAR.
+
+    Args:
+        metar: The METAR string
+
+    Returns:
+        Altimeter string in format "A2992" or "Q1013" or None if not found
+    """
+    if not metar:
+        return None
+
+    # A#### for inches of mercury (e.g., A2992 = 29.92 inHg)
+    # Q#### for hectopascals/millibars (e.g., Q1013 = 1013 hPa)
+    return _first_group(tokenize_report(metar), TOKEN_ALTIMETER)
 
 
 def parse_metar_obs_time(metar: str) -> Optional[str]:
@@ -324,12 +452,7 @@ def parse_metar_obs_time(metar: str) -> Optional[str]:
     if not metar:
         return None
 
-    # Match 6-digit Zulu time after the ICAO code
-    time_pattern = r"\b(\d{6})Z\b"
-    match = re.search(time_pattern, metar)
-    if match:
-        return match.group(1)
-    return None
+    return _obs_time(tokenize_report(metar))
 
 
 def is_speci_metar(metar: str) -> bool:
@@ -451,44 +574,7 @@ def parse_weather_phenomena(metar: str) -> List[str]:
     if not metar:
         return []
 
-    phenomena = []
-
-    # Weather phenomena appear after wind and visibility, before clouds
-    # Pattern: optional intensity (-/+/VC) + optional descriptor + one or more weather types
-    # Examples: -RA, +TSRA, VCSH, FZFG, -SHRA, +TSRAGR
-
-    # Split METAR into parts
-    parts = metar.split()
-
-    for part in parts:
-        # Skip parts that are clearly not weather (timestamps, wind, visibility, clouds, temps)
-        if re.match(r"^\d{6}Z$", part):  # Timestamp
-            continue
-        if re.match(r"^\d{5}(G\d+)?KT$", part):  # Wind
-            continue
-        if re.match(r"^(VRB)?\d{3}V\d{3}$", part):  # Variable wind
-            continue
-        if re.match(r"^[PM]?\d+SM$", part):  # Visibility
-            continue
-        if re.match(r"^\d+/\d+SM$", part):  # Fractional visibility
-            continue
-        if re.match(r"^(SKC|CLR|FEW|SCT|BKN|OVC|VV)\d{3}", part):  # Clouds
-            continue
-        if re.match(r"^[AM]?\d{2}/[AM]?\d{2}$", part):  # Temp/dewpoint
-            continue
-        if re.match(r"^A\d{4}$", part):  # Altimeter
-            continue
-        if re.match(r"^Q\d{4}$", part):  # QNH
-            continue
-        if re.match(r"^RMK", part):  # Start of remarks - stop processing
-            break
-
-        # Try to parse as weather phenomenon
-        parsed = _parse_single_weather(part)
-        if parsed:
-            phenomena.extend(parsed)
-
-    return phenomena
+    return _phenomena(tokenize_report(metar))
 
 
 def get_flight_category(metar: str) -> str:
@@ -510,9 +596,12 @@ def get_flight_category(metar: str) -> str:
     if not metar:
         return "UNK"
 
-    visibility = parse_visibility_sm(metar)
-    ceiling = parse_ceiling_feet(metar)
+    tokens = tokenize_report(metar)
+    return _flight_category(_visibility_sm(tokens), _ceiling(tokens)[0])
 
+
+def _flight_category(visibility: Optional[float], ceiling: Optional[int]) -> str:
+    """Get the flight category of a visibility (SM) and ceiling (feet AGL)."""
     # Determine category based on most restrictive condition
     # Start with VFR and downgrade based on conditions
 
@@ -545,6 +634,121 @@ def get_flight_category(metar: str) -> str:
         return ceil_category
 
 
+@dataclass(frozen=True, slots=True)
+class ParsedMetar:
+    """
+    Fields of one raw METAR, parsed once (see get_parsed_metar).
+
+    Also used for the conditions of a TAF change group (parse_metar_tokens).
+
+    Attributes:
+        raw: The METAR as received
+        wind: Wind group as reported (parse_wind_from_metar)
+        wind_kt: Wind converted to knots, '' if none (parse_wind_kt_from_metar)
+        altimeter: "A2992"/"Q1013" or None
+        visibility_sm: Visibility in statute miles or None
+        visibility_str: Visibility group verbatim (e.g. "1/2SM") or None
+        ceiling_ft: Lowest BKN/OVC/VV layer in feet AGL or None
+        ceiling_layer: That layer verbatim (e.g. "BKN004") or None
+        phenomena: Human-readable weather phenomena
+        flight_category: VFR, MVFR, IFR, LIFR or UNK
+        obs_time: Observation time as DDHHMM or None
+        is_speci: True for SPECI reports
+    """
+
+    raw: str
+    wind: Optional[str]
+    wind_kt: str
+    altimeter: Optional[str]
+    visibility_sm: Optional[float]
+    visibility_str: Optional[str]
+    ceiling_ft: Optional[int]
+    ceiling_layer: Optional[str]
+    phenomena: Tuple[str, ...]
+    flight_category: str
+    obs_time: Optional[str]
+    is_speci: bool
+
+    @property
+    def flight_rules_weather(self) -> Tuple[Optional[str], Optional[str]]:
+        """(visibility_str, ceiling_layer), as extract_flight_rules_weather returns."""
+        return self.visibility_str, self.ceiling_layer
+
+
+def parse_metar(metar: str) -> ParsedMetar:
+    """
+    Parse every field of a METAR (uncached; see get_parsed_metar).
+
+    Args:
+        metar: Raw METAR string
+
+    Returns:
+        ParsedMetar (empty fields and category UNK for an empty string)
+    """
+    return parse_metar_tokens(tokenize_report(metar), metar)
+
+
+def parse_metar_tokens(tokens: Sequence[WeatherToken], raw: str = "") -> ParsedMetar:
+    """
+    Build a ParsedMetar from already tokenized groups.
+
+    Args:
+        tokens: Tokens from tokenize_report(), or a TAF change group's tokens
+        raw: The text the tokens came from
+
+    Returns:
+        ParsedMetar (empty fields and category UNK when there are no tokens)
+    """
+    visibility_sm = _visibility_sm(tokens)
+    ceiling_ft, ceiling_layer = _ceiling(tokens)
+    wind_any_units = _wind_group(tokens)
+    return ParsedMetar(
+        raw=raw,
+        wind=_wind_group(tokens, _WIND_REPORTED_UNITS),
+        wind_kt=_wind_in_knots(wind_any_units) if wind_any_units else "",
+        altimeter=_first_group(tokens, TOKEN_ALTIMETER),
+        visibility_sm=visibility_sm,
+        visibility_str=_visibility_group(tokens, statute_only=True),
+        ceiling_ft=ceiling_ft,
+        ceiling_layer=ceiling_layer,
+        phenomena=tuple(_phenomena(tokens)),
+        flight_category=_flight_category(visibility_sm, ceiling_ft)
+        if tokens
+        else "UNK",
+        obs_time=_obs_time(tokens),
+        is_speci=is_speci_metar(raw),
+    )
+
+
+# Parsed METARs keyed by raw text; a METAR only changes when a new one is
+# issued, so entries stay valid until evicted
+_PARSED_METARS: LRUCache = LRUCache(maxsize=PARSED_METAR_CACHE_SIZE)
+_PARSED_METARS_LOCK = threading.Lock()
+
+
+def get_parsed_metar(metar: str) -> ParsedMetar:
+    """
+    Get the parsed fields of a METAR, parsing each distinct text once.
+
+    This function is thread-safe.
+
+    Args:
+        metar: Raw METAR string
+
+    Returns:
+        ParsedMetar for the text
+    """
+    with _PARSED_METARS_LOCK:
+        parsed = _PARSED_METARS.get(metar)
+    if parsed is not None:
+        return parsed
+
+    parsed = parse_metar(metar)
+    with _PARSED_METARS_LOCK:
+        _PARSED_METARS[metar] = parsed
+    return parsed
+
+
 # Backward-compatible aliases with underscore prefix (deprecated)
 _parse_visibility_sm = parse_visibility_sm
 _parse_ceiling_feet = parse_ceiling_feet
@@ -0,0 +1,240 @@
+"""
+Observation-time-aware METAR refresh scheduling.
+
+A METAR cannot change until its station issues the next report, and routine
+reports follow a fixed cycle (hourly around :50-:56 in North America, every
+30 minutes at most European airports). ObservationScheduler learns each
+station's cycle from the observation times of the METARs it is given and
+predicts when the next routine report will be published, so the METAR cache
+can keep an entry until then instead of refetching it every minute. Stations
+in IFR or LIFR are polled more often, since that is when SPECIs are issued.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from cachetools import LRUCache
+
+from backend.config.constants import (
+    METAR_CACHE_DURATION,
+    METAR_HALF_HOURLY_PREFIXES,
+    METAR_OVERDUE_RETRY,
+    METAR_OVERDUE_WINDOW,
+    METAR_PUBLISH_DELAY,
+    METAR_SCHEDULE_MAX_STATIONS,
+    METAR_SPECI_POLL_INTERVAL,
+)
+from backend.data.weather_parsing import ParsedMetar
+
+HOURLY = timedelta(hours=1)
+HALF_HOURLY = timedelta(minutes=30)
+
+# A new routine report this close to 30 minutes after the previous one
+# shows the station reports half-hourly
+_HALF_HOURLY_TOLERANCE = timedelta(minutes=5)
+
+
+def observation_datetime(obs_time: str, reference: datetime) -> Optional[datetime]:
+    """
+    Resolve a METAR observation time (DDHHMM) to a UTC datetime.
+
+    The report is taken to be from the month of the reference time or, when
+    that would put it in the future (or on a day the month doesn't have),
+    from the month before.
+
+    Args:
+        obs_time: Observation time as DDHHMM (ParsedMetar.obs_time)
+        reference: UTC time the report was received
+
+    Returns:
+        Observation datetime, or None if obs_time is invalid
+    """
+    try:
+        day, hour, minute = int(obs_time[0:2]), int(obs_time[2:4]), int(obs_time[4:6])
+    except (ValueError, TypeError):
+        return None
+
+    # Allow for clocks running slightly behind the station's
+    latest = reference + timedelta(minutes=10)
+    year, month = reference.year, reference.month
+    for _ in range(3):
+        try:
+            candidate = datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+        except ValueError:
+            candidate = None
+        if candidate is not None and candidate <= latest:
+            return candidate
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return None
+
+
+@dataclass(slots=True)
+class _StationCycle:
+    """
+    What is known about a station's routine reports.
+
+    Attributes:
+        last_routine: Observation time of the latest routine (non-SPECI) report
+        interval: Time between routine reports
+    """
+
+    last_routine: Optional[datetime]
+    interval: timedelta
+
+
+class ObservationScheduler:
+    """
+    Predicts when each station's METAR should next be refetched.
+
+    schedule() is given every METAR as it is fetched and returns the time the
+    cached copy goes stale:
+    - The next routine report is expected one interval after the last routine
+      observation and is refetched METAR_PUBLISH_DELAY after that.
+    - If it hasn't been published by then, the station is rechecked every
+      METAR_OVERDUE_RETRY seconds for METAR_OVERDUE_WINDOW, then once per
+      cycle. A half-hourly station that misses a whole half hour is treated
+      as hourly from then on.
+    - Stations in IFR or LIFR are refetched at least every
+      METAR_SPECI_POLL_INTERVAL seconds.
+    - Reports without an observation time keep the flat METAR_CACHE_DURATION.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, max_stations: int = METAR_SCHEDULE_MAX_STATIONS):
+        """
+        Initialize with no station history.
+
+        Args:
+            max_stations: Max stations remembered (least recently used evicted)
+        """
+        self._lock = threading.Lock()
+        self._stations: LRUCache = LRUCache(maxsize=max_stations)
+
+        # Diagnostics counters
+        self._scheduled = 0
+        self._overdue = 0
+        self._speci_polls = 0
+
+    def _default_interval(self, airport_icao: str) -> timedelta:
+        """Get the assumed routine interval of a station not yet seen twice."""
+        if airport_icao.startswith(METAR_HALF_HOURLY_PREFIXES):
+            return HALF_HOURLY
+        return HOURLY
+
+    def _record(
+        self, airport_icao: str, observed: datetime, is_speci: bool
+    ) -> _StationCycle:
+        """Update a station's cycle with a report. Must be called with the lock held."""
+        cycle = self._stations.get(airport_icao)
+        if cycle is None:
+            cycle = _StationCycle(None, self._default_interval(airport_icao))
+            self._stations[airport_icao] = cycle
+
+        if is_speci:
+            return cycle
+
+        if cycle.last_routine is not None and observed > cycle.last_routine:
+            gap = observed - cycle.last_routine
+            if abs(gap - HALF_HOURLY) <= _HALF_HOURLY_TOLERANCE:
+                cycle.interval = HALF_HOURLY
+        if cycle.last_routine is None or observed > cycle.last_routine:
+            cycle.last_routine = observed
+        return cycle
+
+    def schedule(
+        self, airport_icao: str, parsed: ParsedMetar, fetched_at: datetime
+    ) -> datetime:
+        """
+        Record a fetched METAR and get when it should next be refetched.
+
+        Args:
+            airport_icao: The ICAO code of the station
+            parsed: The fetched METAR
+            fetched_at: UTC time it was fetched
+
+        Returns:
+            UTC time after which the cached METAR is stale
+        """
+        observed = (
+            observation_datetime(parsed.obs_time, fetched_at)
+            if parsed.obs_time
+            else None
+        )
+        if observed is None:
+            return fetched_at + timedelta(seconds=METAR_CACHE_DURATION)
+
+        publish_delay = timedelta(seconds=METAR_PUBLISH_DELAY)
+        overdue_window = timedelta(seconds=METAR_OVERDUE_WINDOW)
+
+        with self._lock:
+            self._scheduled += 1
+            cycle = self._record(airport_icao, observed, parsed.is_speci)
+
+            if cycle.last_routine is None:
+                # Only SPECIs seen so far: the routine cycle is unknown
+                refresh_at = fetched_at + timedelta(seconds=METAR_SPECI_POLL_INTERVAL)
+            else:
+                due = cycle.last_routine + cycle.interval + publish_delay
+                if fetched_at >= due + overdue_window and cycle.interval < HOURLY:
+                    # Missed a whole half hour: the station reports hourly
+                    cycle.interval = HOURLY
+                    due = cycle.last_routine + cycle.interval + publish_delay
+
+                if fetched_at < due:
+                    refresh_at = due
+                elif fetched_at < due + overdue_window:
+                    # The next report is late: keep checking for it
+                    self._overdue += 1
+                    refresh_at = fetched_at + timedelta(seconds=METAR_OVERDUE_RETRY)
+                else:
+                    # Long overdue (station not reporting): check once a cycle
+                    cycles = (fetched_at - due) // cycle.interval + 1
+                    refresh_at = due + cycles * cycle.interval
+
+            if parsed.flight_category in ("IFR", "LIFR"):
+                speci_poll = fetched_at + timedelta(seconds=METAR_SPECI_POLL_INTERVAL)
+                if speci_poll < refresh_at:
+                    self._speci_polls += 1
+                    refresh_at = speci_poll
+
+        return refresh_at
+
+    def clear(self) -> None:
+        """Forget every station's history."""
+        with self._lock:
+            self._stations.clear()
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with 'stations' (stations with history), 'half_hourly'
+            (of those, stations on a 30 minute cycle), 'scheduled' (METARs
+            scheduled), 'overdue' (METARs whose next report was late) and
+            'speci_polls' (refreshes brought forward for IFR/LIFR stations)
+        """
+        with self._lock:
+            return {
+                "stations": len(self._stations),
+                "half_hourly": sum(
+                    1
+                    for cycle in self._stations.values()
+                    if cycle.interval == HALF_HOURLY
+                ),
+                "scheduled": self._scheduled,
+                "overdue": self._overdue,
+                "speci_polls": self._speci_polls,
+            }
+
+
+# Scheduler shared by the whole application
+_OBSERVATION_SCHEDULER = ObservationScheduler()
+
+
+def get_observation_scheduler() -> ObservationScheduler:
+    """Get the application's METAR refresh scheduler."""
+    return _OBSERVATION_SCHEDULER
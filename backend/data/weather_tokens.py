@@ -0,0 +1,203 @@
+"""
+Single-pass METAR/TAF tokenizer.
+
+tokenize_report() splits a report into typed groups (wind, visibility, RVR,
+weather, sky, temperature, altimeter, TAF change groups, remarks) in one scan
+over its words. The field extractors in weather_parsing and the TAF change
+parsing in backend.briefing read these tokens instead of each searching the
+raw text with its own regular expressions.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from backend.config.constants import REPORT_TOKEN_CACHE_SIZE
+
+# Token kinds
+TOKEN_TYPE = "type"  # METAR, SPECI, TAF and modifiers (AMD, COR, AUTO, NIL)
+TOKEN_STATION = "station"
+TOKEN_TIME = "time"  # Issue/observation time, DDHHMMZ
+TOKEN_VALID = "valid"  # TAF validity or change period, DDHH/DDHH
+TOKEN_WIND = "wind"  # 28012G18KT, VRB03KT, 05005MPS
+TOKEN_WIND_VARIATION = "wind_variation"  # 250V310
+TOKEN_VISIBILITY = "visibility"  # 10SM, P6SM, 1 1/2SM, M1/4SM, 9999
+TOKEN_RVR = "rvr"  # R28L/2600FT, R27/P1500
+TOKEN_WEATHER = "weather"  # -RA, +TSRAGR, VCSH, FZFG
+TOKEN_SKY = "sky"  # FEW015, BKN025CB, VV002, CLR, CAVOK
+TOKEN_TEMPERATURE = "temperature"  # 15/10, M03/M07
+TOKEN_ALTIMETER = "altimeter"  # A2992, Q1013
+TOKEN_CHANGE = "change"  # FMDDHHMM, TEMPO, BECMG, PROBnn, INTER, NOSIG
+TOKEN_REMARKS = "remarks"  # Everything after RMK, as one token
+TOKEN_OTHER = "other"
+
+# ICAO present-weather codes (the keys of weather_parsing's
+# WEATHER_DESCRIPTORS and WEATHER_PHENOMENA)
+_WX_DESCRIPTORS = r"MI|PR|BC|DR|BL|SH|TS|FZ"
+_WX_PHENOMENA = r"DZ|RA|SN|SG|IC|PL|GR|GS|UP|BR|FG|HZ|FU|VA|DU|SA|PY|SQ|FC|SS|DS|PO"
+
+# Full-group patterns by token kind. Alternatives are tried in order, so a
+# group is classified by the first kind whose pattern matches all of it.
+_GROUP_PATTERNS = (
+    (TOKEN_TYPE, r"METAR|SPECI|TAF|AMD|COR|CC[A-Z]|RTD|AUTO|NIL"),
+    (TOKEN_TIME, r"\d{6}Z"),
+    (TOKEN_VALID, r"\d{4}/\d{4}"),
+    (TOKEN_WIND, r"(?:\d{3}|VRB)\d{2,3}(?:G\d{2,3})?(?:KT|MPS|KMH|KPH)"),
+    (TOKEN_WIND_VARIATION, r"\d{3}V\d{3}"),
+    (TOKEN_VISIBILITY, r"[PM]?\d+SM|M?\d+/\d+SM|\d{4}"),
+    (TOKEN_RVR, r"R\d{2}[LRC]?/[PM]?\d{4}(?:V[PM]?\d{4})?(?:FT)?(?:/?[UDN])?"),
+    (
+        TOKEN_SKY,
+        r"(?:FEW|SCT|BKN|OVC|VV)(?:\d{3}|///)(?:CB|TCU|///)?|SKC|CLR|NSC|NCD|CAVOK",
+    ),
+    (TOKEN_TEMPERATURE, r"M?\d{2}/(?:M?\d{2})?"),
+    (TOKEN_ALTIMETER, r"[AQ]\d{4}"),
+    (TOKEN_CHANGE, r"FM\d{6}|TEMPO|BECMG|PROB\d{2}|INTER|NOSIG"),
+    (
+        TOKEN_WEATHER,
+        rf"(?:[-+]|VC)?(?:{_WX_DESCRIPTORS})?(?:{_WX_PHENOMENA})+"
+        rf"|(?:[-+]|VC)?(?:{_WX_DESCRIPTORS})",
+    ),
+)
+
+_GROUP_RE = re.compile(
+    "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _GROUP_PATTERNS)
+)
+_STATION_RE = re.compile(r"[A-Z][A-Z0-9]{3}")
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherToken:
+    """
+    One group of a METAR or TAF.
+
+    Attributes:
+        kind: One of the TOKEN_* kinds
+        text: The group as it appears in the report (mixed-fraction
+            visibility keeps its space, e.g. "1 1/2SM")
+    """
+
+    kind: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeGroup:
+    """
+    A TAF change group and the forecast conditions it carries.
+
+    Attributes:
+        kind: "FM", "TEMPO" or "BECMG"
+        time_str: "DDHHMM" for FM, "DDHH/DDHH" for TEMPO/BECMG
+        tokens: The group's condition tokens
+    """
+
+    kind: str
+    time_str: str
+    tokens: Tuple[WeatherToken, ...]
+
+
+@lru_cache(maxsize=16384)
+def _word_token(word: str) -> WeatherToken:
+    """Classify one group (cached; groups like "10SM" or "A2992" recur across reports)."""
+    match = _GROUP_RE.fullmatch(word)
+    return WeatherToken(match.lastgroup if match else TOKEN_OTHER, word)
+
+
+@lru_cache(maxsize=REPORT_TOKEN_CACHE_SIZE)
+def tokenize_report(report: str) -> Tuple[WeatherToken, ...]:
+    """
+    Split a METAR, TAF or TAF fragment into typed groups in one pass.
+
+    Groups are classified on their own, except that a station identifier is
+    recognised by the time group that follows it and a whole number followed
+    by a fractional visibility ("1 1/2SM") is joined into one group. Remarks
+    are not tokenized; everything after RMK becomes a single REMARKS token.
+
+    Args:
+        report: Raw report text
+
+    Returns:
+        Tuple of WeatherToken in report order (cached by text)
+    """
+    tokens: List[WeatherToken] = []
+    words = report.split()
+
+    for index, word in enumerate(words):
+        if word.startswith("RMK"):
+            tokens.append(WeatherToken(TOKEN_REMARKS, " ".join(words[index + 1 :])))
+            break
+
+        word = word.rstrip("=")
+        if not word:
+            continue
+
+        token = _word_token(word)
+        kind = token.kind
+
+        if tokens:
+            previous = tokens[-1]
+            if (
+                kind == TOKEN_TIME
+                and previous.kind in (TOKEN_OTHER, TOKEN_WEATHER)
+                and _STATION_RE.fullmatch(previous.text)
+            ):
+                tokens[-1] = WeatherToken(TOKEN_STATION, previous.text)
+            elif (
+                kind == TOKEN_VISIBILITY
+                and "/" in word
+                and word[0].isdigit()
+                and previous.kind == TOKEN_OTHER
+                and previous.text.isdigit()
+            ):
+                tokens[-1] = WeatherToken(TOKEN_VISIBILITY, f"{previous.text} {word}")
+                continue
+
+        tokens.append(token)
+
+    return tuple(tokens)
+
+
+def split_change_groups(tokens: Sequence[WeatherToken]) -> List[ChangeGroup]:
+    """
+    Split a tokenized TAF into its FM, TEMPO and BECMG change groups.
+
+    Each group runs until the next change indicator (FM, TEMPO, BECMG, PROB,
+    INTER) or the remarks. TEMPO/BECMG groups need a DDHH/DDHH period; a
+    PROB group only ends the group before it, and a "PROB30 TEMPO" pair is
+    reported as its TEMPO group. The initial forecast is not a change group.
+
+    Args:
+        tokens: Tokens from tokenize_report()
+
+    Returns:
+        List of ChangeGroup in report order (groups with no conditions omitted)
+    """
+    groups: List[ChangeGroup] = []
+    kind: Optional[str] = None
+    time_str = ""
+    start = 0
+
+    for index, token in enumerate(tokens):
+        if token.kind != TOKEN_CHANGE and token.kind != TOKEN_REMARKS:
+            continue
+
+        if kind and index > start:
+            groups.append(ChangeGroup(kind, time_str, tuple(tokens[start:index])))
+        kind = None
+
+        text = token.text
+        if text.startswith("FM"):
+            kind, time_str, start = "FM", text[2:], index + 1
+        elif (
+            text in ("TEMPO", "BECMG")
+            and index + 1 < len(tokens)
+            and tokens[index + 1].kind == TOKEN_VALID
+        ):
+            kind, time_str, start = text, tokens[index + 1].text, index + 2
+
+    if kind and len(tokens) > start:
+        groups.append(ChangeGroup(kind, time_str, tuple(tokens[start:])))
+
+    return groups
@@ -0,0 +1,19 @@
+"""
+Networking layer: pooled HTTP client and per-host request metrics.
+"""
+
+from backend.net.client import (
+    HttpClient,
+    HostPolicy,
+    get_http_client,
+    get_host_latency_stats,
+)
+from backend.net.metrics import LatencyHistogram
+
+__all__ = [
+    "HttpClient",
+    "HostPolicy",
+    "get_http_client",
+    "get_host_latency_stats",
+    "LatencyHistogram",
+]
@@ -0,0 +1,215 @@
+"""
+Shared pooled HTTP client for all outbound API requests.
+
+HttpClient keeps one keep-alive connection pool per host so hundreds of
+METAR/TAF lookups don't each pay a TCP+TLS handshake. It also negotiates
+compressed responses, bounds how many requests run against each host at
+once, and records per-host latency histograms.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from backend.net.metrics import LatencyHistogram
+
+USER_AGENT = "VATSIM-Control-Recs/1.0"
+
+# Accept-Encoding we can decode: gzip/deflate always, br when a Brotli
+# decoder (brotli or brotlicffi) is installed alongside urllib3
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """
+    Connection and concurrency settings for one host.
+
+    Attributes:
+        max_concurrency: Maximum requests in flight to the host at once
+        pool_size: Keep-alive connections kept open to the host
+        timeout: Default request timeout in seconds
+    """
+
+    max_concurrency: int = 8
+    pool_size: int = 8
+    timeout: float = 10.0
+
+
+DEFAULT_HOST_POLICY = HostPolicy()
+
+HOST_POLICIES: Dict[str, HostPolicy] = {
+    "data.vatsim.net": HostPolicy(max_concurrency=2, pool_size=2, timeout=10.0),
+    "api.vatsim.net": HostPolicy(max_concurrency=4, pool_size=4, timeout=5.0),
+    "api.statsim.net": HostPolicy(max_concurrency=6, pool_size=6, timeout=15.0),
+    "aviationweather.gov": HostPolicy(max_concurrency=10, pool_size=10, timeout=5.0),
+    "metar.vatsim.net": HostPolicy(max_concurrency=10, pool_size=10, timeout=5.0),
+    "api.weather.gov": HostPolicy(max_concurrency=6, pool_size=6, timeout=3.0),
+}
+
+
+class _Host:
+    """Per-host state: concurrency gate and latency histogram."""
+
+    __slots__ = ("policy", "gate", "latency")
+
+    def __init__(self, policy: HostPolicy):
+        self.policy = policy
+        self.gate = threading.BoundedSemaphore(policy.max_concurrency)
+        self.latency = LatencyHistogram()
+
+
+class HttpClient:
+    """
+    Thread-safe HTTP client with per-host pools, limits and latency tracking.
+    """
+
+    def __init__(self, policies: Optional[Dict[str, HostPolicy]] = None):
+        """
+        Create a client.
+
+        Args:
+            policies: Host name -> HostPolicy (defaults to HOST_POLICIES)
+        """
+        self._policies = dict(HOST_POLICIES if policies is None else policies)
+        self._hosts: Dict[str, _Host] = {}
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        self._session.headers.update(
+            {"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING}
+        )
+        # Mount every pool up front: Session.get_adapter() reads the adapter
+        # table without our lock, so it must not change once requests start.
+        # Hosts without a policy share the session's default adapter.
+        for host, policy in self._policies.items():
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=policy.pool_size)
+            self._session.mount(f"https://{host}/", adapter)
+            self._session.mount(f"http://{host}/", adapter)
+
+    def _host(self, host: str) -> _Host:
+        """Get (creating on first use) the state for a host."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = _Host(self._policies.get(host, DEFAULT_HOST_POLICY))
+                self._hosts[host] = state
+            return state
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        on_send: Optional[Callable[[], None]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request through the host's pool.
+
+        Blocks while the host is at its concurrency limit. Errors are not
+        swallowed: requests exceptions propagate, and HTTP error statuses are
+        returned for the caller to inspect (or raise_for_status()).
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            timeout: Request timeout in seconds (default: the host's policy)
+            on_send: Called once the host's concurrency gate is passed, just
+                before the request is sent
+            **kwargs: Passed through to requests (params, headers, ...)
+
+        Returns:
+            The requests.Response
+        """
+        host = urlsplit(url).hostname or ""
+        state = self._host(host)
+        if timeout is None:
+            timeout = state.policy.timeout
+
+        with state.gate:
+            if on_send is not None:
+                on_send()
+            start = time.perf_counter()
+            try:
+                response = self._session.request(method, url, timeout=timeout, **kwargs)
+            except requests.RequestException:
+                state.latency.record((time.perf_counter() - start) * 1000, error=True)
+                raise
+            state.latency.record(
+                (time.perf_counter() - start) * 1000,
+                error=response.status_code >= 400,
+            )
+        return response
+
+    def get(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        on_send: Optional[Callable[[], None]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a GET request (see request())."""
+        return self.request("GET", url, timeout=timeout, on_send=on_send, **kwargs)
+
+    def latency_percentile(
+        self, host: str, pct: float, min_samples: int = 1
+    ) -> Optional[float]:
+        """
+        Get a recent latency percentile for a host in milliseconds.
+
+        Args:
+            host: Host name (e.g. "aviationweather.gov")
+            pct: Percentile in the range 0-100
+            min_samples: Return None unless at least this many samples exist
+
+        Returns:
+            Latency in milliseconds, or None if not enough requests were made
+        """
+        with self._lock:
+            state = self._hosts.get(host)
+        if state is None:
+            return None
+        return state.latency.percentile(pct, min_samples)
+
+    def latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get latency histograms for every host contacted so far.
+
+        Returns:
+            Dictionary mapping host name to LatencyHistogram.snapshot()
+        """
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: state.latency.snapshot() for host, state in sorted(hosts.items())}
+
+
+_HTTP_CLIENT: Optional[HttpClient] = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    This function is thread-safe.
+
+    Returns:
+        The process-wide HttpClient
+    """
+    global _HTTP_CLIENT
+
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            _HTTP_CLIENT = HttpClient()
+        return _HTTP_CLIENT
+
+
+def get_host_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """Get per-host latency histograms from the shared client."""
+    return get_http_client().latency_stats()
@@ -0,0 +1,92 @@
+"""
+Per-host request latency histograms.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# Bucket upper bounds in milliseconds (the last bucket is unbounded)
+LATENCY_BUCKETS_MS: List[float] = [25, 50, 100, 200, 400, 800, 1600, 3200, 6400]
+
+# Number of recent samples kept for percentile estimates
+RECENT_SAMPLES = 256
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with a window of recent samples.
+
+    Bucket counts are cumulative since startup and are meant for display.
+    Percentiles are computed from the most recent samples, so they follow
+    the host's current behaviour (used for hedging budgets).
+
+    This class is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._recent: Deque[float] = deque(maxlen=RECENT_SAMPLES)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+
+    def record(self, elapsed_ms: float, error: bool = False) -> None:
+        """
+        Record one request.
+
+        Args:
+            elapsed_ms: Time until the response (or failure) in milliseconds
+            error: Whether the request failed (network error or HTTP >= 400)
+        """
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                index = i
+                break
+
+        with self._lock:
+            self._buckets[index] += 1
+            self._recent.append(elapsed_ms)
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if error:
+                self.errors += 1
+
+    def percentile(self, pct: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Get a latency percentile over the recent samples.
+
+        Args:
+            pct: Percentile in the range 0-100
+            min_samples: Return None unless at least this many samples exist
+
+        Returns:
+            Latency in milliseconds, or None if there are too few samples
+        """
+        with self._lock:
+            samples = sorted(self._recent)
+        if not samples or len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def snapshot(self) -> Dict[str, object]:
+        """Get counters, bucket counts and p50/p95 as a plain dictionary."""
+        with self._lock:
+            buckets = list(self._buckets)
+            count = self.count
+            errors = self.errors
+            total_ms = self.total_ms
+
+        labels = [f"<={int(bound)}ms" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{int(LATENCY_BUCKETS_MS[-1])}ms")
+        return {
+            "count": count,
+            "errors": errors,
+            "mean_ms": round(total_ms / count, 1) if count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "buckets": dict(zip(labels, buckets)),
+        }
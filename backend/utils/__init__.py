@@ -2,4 +2,19 @@
 Utility functions and helpers.
 """
 
-# Exports will be added as submodules are created
+from backend.utils.single_flight import SingleFlight, get_single_flight_stats
+from backend.utils.timing import (
+    RefreshTimeline,
+    StageTiming,
+    enable_refresh_profile,
+    get_last_refresh_timeline,
+)
+
+__all__ = [
+    "SingleFlight",
+    "get_single_flight_stats",
+    "RefreshTimeline",
+    "StageTiming",
+    "enable_refresh_profile",
+    "get_last_refresh_timeline",
+]
@@ -0,0 +1,107 @@
+"""
+Memory-mapped .npz archives for precomputed data files.
+
+np.load() reads .npz members fully into memory. The precomputed tables under
+data/ are written uncompressed, so each member's array data is a contiguous
+byte range of the file and can be memory-mapped directly; opening a table
+then only costs reading the zip directory and the .npy headers.
+"""
+
+import hashlib
+import struct
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+
+# Zip local file header (before the member's file name and extra field)
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+
+def save_npz(path: Path, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write arrays to an uncompressed .npz that load_npz_memmap can map.
+
+    Args:
+        path: Output file path
+        arrays: Array name -> array
+    """
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+
+
+def load_npz_memmap(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Open the arrays of an uncompressed .npz without reading them into memory.
+
+    Arrays with at least one dimension are memory-mapped read-only; scalars
+    are read.
+
+    Args:
+        path: Path to the .npz file
+
+    Returns:
+        Array name -> array
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If a member is compressed or isn't a valid .npy array
+        zipfile.BadZipFile: If the file isn't a zip archive
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{info.filename} is compressed")
+
+            # The member's data starts after its local header, name and extra field
+            f.seek(info.header_offset)
+            header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+            f.seek(header[-2] + header[-1], 1)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"{info.filename} contains Python objects")
+
+            name = info.filename[: -len(".npy")]
+            if not shape:
+                arrays[name] = np.fromfile(f, dtype=dtype, count=1).reshape(())
+            else:
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    return arrays
+
+
+def arrays_checksum(arrays: Dict[str, np.ndarray], exclude: Iterable[str] = ()) -> str:
+    """
+    Checksum the contents of a set of arrays (names, dtypes, shapes and data).
+
+    Args:
+        arrays: Array name -> array
+        exclude: Names to leave out (e.g. the checksum array itself)
+
+    Returns:
+        Hex digest
+    """
+    skipped = set(exclude)
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(arrays):
+        if name in skipped:
+            continue
+        array = np.ascontiguousarray(arrays[name])
+        digest.update(f"{name}:{array.dtype.str}:{array.shape};".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
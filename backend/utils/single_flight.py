@@ -0,0 +1,136 @@
+"""
+In-flight request coalescing ("single flight") for blocking fetches.
+
+When a cache entry expires, several threads (the refresh worker, the Go To
+cache warm-up, open modals) tend to miss at the same moment and each start
+their own HTTP request. A SingleFlight registry lets the first caller for a
+key do the fetch while concurrent callers for the same key wait for, and
+share, its result.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+# All registries, by name, for get_single_flight_stats()
+_REGISTRIES: List["SingleFlight"] = []
+_REGISTRIES_LOCK = threading.Lock()
+
+
+class _Call:
+    """A fetch in progress that other callers can wait on."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Registry of in-flight calls keyed by request.
+
+    Counters:
+        calls: Total calls to do()
+        executions: Calls that actually ran the function
+        coalesced: Calls that waited for another caller's result instead
+
+    This class is thread-safe.
+    """
+
+    def __init__(self, name: str):
+        """
+        Create a registry and register it for statistics reporting.
+
+        Args:
+            name: Name reported by get_single_flight_stats (e.g. "metar")
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.max_waiters = 0
+
+        with _REGISTRIES_LOCK:
+            _REGISTRIES.append(self)
+
+    def do(
+        self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run fn(*args, **kwargs), or wait for an identical call already running.
+
+        Exceptions raised by the leading call are re-raised in every caller
+        that was waiting on it.
+
+        Args:
+            key: Identity of the request (e.g. an airport ICAO code)
+            fn: Blocking function performing the fetch
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            The value returned by fn (shared between coalesced callers)
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._in_flight.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                self.max_waiters = max(self.max_waiters, call.waiters)
+                leader = False
+            else:
+                call = _Call()
+                self._in_flight[key] = call
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def stats(self) -> Dict[str, int]:
+        """Get a snapshot of this registry's counters."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "max_waiters": self.max_waiters,
+                "in_flight": len(self._in_flight),
+            }
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get coalescing counters for every registry, keyed by registry name.
+
+    Returns:
+        Dictionary mapping registry name to its stats() dictionary
+    """
+    with _REGISTRIES_LOCK:
+        registries = list(_REGISTRIES)
+    return {registry.name: registry.stats() for registry in registries}
@@ -0,0 +1,256 @@
+"""
+Per-stage timing spans for the refresh pipeline.
+
+analyze_flights_data records one RefreshTimeline per refresh with a span per
+stage (feed download, classification, weather fetch, ...) and the number of
+items each stage handled. The last completed timeline is kept for the status
+bar, and with profiling enabled (main.py --profile) every timeline is appended
+to a JSON Lines or CSV file. JSON Lines records also carry a snapshot of the
+cache, hedging and spatial index counters (see get_refresh_diagnostics).
+"""
+
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from common import logger as debug_logger
+
+CSV_FIELDS = [
+    "refresh",
+    "started_at",
+    "stage",
+    "start_ms",
+    "duration_ms",
+    "items",
+    "total_ms",
+]
+
+
+@dataclass
+class StageTiming:
+    """
+    Timing of one stage of a refresh.
+
+    Attributes:
+        name: Stage name (e.g. "feed_download")
+        start_ms: Start offset from the beginning of the refresh
+        duration_ms: Wall-clock duration of the stage
+        items: Number of items the stage processed (None if not applicable)
+    """
+
+    name: str
+    start_ms: float
+    duration_ms: float
+    items: Optional[int] = None
+
+
+class _Span:
+    """Handle yielded by RefreshTimeline.span() for setting the item count."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Optional[int]):
+        self.items = items
+
+
+class RefreshTimeline:
+    """
+    Stage timings of a single refresh.
+
+    Spans may be recorded from several threads. This class is thread-safe.
+    """
+
+    def __init__(self, refresh_id: int):
+        """
+        Start a timeline.
+
+        Args:
+            refresh_id: Sequence number of the refresh
+        """
+        self.refresh_id = refresh_id
+        self.started_at = datetime.now(timezone.utc)
+        self.reused = False
+        self.total_ms: Optional[float] = None
+        # Counters captured when the refresh finished (profiling only)
+        self.diagnostics: Optional[Dict[str, Any]] = None
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stages: List[StageTiming] = []
+
+    @contextmanager
+    def span(self, name: str, items: Optional[int] = None) -> Iterator[_Span]:
+        """
+        Time a stage.
+
+        Args:
+            name: Stage name
+            items: Number of items processed, if known up front (can also be
+                set on the yielded handle's 'items' attribute)
+
+        Yields:
+            Handle whose 'items' attribute is recorded with the stage
+        """
+        handle = _Span(items)
+        start = time.perf_counter()
+        try:
+            yield handle
+        finally:
+            end = time.perf_counter()
+            stage = StageTiming(
+                name=name,
+                start_ms=round((start - self._origin) * 1000, 3),
+                duration_ms=round((end - start) * 1000, 3),
+                items=handle.items,
+            )
+            with self._lock:
+                self._stages.append(stage)
+
+    @property
+    def stages(self) -> List[StageTiming]:
+        """Recorded stages in start order."""
+        with self._lock:
+            return sorted(self._stages, key=lambda stage: stage.start_ms)
+
+    def finish(self, reused: bool = False) -> None:
+        """
+        Mark the refresh as complete and record its total duration.
+
+        Args:
+            reused: True if the previous refresh's results were reused
+        """
+        self.reused = reused
+        self.total_ms = round((time.perf_counter() - self._origin) * 1000, 3)
+
+    def slowest(self) -> Optional[StageTiming]:
+        """Get the stage with the longest duration, or None if there are none."""
+        stages = self.stages
+        if not stages:
+            return None
+        return max(stages, key=lambda stage: stage.duration_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        result: Dict[str, Any] = {
+            "refresh": self.refresh_id,
+            "started_at": self.started_at.isoformat(),
+            "total_ms": self.total_ms,
+            "reused": self.reused,
+            "stages": [asdict(stage) for stage in self.stages],
+        }
+        if self.diagnostics is not None:
+            result["diagnostics"] = self.diagnostics
+        return result
+
+
+_TIMELINE_LOCK = threading.Lock()
+_REFRESH_COUNT = 0
+_LAST_TIMELINE: Optional[RefreshTimeline] = None
+_PROFILE_PATH: Optional[Path] = None
+_PROFILE_DIAGNOSTICS: Optional[Callable[[], Dict[str, Any]]] = None
+
+
+def start_refresh_timeline() -> RefreshTimeline:
+    """Start the timeline for a new refresh."""
+    global _REFRESH_COUNT
+
+    with _TIMELINE_LOCK:
+        _REFRESH_COUNT += 1
+        return RefreshTimeline(_REFRESH_COUNT)
+
+
+def finish_refresh_timeline(timeline: RefreshTimeline, reused: bool = False) -> None:
+    """
+    Complete a refresh timeline, publish it and write it to the profile.
+
+    Args:
+        timeline: The refresh's timeline
+        reused: True if the previous refresh's results were reused
+    """
+    global _LAST_TIMELINE
+
+    timeline.finish(reused)
+    with _TIMELINE_LOCK:
+        _LAST_TIMELINE = timeline
+        profile_path = _PROFILE_PATH
+        diagnostics = _PROFILE_DIAGNOSTICS
+
+    slowest = timeline.slowest()
+    debug_logger.debug(
+        f"Refresh {timeline.refresh_id} took {timeline.total_ms:.0f}ms"
+        + (f" (slowest: {slowest.name} {slowest.duration_ms:.0f}ms)" if slowest else "")
+    )
+
+    if profile_path is not None:
+        if diagnostics is not None:
+            try:
+                timeline.diagnostics = diagnostics()
+            except Exception as e:
+                debug_logger.warning(f"Could not collect refresh diagnostics: {e}")
+        _write_profile(profile_path, timeline)
+
+
+def get_last_refresh_timeline() -> Optional[RefreshTimeline]:
+    """Get the timeline of the most recently completed refresh."""
+    with _TIMELINE_LOCK:
+        return _LAST_TIMELINE
+
+
+def enable_refresh_profile(
+    path: str, diagnostics: Optional[Callable[[], Dict[str, Any]]] = None
+) -> Path:
+    """
+    Append every refresh timeline to a profile file.
+
+    Files ending in .csv get one row per stage; anything else gets one JSON
+    object per refresh (JSON Lines).
+
+    Args:
+        path: Output file path
+        diagnostics: Called as each refresh finishes; its result is stored in
+            the timeline's 'diagnostics' (JSON Lines records only)
+
+    Returns:
+        The resolved output path
+    """
+    global _PROFILE_PATH, _PROFILE_DIAGNOSTICS
+
+    resolved = Path(path).expanduser().resolve()
+    resolved.parent.mkdir(parents=True, exist_ok=True)
+    with _TIMELINE_LOCK:
+        _PROFILE_PATH = resolved
+        _PROFILE_DIAGNOSTICS = diagnostics
+    return resolved
+
+
+def _write_profile(path: Path, timeline: RefreshTimeline) -> None:
+    """Append a timeline to the profile file (errors are logged, not raised)."""
+    try:
+        if path.suffix.lower() == ".csv":
+            write_header = not path.exists() or path.stat().st_size == 0
+            with open(path, "a", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                if write_header:
+                    writer.writeheader()
+                for stage in timeline.stages:
+                    writer.writerow(
+                        {
+                            "refresh": timeline.refresh_id,
+                            "started_at": timeline.started_at.isoformat(),
+                            "stage": stage.name,
+                            "start_ms": stage.start_ms,
+                            "duration_ms": stage.duration_ms,
+                            "items": "" if stage.items is None else stage.items,
+                            "total_ms": timeline.total_ms,
+                        }
+                    )
+        else:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(timeline.to_dict()) + "\n")
+    except OSError as e:
+        debug_logger.warning(f"Could not write refresh profile to {path}: {e}")
@@ -71,6 +71,11 @@ def show_help_and_exit():
         default="metar",
         help="Wind data source: 'metar' for METAR from aviationweather.gov (default), 'minute' for up-to-the-minute from weather.gov",
     )
+    parser.add_argument(
+        "--bulk-weather-source",
+        metavar="URL_OR_DIR",
+        help="Where to read the bulk METAR/TAF cache files used when tracking all airports (default: aviationweather.gov)",
+    )
     parser.add_argument(
         "--hide-wind",
         action="store_true",
@@ -81,6 +86,13 @@ def show_help_and_exit():
         action="store_true",
         help="Include airports with any arrivals filed, regardless of max-eta-hours (default: False)",
     )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="refresh_profile.jsonl",
+        metavar="FILE",
+        help="Append per-stage refresh timings to FILE: CSV if it ends in .csv, JSON Lines (with cache and hedging counters) otherwise (default: refresh_profile.jsonl)",
+    )
     parser.print_help()
     sys.exit(0)
 
@@ -276,6 +288,7 @@ if not ensure_spacy_model_installed():
 from backend import analyze_flights_data, load_unified_airport_data  # noqa: E402
 from backend import ensure_cifp_data, ensure_runway_data, cleanup_old_cifp_caches  # noqa: E402
 from backend import load_weather_cache, save_weather_cache  # noqa: E402
+from backend import get_refresh_diagnostics  # noqa: E402
 from backend.config import constants as backend_constants  # noqa: E402
 from backend.core.groupings import (
     load_all_groupings,
@@ -283,6 +296,7 @@ from backend.core.groupings import (
     find_grouping_case_insensitive,
 )  # noqa: E402
 from backend.cache.manager import load_aircraft_approach_speeds  # noqa: E402
+from backend.utils.timing import enable_refresh_profile  # noqa: E402
 from airport_disambiguator import AirportDisambiguator  # noqa: E402
 from common.paths import ensure_user_directories  # noqa: E402
 from ui import VATSIMControlApp, expand_countries_to_airports  # noqa: E402
@@ -362,6 +376,18 @@ def main():
         action="store_true",
         help="Include airports with any arrivals filed, regardless of max-eta-hours (default: False)",
     )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="refresh_profile.jsonl",
+        metavar="FILE",
+        help="Append per-stage refresh timings to FILE: CSV if it ends in .csv, JSON Lines (with cache and hedging counters) otherwise (default: refresh_profile.jsonl)",
+    )
+    parser.add_argument(
+        "--bulk-weather-source",
+        metavar="URL_OR_DIR",
+        help="Where to read the bulk METAR/TAF cache files used when tracking all airports (default: aviationweather.gov)",
+    )
 
     # Parse arguments
     args = parser.parse_args()
@@ -369,6 +395,17 @@ def main():
     # Set the global wind source from command-line argument
     backend_constants.WIND_SOURCE = args.wind_source
 
+    # Read the bulk weather files from elsewhere (e.g. an offline stand-in)
+    if args.bulk_weather_source:
+        backend_constants.WEATHER_BULK_SOURCE = args.bulk_weather_source
+
+    # Record per-stage refresh timings if requested
+    if args.profile:
+        profile_path = enable_refresh_profile(
+            args.profile, diagnostics=get_refresh_diagnostics
+        )
+        print(f"Writing refresh profile to {profile_path}")
+
     # Log cleanup happens automatically when debug_logger is imported
     debug_logger.info("Application starting")
 
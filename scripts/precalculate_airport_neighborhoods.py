@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Precalculate the airport neighborhood table for alternate and diversion searches.
+
+This script generates data/airport_neighborhoods.npz, which stores for every
+airport its alternate-capable neighbors within 150nm (distance and bearing),
+plus each airport's longest runway, instrument approach flag and METAR flag.
+See backend/data/neighborhoods.py.
+
+Run this script when airport, runway or CIFP data changes (e.g., each AIRAC cycle).
+
+Usage:
+    python scripts/precalculate_airport_neighborhoods.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.data.cifp import get_airports_with_approaches, has_approaches_in
+from backend.data.loaders import load_unified_airport_data
+from backend.data.neighborhoods import (
+    NEIGHBORHOOD_FILENAME,
+    NEIGHBORHOOD_LIMIT,
+    NEIGHBORHOOD_RADIUS_NM,
+    build_neighborhood_arrays,
+    load_neighborhood_table,
+    save_neighborhood_table,
+)
+from backend.data.runways import load_runway_data
+
+
+def build_longest_runways(runway_data: dict) -> dict:
+    """
+    Get the longest open runway of every airport.
+
+    Args:
+        runway_data: Dictionary from load_runway_data()
+
+    Returns:
+        Dictionary mapping ICAO codes to runway lengths in feet
+    """
+    longest = {}
+    for icao, runways in runway_data.items():
+        lengths = [r.length_ft for r in runways if not r.closed]
+        if lengths:
+            longest[icao] = max(lengths)
+    return longest
+
+
+def main():
+    # Paths
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+    data_dir = project_root / "data"
+    output_file = data_dir / NEIGHBORHOOD_FILENAME
+
+    print("Loading unified airport data...")
+    airports_data = load_unified_airport_data(
+        apt_base_path=str(data_dir / "APT_BASE.csv"),
+        airports_json_path=str(data_dir / "airports.json"),
+        iata_icao_path=str(data_dir / "iata-icao.csv"),
+    )
+    print(f"  Loaded {len(airports_data)} airports")
+
+    print("\nLoading runway data...")
+    longest_runways = build_longest_runways(load_runway_data())
+    print(f"  {len(longest_runways)} airports with open runways")
+
+    print("\nScanning CIFP for instrument approaches...")
+    cifp_airports = get_airports_with_approaches()
+    iap_airports = {
+        icao for icao in airports_data if has_approaches_in(icao, cifp_airports)
+    }
+    print(f"  {len(iap_airports)} airports with instrument approaches")
+
+    print(
+        f"\nBuilding neighborhoods ({NEIGHBORHOOD_RADIUS_NM:.0f}nm, "
+        f"up to {NEIGHBORHOOD_LIMIT} neighbors each)..."
+    )
+    start = time.perf_counter()
+    arrays = build_neighborhood_arrays(airports_data, longest_runways, iap_airports)
+    print(
+        f"  {len(arrays['codes'])} airports, {len(arrays['neighbors'])} neighbor "
+        f"entries in {time.perf_counter() - start:.1f}s"
+    )
+
+    print(f"\nWriting table to {output_file}...")
+    save_neighborhood_table(output_file, arrays)
+
+    # Make sure the file loads the way the application reads it
+    if load_neighborhood_table(output_file) is None:
+        print("  ERROR: written table could not be loaded")
+        sys.exit(1)
+
+    file_size = output_file.stat().st_size
+    print(f"  Table file size: {file_size / 1024:.1f} KB")
+
+    print("\nDone!")
+
+
+if __name__ == "__main__":
+    main()
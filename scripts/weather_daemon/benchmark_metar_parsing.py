@@ -0,0 +1,179 @@
+"""
+Benchmark: Per-Field METAR Extraction vs Parse-Once ParsedMetar
+
+Compares the old consumer pattern (each screen calling the individual
+regex extractors on the same raw METAR) against building a ParsedMetar
+once (parse_metar) and reading it back from the bounded parse cache
+(get_parsed_metar).
+
+By default the METAR set is the daemon's CONUS bbox fetch; pass --metars
+to benchmark a saved set instead (JSON {icao: metar} or one METAR per line).
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.data.weather_parsing import (  # noqa: E402
+    extract_visibility_str,
+    get_flight_category,
+    get_parsed_metar,
+    is_speci_metar,
+    parse_altimeter_from_metar,
+    parse_ceiling_feet,
+    parse_ceiling_layer,
+    parse_metar,
+    parse_metar_obs_time,
+    parse_visibility_sm,
+    parse_weather_phenomena,
+    parse_wind_from_metar,
+    parse_wind_kt_from_metar,
+)
+from backend.data.weather_tokens import tokenize_report  # noqa: E402
+
+
+def load_metars_from_file(path: Path) -> List[str]:
+    """
+    Load a METAR set saved to disk.
+
+    Args:
+        path: JSON file mapping ICAO -> METAR, or a text file with one METAR per line
+
+    Returns:
+        List of raw METAR strings
+    """
+    text = path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return [line.strip() for line in text.splitlines() if line.strip()]
+    if isinstance(data, dict):
+        return [m for m in data.values() if m]
+    return [m for m in data if m]
+
+
+def fetch_conus_metars(cache_dir: Path) -> List[str]:
+    """
+    Fetch the METARs the daemon fetches: one bbox query per CONUS ARTCC.
+
+    Args:
+        cache_dir: Cache directory for ARTCC boundary data
+
+    Returns:
+        List of raw METAR strings (deduplicated by station)
+    """
+    from backend import fetch_weather_bbox
+
+    from .generator import get_artcc_bboxes
+    from .index_generator import CONUS_ARTCCS
+
+    bboxes = get_artcc_bboxes(set(CONUS_ARTCCS), cache_dir)
+    metars: Dict[str, str] = {}
+    for artcc, bbox in sorted(bboxes.items()):
+        artcc_metars, _ = fetch_weather_bbox(bbox, include_taf=False)
+        print(f"  {artcc}: {len(artcc_metars)} METARs")
+        metars.update(artcc_metars)
+    return list(metars.values())
+
+
+def legacy_extract(metar: str) -> None:
+    """Extract every field the way the screens did before ParsedMetar."""
+    get_flight_category(metar)
+    extract_visibility_str(metar)
+    parse_visibility_sm(metar)
+    parse_ceiling_layer(metar)
+    parse_ceiling_feet(metar)
+    parse_wind_from_metar(metar)
+    parse_wind_kt_from_metar(metar)
+    parse_altimeter_from_metar(metar)
+    parse_weather_phenomena(metar)
+    parse_metar_obs_time(metar)
+    is_speci_metar(metar)
+
+
+def time_per_metar(
+    func: Callable[[str], object], metars: List[str], rounds: int
+) -> float:
+    """
+    Time a parsing function over the METAR set.
+
+    The tokenizer cache is cleared before each round, so every METAR is
+    tokenized once per round.
+
+    Returns:
+        Best-of-rounds time per METAR in microseconds
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        tokenize_report.cache_clear()
+        start = time.perf_counter()
+        for metar in metars:
+            func(metar)
+        best = min(best, time.perf_counter() - start)
+    return best / len(metars) * 1e6
+
+
+def run_benchmark(metars: List[str], rounds: int = 5):
+    """Run the benchmark over the given METARs."""
+    print(f"\n{'=' * 60}")
+    print(f"METAR Parsing Benchmark: {len(metars)} METARs, best of {rounds}")
+    print(f"{'=' * 60}")
+
+    mismatches = 0
+    for metar in metars:
+        parsed = parse_metar(metar)
+        if (
+            parsed.flight_category != get_flight_category(metar)
+            or parsed.wind != parse_wind_from_metar(metar)
+            or parsed.altimeter != parse_altimeter_from_metar(metar)
+            or list(parsed.phenomena) != parse_weather_phenomena(metar)
+        ):
+            mismatches += 1
+    print(f"  Parity mismatches: {mismatches}")
+
+    legacy_us = time_per_metar(legacy_extract, metars, rounds)
+    cold_us = time_per_metar(parse_metar, metars, rounds)
+    # Prime the cache, then time repeat lookups (the common case: several
+    # screens and refreshes reading the same METAR text)
+    for metar in metars:
+        get_parsed_metar(metar)
+    warm_us = time_per_metar(get_parsed_metar, metars, rounds)
+
+    print(f"\n  Per-field extraction:     {legacy_us:8.2f} us/METAR")
+    print(f"  parse_metar (cold):       {cold_us:8.2f} us/METAR")
+    print(f"  get_parsed_metar (warm):  {warm_us:8.2f} us/METAR")
+    print(f"\n  Warm speedup: {legacy_us / warm_us:.1f}x")
+
+    return {"legacy_us": legacy_us, "cold_us": cold_us, "warm_us": warm_us}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-field METAR extraction vs the parse-once cache"
+    )
+    parser.add_argument(
+        "--metars",
+        type=Path,
+        help="Saved METAR set (JSON dict or one METAR per line) instead of fetching",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Timing rounds (default: 5)"
+    )
+    args = parser.parse_args()
+
+    if args.metars:
+        metar_list = load_metars_from_file(args.metars)
+    else:
+        metar_list = fetch_conus_metars(Path(__file__).parent / "cache")
+
+    if not metar_list:
+        print("Error: No METARs to benchmark")
+        sys.exit(1)
+
+    run_benchmark(metar_list, args.rounds)
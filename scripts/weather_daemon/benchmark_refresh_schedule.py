@@ -0,0 +1,223 @@
+"""
+Benchmark: Flat METAR Cache TTL vs Observation-Time-Aware Refresh
+
+Simulates a day of stations issuing routine METARs (hourly North American
+stations, half-hourly and hourly European stations) and SPECIs (stations in
+IFR), published a few minutes after observation, and a reader (the TUI
+refresh) checking every station at a fixed interval. Compares refetching
+each METAR once METAR_CACHE_DURATION has passed against refetching when
+ObservationScheduler expects the next report.
+
+Reports fetches per station-hour and how long each published report took to
+reach the cache.
+"""
+
+import random
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.config.constants import METAR_CACHE_DURATION  # noqa: E402
+from backend.data.weather_parsing import parse_metar  # noqa: E402
+from backend.data.weather_schedule import ObservationScheduler  # noqa: E402
+
+# Simulation starts just before a month boundary to exercise DDHHMM rollover
+SIM_START = datetime(2026, 10, 31, 6, 0, tzinfo=timezone.utc)
+
+
+@dataclass
+class Report:
+    """A METAR as the simulated station publishes it."""
+
+    published: datetime
+    text: str
+    is_speci: bool
+
+
+def _report_text(icao: str, observed: datetime, ifr: bool, speci: bool) -> str:
+    """Build a plausible METAR for the simulation."""
+    conditions = "1SM BR OVC004 12/11 A2988" if ifr else "10SM FEW050 20/10 A3001"
+    prefix = "SPECI " if speci else ""
+    return f"{prefix}{icao} {observed:%d%H%M}Z 27010KT {conditions}"
+
+
+def build_station_reports(
+    stations: int, hours: int, seed: int
+) -> Dict[str, List[Report]]:
+    """
+    Generate each station's published reports, sorted by publication time.
+
+    Args:
+        stations: Number of stations
+        hours: Simulated hours
+        seed: Random seed
+
+    Returns:
+        Dictionary mapping station ICAO to its reports
+    """
+    rng = random.Random(seed)
+    reports: Dict[str, List[Report]] = {}
+    end = SIM_START + timedelta(hours=hours)
+
+    for index in range(stations):
+        kind = rng.random()
+        if kind < 0.7:
+            icao = f"K{index:03d}"
+            minutes = [rng.randint(51, 56)]
+        elif kind < 0.9:
+            icao = f"E{index:03d}"
+            minutes = [20, 50]
+        else:
+            icao = f"E{index:03d}"
+            minutes = [50]
+        ifr = rng.random() < 0.2
+
+        station_reports = []
+        hour = SIM_START - timedelta(hours=1)
+        while hour < end:
+            for minute in minutes:
+                observed = hour + timedelta(minutes=minute)
+                published = observed + timedelta(seconds=rng.randint(60, 240))
+                station_reports.append(
+                    Report(published, _report_text(icao, observed, ifr, False), False)
+                )
+            hour += timedelta(hours=1)
+
+        if ifr:
+            # SPECIs about every 40 minutes
+            observed = SIM_START - timedelta(hours=1)
+            while observed < end:
+                observed += timedelta(minutes=rng.expovariate(1 / 40))
+                published = observed + timedelta(seconds=rng.randint(60, 180))
+                station_reports.append(
+                    Report(
+                        published,
+                        _report_text(icao, observed.replace(second=0), ifr, True),
+                        True,
+                    )
+                )
+
+        station_reports.sort(key=lambda report: report.published)
+        reports[icao] = station_reports
+
+    return reports
+
+
+def simulate(
+    reports: Dict[str, List[Report]],
+    hours: int,
+    read_interval: int,
+    scheduler: Optional[ObservationScheduler],
+) -> Tuple[int, Dict[bool, List[float]]]:
+    """
+    Run the reader against a METAR cache.
+
+    Args:
+        reports: Reports by station (from build_station_reports)
+        hours: Simulated hours
+        read_interval: Seconds between reader passes over every station
+        scheduler: Scheduler deciding when to refetch, or None for the flat TTL
+
+    Returns:
+        Tuple of (fetches, pickup delays in seconds of every published report
+        keyed by whether it is a SPECI)
+    """
+    published_at = {
+        icao: [report.published for report in station_reports]
+        for icao, station_reports in reports.items()
+    }
+    # Station -> (refresh_at, index of the latest report in the cache)
+    cache: Dict[str, Tuple[datetime, int]] = {}
+    fetches = 0
+    delays: Dict[bool, List[float]] = {False: [], True: []}
+    end = SIM_START + timedelta(hours=hours)
+
+    now = SIM_START
+    while now < end:
+        for icao, station_reports in reports.items():
+            cached = cache.get(icao)
+            if cached is not None and now < cached[0]:
+                continue
+
+            fetches += 1
+            latest = bisect_right(published_at[icao], now) - 1
+            if latest < 0:
+                continue
+            if cached is not None:
+                # Every report published since the last fetch arrives now
+                for report in station_reports[cached[1] + 1 : latest + 1]:
+                    delays[report.is_speci].append(
+                        (now - report.published).total_seconds()
+                    )
+
+            if scheduler is None:
+                refresh_at = now + timedelta(seconds=METAR_CACHE_DURATION)
+            else:
+                parsed = parse_metar(station_reports[latest].text)
+                refresh_at = scheduler.schedule(icao, parsed, now)
+            cache[icao] = (refresh_at, latest)
+
+        now += timedelta(seconds=read_interval)
+
+    return fetches, delays
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Get a percentile of a list of values (nearest rank)."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+def run_benchmark(stations: int = 300, hours: int = 24, read_interval: int = 15):
+    """Run the simulation with both refresh policies and print the comparison."""
+    reports = build_station_reports(stations, hours, seed=1)
+
+    print(f"\n{'=' * 60}")
+    print(
+        f"METAR Refresh Simulation: {stations} stations, {hours}h, "
+        f"reader every {read_interval}s"
+    )
+    print(f"{'=' * 60}")
+
+    results = {}
+    scheduler = ObservationScheduler()
+    for name, policy in (("Flat TTL", None), ("Scheduled", scheduler)):
+        fetches, delays = simulate(reports, hours, read_interval, policy)
+        per_station_hour = fetches / (stations * hours)
+        results[name] = {"fetches": fetches}
+        print(f"\n  {name}: {fetches} fetches ({per_station_hour:.1f}/station-hour)")
+        for is_speci, label in ((False, "routine"), (True, "SPECI")):
+            mean = sum(delays[is_speci]) / len(delays[is_speci])
+            p95 = _percentile(delays[is_speci], 95)
+            results[name][f"{label}_mean_delay"] = mean
+            results[name][f"{label}_p95_delay"] = p95
+            print(f"    {label:8s} pickup mean {mean:5.0f}s  p95 {p95:5.0f}s")
+
+    print(f"\n  Scheduler: {scheduler.diagnostics()}")
+    saved = 1 - results["Scheduled"]["fetches"] / results["Flat TTL"]["fetches"]
+    print(f"  Requests saved: {saved:.0%}")
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Simulate flat-TTL vs observation-time-aware METAR refresh"
+    )
+    parser.add_argument("--stations", type=int, default=300)
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument(
+        "--read-interval",
+        type=int,
+        default=15,
+        help="Seconds between reader passes (default: 15)",
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.stations, args.hours, args.read_interval)
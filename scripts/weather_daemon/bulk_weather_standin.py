@@ -0,0 +1,173 @@
+"""
+Bulk Weather Stand-in
+
+Writes METAR and TAF cache files in the aviationweather.gov bulk format
+(gzipped CSV with a few status lines before the header, see
+backend/data/weather_bulk.py) from text files holding one raw report per
+line, and optionally serves them over HTTP. Point the weather daemon or the
+TUI at the output directory or the served URL (both take
+--bulk-weather-source) to run bulk ingest without network access.
+"""
+
+import csv
+import functools
+import gzip
+import io
+import re
+import sys
+from datetime import datetime, timezone
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.config.constants import (  # noqa: E402
+    WEATHER_BULK_METAR_FILE,
+    WEATHER_BULK_TAF_FILE,
+)
+from backend.data.weather_schedule import observation_datetime  # noqa: E402
+
+# Report types that may precede the station identifier
+_REPORT_PREFIXES = {"METAR", "SPECI", "TAF", "AMD", "COR"}
+_TIME_TOKEN = re.compile(r"^(\d{6})Z$")
+
+
+def parse_report_line(line: str, now: datetime) -> Optional[Tuple[str, str, str]]:
+    """
+    Get the station and report time of a raw METAR or TAF.
+
+    Args:
+        line: Raw report
+        now: UTC time the report is taken to be current at
+
+    Returns:
+        Tuple of (station ICAO, raw report, ISO 8601 report time), or None if
+        the line has no station
+    """
+    raw = " ".join(line.split())
+    tokens = [token for token in raw.split() if token not in _REPORT_PREFIXES]
+    if not tokens:
+        return None
+
+    report_time = now
+    for token in tokens[1:3]:
+        match = _TIME_TOKEN.match(token)
+        if match:
+            report_time = observation_datetime(match.group(1), now) or now
+            break
+    return tokens[0].upper(), raw, report_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_cache_file(
+    reports: List[Tuple[str, str, str]], data_source: str, time_column: str
+) -> bytes:
+    """
+    Build a gzipped cache file.
+
+    Args:
+        reports: Tuples of (station ICAO, raw report, report time)
+        data_source: "metars" or "tafs"
+        time_column: Name of the report time column
+
+    Returns:
+        Gzipped CSV content
+    """
+    text = io.StringIO(newline="")
+    text.write("No errors\nNo warnings\n1 ms\n")
+    text.write(f"data source={data_source}\n{len(reports)} results\n")
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(["raw_text", "station_id", time_column])
+    writer.writerows((raw, station, when) for station, raw, when in reports)
+    return gzip.compress(text.getvalue().encode("utf-8"))
+
+
+def write_cache_file(
+    input_path: Path,
+    output_path: Path,
+    data_source: str,
+    time_column: str,
+    now: datetime,
+) -> int:
+    """
+    Convert a file of raw reports (one per line) to a cache file.
+
+    Args:
+        input_path: Text file with one raw report per line
+        output_path: Cache file to write
+        data_source: "metars" or "tafs"
+        time_column: Name of the report time column
+        now: UTC time the reports are taken to be current at
+
+    Returns:
+        Number of reports written
+    """
+    reports = []
+    with open(input_path, encoding="utf-8") as f:
+        for line in f:
+            report = parse_report_line(line, now)
+            if report is not None:
+                reports.append(report)
+
+    output_path.write_bytes(build_cache_file(reports, data_source, time_column))
+    return len(reports)
+
+
+def serve(directory: Path, port: int) -> None:
+    """Serve the cache files over HTTP until interrupted."""
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(directory))
+    with ThreadingHTTPServer(("127.0.0.1", port), handler) as server:
+        print(f"Serving {directory} at http://127.0.0.1:{port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Write (and optionally serve) bulk METAR/TAF cache files for offline tests"
+    )
+    parser.add_argument(
+        "--metars", type=Path, help="Text file with one raw METAR per line"
+    )
+    parser.add_argument("--tafs", type=Path, help="Text file with one raw TAF per line")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        required=True,
+        help="Directory to write the cache files to",
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        metavar="PORT",
+        help="Serve the output directory on 127.0.0.1:PORT after writing",
+    )
+    args = parser.parse_args()
+
+    if not args.metars and not args.tafs:
+        parser.error("Give --metars and/or --tafs")
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    now = datetime.now(timezone.utc)
+    if args.metars:
+        count = write_cache_file(
+            args.metars,
+            args.output / WEATHER_BULK_METAR_FILE,
+            "metars",
+            "observation_time",
+            now,
+        )
+        print(f"Wrote {count} METARs to {args.output / WEATHER_BULK_METAR_FILE}")
+    if args.tafs:
+        count = write_cache_file(
+            args.tafs, args.output / WEATHER_BULK_TAF_FILE, "tafs", "issue_time", now
+        )
+        print(f"Wrote {count} TAFs to {args.output / WEATHER_BULK_TAF_FILE}")
+
+    if args.serve:
+        serve(args.output, args.serve)
@@ -90,6 +90,9 @@ Examples:
 
   # Generate only for specific ARTCCs
   python -m scripts.weather_daemon.cli --artccs ZOA ZLA ZSE
+
+  # Fetch all weather with two bulk downloads
+  python -m scripts.weather_daemon.cli --bulk-weather
 """,
     )
 
@@ -143,6 +146,19 @@ Examples:
         help="Maximum concurrent tile generation workers (default: 2 for servers, increase for local machines with more RAM)",
     )
 
+    parser.add_argument(
+        "--bulk-weather",
+        action="store_true",
+        help="Fetch every station's METAR/TAF from the aviationweather.gov bulk cache files (two requests) instead of per-ARTCC bbox queries",
+    )
+
+    parser.add_argument(
+        "--bulk-weather-source",
+        type=str,
+        default=None,
+        help="Base URL or local directory of the bulk cache files, e.g. one written by bulk_weather_standin.py (implies --bulk-weather)",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -224,6 +240,10 @@ Examples:
     if args.data_dir:
         config.data_dir = args.data_dir
 
+    if args.bulk_weather or args.bulk_weather_source:
+        config.bulk_weather = True
+        config.bulk_weather_source = args.bulk_weather_source
+
     # Handle --force flag
     if args.force:
         config.skip_if_unchanged = False
@@ -68,6 +68,13 @@ class DaemonConfig:
     # Fetch fresh weather data (False = use cached)
     fetch_fresh_weather: bool = True
 
+    # Fetch every station's METAR/TAF from the bulk cache files (two requests)
+    # instead of one bbox query per ARTCC plus per-airport fallbacks
+    bulk_weather: bool = False
+
+    # Base URL or local directory of the bulk cache files (None = aviationweather.gov)
+    bulk_weather_source: Optional[str] = None
+
     # Generate briefing HTML pages
     generate_briefings: bool = True
 
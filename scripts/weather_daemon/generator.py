@@ -394,6 +394,7 @@ from backend import (  # noqa: E402
     get_taf_batch,
     get_rate_limit_status,
     fetch_weather_bbox,
+    fetch_weather_bulk,
     load_all_groupings,
     load_unified_airport_data,
 )
@@ -401,7 +402,6 @@ from backend.briefing import (  # noqa: E402
     AreaClusterer,
     count_area_categories,
     build_area_summary,
-    parse_wind_from_metar,
     parse_taf_changes,
     format_taf_relative_time,
 )
@@ -419,15 +419,8 @@ from .config import DaemonConfig, CATEGORY_COLORS, ARTCC_NAMES  # noqa: E402
 
 # Import METAR parsing functions
 from backend.data.weather_parsing import (  # noqa: E402
-    get_flight_category,
-    extract_visibility_str,
-    parse_ceiling_layer,
-    parse_visibility_sm,
-    parse_ceiling_feet,
-    parse_weather_phenomena,
-    parse_metar_obs_time,
+    get_parsed_metar,
     format_obs_time_display,
-    is_speci_metar,
 )
 
 
@@ -506,31 +499,29 @@ class WeatherBriefingGenerator:
         for icao in self.airports:
             metar = metars.get(icao, "")
             taf = tafs.get(icao, "")
-            category = get_flight_category(metar) if metar else "UNK"
+            parsed = get_parsed_metar(metar)
+            category = parsed.flight_category
             color = CATEGORY_COLORS.get(category, "white")
-            visibility_sm = parse_visibility_sm(metar) if metar else None
-            ceiling_ft = parse_ceiling_feet(metar) if metar else None
-            obs_time = parse_metar_obs_time(metar) if metar else None
 
             self.weather_data[icao] = {
                 "metar": metar,
                 "taf": taf,
                 "category": category,
                 "color": color,
-                "visibility": extract_visibility_str(metar) if metar else None,
-                "visibility_sm": visibility_sm,
-                "ceiling": parse_ceiling_layer(metar) if metar else None,
-                "ceiling_ft": ceiling_ft,
-                "wind": parse_wind_from_metar(metar) if metar else None,
+                "visibility": parsed.visibility_str,
+                "visibility_sm": parsed.visibility_sm,
+                "ceiling": parsed.ceiling_layer,
+                "ceiling_ft": parsed.ceiling_ft,
+                "wind": parsed.wind,
                 "atis": atis_data.get(icao),
-                "phenomena": parse_weather_phenomena(metar) if metar else [],
+                "phenomena": list(parsed.phenomena),
                 "taf_changes": parse_taf_changes(
-                    taf, category, visibility_sm, ceiling_ft
+                    taf, category, parsed.visibility_sm, parsed.ceiling_ft
                 )
                 if taf
                 else [],
-                "obs_time": obs_time,
-                "is_speci": is_speci_metar(metar) if metar else False,
+                "obs_time": parsed.obs_time,
+                "is_speci": parsed.is_speci,
             }
 
     def _get_airport_coords(self, icao: str) -> Optional[Tuple[float, float]]:
@@ -1212,14 +1203,43 @@ def generate(config: DaemonConfig) -> Dict[str, str]:
         logger.info(f"Using cached weather data from {cache_timestamp}")
         atis_count = len([a for a in atis_data.values() if a]) if atis_data else 0
     elif config.fetch_fresh_weather:
+        bulk_metars_fetched = False
+        bulk_tafs_fetched = False
+        bbox_fetched = False
+        if config.bulk_weather:
+            # Every station worldwide in two requests (METAR and TAF files)
+            print("  Fetching weather via bulk cache files...")
+            logger.info("Fetching weather via bulk cache files")
+            bulk_metars, bulk_tafs = fetch_weather_bulk(
+                True, config.bulk_weather_source
+            )
+            metars.update(bulk_metars)
+            tafs.update(bulk_tafs)
+            bulk_metars_fetched = bool(bulk_metars)
+            bulk_tafs_fetched = bool(bulk_tafs)
+            if bulk_metars_fetched and bulk_tafs_fetched:
+                print(
+                    f"    Retrieved {len(metars)} METARs, {len(tafs)} TAFs from bulk files"
+                )
+                logger.info(
+                    f"Retrieved {len(metars)} METARs, {len(tafs)} TAFs from bulk files"
+                )
+            elif bulk_metars_fetched:
+                print("  WARNING: Bulk TAF download failed, using bbox queries")
+                logger.warning("Bulk TAF download failed, using bbox queries")
+            else:
+                print("  WARNING: Bulk weather download failed, using bbox queries")
+                logger.warning("Bulk weather download failed, using bbox queries")
+
         # Fetch fresh weather data using bounding box approach for efficiency
         # This uses ~1 API call per ARTCC instead of ~1 per airport
 
-        if artccs_involved:
+        if artccs_involved and not (bulk_metars_fetched and bulk_tafs_fetched):
             # Get bounding boxes for all ARTCCs
             artcc_bboxes = get_artcc_bboxes(artccs_involved, config.artcc_cache_dir)
 
             if artcc_bboxes:
+                bbox_fetched = True
                 print(
                     f"  Fetching weather via bbox for {len(artcc_bboxes)} ARTCCs ({num_airports} airports)..."
                 )
@@ -1279,7 +1299,11 @@ def generate(config: DaemonConfig) -> Dict[str, str]:
                 return True
             return False
 
-        missing_airports = [a for a in airports_list if a not in metars]
+        # The bulk files hold every current report, so airports missing from
+        # them have nothing to fetch
+        missing_airports = (
+            [] if bulk_metars_fetched else [a for a in airports_list if a not in metars]
+        )
         fetchable_airports = [a for a in missing_airports if likely_has_metar(a)]
         skipped_count = len(missing_airports) - len(fetchable_airports)
 
@@ -1308,6 +1332,21 @@ def generate(config: DaemonConfig) -> Dict[str, str]:
                 f"Skipping {skipped_count} airports unlikely to have METAR stations"
             )
 
+        # METARs came from the bulk file but neither the TAF file nor a bbox
+        # query provided TAFs: fetch them for the reporting airports
+        if bulk_metars_fetched and not bulk_tafs_fetched and not bbox_fetched:
+            taf_airports = [
+                a for a in airports_list if a in metars and likely_has_metar(a)
+            ]
+            if taf_airports:
+                print(
+                    f"  Fetching TAFs for {len(taf_airports)} airports individually..."
+                )
+                logger.info(
+                    f"Fetching TAFs for {len(taf_airports)} airports individually"
+                )
+                tafs.update(get_taf_batch(taf_airports, max_workers=config.max_workers))
+
         # Log rate limit status after fetches
         rate_status = get_rate_limit_status()
         if rate_status["is_rate_limited"]:
@@ -1522,7 +1561,7 @@ def generate(config: DaemonConfig) -> Dict[str, str]:
             if lat is None or lon is None:
                 continue
             # Parse weather category
-            category = get_flight_category(metar)
+            category = get_parsed_metar(metar).flight_category
             all_airport_weather[icao] = {
                 "icao": icao,
                 "lat": lat,
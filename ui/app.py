@@ -17,6 +17,8 @@ from textual.events import Key
 
 from backend import analyze_flights_data
 from backend.core.groupings import load_all_groupings
+from backend.core.snapshot import FlightSnapshot, get_flight_snapshot
+from backend.utils.timing import get_last_refresh_timeline
 
 from widgets.split_flap_datatable import SplitFlapDataTable
 from .tables import (
@@ -218,6 +220,9 @@ class VATSIMControlApp(App):
         self.groupings_manager = None
         # Cached data for Go To modal (warmed up on mount, kept fresh)
         self.cached_pilots: List[dict] = []
+        self.cached_snapshot: Optional[FlightSnapshot] = None
+        # Airport list from the last refresh, to detect an unchanged feed
+        self._last_refresh_airport_data: Optional[list] = None
         self.cached_groupings: dict = {}
         # Pre-built results list for Go To modal (list of (type, identifier, data) tuples)
         self.cached_goto_results: List[Tuple[str, str, Any]] = []
@@ -306,7 +311,8 @@ class VATSIMControlApp(App):
         # Load pilots data (network call)
         vatsim_data = await loop.run_in_executor(None, download_vatsim_data)
         if vatsim_data:
-            self.cached_pilots = vatsim_data.get("pilots", [])
+            self.cached_snapshot = get_flight_snapshot(vatsim_data)
+            self.cached_pilots = self.cached_snapshot.pilots
 
         # Pre-build the Go To results list in executor (includes disambiguator warmup)
         await loop.run_in_executor(None, self._build_goto_results)
@@ -333,11 +339,11 @@ class VATSIMControlApp(App):
         for name in sorted(self.cached_groupings.keys()):
             results.append(("grouping", name, None))
 
-        # Add flights (sorted by callsign)
-        for pilot in sorted(self.cached_pilots, key=lambda p: p.get("callsign", "")):
-            callsign = pilot.get("callsign", "")
-            if callsign:
-                results.append(("flight", callsign, pilot))
+        # Add flights (sorted by callsign) from the columnar feed snapshot
+        snapshot = self.cached_snapshot
+        if snapshot is not None:
+            for row in snapshot.rows_by_callsign():
+                results.append(("flight", snapshot.callsign[row], snapshot.pilots[row]))
 
         self.cached_goto_results = results
         self.goto_cache_ready = True
@@ -489,8 +495,18 @@ class VATSIMControlApp(App):
         )
         time_str = self.format_time_since(time_since_refresh)
 
+        # Duration of the last refresh and its slowest stage
+        timing_str = ""
+        timeline = get_last_refresh_timeline()
+        if timeline is not None and timeline.total_ms is not None:
+            timing_str = f" ({timeline.total_ms:.0f}ms"
+            slowest = timeline.slowest()
+            if slowest is not None and not timeline.reused:
+                timing_str += f", slowest: {slowest.name} {slowest.duration_ms:.0f}ms"
+            timing_str += ")"
+
         status_bar.update(
-            f"Auto-refresh: {pause_status} | Last refresh: {time_str} ago | {len(self.airport_data)} airports, {groupings_count} groupings"
+            f"Auto-refresh: {pause_status} | Last refresh: {time_str} ago{timing_str} | {len(self.airport_data)} airports, {groupings_count} groupings"
         )
 
     async def fetch_data_async(self):
@@ -611,9 +627,19 @@ class VATSIMControlApp(App):
         loop = asyncio.get_event_loop()
         vatsim_data = await loop.run_in_executor(None, download_vatsim_data)
         if vatsim_data:
-            self.cached_pilots = vatsim_data.get("pilots", [])
-            # Rebuild Go To results in background to keep cache warm
-            await loop.run_in_executor(None, self._build_goto_results)
+            snapshot = get_flight_snapshot(vatsim_data)
+            if snapshot is not self.cached_snapshot:
+                self.cached_snapshot = snapshot
+                self.cached_pilots = snapshot.pilots
+                # Rebuild Go To results in background to keep cache warm
+                await loop.run_in_executor(None, self._build_goto_results)
+
+        # analyze_flights_data returns the very same list when the feed hasn't
+        # advanced - the tables already show it, so only the status bar changes
+        if airport_data is not None and airport_data is self._last_refresh_airport_data:
+            self.update_status_bar()
+            return
+        self._last_refresh_airport_data = airport_data
 
         if airport_data is not None:
             self._disable_activity_watching()  # Temporarily disable user activity tracking
@@ -26,10 +26,10 @@ from backend import (
     get_required_runway_length,
     haversine_distance_nm,
 )
+from backend.data.weather_parsing import get_parsed_metar
 from ui import config
 from ui.config import CATEGORY_COLORS
 from widgets.split_flap_datatable import SplitFlapDataTable
-from .metar_info import get_flight_category, _extract_flight_rules_weather
 
 
 # Constants for diversion search
@@ -421,8 +421,9 @@ class DiversionModal(ModalScreen):
         # Process results
         for icao, metar in metars.items():
             if metar:
-                category, _ = get_flight_category(metar)
-                vis_str, ceil_str = _extract_flight_rules_weather(metar)
+                parsed = get_parsed_metar(metar)
+                category = parsed.flight_category
+                vis_str, ceil_str = parsed.flight_rules_weather
                 details = f"{vis_str or ''} {ceil_str or ''}".strip()
                 self._weather_data[icao] = (category, details)
 
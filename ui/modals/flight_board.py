@@ -14,9 +14,10 @@ from backend import (
     get_wind_info,
     get_altimeter_setting,
     get_metar_batch,
-    find_airports_near_position,
+    find_nearest_metar_batch,
 )
 from backend.core.flights import get_airport_flight_details
+from backend.core.snapshot import get_flight_snapshot
 from backend.data.vatsim_api import download_vatsim_data, get_atis_for_airports
 from backend.data.atis_filter import (
     parse_approach_info,
@@ -24,7 +25,7 @@ from backend.data.atis_filter import (
     format_runway_summary,
 )
 from backend.config import constants as backend_constants
-from ui.modals.metar_info import get_flight_category
+from backend.data.weather_parsing import get_parsed_metar
 from ui.modals.notification_manager import NotificationManager
 
 from widgets.split_flap_datatable import SplitFlapDataTable
@@ -40,6 +41,11 @@ from ui.tables import (
 from ui.modals.flight_info import FlightInfoScreen
 
 
+def _atis_texts(atis_list: list) -> Tuple[str, ...]:
+    """Get the ATIS texts for an airport as a comparable tuple."""
+    return tuple(atis.get("text_atis", "") for atis in atis_list)
+
+
 class FlightBoardScreen(ModalScreen):
     """Modal screen showing departure and arrivals board for an airport or grouping"""
 
@@ -187,6 +193,9 @@ class FlightBoardScreen(ModalScreen):
         self._previous_approaches: Dict[
             str, Dict[str, frozenset]
         ] = {}  # ICAO -> {runway: frozenset of approach types}
+        self._previous_atis_texts: Dict[
+            str, Tuple[str, ...]
+        ] = {}  # ICAO -> ATIS texts the runway baseline was parsed from
         self._weather_check_timer = None  # Timer for weather/runway change checks
         # Notification manager (initialized in on_mount)
         self._notification_manager: Optional[NotificationManager] = None
@@ -287,6 +296,11 @@ class FlightBoardScreen(ModalScreen):
                 if not vatsim_data:
                     return None, None, None
 
+                # Same feed object means the feed hasn't advanced since the
+                # board was last populated - nothing to recompute
+                if vatsim_data is self.vatsim_data:
+                    return vatsim_data, self.departures_data, self.arrivals_data
+
                 result = get_airport_flight_details(
                     self.airport_icao_or_list,
                     0,  # Always show all arrivals on the flight board
@@ -306,6 +320,9 @@ class FlightBoardScreen(ModalScreen):
                 None, fetch_and_process_flights
             )
 
+            if vatsim_data is self.vatsim_data:
+                return
+
             if vatsim_data:
                 self.vatsim_data = vatsim_data
                 self.departures_data = departures or []
@@ -338,9 +355,7 @@ class FlightBoardScreen(ModalScreen):
             return
 
         airports_to_cache = set()
-        pilots_by_callsign = {
-            p.get("callsign"): p for p in self.vatsim_data.get("pilots", [])
-        }
+        snapshot = get_flight_snapshot(self.vatsim_data)
 
         # For departures on the ground, use their departure airport
         for dep in self.departures_data:
@@ -349,28 +364,33 @@ class FlightBoardScreen(ModalScreen):
             # Also add destination in case they need it
             airports_to_cache.add(dep.destination.icao_code)
 
-        # For arrivals (in-flight or on ground), find airports near their current position
+        # For arrivals (in-flight or on ground), resolve the nearest METAR station
+        # to every position at once (same lookup as the flight info altimeter)
+        positions = []
+        headings = []
+        groundspeeds = []
         for arr in self.arrivals_data:
-            pilot = pilots_by_callsign.get(arr.callsign)
-            if pilot:
-                lat = pilot.get("latitude")
-                lon = pilot.get("longitude")
-                if lat is not None and lon is not None:
-                    # Find airports near this flight's position
-                    nearby = find_airports_near_position(
-                        lat,
-                        lon,
-                        config.UNIFIED_AIRPORT_DATA,
-                        radius_nm=75,  # Search within 75nm
-                        max_results=3,  # Get closest 3 airports
-                    )
-                    airports_to_cache.update(nearby)
+            row = snapshot.row_of(arr.callsign)
+            if row is not None and snapshot.has_position[row]:
+                positions.append(
+                    (float(snapshot.latitude[row]), float(snapshot.longitude[row]))
+                )
+                headings.append(float(snapshot.heading[row]))
+                groundspeeds.append(float(snapshot.groundspeed[row]))
 
             # Also add origin airport
             airports_to_cache.add(arr.origin.icao_code)
             if arr.arrival:
                 airports_to_cache.add(arr.arrival.icao_code)
 
+        if positions:
+            find_nearest_metar_batch(
+                positions,
+                config.UNIFIED_AIRPORT_DATA,
+                headings=headings,
+                groundspeeds=groundspeeds,
+            )
+
         # Batch fetch METARs to warm the cache
         if airports_to_cache:
             get_metar_batch(list(airports_to_cache), max_workers=10)
@@ -662,13 +682,8 @@ class FlightBoardScreen(ModalScreen):
         # Extract callsign from first column and clean it
         callsign = str(row_data[0]).strip()
 
-        # Find the flight in vatsim_data
-        flight_data = None
-        pilots_list = self.vatsim_data.get("pilots", [])
-        for pilot in pilots_list:
-            if pilot.get("callsign", "").strip() == callsign:
-                flight_data = pilot
-                break
+        # Find the flight in the feed snapshot
+        flight_data = get_flight_snapshot(self.vatsim_data).get_pilot(callsign)
 
         if not flight_data:
             # Debug: log that flight was not found
@@ -702,7 +717,7 @@ class FlightBoardScreen(ModalScreen):
         for icao in airports:
             metar = metars.get(icao, "")
             if metar:
-                category = get_flight_category(metar)
+                category = get_parsed_metar(metar).flight_category
                 self._previous_weather[icao] = category
 
         # Build baseline runway state and approach types from ATIS
@@ -710,6 +725,7 @@ class FlightBoardScreen(ModalScreen):
         for icao in airports:
             atis_list = atis_data.get(icao, [])
             if atis_list:
+                self._previous_atis_texts[icao] = _atis_texts(atis_list)
                 # Combine runway/approach info from all ATIS entries
                 combined_landing: set = set()
                 combined_departing: set = set()
@@ -760,7 +776,7 @@ class FlightBoardScreen(ModalScreen):
             if not metar:
                 continue
 
-            new_category = get_flight_category(metar)
+            new_category = get_parsed_metar(metar).flight_category
             old_category = self._previous_weather.get(icao)
 
             # If we have a previous category and it changed, show notification
@@ -780,6 +796,13 @@ class FlightBoardScreen(ModalScreen):
             if not atis_list:
                 continue
 
+            # Only re-parse ATIS that changed since the last check; identical
+            # text cannot produce a runway or approach change
+            atis_texts = _atis_texts(atis_list)
+            if atis_texts == self._previous_atis_texts.get(icao):
+                continue
+            self._previous_atis_texts[icao] = atis_texts
+
             # Combine runway/approach info from all ATIS entries
             combined_landing: set = set()
             combined_departing: set = set()
@@ -22,16 +22,8 @@ from backend.core.route import (
     parse_route_waypoints,
     format_ete,
 )
-from backend.briefing import (
-    parse_taf_changes,
-    parse_wind_from_metar,
-)
-from backend.data.weather_parsing import (
-    get_flight_category,
-    parse_visibility_sm,
-    parse_ceiling_feet,
-    parse_ceiling_layer,
-)
+from backend.briefing import parse_taf_changes
+from backend.data.weather_parsing import get_parsed_metar
 from ui import config
 from ui.config import CATEGORY_COLORS
 
@@ -246,17 +238,18 @@ class FlightWeatherBriefingScreen(ModalScreen):
         for icao in unique_airports:
             metar = metars.get(icao, "")
             taf = tafs.get(icao, "")
-            category = get_flight_category(metar) if metar else "UNK"
+            parsed = get_parsed_metar(metar)
+            category = parsed.flight_category
 
             self.weather_data[icao] = {
                 "metar": metar,
                 "taf": taf,
                 "category": category,
                 "color": CATEGORY_COLORS.get(category, "white"),
-                "visibility_sm": parse_visibility_sm(metar) if metar else None,
-                "ceiling_ft": parse_ceiling_feet(metar) if metar else None,
-                "ceiling_layer": parse_ceiling_layer(metar) if metar else None,
-                "wind": parse_wind_from_metar(metar) if metar else None,
+                "visibility_sm": parsed.visibility_sm,
+                "ceiling_ft": parsed.ceiling_ft,
+                "ceiling_layer": parsed.ceiling_layer,
+                "wind": parsed.wind,
                 "atis": atis_data.get(icao),
             }
 
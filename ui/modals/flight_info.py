@@ -11,19 +11,21 @@ from textual.binding import Binding
 from textual.app import ComposeResult
 from backend import (
     find_nearest_airport_with_metar,
-    find_airports_near_position,
+    find_alternate_candidates,
     get_metar,
     haversine_distance_nm,
-    calculate_bearing,
     bearing_to_compass,
     calculate_eta,
 )
+from backend.core.classification import get_last_ground_positions
 from backend.core.flights import get_nearest_airport_if_on_ground
+from backend.core.snapshot import get_flight_snapshot
 from backend.data.navaids import get_max_mea_for_route, MeaViolation
 from backend.data.vatsim_api import download_vatsim_data, get_member_stats
+from backend.data.weather_parsing import get_parsed_metar
 from ui import config
+from ui.config import CATEGORY_COLORS
 from ui.debug_logger import debug
-from ui.modals.metar_info import get_flight_category, _extract_flight_rules_weather
 
 
 # Cache for VFR alternate results: {origin_icao: {'result': [...], 'timestamp': datetime}}
@@ -199,9 +201,22 @@ class FlightInfoScreen(ModalScreen):
             # Fetch fresh VATSIM data and look up this flight
             fresh_data = await loop.run_in_executor(None, self._fetch_fresh_pilot_data)
 
+            # The same pilot dict comes back while the feed hasn't advanced,
+            # so the position-dependent lookups below would repeat exactly
+            if fresh_data is not None and fresh_data is self.flight_data:
+                return
+
             if fresh_data:
+                old_plan = self.flight_data.get("flight_plan") or {}
+                new_plan = fresh_data.get("flight_plan") or {}
+                refiled = old_plan.get("revision_id") != new_plan.get("revision_id")
                 self.flight_data = fresh_data
 
+                # Route parsing only needs redoing when the pilot refiled
+                if refiled and self._should_check_mea():
+                    self.mea_loading = True
+                    await self._load_mea_info()
+
             # Now fetch altimeter for the (potentially new) position
             self.altimeter_info = await loop.run_in_executor(
                 None, self._get_altimeter_info_sync
@@ -265,10 +280,7 @@ class FlightInfoScreen(ModalScreen):
             if not vatsim_data:
                 return None
 
-            pilots = vatsim_data.get("pilots", [])
-            for pilot in pilots:
-                if pilot.get("callsign") == self.callsign:
-                    return pilot
+            return get_flight_snapshot(vatsim_data).get_pilot(self.callsign)
         except Exception:
             pass
 
@@ -377,8 +389,10 @@ class FlightInfoScreen(ModalScreen):
         try:
             metar = get_metar(icao)
             if metar:
-                category, color = get_flight_category(metar)
-                visibility_str, ceiling_str = _extract_flight_rules_weather(metar)
+                parsed = get_parsed_metar(metar)
+                category = parsed.flight_category
+                color = CATEGORY_COLORS.get(category, "white")
+                visibility_str, ceiling_str = parsed.flight_rules_weather
                 return (category, color, visibility_str, ceiling_str)
         except Exception:
             pass
@@ -415,30 +429,14 @@ class FlightInfoScreen(ModalScreen):
         if not config.UNIFIED_AIRPORT_DATA:
             return
 
-        origin_data = config.UNIFIED_AIRPORT_DATA.get(origin_icao)
-        if not origin_data:
-            return
-
-        origin_lat = origin_data.get("latitude")
-        origin_lon = origin_data.get("longitude")
-        if origin_lat is None or origin_lon is None:
-            return
-
-        # Find nearby airports
-        nearby_all = find_airports_near_position(
-            origin_lat,
-            origin_lon,
+        # Find nearby METAR-capable airports (closest first)
+        nearby = find_alternate_candidates(
+            origin_icao,
             config.UNIFIED_AIRPORT_DATA,
             radius_nm=self.MAX_ALTERNATE_SEARCH_RADIUS_NM,
             max_results=500,
         )
 
-        nearby = [
-            icao
-            for icao in nearby_all
-            if len(icao) == 4 and icao.isalpha() and icao != origin_icao
-        ]
-
         if not nearby:
             setattr(self, target_attr, [])
             _VFR_ALTERNATES_CACHE[origin_icao] = {
@@ -451,7 +449,7 @@ class FlightInfoScreen(ModalScreen):
         alternates = []
 
         # Search airports one at a time, updating display as we find VFR/MVFR
-        for icao in nearby:
+        for icao, distance, bearing in nearby:
             if len(alternates) >= max_results:
                 break
 
@@ -463,21 +461,12 @@ class FlightInfoScreen(ModalScreen):
             if not metar:
                 continue
 
-            category, color = get_flight_category(metar)
+            category = get_parsed_metar(metar).flight_category
             if category not in ("VFR", "MVFR"):
                 continue
+            color = CATEGORY_COLORS.get(category, "white")
 
-            # Calculate distance and direction
-            apt_data = config.UNIFIED_AIRPORT_DATA.get(icao, {})
-            apt_lat = apt_data.get("latitude")
-            apt_lon = apt_data.get("longitude")
-            if apt_lat is None or apt_lon is None:
-                continue
-
-            distance = haversine_distance_nm(origin_lat, origin_lon, apt_lat, apt_lon)
-            bearing = calculate_bearing(origin_lat, origin_lon, apt_lat, apt_lon)
             direction = bearing_to_compass(bearing)
-
             alternates.append((icao, category, color, distance, direction))
 
             # Update display immediately with new result
@@ -789,9 +778,20 @@ class FlightInfoScreen(ModalScreen):
             if groundspeed <= 40:  # On ground or nearly stopped
                 # Get nearest airport info
                 if config.UNIFIED_AIRPORT_DATA:
-                    nearest_airport = get_nearest_airport_if_on_ground(
-                        self.flight_data, config.UNIFIED_AIRPORT_DATA
+                    # When every airport is tracked, the refresh already knows
+                    # the one the pilot is on the ground at; otherwise (or if
+                    # it doesn't) search every airport
+                    ground = get_last_ground_positions()
+                    nearest_airport = (
+                        ground.airport_for(self.flight_data)
+                        if ground is not None
+                        and ground.covers_all(config.UNIFIED_AIRPORT_DATA)
+                        else None
                     )
+                    if nearest_airport is None:
+                        nearest_airport = get_nearest_airport_if_on_ground(
+                            self.flight_data, config.UNIFIED_AIRPORT_DATA
+                        )
                     if nearest_airport:
                         airport_data = config.UNIFIED_AIRPORT_DATA.get(
                             nearest_airport, {}
@@ -10,17 +10,16 @@ from textual.containers import Container, VerticalScroll
 from textual.binding import Binding
 from textual.app import ComposeResult
 
-from backend import get_metar, get_taf
+from backend import get_metar, get_taf, get_weather_age
 from backend.data.vatsim_api import download_vatsim_data, get_atis_for_airports
 from backend.data.atis_filter import filter_atis_text, colorize_atis_text
 from backend.data.weather_parsing import (
-    get_flight_category,
     parse_visibility_sm,
     parse_ceiling_feet,
     parse_ceiling_layer,
     extract_visibility_str,
     extract_flight_rules_weather,
-    is_speci_metar,
+    get_parsed_metar,
 )
 from ui import config
 from ui.config import CATEGORY_COLORS
@@ -236,6 +235,27 @@ class MetarInfoScreen(ModalScreen):
         else:
             return f" [dim]({time_str} ago)[/dim]"
 
+    def _format_cache_age(self, icao: str, cache_name: str) -> str:
+        """
+        Format how long ago a cached METAR or TAF was fetched.
+
+        Args:
+            icao: Airport ICAO code
+            cache_name: "metar" or "taf"
+
+        Returns:
+            Dim markup like "Fetched 3m ago, refreshing", or empty string if not cached
+        """
+        age = get_weather_age(icao, cache_name)
+        if age is None:
+            return ""
+
+        age_seconds, is_stale = age
+        mins = int(age_seconds / 60)
+        age_str = f"{mins}m ago" if mins else "just now"
+        refreshing = ", refreshing" if is_stale else ""
+        return f"[dim]Fetched {age_str}{refreshing}[/dim]"
+
     def _highlight_flight_category_components(self, metar: str) -> str:
         """
         Highlight visibility and ceiling components in METAR that determine flight category.
@@ -249,12 +269,10 @@ class MetarInfoScreen(ModalScreen):
         if not metar:
             return metar
 
-        # Get flight category and color
-        _category = get_flight_category(metar)
-        color = CATEGORY_COLORS.get(_category, "white")
-
-        # Extract visibility and ceiling strings
-        vis_str, ceiling_str = _extract_flight_rules_weather(metar)
+        # Get flight category and color, and the visibility and ceiling strings
+        parsed = get_parsed_metar(metar)
+        color = CATEGORY_COLORS.get(parsed.flight_category, "white")
+        vis_str, ceiling_str = parsed.flight_rules_weather
 
         highlighted = metar
 
@@ -451,7 +469,7 @@ class MetarInfoScreen(ModalScreen):
         # Airport title first with flight category on same line
         category: Optional[str] = None
         if metar:
-            category = get_flight_category(metar)
+            category = get_parsed_metar(metar).flight_category
             color = CATEGORY_COLORS.get(category, "white")
             result_lines.append(
                 f"{pretty_name} ({icao}) // [{color} bold]{category}[/{color} bold]"
@@ -487,12 +505,15 @@ class MetarInfoScreen(ModalScreen):
         # METAR with highlighted flight category components
         if metar:
             # Check if this is a SPECI (special) report
-            if is_speci_metar(metar):
+            if get_parsed_metar(metar).is_speci:
                 result_lines.append(
                     "[bold #ff9900]⚠ SPECI[/bold #ff9900] [dim](significant weather change)[/dim]"
                 )
             highlighted_metar = self._highlight_flight_category_components(metar)
             result_lines.append(highlighted_metar)
+            metar_age = self._format_cache_age(icao, "metar")
+            if metar_age:
+                result_lines.append(metar_age)
             self._update_hint(category)
         else:
             result_lines.append("METAR: No data available")
@@ -504,6 +525,9 @@ class MetarInfoScreen(ModalScreen):
         if taf:
             colorized_taf = self._colorize_taf(taf)
             result_lines.append(colorized_taf)
+            taf_age = self._format_cache_age(icao, "taf")
+            if taf_age:
+                result_lines.append(taf_age)
         else:
             result_lines.append("TAF: No data available")
 
@@ -10,13 +10,7 @@ from textual.app import ComposeResult
 
 from backend import get_metar_batch, haversine_distance_nm, find_airports_near_position
 from backend.data.navaids import parse_route_string, Waypoint
-from backend.data.weather_parsing import (
-    get_flight_category,
-    extract_visibility_str,
-    parse_ceiling_layer,
-    parse_weather_phenomena,
-    parse_wind_from_metar,
-)
+from backend.data.weather_parsing import get_parsed_metar
 from ui import config
 from ui.config import CATEGORY_COLORS
 from ui.modals.weather_briefing import _parse_metar_observation_time
@@ -203,17 +197,18 @@ class RouteWeatherScreen(ModalScreen):
         for icao in all_airports:
             metar = metars.get(icao, "")
             if metar:
-                category = get_flight_category(metar)
+                parsed = get_parsed_metar(metar)
+                category = parsed.flight_category
                 color = CATEGORY_COLORS.get(category, "white")
                 self.weather_data[icao] = {
                     "metar": metar,
                     "category": category,
                     "color": color,
-                    "visibility": extract_visibility_str(metar),
-                    "ceiling": parse_ceiling_layer(metar),
-                    "wind": parse_wind_from_metar(metar),
+                    "visibility": parsed.visibility_str,
+                    "ceiling": parsed.ceiling_layer,
+                    "wind": parsed.wind,
                     "obs_time": _parse_metar_observation_time(metar),
-                    "phenomena": parse_weather_phenomena(metar),
+                    "phenomena": list(parsed.phenomena),
                 }
             else:
                 self.weather_data[icao] = {
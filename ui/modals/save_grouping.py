@@ -8,6 +8,7 @@ from textual.containers import Container
 from textual.binding import Binding
 from textual.app import ComposeResult
 
+from backend.core.analysis_context import invalidate_analysis_context
 from common.paths import get_custom_groupings_file
 
 
@@ -110,6 +111,10 @@ class SaveGroupingModal(ModalScreen):
             with open(groupings_file, "w", encoding="utf-8") as f:
                 json.dump(groupings_data, f, indent=2, ensure_ascii=False)
 
+            # Pick up the new grouping on the next refresh even if the file's
+            # mtime resolution hides the write
+            invalidate_analysis_context()
+
             self.dismiss(
                 f"Saved '{grouping_name}' with {len(self.airport_list)} airports"
             )
@@ -9,13 +9,12 @@ from textual.app import ComposeResult
 
 from backend import (
     get_metar,
-    find_airports_near_position,
-    haversine_distance_nm,
-    calculate_bearing,
+    find_alternate_candidates,
     bearing_to_compass,
 )
+from backend.data.weather_parsing import get_parsed_metar
 from ui import config
-from .metar_info import get_flight_category, _extract_flight_rules_weather
+from ui.config import CATEGORY_COLORS
 
 
 # Constants for alternate airport search
@@ -185,8 +184,10 @@ class VfrAlternativesScreen(ModalScreen):
             return
 
         if origin_metar:
-            category, color = get_flight_category(origin_metar)
-            vis_str, ceil_str = _extract_flight_rules_weather(origin_metar)
+            parsed = get_parsed_metar(origin_metar)
+            category = parsed.flight_category
+            color = CATEGORY_COLORS.get(category, "white")
+            vis_str, ceil_str = parsed.flight_rules_weather
             details = self._format_weather_details(vis_str, ceil_str)
             header_lines.append(
                 f"Current conditions: [{color} bold]{category}[/{color} bold] {details}"
@@ -201,22 +202,14 @@ class VfrAlternativesScreen(ModalScreen):
 
         result_widget.update("\n".join(header_lines))
 
-        # Find nearby airports
-        nearby_all = find_airports_near_position(
-            origin_lat,
-            origin_lon,
+        # Find nearby airports likely to have METAR (closest first)
+        nearby = find_alternate_candidates(
+            icao,
             config.UNIFIED_AIRPORT_DATA,
             radius_nm=MAX_ALTERNATE_SEARCH_RADIUS_NM,
             max_results=500,
         )
 
-        # Filter to airports likely to have METAR
-        nearby = [
-            apt_icao
-            for apt_icao in nearby_all
-            if len(apt_icao) == 4 and apt_icao.isalpha() and apt_icao != icao
-        ]
-
         if self._search_cancelled:
             return
 
@@ -224,7 +217,7 @@ class VfrAlternativesScreen(ModalScreen):
         alternates = []
         checked_count = 0
 
-        for apt_icao in nearby:
+        for apt_icao, distance, bearing in nearby:
             if self._search_cancelled:
                 return
 
@@ -242,22 +235,15 @@ class VfrAlternativesScreen(ModalScreen):
             if not metar:
                 continue
 
-            category, color = get_flight_category(metar)
+            parsed = get_parsed_metar(metar)
+            category = parsed.flight_category
             if category not in ("VFR", "MVFR"):
                 continue
+            color = CATEGORY_COLORS.get(category, "white")
 
             # Get weather details
-            vis_str, ceil_str = _extract_flight_rules_weather(metar)
-
-            # Calculate distance and direction
-            apt_data = config.UNIFIED_AIRPORT_DATA.get(apt_icao, {})
-            apt_lat = apt_data.get("latitude")
-            apt_lon = apt_data.get("longitude")
-            if apt_lat is None or apt_lon is None:
-                continue
+            vis_str, ceil_str = parsed.flight_rules_weather
 
-            distance = haversine_distance_nm(origin_lat, origin_lon, apt_lat, apt_lon)
-            bearing = calculate_bearing(origin_lat, origin_lon, apt_lat, apt_lon)
             direction = bearing_to_compass(bearing)
 
             # Get full name (no length limit)
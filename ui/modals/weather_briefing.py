@@ -2,7 +2,6 @@
 
 import asyncio
 import os
-import re
 import tempfile
 import webbrowser
 from datetime import datetime, timedelta, timezone
@@ -21,19 +20,10 @@ from backend.briefing import (
     AreaClusterer,
     count_area_categories,
     build_area_summary,
-    parse_wind_from_metar,
     parse_taf_changes,
     format_taf_relative_time,
 )
-from backend.data.weather_parsing import (
-    get_flight_category,
-    extract_visibility_str,
-    parse_ceiling_layer,
-    parse_visibility_sm,
-    parse_ceiling_feet,
-    parse_weather_phenomena,
-    is_speci_metar,
-)
+from backend.data.weather_parsing import get_parsed_metar
 from ui import config
 from ui.config import CATEGORY_COLORS
 
@@ -52,13 +42,13 @@ def _parse_metar_observation_time(metar: str) -> Optional[tuple]:
         return None
 
     # METAR timestamp format: DDHHMM Z (e.g., "251856Z")
-    match = re.search(r"\b(\d{2})(\d{2})(\d{2})Z\b", metar)
-    if not match:
+    obs_time = get_parsed_metar(metar).obs_time
+    if not obs_time:
         return None
 
-    day = int(match.group(1))
-    hour = int(match.group(2))
-    minute = int(match.group(3))
+    day = int(obs_time[0:2])
+    hour = int(obs_time[2:4])
+    minute = int(obs_time[4:6])
 
     zulu_str = f"{hour:02d}{minute:02d}Z"
 
@@ -295,31 +285,28 @@ class WeatherBriefingScreen(ModalScreen):
 
             metar = metars.get(icao, "")
             taf = tafs.get(icao, "")
-            category = get_flight_category(metar) if metar else "UNK"
+            parsed = get_parsed_metar(metar)
+            category = parsed.flight_category
             color = CATEGORY_COLORS.get(category, "white")
 
-            # Parse visibility and ceiling for trend comparison
-            visibility_sm = parse_visibility_sm(metar) if metar else None
-            ceiling_ft = parse_ceiling_feet(metar) if metar else None
-
             self.weather_data[icao] = {
                 "metar": metar,
                 "taf": taf,
                 "category": category,
                 "color": color,
-                "visibility": extract_visibility_str(metar) if metar else None,
-                "visibility_sm": visibility_sm,
-                "ceiling": parse_ceiling_layer(metar) if metar else None,
-                "ceiling_ft": ceiling_ft,
-                "wind": parse_wind_from_metar(metar) if metar else None,
+                "visibility": parsed.visibility_str,
+                "visibility_sm": parsed.visibility_sm,
+                "ceiling": parsed.ceiling_layer,
+                "ceiling_ft": parsed.ceiling_ft,
+                "wind": parsed.wind,
                 "atis": atis_data.get(icao),
-                "phenomena": parse_weather_phenomena(metar) if metar else [],
+                "phenomena": list(parsed.phenomena),
                 "taf_changes": parse_taf_changes(
-                    taf, category, visibility_sm, ceiling_ft
+                    taf, category, parsed.visibility_sm, parsed.ceiling_ft
                 )
                 if taf
                 else [],
-                "is_speci": is_speci_metar(metar) if metar else False,
+                "is_speci": parsed.is_speci,
             }
 
         # Final progress